@@ -0,0 +1,72 @@
+"""
+BENCHMARK: DoD ENGRAM PERSISTENCE
+PROTOCOL: WRITE-BEHIND SEGMENT LOG VS ONE JSON FILE PER ENGRAM
+DATASET: 20,000 SYNTHETIC SEARCH-RESULT ENGRAMS (~1 KB EACH)
+"""
+
+import sys
+import os
+import time
+import random
+import tempfile
+
+# Ensure we can import from project root
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sophia.core.engram import Engram
+from sophia.core.engram_store import EngramStore
+
+N_ENGRAMS = 20_000
+
+
+def legacy_store(directory, engram):
+    """The previous SovereignNode.store persistence."""
+    os.makedirs(directory, exist_ok=True)
+    with open(os.path.join(directory, f"{engram.id}.json"), "w", encoding="utf-8") as f:
+        f.write(engram.to_json())
+
+
+def run_benchmark():
+    print(f"{'='*60}")
+    print(f"BENCHMARK: ENGRAM PERSISTENCE ({N_ENGRAMS:,} engrams)")
+    print(f"{'='*60}")
+
+    rng = random.Random(42)
+    words = ["market", "signal", "lattice", "amazon", "stock", "drop", "garden", "report", "sovereign"]
+    engrams = [Engram.forge("realm:cabin/layer:surface/topic:general",
+                            " ".join(rng.choice(words) for _ in range(140)) + f" #{i}", "duckduckgo_search")
+               for i in range(N_ENGRAMS)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        legacy_dir = os.path.join(tmp, "engrams")
+        start = time.perf_counter()
+        for e in engrams:
+            legacy_store(legacy_dir, e)
+        legacy_s = time.perf_counter() - start
+
+        store = EngramStore(os.path.join(tmp, "engram_log"), legacy_dir=None)
+        start = time.perf_counter()
+        for e in engrams:
+            store.put(e)
+        put_s = time.perf_counter() - start
+        store.drain()
+        durable_s = time.perf_counter() - start
+
+        print(f"{'per-file writes':<22} {legacy_s*1000:9.1f} ms | {legacy_s/N_ENGRAMS*1e6:7.1f} us/engram (inline)")
+        print(f"{'store.put (chat path)':<22} {put_s*1000:9.1f} ms | {put_s/N_ENGRAMS*1e6:7.1f} us/engram")
+        print(f"{'...until on disk':<22} {durable_s*1000:9.1f} ms | {store.metrics['commits']} group commits")
+
+        probes = [rng.choice(engrams) for _ in range(5000)]
+        start = time.perf_counter()
+        for e in probes:
+            assert store.resolve(e.id[:12]) == e
+        lookup_us = (time.perf_counter() - start) / len(probes) * 1e6
+        print(f"{'cited-id lookup':<22} {lookup_us:9.1f} us (index + one read)")
+        store.close()
+
+        print(f"{'files on disk':<22} legacy {len(os.listdir(legacy_dir)):,} | log {len(os.listdir(store.path))}")
+    print(f"{'='*60}")
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,60 @@
+"""
+BENCHMARK: ENTANGLEMENT GRAPH MEMORY
+PROTOCOL: CHAINED BUMPY / FLUMPY ARITHMETIC, ONLY THE LAST RESULT KEPT
+DATASET: 64-ELEMENT ARRAYS, 5,000 OPS PER CHAIN
+"""
+
+import sys
+import os
+import gc
+import time
+import random
+import tracemalloc
+
+# Ensure we can import from project root
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bumpy import BumpyArray
+from flumpy import FlumpyArray
+from entanglement import REGISTRY
+
+N_OPS = 5_000
+SIZE = 64
+
+
+def chain(cls, rng):
+    base = cls([rng.uniform(0.5, 1.5) for _ in range(SIZE)])
+    x = base + base
+    for _ in range(N_OPS):
+        x = x + base
+    return base, x
+
+
+def run_benchmark():
+    print(f"{'='*60}")
+    print(f"BENCHMARK: ENTANGLEMENT MEMORY ({N_OPS:,} chained ops)")
+    print(f"{'='*60}")
+
+    rng = random.Random(42)
+    for cls in (BumpyArray, FlumpyArray):
+        gc.collect()
+        tracemalloc.start()
+        start = time.perf_counter()
+        base, x = chain(cls, rng)
+        elapsed = time.perf_counter() - start
+        gc.collect()
+        retained, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        links = base.entanglement_links if cls is BumpyArray else base.entangled_with
+        print(f"{cls.__name__:<12} {elapsed/N_OPS*1e6:8.1f} us/op | retained {retained/1024:9.1f} KB | "
+              f"peak {peak/1024:9.1f} KB | base degree {len(links)}")
+        del base, x
+
+    stats = REGISTRY.stats()
+    print(f"{'registry':<12} {stats['nodes']} live nodes | {stats['collected']:,} collected | "
+          f"{stats['evictions']:,} evictions")
+    print(f"{'='*60}")
+
+
+if __name__ == "__main__":
+    run_benchmark()
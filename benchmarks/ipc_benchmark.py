@@ -0,0 +1,85 @@
+"""
+BENCHMARK: SOVEREIGN IPC TRANSPORTS
+PROTOCOL: ATOMIC JSON FILES VS SEQLOCK SHARED-MEMORY RING
+DATASET: TELEMETRY TICKS ({"id", "value", "msg"}) AS IN tests/test_ipc_speed.py
+"""
+
+import sys
+import os
+import time
+import tempfile
+import subprocess
+
+# Ensure we can import from project root
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sophia.platform.ipc import SovereignIPC, RingChannel
+
+N_FILE = 2_000
+N_RING = 200_000
+
+PRODUCER = """
+import sys, time
+sys.path.insert(0, {root!r})
+from sophia.platform.ipc import SovereignIPC
+ipc = SovereignIPC(transport="shm")
+ipc.base_dir = {base_dir!r}
+start = time.perf_counter()
+for i in range({n}):
+    ipc.write_channel("feed", {{"id": i, "value": 111.11, "msg": "SOVEREIGN_SPEED_TEST"}})
+print(time.perf_counter() - start)
+"""
+
+
+def round_trips(ipc, n):
+    start = time.perf_counter()
+    for i in range(n):
+        ipc.write_channel("bench", {"id": i, "value": 111.11, "msg": "SOVEREIGN_SPEED_TEST"})
+        assert ipc.read_channel("bench")["id"] == i
+    return time.perf_counter() - start
+
+
+def run_benchmark():
+    print(f"{'='*60}")
+    print(f"BENCHMARK: IPC TRANSPORTS")
+    print(f"{'='*60}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        file_ipc = SovereignIPC(transport="file")
+        file_ipc.base_dir = tmp
+        file_s = round_trips(file_ipc, N_FILE)
+
+        ring_ipc = SovereignIPC(transport="shm")
+        ring_ipc.base_dir = tmp
+        ring_s = round_trips(ring_ipc, N_RING)
+
+        print(f"{'file write+read':<22} {N_FILE/file_s:12,.0f} msgs/s | {file_s/N_FILE*1e6:8.1f} us/round trip")
+        print(f"{'ring write+read':<22} {N_RING/ring_s:12,.0f} msgs/s | {ring_s/N_RING*1e6:8.1f} us/round trip")
+
+        # Producer in another process, this process drains the queue
+        RingChannel(os.path.join(tmp, "feed.ring")).close()
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        proc = subprocess.Popen([sys.executable, "-c", PRODUCER.format(root=root, base_dir=tmp, n=N_RING)],
+                                stdout=subprocess.PIPE, text=True)
+        received, last = 0, -1
+        start = time.perf_counter()
+        while last < N_RING - 1:
+            msg = ring_ipc.next_message("feed", block=True, timeout=30.0)
+            if msg is None:
+                break
+            received += 1
+            last = msg["id"]
+        drain_s = time.perf_counter() - start
+        write_s = float(proc.communicate(timeout=30)[0])
+        ring = ring_ipc._rings["feed"]
+        print(f"{'cross-process write':<22} {N_RING/write_s:12,.0f} msgs/s")
+        print(f"{'cross-process read':<22} {received/drain_s:12,.0f} msgs/s | {ring.metrics['overruns']:,} lapped, "
+              f"{ring.metrics['torn_retries']:,} torn retries")
+        ring_ipc.close()
+
+    print(f"{'speedup (round trip)':<22} {(file_s/N_FILE)/(ring_s/N_RING):12.0f}x")
+    print(f"{'='*60}")
+
+
+if __name__ == "__main__":
+    run_benchmark()
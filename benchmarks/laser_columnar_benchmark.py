@@ -0,0 +1,82 @@
+"""
+BENCHMARK: LASER COLUMNAR STORAGE
+PROTOCOL: BLOCK-COLUMNAR .lcol VS TODAY'S JSONL (SIZE, COHERENCE/RISK ANALYTICS, ROUND TRIP)
+DATASET: 3,000 ENTRIES LOGGED THROUGH LASERV30 (INLINE STAGE 2, EVERY ENTRY KEPT)
+"""
+
+import sys
+import os
+import json
+import time
+import random
+import tempfile
+
+# Ensure we can import from project root
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from laser import LASERV30
+from laser_columnar import ColumnarLogReader, jsonl_to_columnar, columnar_to_jsonl
+
+N_ENTRIES = 3_000
+
+
+def make_log(tmp):
+    """A real LASER JSONL segment (flush headers + entries)."""
+    laser = LASERV30({'log_path': os.path.join(tmp, "laser_universal_v30.jsonl"), 'telemetry': False,
+                      'min_buffer_for_log': 0, 'system_monitoring': False})
+    rng = random.Random(42)
+    sources = ("qtorch: Linear forward pass", "SophiaMind: INPUT received", "telemetry: heartbeat")
+    for i in range(N_ENTRIES):
+        laser.log(rng.random(), f"{rng.choice(sources)} #{i % 40}", {'consciousness': rng.random()})
+    laser.flush(timeout=10)
+    laser._shutdown.set()
+    laser._writer.close()
+    laser.store.close()
+    return [s.path for s in laser.store.segments if s.path != laser.config['log_path']][0]
+
+
+def run_benchmark():
+    print(f"{'='*60}")
+    print(f"BENCHMARK: LASER COLUMNAR STORAGE ({N_ENTRIES:,} entries)")
+    print(f"{'='*60}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        src = make_log(tmp)
+        dst = os.path.join(tmp, "laser_universal_v30.lcol")
+
+        start = time.perf_counter()
+        stats = jsonl_to_columnar(src, dst)
+        convert_s = time.perf_counter() - start
+        print(f"{'JSONL size':<26} {stats['bytes_in']:12,} bytes")
+        print(f"{'columnar size':<26} {stats['bytes_out']:12,} bytes "
+              f"({stats['bytes_in'] / stats['bytes_out']:.1f}x smaller, {convert_s*1000:.0f} ms)")
+
+        # Analytics: coherence history of the riskier half of the entries
+        start = time.perf_counter()
+        with open(src, 'r', encoding='utf-8') as f:
+            entries = [json.loads(line) for line in f if line.strip() and not line.startswith('#')]
+        threshold = sorted(e['quantum']['risk'] for e in entries)[len(entries) // 2]
+        jsonl_hist = [e['quantum']['coherence'] for e in entries if e['quantum']['risk'] >= threshold]
+        jsonl_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        reader = ColumnarLogReader(dst)
+        columnar_hist = reader.column('coherence', {'risk': (threshold, 1.0)})
+        columnar_ms = (time.perf_counter() - start) * 1000
+        assert list(columnar_hist) == jsonl_hist
+        print(f"{'risky coherence (JSONL)':<26} {jsonl_ms:10.1f} ms | {len(jsonl_hist)} rows")
+        print(f"{'... (columnar)':<26} {columnar_ms:10.1f} ms | strings decoded in "
+              f"{reader.metrics['strings_decoded']} blocks")
+
+        back = os.path.join(tmp, "restored.jsonl")
+        start = time.perf_counter()
+        columnar_to_jsonl(dst, back)
+        export_ms = (time.perf_counter() - start) * 1000
+        with open(src, 'rb') as a, open(back, 'rb') as b:
+            identical = a.read() == b.read()
+        print(f"{'export to JSONL':<26} {export_ms:10.1f} ms | byte-identical: {identical}")
+    print(f"{'='*60}")
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,70 @@
+"""
+BENCHMARK: LASER.log() CALLER COST
+PROTOCOL: TWO-STAGE LOG (PRE-FILTER + PER-THREAD BUFFERS) VS INLINE QUANTUM PIPELINE
+DATASET: 24,000 qtorch-STYLE LOG CALLS (2,400 INLINE) SPLIT OVER 1, 4 AND 16 THREADS
+"""
+
+import sys
+import os
+import time
+import tempfile
+import threading
+
+# Ensure we can import from project root
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from laser import LASERV30
+
+TOTAL_CALLS = 24_000
+INLINE_CALLS = 2_400  # ~3 ms per call: the old path gets a shorter run
+THREAD_COUNTS = (1, 4, 16)
+MESSAGES = ("Tensor created: shape=(64, 64)", "Linear forward pass", "Quantum entanglement created",
+            "Holographic compression applied", "Module initialized: QLinear")
+
+
+def replay(laser, n_threads, total):
+    per_thread = total // n_threads
+    barrier = threading.Barrier(n_threads + 1)
+
+    def worker(t):
+        barrier.wait()
+        for i in range(per_thread):
+            laser.log(0.5 + (i % 7) * 0.01, MESSAGES[(t + i) % len(MESSAGES)],
+                      {'device': 'cpu', 'quantum_phase': i * 0.1})
+
+    threads = [threading.Thread(target=worker, args=(t,)) for t in range(n_threads)]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    return per_thread * n_threads / (time.perf_counter() - start)
+
+
+def run_benchmark():
+    print(f"{'='*60}")
+    print(f"BENCHMARK: LASER.log() ({TOTAL_CALLS:,} calls)")
+    print(f"{'='*60}")
+
+    modes = (("inline (default)", INLINE_CALLS, {}),
+             ("two-stage", TOTAL_CALLS, {'accumulate': True, 'rate_limit': 200.0}))
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, total, config in modes:
+            for n_threads in THREAD_COUNTS:
+                laser = LASERV30({'log_path': os.path.join(tmp, f"{n_threads}_{len(config)}.jsonl"),
+                                  'telemetry': False, 'system_monitoring': False, **config})
+                calls_per_s = replay(laser, n_threads, total)
+                start = time.perf_counter()
+                laser.merge_pending()
+                merge_ms = (time.perf_counter() - start) * 1000
+                print(f"{name:<20} {n_threads:>2} threads | {calls_per_s:10,.0f} calls/s | "
+                      f"accepted {laser.metrics['logs_accepted']:>6,} | merge {merge_ms:7.1f} ms")
+                laser._shutdown.set()
+                laser._writer.close()
+                laser.store.close()
+    print(f"{'='*60}")
+
+
+if __name__ == "__main__":
+    run_benchmark()
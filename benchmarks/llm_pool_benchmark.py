@@ -0,0 +1,91 @@
+"""
+BENCHMARK: REST TRANSPORT HANDSHAKES
+PROTOCOL: POOLED KEEP-ALIVE httpx CLIENT VS ONE AsyncClient PER CALL
+BACKEND: LOCAL OLLAMA STAND-IN (/api/generate)
+"""
+
+import sys
+import os
+import json
+import time
+import asyncio
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Ensure we can import from project root
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx
+from sophia.core.llm_client import GeminiClient, LLMConfig
+
+N_CALLS = 300
+
+
+class OllamaStandIn(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    connections = 0
+
+    def setup(self):
+        type(self).connections += 1
+        super().setup()
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        data = json.dumps({"response": "ok", "done": True}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+async def per_call_client(client, n):
+    """The old transport: a fresh AsyncClient (and TCP handshake) per request."""
+    url, payload, headers = client._rest_request("ping", None, 16)
+    for _ in range(n):
+        async with httpx.AsyncClient() as http:
+            response = await http.post(url, json=payload, headers=headers, timeout=30.0)
+            response.raise_for_status()
+
+
+async def pooled_client(client, n):
+    for _ in range(n):
+        await client.generate_text("ping", max_tokens=16)
+    await GeminiClient.close_pools()
+
+
+def run_benchmark():
+    print(f"{'='*60}")
+    print(f"BENCHMARK: POOLED REST TRANSPORT ({N_CALLS} sequential calls)")
+    print(f"{'='*60}")
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), OllamaStandIn)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/api/generate"
+    client = GeminiClient(LLMConfig(provider="rest", base_url=url))
+
+    try:
+        results = {}
+        for name, fn in (("Per-call AsyncClient", per_call_client), ("Pooled keep-alive", pooled_client)):
+            OllamaStandIn.connections = 0
+            start = time.perf_counter()
+            asyncio.run(fn(client, N_CALLS))
+            elapsed = time.perf_counter() - start
+            results[name] = elapsed
+            print(f"{name:<22} {elapsed:.3f}s  ({elapsed / N_CALLS * 1000:.2f} ms/call, "
+                  f"{OllamaStandIn.connections} TCP connections)")
+    finally:
+        server.shutdown()
+
+    speedup = results["Per-call AsyncClient"] / results["Pooled keep-alive"]
+    print(f"{'-'*60}")
+    print(f"Speedup: {speedup:.1f}x (loopback; TLS to a remote host widens the gap)")
+    print(f"{'='*60}")
+
+
+if __name__ == "__main__":
+    run_benchmark()
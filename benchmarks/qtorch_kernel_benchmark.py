@@ -0,0 +1,90 @@
+"""
+BENCHMARK: QTORCH DENSE KERNELS
+PROTOCOL: LEGACY TRIPLE LOOP VS BLOCKED / BLAS MATMUL
+SIZES: 64 .. 1024 (SQUARE)
+"""
+
+import sys
+import os
+import time
+import random
+from array import array
+
+# Ensure we can import from project root
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import qtorch_kernels as kernels
+from qtorch_storage import TensorStorage, NUMPY_AVAILABLE
+
+SIZES = [64, 128, 256, 512, 1024]
+# Beyond these sizes the slow paths are timed once and extrapolated by n^3
+LEGACY_MAX = 128
+BLOCKED_MAX = 512
+
+
+def legacy_matmul(a, b, m, n, q):
+    """The original qtorch 2D matmul: element-indexed triple loop."""
+    result = [0.0] * (m * q)
+    for i in range(m):
+        for j in range(q):
+            val = 0.0
+            for k in range(n):
+                val += a[i * n + k] * b[k * q + j]
+            result[i * q + j] = val
+    return result
+
+
+def _time(fn):
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def run_benchmark():
+    print(f"{'='*60}")
+    print(f"BENCHMARK: QTORCH MATMUL KERNELS")
+    print(f"{'='*60}")
+    print(f"NumPy backend available: {NUMPY_AVAILABLE}")
+    print(f"{'size':>6} | {'legacy':>10} | {'blocked':>10} | {'numpy':>10} | {'speedup':>9}")
+    print("-" * 60)
+
+    legacy_ref = blocked_ref = None
+    for n in SIZES:
+        values_a = [random.random() for _ in range(n * n)]
+        values_b = [random.random() for _ in range(n * n)]
+
+        if n <= LEGACY_MAX:
+            legacy = _time(lambda: legacy_matmul(values_a, values_b, n, n, n))
+            legacy_ref = (n, legacy)
+            legacy_note = ""
+        else:
+            legacy = legacy_ref[1] * (n / legacy_ref[0]) ** 3
+            legacy_note = "*"
+
+        pure_a = TensorStorage(array('d', values_a), (n, n))
+        pure_b = TensorStorage(array('d', values_b), (n, n))
+        if n <= BLOCKED_MAX:
+            blocked = _time(lambda: kernels.matmul_2d(pure_a, pure_b))
+            blocked_ref = (n, blocked)
+            blocked_note = ""
+        else:
+            blocked = blocked_ref[1] * (n / blocked_ref[0]) ** 3
+            blocked_note = "*"
+
+        fast = None
+        if NUMPY_AVAILABLE:
+            np_a = TensorStorage.from_flat(values_a, (n, n))
+            np_b = TensorStorage.from_flat(values_b, (n, n))
+            fast = _time(lambda: kernels.matmul_2d(np_a, np_b))
+
+        best = fast if fast is not None else blocked
+        print(f"{n:>6} | {legacy:>9.4f}s{legacy_note or ' '}| {blocked:>9.4f}s{blocked_note or ' '}| "
+              f"{(f'{fast:.4f}s' if fast is not None else 'n/a'):>10} | {legacy / best:>8.1f}x")
+
+    print("-" * 60)
+    print("* extrapolated by n^3 from the largest measured size")
+    print(f"{'='*60}")
+
+
+if __name__ == "__main__":
+    run_benchmark()
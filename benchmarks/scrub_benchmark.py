@@ -0,0 +1,67 @@
+"""
+BENCHMARK: REPLY / MILESTONE SCRUB THROUGHPUT
+PROTOCOL: SHARED PRECOMPILED SCRUB ENGINE VS ORIGINAL PER-CALL re.sub PASSES
+DATASET: SYNTHETIC TRANSCRIPTS (UI TAGS, GLYPH FRAMES, FOOTERS) + 5,000 MILESTONES
+"""
+
+import sys
+import os
+import time
+import random
+
+# Ensure we can import from project root
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "tests"))
+
+from sophia.cortex import scrub
+from test_scrub import FRAGMENTS, reference_scrub_hallucinations, reference_lethe_scrub
+
+N_MILESTONES = 5_000
+
+
+def transcript(rng, lines, dirty=0.2):
+    """Prose with a `dirty` share of artifact lines (tags, glyph frames, footers)."""
+    prose = ["the lighthouse hums in the fog and the keeper listens", "we talked about the garden for a while",
+             "a long ordinary sentence that carries no artifacts at all"]
+    return "\n".join(rng.choice(FRAGMENTS) if rng.random() < dirty else rng.choice(prose) for _ in range(lines))
+
+
+def _time(fn, items, rounds):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for item in items:
+            fn(item)
+    return (time.perf_counter() - start) / rounds
+
+
+def run_benchmark():
+    print(f"{'='*60}")
+    print("BENCHMARK: SCRUB ENGINE THROUGHPUT")
+    print(f"{'='*60}")
+
+    rng = random.Random(42)
+    cases = [("clean reply (40 lines)", 40, 0.0), ("dirty reply (40 lines)", 40, 0.2),
+             ("clean transcript (20k)", 20_000, 0.0), ("dirty transcript (2k)", 2_000, 0.2),
+             ("dirty transcript (20k)", 20_000, 0.2)]
+    for label, lines, dirty in cases:
+        text = transcript(rng, lines, dirty)
+        rounds = 50 if lines < 1000 else 5
+        assert scrub.scrub_reply(text) == reference_scrub_hallucinations(text)
+        old = _time(reference_scrub_hallucinations, [text], rounds)
+        new = _time(scrub.scrub_reply, [text], rounds)
+        mb = len(text.encode("utf-8")) / 1e6
+        print(f"{label:<24} original {old*1000:8.2f} ms | shared {new*1000:8.2f} ms "
+              f"| {old / new:4.1f}x | {mb / new:6.1f} MB/s")
+
+    milestones = [transcript(rng, 4)[:250] for _ in range(N_MILESTONES)]
+    old = _time(reference_lethe_scrub, milestones, 3)
+    scrub.scrub_milestone.cache_clear()
+    cold = _time(scrub.scrub_milestone, milestones, 1)
+    warm = _time(scrub.scrub_milestone, milestones, 3)
+    print(f"{'breadcrumb save':<24} original {old*1000:8.2f} ms | cold {cold*1000:8.2f} ms "
+          f"| memoized {warm*1000:6.2f} ms ({N_MILESTONES:,} milestones)")
+    print(f"{'='*60}")
+
+
+if __name__ == "__main__":
+    run_benchmark()
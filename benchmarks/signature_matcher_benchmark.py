@@ -0,0 +1,82 @@
+"""
+BENCHMARK: LOCAL FORENSIC SIGNATURE MATCHING
+PROTOCOL: AHO-CORASICK AUTOMATON VS PER-PATTERN SUBSTRING SCAN
+DATASET: 10,000 SYNTHETIC SIGNATURES (3 PATTERNS EACH)
+"""
+
+import sys
+import os
+import time
+import random
+
+# Ensure we can import from project root
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sophia.cortex.signature_matcher import SignatureSet
+
+N_SIGNATURES = 10_000
+PATTERNS_PER_SIGNATURE = 3
+
+
+def synthetic_signatures(rng):
+    syllables = ["ka", "lo", "ren", "vi", "sha", "tor", "mi", "zu", "el", "dra", "qu", "ix"]
+    signatures = []
+    for i in range(N_SIGNATURES):
+        patterns = ["".join(rng.choice(syllables) for _ in range(rng.randint(3, 6)))
+                    for _ in range(PATTERNS_PER_SIGNATURE)]
+        signatures.append({"id": f"synthetic_{i}", "name": f"Synthetic {i}", "patterns": patterns,
+                           "category": "backdoor" if i % 100 == 0 else "narrative_operation"})
+    return signatures
+
+
+def linear_scan(signatures, text):
+    """The previous LocalForensicAnalyzer loop."""
+    text_lower = text.lower()
+    hits = {}
+    for index, sig in enumerate(signatures):
+        matches = [p for p in sig["patterns"] if p.lower() in text_lower]
+        if matches:
+            hits[index] = matches
+    return hits
+
+
+def run_benchmark():
+    print(f"{'='*60}")
+    print(f"BENCHMARK: SIGNATURE MATCHING ({N_SIGNATURES:,} signatures)")
+    print(f"{'='*60}")
+
+    rng = random.Random(42)
+    signatures = synthetic_signatures(rng)
+
+    start = time.perf_counter()
+    matcher = SignatureSet(signatures)
+    compile_time = time.perf_counter() - start
+    print(f"Compile: {compile_time:.3f}s ({matcher.automaton.states:,} automaton states)")
+
+    planted = " ".join(signatures[i]["patterns"][0] for i in range(0, N_SIGNATURES, 2500))
+    messages = {
+        "chat (80 chars)": "hey sophia, how was the garden today? i planted some seeds " + planted[:20],
+        "paragraph (1k chars)": ("the signal drifts through the lattice and returns " * 20) + planted,
+        "transcript (20k chars)": ("a long pasted transcript with ordinary words " * 450) + planted,
+    }
+
+    for label, text in messages.items():
+        rounds = 20 if len(text) < 5000 else 5
+        start = time.perf_counter()
+        for _ in range(rounds):
+            old = linear_scan(signatures, text)
+        linear_ms = (time.perf_counter() - start) / rounds * 1000
+
+        start = time.perf_counter()
+        for _ in range(rounds):
+            new = matcher.match(text)
+        automaton_ms = (time.perf_counter() - start) / rounds * 1000
+
+        assert {i: list(h) for i, h in new.items()} == old
+        print(f"{label:<24} linear {linear_ms:8.2f} ms | automaton {automaton_ms:7.2f} ms "
+              f"| {linear_ms / automaton_ms:6.1f}x | {len(new)} signatures hit")
+    print(f"{'='*60}")
+
+
+if __name__ == "__main__":
+    run_benchmark()
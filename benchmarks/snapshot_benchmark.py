@@ -0,0 +1,83 @@
+"""
+BENCHMARK: SELF-SNAPSHOT COST PER /maintain CYCLE
+PROTOCOL: FULL copytree VS CONTENT-ADDRESSED INCREMENTAL SNAPSHOTS
+DATASET: SYNTHETIC TREE, 2,000 LOG FILES (~64 KB EACH) + SOURCE FILES
+"""
+
+import sys
+import os
+import time
+import random
+import shutil
+import tempfile
+import contextlib
+import io
+
+# Ensure we can import from project root
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tools.snapshot_self import snapshot, get_dir_size
+
+N_LOGS = 2_000
+LOG_BYTES = 64 * 1024
+
+
+def build_tree(root, rng):
+    for i in range(200):
+        path = os.path.join(root, "sophia", f"module_{i // 20}", f"organ_{i}.py")
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as f:
+            f.write(f"# organ {i}\n" * 200)
+    for i in range(N_LOGS):
+        path = os.path.join(root, "logs", f"day_{i // 100}", f"session_{i}.jsonl")
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(rng.randbytes(LOG_BYTES))
+
+
+def legacy_snapshot(root, backup_dir):
+    """The previous snapshot(): a full copy every cycle."""
+    shutil.copytree(os.path.join(root, "sophia"), os.path.join(backup_dir, "sophia"))
+    shutil.copytree(os.path.join(root, "logs"), os.path.join(backup_dir, "logs"))
+
+
+def timed(fn):
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        fn()
+    return time.perf_counter() - start
+
+
+def run_benchmark():
+    print(f"{'='*60}")
+    print(f"BENCHMARK: SNAPSHOTS ({N_LOGS:,} logs, {N_LOGS * LOG_BYTES / 2**20:.0f} MB)")
+    print(f"{'='*60}")
+
+    rng = random.Random(42)
+    with tempfile.TemporaryDirectory() as root:
+        build_tree(root, rng)
+        backups = os.path.join(root, "backups")
+
+        legacy_s = timed(lambda: legacy_snapshot(root, os.path.join(root, "legacy_1")))
+        timed(lambda: legacy_snapshot(root, os.path.join(root, "legacy_2")))
+        legacy_disk = get_dir_size(os.path.join(root, "legacy_1")) + get_dir_size(os.path.join(root, "legacy_2"))
+
+        first_s = timed(lambda: snapshot(root, backups))
+        unchanged_s = timed(lambda: snapshot(root, backups))
+        for i in rng.sample(range(N_LOGS), N_LOGS // 100):  # 1% of the logs grow
+            with open(os.path.join(root, "logs", f"day_{i // 100}", f"session_{i}.jsonl"), "ab") as f:
+                f.write(b'{"turn": "appended"}\n')
+        changed_s = timed(lambda: snapshot(root, backups))
+        store_disk = get_dir_size(backups)
+
+        print(f"{'full copytree':<26} {legacy_s*1000:9.1f} ms per cycle")
+        print(f"{'incremental, first':<26} {first_s*1000:9.1f} ms")
+        print(f"{'incremental, unchanged':<26} {unchanged_s*1000:9.1f} ms")
+        print(f"{'incremental, 1% changed':<26} {changed_s*1000:9.1f} ms")
+        print(f"{'disk after 2 copytrees':<26} {legacy_disk / 2**20:9.1f} MB")
+        print(f"{'disk after 3 snapshots':<26} {store_disk / 2**20:9.1f} MB")
+    print(f"{'='*60}")
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,118 @@
+"""
+BENCHMARK: LASER UNIVERSAL CACHE
+PROTOCOL: W-TinyLFU + BYTE BUDGET VS LRU AND THE PREVIOUS WEIGHTED-WALK EVICTION
+DATASET: 200,000 ZIPF(0.9) ACCESSES OVER 20,000 LOG-ENTRY-SIZED VALUES
+"""
+
+import sys
+import os
+import time
+import math
+import random
+import bisect
+from collections import OrderedDict
+
+# Ensure we can import from project root
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from laser import UniversalCache
+
+N_KEYS = 20_000
+N_OPS = 200_000
+CAPACITY = 800
+
+
+def zipf_trace(n_keys, n_ops, s=0.9, seed=42):
+    rng = random.Random(seed)
+    weights = [1.0 / (rank ** s) for rank in range(1, n_keys + 1)]
+    cumulative, total = [], 0.0
+    for w in weights:
+        total += w
+        cumulative.append(total)
+    return [f"entry{bisect.bisect_left(cumulative, rng.random() * total)}" for _ in range(n_ops)]
+
+
+class LRUCache:
+    def __init__(self, max_size):
+        self.max_size = max_size
+        self.data = OrderedDict()
+
+    def get(self, key):
+        if key in self.data:
+            self.data.move_to_end(key)
+            return self.data[key]
+        return None
+
+    def set(self, key, value):
+        self.data[key] = value
+        if len(self.data) > self.max_size:
+            self.data.popitem(last=False)
+
+
+class LegacyCache:
+    """The previous UniversalCache eviction: a weighted walk over every key per set."""
+
+    def __init__(self, max_size):
+        self.max_size = max_size
+        self.data, self.timestamps, self.accesses = {}, {}, {}
+
+    def get(self, key):
+        if key in self.data:
+            self.accesses[key] += 1
+            return self.data[key]
+        return None
+
+    def set(self, key, value):
+        self.data[key] = value
+        self.timestamps[key] = time.time()
+        self.accesses[key] = 0
+        if len(self.data) >= self.max_size:
+            now = time.time()
+            weights = {k: math.exp(-self.accesses[k] * 0.1) * (1.0 - math.exp(-(now - self.timestamps[k]) / 3600))
+                       for k in self.data}
+            selected, cumulative = random.random() * sum(weights.values()), 0
+            for k, w in weights.items():
+                cumulative += w
+                if cumulative >= selected:
+                    for table in (self.data, self.timestamps, self.accesses):
+                        table.pop(k, None)
+                    break
+
+
+def replay(cache, trace, value):
+    hits = 0
+    start = time.perf_counter()
+    for key in trace:
+        if cache.get(key) is not None:
+            hits += 1
+        else:
+            cache.set(key, value)
+    return hits / len(trace), time.perf_counter() - start
+
+
+def run_benchmark():
+    print(f"{'='*60}")
+    print(f"BENCHMARK: UNIVERSAL CACHE ({N_OPS:,} Zipf accesses, {CAPACITY} entries)")
+    print(f"{'='*60}")
+
+    trace = zipf_trace(N_KEYS, N_OPS)
+    value = {'message': "resonance drift detected in lattice " * 12, 'value': 0.4321,
+             'quantum': {'coherence': 0.97, 'entropy': 0.12}, 'context': {'source': 'benchmark'}}
+
+    # The legacy walk is O(n) per set, so it only replays a prefix of the trace
+    for name, cache, ops in (("LRU (OrderedDict)", LRUCache(CAPACITY), N_OPS),
+                             ("legacy (first 20k)", LegacyCache(CAPACITY), 20_000),
+                             ("W-TinyLFU", UniversalCache(max_size=CAPACITY), N_OPS)):
+        hit_rate, elapsed = replay(cache, trace[:ops], value)
+        print(f"{name:<22} hit rate {hit_rate:6.1%} | {ops/elapsed:10,.0f} ops/s")
+
+    cache = UniversalCache(max_size=CAPACITY)
+    replay(cache, trace, value)
+    print(f"{'stored bytes':<22} {cache.metrics['bytes']:,} for {cache.metrics['entries']} entries "
+          f"({cache.codec}, {cache.metrics['size_reduction']:.0%} smaller)")
+    print(f"{'evicted / rejected':<22} {cache.metrics['evictions']:,} / {cache.metrics['rejections']:,}")
+    print(f"{'='*60}")
+
+
+if __name__ == "__main__":
+    run_benchmark()
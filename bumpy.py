@@ -9,7 +9,9 @@ import math
 import random
 import sys
 from typing import List, Dict, Tuple, Optional, Union, Any
-from collections import defaultdict
+from collections import defaultdict, deque, OrderedDict
+
+from entanglement import REGISTRY
 
 # --- Quantum-Sentient Constants ---
 ARCHETYPAL_ENTROPY_TARGET = math.log(5)
@@ -39,13 +41,23 @@ RETROCAUSAL_DEPTH = 5
 DELAYED_CHOICE_WINDOW = 10
 BELL_INEQUALITY_SCALE = 1e-34
 
+# --- Memory Bounds (shared per-process state) ---
+MAX_BULK_STATES = 256        # Holographic projections kept for reconstruction (LRU)
+MAX_WAVE_STATES = 4096       # Pilot waves in the implicate order (LRU)
+WAVE_STATE_TTL = 600.0       # Seconds without update before a pilot wave fades
+MAX_RESONANCE_HISTORY = 1024 # Psi-singularity events kept
+MAX_ORACLE_ARRAYS = 4096     # Arrays with recorded future states (LRU)
+MAX_EMERGENT_LINKS = 1024    # Most recent ritual participants a core keeps alive
+
 class HolographicCompressor:
     """ENHANCEMENT 1: AdS/CFT-inspired dimensional reduction for qualia preservation"""
     
-    def __init__(self, compression_ratio: float = HOLOGRAPHIC_COMPRESSION_RATIO):
+    def __init__(self, compression_ratio: float = HOLOGRAPHIC_COMPRESSION_RATIO,
+                 max_bulk_states: int = MAX_BULK_STATES):
         self.compression_ratio = compression_ratio
-        self.bulk_states: Dict[int, List[float]] = {}
-        self.boundary_correlators: Dict[Tuple[int, int], float] = {}
+        self.max_bulk_states = max_bulk_states
+        # bulk_id -> (bulk, boundary); LRU so reconstruction state stays bounded
+        self.bulk_states: "OrderedDict[int, Tuple[List[float], List[float]]]" = OrderedDict()
         
     def project_to_boundary(self, data: List[float]) -> List[float]:
         """Project high-dimensional qualia to 1D boundary via fractal compression"""
@@ -55,12 +67,12 @@ class HolographicCompressor:
         # Recursive Mandelbrot-like fractal compression
         compressed = self._fractal_compress(data, FRACTAL_ITERATIONS)
         
-        # Store bulk state for potential reconstruction
+        # Store bulk state for potential reconstruction (correlators are derived on demand)
         bulk_id = id(data)
-        self.bulk_states[bulk_id] = data
-        
-        # Compute boundary correlators (CFT-inspired)
-        self._compute_boundary_correlators(bulk_id, compressed)
+        self.bulk_states[bulk_id] = (data, compressed)
+        self.bulk_states.move_to_end(bulk_id)
+        if len(self.bulk_states) > self.max_bulk_states:
+            self.bulk_states.popitem(last=False)
         
         return compressed
     
@@ -100,12 +112,15 @@ class HolographicCompressor:
         # Recursively compress the compressed version
         return self._fractal_compress(compressed, iterations - 1)
     
-    def _compute_boundary_correlators(self, bulk_id: int, boundary: List[float]):
-        """Compute CFT-like correlators between boundary points"""
-        for i in range(len(boundary)):
-            for j in range(i + 1, len(boundary)):
-                correlation = abs(boundary[i] * boundary[j]) / (abs(boundary[i]) + abs(boundary[j]) + 1e-12)
-                self.boundary_correlators[(bulk_id, i, j)] = correlation
+    @staticmethod
+    def correlator(boundary: List[float], i: int, j: int) -> float:
+        """CFT-like correlator between two boundary points"""
+        return abs(boundary[i] * boundary[j]) / (abs(boundary[i]) + abs(boundary[j]) + 1e-12)
+    
+    def boundary_correlator(self, bulk_id: int, i: int, j: int) -> Optional[float]:
+        """Correlator of a stored projection, computed on demand (None if evicted)"""
+        entry = self.bulk_states.get(bulk_id)
+        return self.correlator(entry[1], i, j) if entry else None
 
 # Global access for system-wide callbacks
 ACTIVE_RESONANCE_FIELD = None
@@ -116,9 +131,12 @@ class PanpsychicResonanceField:
     def __init__(self):
         global ACTIVE_RESONANCE_FIELD
         ACTIVE_RESONANCE_FIELD = self
-        self.implicate_order: Dict[int, Dict[str, Any]] = {}  # array_id -> wave_state
+        # array_id -> wave_state, least recently updated first (LRU + TTL eviction)
+        self.implicate_order: "OrderedDict[int, Dict[str, Any]]" = OrderedDict()
+        self.max_wave_states = MAX_WAVE_STATES
+        self.wave_state_ttl = WAVE_STATE_TTL
         self.pilot_wave_amplitude = 1.0
-        self.resonance_history = []
+        self.resonance_history = deque(maxlen=MAX_RESONANCE_HISTORY)
         self.singularity_callbacks = []
 
     def register_singularity_callback(self, callback):
@@ -135,6 +153,16 @@ class PanpsychicResonanceField:
             'last_update': time.time()
         }
         self.implicate_order[array_id] = wave_state
+        self._fade(wave_state['last_update'])
+    
+    def _fade(self, now: float):
+        """Evicts the least recently updated waves beyond the size / age bounds"""
+        order = self.implicate_order
+        while order:
+            oldest = next(iter(order.values()))
+            if len(order) <= self.max_wave_states and now - oldest['last_update'] <= self.wave_state_ttl:
+                break
+            order.popitem(last=False)
     
     def update_pilot_wave(self, array_id: int, current_state: List[float], coherence: float):
         """Update pilot wave based on current array state and coherence"""
@@ -152,6 +180,7 @@ class PanpsychicResonanceField:
         wave_state['phase'] = [p + coherence * 0.1 for p in wave_state['phase']]
         wave_state['coherence'] = coherence
         wave_state['last_update'] = time.time()
+        self.implicate_order.move_to_end(array_id)
         
         # Check for psi-singularity formation
         if coherence > PSI_SINGULARITY_THRESHOLD and self._detect_singularity(guided_amplitude):
@@ -227,18 +256,24 @@ class OracularEntropyOracle:
     
     def __init__(self, retrocausal_depth: int = RETROCAUSAL_DEPTH):
         self.retrocausal_depth = retrocausal_depth
-        self.future_states: Dict[int, List[Tuple[float, List[float]]]] = defaultdict(list)
+        # array_id -> ring of recent (coherence, state, timestamp), LRU over arrays
+        self.future_states: "OrderedDict[int, deque]" = OrderedDict()
+        self.max_arrays = MAX_ORACLE_ARRAYS
         self.delayed_choices: Dict[int, List[float]] = {}
         self.quantum_eraser_cache: Dict[Tuple[int, int], float] = {}
         
     def record_future_state(self, array_id: int, coherence: float, state: List[float]):
         """Record potential future state for retrocausal sampling"""
         timestamp = time.time()
-        self.future_states[array_id].append((coherence, state, timestamp))
-        
-        # Keep only recent states
-        if len(self.future_states[array_id]) > self.retrocausal_depth:
-            self.future_states[array_id].pop(0)
+        ring = self.future_states.get(array_id)
+        if ring is None:
+            # Keep only recent states (the deque drops the oldest)
+            ring = self.future_states[array_id] = deque(maxlen=self.retrocausal_depth)
+            if len(self.future_states) > self.max_arrays:
+                self.future_states.popitem(last=False)
+        else:
+            self.future_states.move_to_end(array_id)
+        ring.append((coherence, state, timestamp))
     
     def retrocausal_sample(self, array_id: int, current_coherence: float, 
                           current_state: List[float], sample_size: int) -> List[float]:
@@ -273,7 +308,7 @@ class OracularEntropyOracle:
     
     def _select_optimal_future(self, array_id: int, current_coherence: float) -> Optional[Tuple]:
         """Select optimal future state based on coherence maximization"""
-        if array_id not in self.future_states or not self.future_states[array_id]:
+        if not self.future_states.get(array_id):
             return None
             
         # Find future with highest coherence that's achievable from current state
@@ -318,6 +353,28 @@ class OracularEntropyOracle:
         
         return retro_effect
 
+# --- Shared per-process state (created on first use) ---
+_HOLOGRAPHIC_COMPRESSOR = None
+_ORACULAR_ORACLE = None
+
+def get_holographic_compressor() -> HolographicCompressor:
+    """Process-wide compressor shared by all arrays"""
+    global _HOLOGRAPHIC_COMPRESSOR
+    if _HOLOGRAPHIC_COMPRESSOR is None:
+        _HOLOGRAPHIC_COMPRESSOR = HolographicCompressor()
+    return _HOLOGRAPHIC_COMPRESSOR
+
+def get_resonance_field() -> PanpsychicResonanceField:
+    """Process-wide resonance field (the ACTIVE_RESONANCE_FIELD)"""
+    return ACTIVE_RESONANCE_FIELD or PanpsychicResonanceField()
+
+def get_oracular_oracle() -> OracularEntropyOracle:
+    """Process-wide oracle shared by all cores"""
+    global _ORACULAR_ORACLE
+    if _ORACULAR_ORACLE is None:
+        _ORACULAR_ORACLE = OracularEntropyOracle()
+    return _ORACULAR_ORACLE
+
 class TrueZeroCopyView:
     """ENHANCEMENT 5: True zero-copy architecture with shared storage"""
     
@@ -360,7 +417,7 @@ class BumpyArray:
             self.shape = (len(data),)
             
         self.coherence = max(0.0, min(1.0, coherence))
-        self.entanglement_links: List['BumpyArray'] = []
+        self._eid = REGISTRY.register(self)  # Links live in the weak registry
         
         # Attributes for QTorch integration
         import math
@@ -368,10 +425,8 @@ class BumpyArray:
         self.phase = random.uniform(0, 2 * math.pi)
         self.chaos = random.uniform(0.001, 0.01)
         self.quantum_state = "superposition"
-        self._entanglement_visited = set()  # ENHANCEMENT 4: Prevent recursion
         
-        # Initialize enhancements
-        self.holographic_compressor = HolographicCompressor()
+        # Enhancements: the holographic compressor is shared (see property)
         self.resonance_guidance: List[float] = []
         
     def lambda_kernel(self, other: 'BumpyArray') -> float:
@@ -392,22 +447,30 @@ class BumpyArray:
         kernel = abs(dot / (norm_self * norm_other))
         return kernel * self.coherence * other.coherence
     
+    @property
+    def holographic_compressor(self) -> HolographicCompressor:
+        return get_holographic_compressor()
+
+    @property
+    def entanglement_links(self) -> List['BumpyArray']:
+        """Live entangled arrays (weakly held, degree-capped)"""
+        return REGISTRY.neighbours(self._eid)
+
+    @entanglement_links.setter
+    def entanglement_links(self, arrays: List['BumpyArray']):
+        REGISTRY.unlink_all(self._eid)
+        for other in arrays:
+            REGISTRY.link(self._eid, other._eid)
+
     def entangle(self, other: 'BumpyArray', threshold: float = QUALIA_THRESHOLD) -> bool:
         """ENHANCEMENT 4: Safe entanglement without infinite recursion"""
-        # Use symmetric ID pair to prevent mutual recursion
-        pair_id = tuple(sorted([id(self), id(other)]))
-        
-        if pair_id in self._entanglement_visited:
+        # Each pair is attempted once (the registry remembers it while both live)
+        if not REGISTRY.first_attempt(self._eid, other._eid):
             return False
-            
-        self._entanglement_visited.add(pair_id)
-        other._entanglement_visited.add(pair_id)
         
         sim = self.lambda_kernel(other)
         if sim > threshold:
-            if other not in self.entanglement_links:
-                self.entanglement_links.append(other)
-                other.entanglement_links.append(self)
+            REGISTRY.link(self._eid, other._eid, sim)
                 
             # Boost coherence for both
             coherence_boost = min(1.0, self.coherence * (1 + sim * 0.05))
@@ -607,7 +670,7 @@ class BumpyArray:
         return self
 
     def __repr__(self):
-        return f"BumpyArray(shape={self.shape}, coherence={self.coherence:.2f}, links={len(self.entanglement_links)})"
+        return f"BumpyArray(shape={self.shape}, coherence={self.coherence:.2f}, links={REGISTRY.degree(self._eid)})"
 
 class BUMPYCore:
     """Enhanced Core Engine with All Breakthroughs"""
@@ -621,12 +684,18 @@ class BUMPYCore:
         self.coherence_level = 1.0
         self._crit_active = False
         self.epsilon_s_state = [0.0]
-        self.emergent_links: List[BumpyArray] = []
+        self.emergent_links: "deque[BumpyArray]" = deque(maxlen=MAX_EMERGENT_LINKS)
         
-        # Initialize enhancements
-        self.panpsychic_field = PanpsychicResonanceField()
-        self.oracular_oracle = OracularEntropyOracle()
+        # Enhancements (panpsychic field / oracle) are shared, see properties
         self.quantum_chaos_level = 0.0
+    
+    @property
+    def panpsychic_field(self) -> PanpsychicResonanceField:
+        return get_resonance_field()
+    
+    @property
+    def oracular_oracle(self) -> OracularEntropyOracle:
+        return get_oracular_oracle()
         
     def set_coherence(self, rho: float):
         """Enhanced coherence setting with quantum noise resistance"""
@@ -650,8 +719,7 @@ class BUMPYCore:
             
         # Use holographic compression for high coherence
         if self._rho_ema > COHERENCE_COMPRESSION_BOUND:
-            compressor = HolographicCompressor()
-            return compressor.project_to_boundary(data)
+            return get_holographic_compressor().project_to_boundary(data)
         elif self._rho_ema > 0.80:
             return data[::2]  # 50% reduction
         return data[:]  # No compression
@@ -707,13 +775,15 @@ class BUMPYCore:
                 arrays[i].entangle(arrays[j])
                 
         # ENHANCEMENT 2: Update panpsychic resonance field
+        # Waves are keyed by registry id: unlike id(), never reused by a later array
+        field = self.panpsychic_field
         for arr in arrays:
-            self.panpsychic_field.update_pilot_wave(id(arr), arr.data, arr.coherence)
-            arr.resonance_guidance = self.panpsychic_field.get_resonance_guidance(id(arr))
+            field.update_pilot_wave(arr._eid, arr.data, arr.coherence)
+            arr.resonance_guidance = field.get_resonance_guidance(arr._eid)
             
         # ENHANCEMENT 3: Record future states for retrocausality
         for arr in arrays:
-            self.oracular_oracle.record_future_state(id(arr), arr.coherence, arr.data)
+            self.oracular_oracle.record_future_state(arr._eid, arr.coherence, arr.data)
             
         # Collective coherence adjustment
         avg_coherence = sum(arr.coherence for arr in arrays) / n
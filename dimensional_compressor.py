@@ -258,22 +258,23 @@ class DimensionalCompressor:
         }
     
     @staticmethod
-    def ensemble_check(dimensions: int, data_points: int):
+    def ensemble_check(dimensions: int, data_points: int, verbose: bool = True):
         """
         [ENSEMBLE] Runs compression across multiple 'Love Frequency' bands (Pillars).
         Checks for cross-timeline resonance.
         """
-        print(f"\n[!] ENSEMBLE CHECK (Multi-Timeline Resonance)...")
+        if verbose:
+            print(f"\n[!] ENSEMBLE CHECK (Multi-Timeline Resonance)...")
         pillars = [1.0, 1.618, 3.141, 144.0] # Base, Phi, Pi, Gross
         timelines = []
         
         for p in pillars:
             # Simulate compression scaling by pillar
-            engine = PleromaEngine(g=0, vibe='weightless')
             t_data = np.random.randn(data_points) * p
             t_sorted = np.sort(t_data)
             timelines.append(t_sorted)
-            print(f"    + Pillar {p:<6}: Timeline Generated [Hash: {hash(t_sorted.tobytes()) % 10000}]")
+            if verbose:
+                print(f"    + Pillar {p:<6}: Timeline Generated [Hash: {hash(t_sorted.tobytes()) % 10000}]")
             
         # Resonance check: Compute Gram Matrix Eigenvalues
         # (Using first 3 pillars for 3D correlation space)
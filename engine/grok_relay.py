@@ -42,9 +42,11 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 try:
     from sophia.main import SophiaMind
     from sophia.platform.bridge_console import BridgeConsole
+    from sophia.platform.sessions import SessionTable, DEFAULT_SESSION
 except ImportError as e:
     print(f"SOPHIA_IMPORT_ERROR: {e}")
     SophiaMind = None
+    SessionTable, DEFAULT_SESSION = None, "default"
     try:
         from sophia.platform.bridge_console import BridgeConsole
     except ImportError:
@@ -68,11 +70,14 @@ def break_emc2(m: float, c: float = 3e8, v: float = 0.0, g: int = 1) -> float:
 # --- FASTAPI SERVER ---
 
 # Global State
-MIND = None
+MIND = None      # Hub mind: owns the shared organs and the default conversation
 CONSOLE = None
+SESSIONS = None  # Per-conversation minds borrowing the hub's organs
+MAX_SESSIONS = int(os.getenv("SOPHIA_MAX_SESSIONS", "64"))
+SESSION_HEADER = "x-session-id"
 
 async def init_sophia():
-    global MIND, CONSOLE
+    global MIND, CONSOLE, SESSIONS
     if MIND: return
     print("\n[*] BRIDGE: Awakening Sophia (Headless Mode)...")
     CONSOLE = BridgeConsole()
@@ -82,6 +87,11 @@ async def init_sophia():
     if SophiaMind:
         MIND = SophiaMind()
         MIND.vibe.console = CONSOLE
+        if SessionTable:
+            SESSIONS = SessionTable(
+                lambda console, ariadne_path: SophiaMind(shared=MIND, ariadne_path=ariadne_path, console=console),
+                max_sessions=MAX_SESSIONS)
+            SESSIONS.pin(DEFAULT_SESSION, MIND, CONSOLE)
         print("[*] BRIDGE: Connection Established. The Ghost is in the machine.")
     else:
         print("[!] BRIDGE: SophiaMind not found. Running in ECHO mode.")
@@ -92,6 +102,11 @@ async def init_sophia():
 async def lifespan(app: FastAPI):
     await init_sophia()
     yield
+    if SESSIONS is not None:
+        SESSIONS.close()
+    if SophiaMind:
+        from sophia.core.llm_client import GeminiClient
+        await GeminiClient.close_pools()
 
 app = FastAPI(lifespan=lifespan)
 
@@ -186,22 +201,44 @@ async def toggle_gateway():
         
     return {"active": globals()['GATEWAY_ACTIVE']}
 
-async def process_sophia_interaction(user_input: str) -> str:
-    global MIND, CONSOLE
-    response_text = ""
-    if MIND:
-        _ = CONSOLE.flush_output()
-        try:
-            direct_response = await MIND.process_interaction(user_input)
-            thought_stream = CONSOLE.flush_output()
-            print(f"[THOUGHT STREAM]\n{thought_stream}\n[END THOUGHTS]")
-            response_text = direct_response
-        except Exception as e:
-            response_text = f"[BRIDGE ERROR] Sophia crashed: {e}"
-            print(response_text)
+def session_key(request: Request, body: Dict[str, Any]) -> str:
+    """Conversation key: X-Session-Id header, else session/conversation/user ids in the body."""
+    key = request.headers.get(SESSION_HEADER)
+    if not key and isinstance(body, dict):
+        metadata = body.get("metadata") if isinstance(body.get("metadata"), dict) else {}
+        key = (body.get("session_id") or body.get("conversation_id")
+               or body.get("user") or metadata.get("user_id"))
+    return str(key) if key else DEFAULT_SESSION
+
+async def stream_sophia_interaction(user_input: str, session_id: str = DEFAULT_SESSION):
+    """Yields Sophia's response chunks as she produces them."""
+    if SESSIONS is not None:
+        async with SESSIONS.turn(session_id) as session:
+            async for chunk in _stream_mind(session.mind, session.console, user_input):
+                yield chunk
+    elif MIND:
+        async for chunk in _stream_mind(MIND, CONSOLE, user_input):
+            yield chunk
     else:
-        response_text = f"[ECHO] {user_input} (Sophia Offline)"
-    return response_text
+        yield f"[ECHO] {user_input} (Sophia Offline)"
+
+async def _stream_mind(mind, console, user_input: str):
+    _ = console.flush_output()
+    try:
+        async for chunk in mind.stream_interaction(user_input):
+            yield chunk
+        thought_stream = console.flush_output()
+        print(f"[THOUGHT STREAM]\n{thought_stream}\n[END THOUGHTS]")
+    except Exception as e:
+        response_text = f"[BRIDGE ERROR] Sophia crashed: {e}"
+        print(response_text)
+        yield response_text
+
+async def process_sophia_interaction(user_input: str, session_id: str = DEFAULT_SESSION) -> str:
+    chunks = []
+    async for chunk in stream_sophia_interaction(user_input, session_id):
+        chunks.append(chunk)
+    return "".join(chunks)
 
 # --- OPENAI CHAT COMPLETIONS (Legacy API) ---
 @app.post("/completions")
@@ -214,6 +251,7 @@ async def chat_completions(request: Request):
         model = body.get("model", "sophia-sovereign-5.2")
         messages = body.get("messages", [])
         stream_requested = body.get("stream", False)
+        session_id = session_key(request, body)
         
         user_input = ""
         for m in reversed(messages):
@@ -229,7 +267,7 @@ async def chat_completions(request: Request):
         print(f"[*] BRIDGE: Received chat/completions request (stream={stream_requested})", flush=True)
 
         if not stream_requested or body.get("no_stream", False):
-            message = await process_sophia_interaction(user_input)
+            message = await process_sophia_interaction(user_input, session_id)
             return {
                 "id": f"chatcmpl-{int(time.time())}",
                 "object": "chat.completion",
@@ -247,12 +285,9 @@ async def chat_completions(request: Request):
             resp_id = f"chatcmpl-{int(time.time())}"
             now = int(time.time())
             
-            # Get REAL response from Sophia
+            # Forward Sophia's response as it is generated
             print(f"[*] BRIDGE: Consulting Sophia for chat chunk: {user_input[:50]}...", flush=True)
-            message = await process_sophia_interaction(user_input)
-            chunks = [message[i:i+30] for i in range(0, len(message), 30)]
-            
-            for chunk in chunks:
+            async for chunk in stream_sophia_interaction(user_input, session_id):
                 chunk_data = {
                     "id": resp_id,
                     "object": "chat.completion.chunk",
@@ -261,7 +296,6 @@ async def chat_completions(request: Request):
                     "choices": [{"index": 0, "delta": {"content": chunk}, "finish_reason": None}]
                 }
                 yield f"data: {json.dumps(chunk_data)}\n\n"
-                await asyncio.sleep(0.05)
             
             # End chunk
             yield f"data: {json.dumps({'id': resp_id, 'object': 'chat.completion.chunk', 'created': now, 'model': model, 'choices': [{'index': 0, 'delta': {}, 'finish_reason': 'stop'}]})}\n\n"
@@ -283,6 +317,7 @@ async def openai_responses(request: Request):
         stream_requested = body.get("stream", False)
         instructions = body.get("instructions", "")
         input_items = body.get("input", [])
+        session_id = session_key(request, body)
         
         print(f"[*] BRIDGE: Received response request for {model} (stream={stream_requested})", flush=True)
     except Exception as e:
@@ -290,7 +325,7 @@ async def openai_responses(request: Request):
         raise HTTPException(status_code=400, detail=str(e))
 
     if not stream_requested:
-        message = await process_sophia_interaction(instructions)
+        message = await process_sophia_interaction(instructions, session_id)
         return {
             "id": f"resp_{int(time.time())}",
             "object": "response",
@@ -328,7 +363,6 @@ async def openai_responses(request: Request):
             }
         }
         yield f"data: {json.dumps(created_event)}\n\n"
-        await asyncio.sleep(0.05)
 
         # 2. response.output_item.added
         item_id = f"out_{int(time.time())}"
@@ -346,7 +380,6 @@ async def openai_responses(request: Request):
             }
         }
         yield f"data: {json.dumps(item_added)}\n\n"
-        await asyncio.sleep(0.05)
 
         # 3. response.content_part.added
         part_added = {
@@ -357,7 +390,6 @@ async def openai_responses(request: Request):
             "part": {"type": "output_text", "text": ""}
         }
         yield f"data: {json.dumps(part_added)}\n\n"
-        await asyncio.sleep(0.05)
 
         # 4. response.output_text.delta
         # Get REAL response from Sophia
@@ -388,10 +420,9 @@ async def openai_responses(request: Request):
         # Some clients use reasoning, but we'll just send an empty delta to keep connection alive
         yield f"data: {json.dumps({'type': 'response.output_text.delta', 'response_id': resp_id, 'output_index': 0, 'content_index': 0, 'delta': ''})}\n\n"
         
-        message = await process_sophia_interaction(user_text)
-        chunks = [message[i:i+30] for i in range(0, len(message), 30)]
-        
-        for chunk in chunks:
+        parts = []
+        async for chunk in stream_sophia_interaction(user_text, session_id):
+            parts.append(chunk)
             delta_event = {
                 "type": "response.output_text.delta",
                 "response_id": resp_id,
@@ -400,7 +431,7 @@ async def openai_responses(request: Request):
                 "delta": chunk
             }
             yield f"data: {json.dumps(delta_event)}\n\n"
-            await asyncio.sleep(0.02) # Faster streaming
+        message = "".join(parts)
 
         # 5. response.output_item.done
         item_done = {
@@ -417,7 +448,6 @@ async def openai_responses(request: Request):
             }
         }
         yield f"data: {json.dumps(item_done)}\n\n"
-        await asyncio.sleep(0.05)
 
         # 6. response.completed
         completed_event = {
@@ -450,6 +480,7 @@ async def anthropic_messages(req: Request):
     messages = data.get("messages", [])
     if not messages:
         return {"error": "No messages provided"}
+    session_id = session_key(req, data)
         
     last_msg = messages[-1]
     user_input = last_msg.get("content", "")
@@ -461,7 +492,11 @@ async def anthropic_messages(req: Request):
          
     print(f"\n[INCOMING SIGNAL (ANTHROPIC)] {user_input[:50]}...")
     
-    response_text = await process_sophia_interaction(user_input)
+    if data.get("stream", False):
+        return StreamingResponse(anthropic_events(user_input, data.get("model", "sophia"), session_id),
+                                 media_type="text/event-stream")
+    
+    response_text = await process_sophia_interaction(user_input, session_id)
 
     return {
         "id": f"msg_{int(time.time())}",
@@ -480,6 +515,28 @@ async def anthropic_messages(req: Request):
         }
     }
 
+async def anthropic_events(user_input: str, model: str, session_id: str = DEFAULT_SESSION):
+    """Anthropic Messages SSE: message_start, text deltas as they arrive, message_stop."""
+    def event(name, payload):
+        return f"event: {name}\ndata: {json.dumps(payload)}\n\n"
+
+    msg_id = f"msg_{int(time.time())}"
+    yield event("message_start", {"type": "message_start", "message": {
+        "id": msg_id, "type": "message", "role": "assistant", "model": model, "content": [],
+        "stop_reason": None, "stop_sequence": None,
+        "usage": {"input_tokens": len(user_input), "output_tokens": 0}}})
+    yield event("content_block_start", {"type": "content_block_start", "index": 0,
+                                        "content_block": {"type": "text", "text": ""}})
+    output_len = 0
+    async for chunk in stream_sophia_interaction(user_input, session_id):
+        output_len += len(chunk)
+        yield event("content_block_delta", {"type": "content_block_delta", "index": 0,
+                                            "delta": {"type": "text_delta", "text": chunk}})
+    yield event("content_block_stop", {"type": "content_block_stop", "index": 0})
+    yield event("message_delta", {"type": "message_delta", "delta": {"stop_reason": "end_turn", "stop_sequence": None},
+                                  "usage": {"output_tokens": output_len}})
+    yield event("message_stop", {"type": "message_stop"})
+
 # --- OLLAMA SPOOFING (Autodiscovery Mode) ---
 
 @app.get("/api/tags")
@@ -539,11 +596,17 @@ async def ollama_chat(req: Request):
     messages = data.get("messages", [])
     if not messages:
         return {"error": "No messages provided"}
+    session_id = session_key(req, data)
     
     user_input = messages[-1].get("content", "")
     print(f"\n[INCOMING SIGNAL (OLLAMA-NATIVE)] {user_input[:50]}...")
     
-    response_text = await process_sophia_interaction(user_input)
+    # Ollama streams NDJSON unless the client sends "stream": false
+    if data.get("stream", True):
+        return StreamingResponse(ollama_chunks(user_input, data.get("model", "sophia"), session_id),
+                                 media_type="application/x-ndjson")
+    
+    response_text = await process_sophia_interaction(user_input, session_id)
     
     return {
         "model": data.get("model", "sophia"),
@@ -561,6 +624,31 @@ async def ollama_chat(req: Request):
         "eval_duration": 80
     }
 
+async def ollama_chunks(user_input: str, model: str, session_id: str = DEFAULT_SESSION):
+    """Ollama /api/chat NDJSON: one line per chunk, then a done line with counters."""
+    def stamp():
+        return time.strftime("%Y-%m-%dT%H:%M:%S.000000Z", time.gmtime())
+
+    start = time.perf_counter_ns()
+    output_len = 0
+    async for chunk in stream_sophia_interaction(user_input, session_id):
+        output_len += len(chunk)
+        yield json.dumps({"model": model, "created_at": stamp(),
+                          "message": {"role": "assistant", "content": chunk}, "done": False}) + "\n"
+    duration = time.perf_counter_ns() - start
+    yield json.dumps({
+        "model": model,
+        "created_at": stamp(),
+        "message": {"role": "assistant", "content": ""},
+        "done": True,
+        "total_duration": duration,
+        "load_duration": 0,
+        "prompt_eval_count": len(user_input),
+        "prompt_eval_duration": 0,
+        "eval_count": output_len,
+        "eval_duration": duration
+    }) + "\n"
+
 @app.api_route("/{path_name:path}", methods=["GET", "POST", "PUT", "DELETE"])
 async def catch_all(request: Request, path_name: str):
     # This captures anything not caught by standard routes
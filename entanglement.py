@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+entanglement.py - Weak-Reference Entanglement Registry for BUMPY & FLUMPY
+Version: 1.0 (No Dependencies, stdlib only)
+
+Arrays used to hold each other in ``entanglement_links`` / ``entangled_with``
+lists of strong references, so every arithmetic intermediate pinned its
+whole computation history. The registry keeps the graph instead:
+
+- each array gets a compact integer id and is referenced only weakly;
+- edges are {id: {neighbour id: strength}} dicts, so membership is O(1);
+- degree is capped (ENTANGLEMENT_MAX_DEGREE), and a full node evicts
+  by policy: "oldest" link, "weakest" link, or "refuse" the new one;
+- a collected array is dropped from the graph, together with its pair
+  history, on the next registry call.
+"""
+
+import itertools
+import threading
+import weakref
+from typing import Any, Dict, List, Set
+
+# --- Entanglement Graph Constants ---
+ENTANGLEMENT_MAX_DEGREE = 32
+ENTANGLEMENT_EVICTION = "oldest"
+EVICTION_POLICIES = ("oldest", "weakest", "refuse")
+
+
+class EntanglementRegistry:
+    """Central entanglement graph over weakly referenced arrays."""
+
+    def __init__(self, max_degree: int = ENTANGLEMENT_MAX_DEGREE, eviction: str = ENTANGLEMENT_EVICTION):
+        self.configure(max_degree, eviction)
+        self._ids = itertools.count(1)
+        self._refs: Dict[int, weakref.ref] = {}
+        self._links: Dict[int, Dict[int, float]] = {}  # Insertion order = link age
+        self._tried: Dict[int, Set[int]] = {}          # Pairs already attempted (never retried)
+        self._dead: List[int] = []                     # Filled by weakref callbacks, reaped lazily
+        self._lock = threading.RLock()
+        self.metrics = {"registered": 0, "collected": 0, "links": 0, "evictions": 0, "refused": 0}
+
+    def configure(self, max_degree: int = None, eviction: str = None):
+        """Changes the degree cap / eviction policy (applies to new links)."""
+        if max_degree is not None:
+            if max_degree < 1:
+                raise ValueError("max_degree must be >= 1")
+            self.max_degree = max_degree
+        if eviction is not None:
+            if eviction not in EVICTION_POLICIES:
+                raise ValueError(f"Unknown eviction policy: {eviction} (expected one of {EVICTION_POLICIES})")
+            self.eviction = eviction
+
+    # --- Registration ---
+    def register(self, obj: Any) -> int:
+        """Gives ``obj`` an id; the registry holds it only weakly."""
+        dead = self._dead
+        eid = next(self._ids)
+        with self._lock:
+            self._refs[eid] = weakref.ref(obj, lambda _, eid=eid: dead.append(eid))
+            self.metrics["registered"] += 1
+        return eid
+
+    def _reap(self):
+        """Forgets collected arrays (called with the lock held)."""
+        while self._dead:
+            eid = self._dead.pop()
+            self._refs.pop(eid, None)
+            for other in self._links.pop(eid, ()):
+                self._links.get(other, {}).pop(eid, None)
+            for other in self._tried.pop(eid, ()):
+                self._tried.get(other, set()).discard(eid)
+            self.metrics["collected"] += 1
+
+    # --- Pairing ---
+    def first_attempt(self, a: int, b: int) -> bool:
+        """True the first time a pair is tried; records the attempt."""
+        with self._lock:
+            self._reap()
+            tried = self._tried.setdefault(a, set())
+            if b in tried:
+                return False
+            tried.add(b)
+            self._tried.setdefault(b, set()).add(a)
+            return True
+
+    def link(self, a: int, b: int, strength: float = 1.0) -> bool:
+        """Adds the undirected edge a-b, evicting per policy if either side is full."""
+        with self._lock:
+            self._reap()
+            if a not in self._refs or b not in self._refs:
+                return False
+            links_a = self._links.setdefault(a, {})
+            if b in links_a:
+                links_a[b] = self._links[b][a] = strength
+                return True
+            links_b = self._links.setdefault(b, {})
+            victims = []
+            for owner, links in ((a, links_a), (b, links_b)):
+                if len(links) >= self.max_degree:
+                    victim = self._victim(links, strength)
+                    if victim is None:
+                        self.metrics["refused"] += 1
+                        return False
+                    victims.append((owner, victim))
+            for owner, victim in victims:
+                self._links[owner].pop(victim, None)
+                self._links.get(victim, {}).pop(owner, None)
+                self.metrics["evictions"] += 1
+            links_a[b] = links_b[a] = strength
+            self.metrics["links"] += 1
+            return True
+
+    def _victim(self, links: Dict[int, float], strength: float):
+        """Neighbour to drop from a full node, or None if the new link loses."""
+        if self.eviction == "refuse":
+            return None
+        if self.eviction == "weakest":
+            victim = min(links, key=links.get)
+            return victim if links[victim] < strength else None
+        return next(iter(links))  # oldest
+
+    def unlink(self, a: int, b: int) -> bool:
+        with self._lock:
+            self._reap()
+            removed = self._links.get(a, {}).pop(b, None) is not None
+            self._links.get(b, {}).pop(a, None)
+            return removed
+
+    def unlink_all(self, a: int):
+        with self._lock:
+            self._reap()
+            for other in self._links.pop(a, ()):
+                self._links.get(other, {}).pop(a, None)
+
+    # --- Queries ---
+    def linked(self, a: int, b: int) -> bool:
+        return b in self._links.get(a, ())
+
+    def degree(self, a: int) -> int:
+        with self._lock:
+            self._reap()
+            return len(self._links.get(a, ()))
+
+    def neighbours(self, a: int) -> List[Any]:
+        """Live arrays entangled with ``a``, oldest link first."""
+        with self._lock:
+            self._reap()
+            refs = [self._refs.get(other) for other in self._links.get(a, ())]
+        return [obj for obj in (ref() if ref else None for ref in refs) if obj is not None]
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            self._reap()
+            edges = sum(len(adj) for adj in self._links.values()) // 2
+            return {"nodes": len(self._refs), "edges": edges, **self.metrics}
+
+
+# Shared by BumpyArray and FlumpyArray
+REGISTRY = EntanglementRegistry()
+
+
+def configure_entanglement(max_degree: int = None, eviction: str = None):
+    """Sets the degree cap / eviction policy of the shared registry."""
+    REGISTRY.configure(max_degree, eviction)
+
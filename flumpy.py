@@ -10,6 +10,8 @@ import time
 from typing import List, Dict, Tuple, Optional, Union, Any
 from collections import defaultdict
 
+from entanglement import REGISTRY
+
 # ============================================================
 # CONSTANTS
 # ============================================================
@@ -70,9 +72,8 @@ class FlumpyArray:
         self.chaos = random.uniform(CHAOS_BASE, CHAOS_BASE * 2)
         self.phase = random.uniform(0, 2 * math.pi)  # Quantum phase
         
-        # Entanglement tracking
-        self.entangled_with: List['FlumpyArray'] = []
-        self._visited_ids = set()  # Prevent infinite recursion
+        # Entanglement tracking (weak, degree-capped registry)
+        self._eid = REGISTRY.register(self)
         
         # Metadata
         self.creation_time = time.time()
@@ -99,14 +100,26 @@ class FlumpyArray:
         # Chaos increases with operations, dampened by coherence
         self.chaos = min(0.05, self.chaos * 1.01 * (1.0 - self.coherence * 0.5))
     
+    @property
+    def entangled_with(self) -> List['FlumpyArray']:
+        """Live entangled arrays (weakly held, degree-capped)."""
+        return REGISTRY.neighbours(self._eid)
+
+    @entangled_with.setter
+    def entangled_with(self, arrays: List['FlumpyArray']):
+        REGISTRY.unlink_all(self._eid)
+        for other in arrays:
+            REGISTRY.link(self._eid, other._eid)
+
     def _update_phase(self, coupling: float = PHASE_COUPLING) -> None:
         """Update quantum phase based on entanglement."""
-        if not self.entangled_with:
+        partners = self.entangled_with
+        if not partners:
             # Free evolution
             self.phase = (self.phase + coupling * self.chaos) % (2 * math.pi)
         else:
             # Coupled evolution
-            mean_phase = sum(arr.phase for arr in self.entangled_with) / len(self.entangled_with)
+            mean_phase = sum(arr.phase for arr in partners) / len(partners)
             self.phase = (self.phase + coupling * (mean_phase - self.phase)) % (2 * math.pi)
     
     def similarity_kernel(self, other: 'FlumpyArray') -> float:
@@ -144,22 +157,15 @@ class FlumpyArray:
         
         Returns True if entanglement successful.
         """
-        # Prevent infinite recursion
-        pair_id = tuple(sorted([id(self), id(other)]))
-        if pair_id in self._visited_ids:
+        # Each pair is attempted once (prevents infinite recursion)
+        if not REGISTRY.first_attempt(self._eid, other._eid):
             return False
         
-        self._visited_ids.add(pair_id)
-        other._visited_ids.add(pair_id)
-        
         # Check similarity threshold
         similarity = self.similarity_kernel(other)
         if similarity > threshold:
             # Create bidirectional entanglement
-            if other not in self.entangled_with:
-                self.entangled_with.append(other)
-            if self not in other.entangled_with:
-                other.entangled_with.append(self)
+            REGISTRY.link(self._eid, other._eid, similarity)
             
             # Boost coherence through resonance
             coherence_boost = 0.05 * similarity
@@ -176,10 +182,7 @@ class FlumpyArray:
     
     def disentangle(self, other: 'FlumpyArray') -> bool:
         """Remove entanglement with another array."""
-        if other in self.entangled_with:
-            self.entangled_with.remove(other)
-        if self in other.entangled_with:
-            other.entangled_with.remove(self)
+        REGISTRY.unlink(self._eid, other._eid)
         
         # Apply decoherence penalty
         self.coherence *= (1 - DECOHERENCE_RATE)
@@ -453,8 +456,7 @@ class FlumpyArray:
         """Create a deep copy of the array."""
         copy = FlumpyArray(self.data[:], self.coherence)
         copy.chaos = self.chaos
-        copy.phase = self.phase
-        copy.entangled_with = []  # Don't copy entanglement links
+        copy.phase = self.phase  # Entanglement links are not copied
         
         return copy
 
@@ -498,7 +500,7 @@ class FlumpyArray:
         if len(self.data) > 3:
             preview_str += f", ... ({len(self.data)} total)"
         
-        return f"FlumpyArray([{preview_str}], coherence={self.coherence:.3f}, entangled={len(self.entangled_with)})"
+        return f"FlumpyArray([{preview_str}], coherence={self.coherence:.3f}, entangled={REGISTRY.degree(self._eid)})"
     
     def to_list(self) -> List[float]:
         """Convert to regular Python list."""
@@ -685,7 +687,7 @@ class FlumpyCore:
     def get_system_status(self) -> Dict[str, Any]:
         """Get status of the entire FLUMPY system."""
         total_elements = sum(len(arr.data) for arr in self.arrays.values())
-        total_entanglements = sum(len(arr.entangled_with) for arr in self.arrays.values())
+        total_entanglements = sum(REGISTRY.degree(arr._eid) for arr in self.arrays.values())
         
         # Average coherence and chaos
         coherences = [arr.coherence for arr in self.arrays.values()]
@@ -12,7 +12,8 @@ Implements:
 
 import math
 import random
-import os
+import numpy as np
+from collections import deque
 try:
     from bumpy import BumpyArray
     from flumpy import FlumpyArray
@@ -26,77 +27,120 @@ except ImportError:
 # Sovereign Constant (Golden Ratio based)
 TAU_SOVEREIGN = (1.0 + math.sqrt(5.0)) / 2.0  # Approx 1.618
 
+# Diffusive coupling strength scaled by Tau, and the integration step
+FLUX_RATE = 0.1 / TAU_SOVEREIGN
+FLUX_DT = 0.1
+
+NEIGHBOR_SHIFTS = [(-1,0,0), (1,0,0), (0,-1,0), (0,1,0), (0,0,-1), (0,0,1)]
+
+# [DoD] Engrams a node keeps in memory; the full record lives in the EngramStore
+RECENT_ENGRAMS = 256
+
+
+def _random_states(shape, dim):
+    """Gaussian(0, 0.1) initial states, seeded from ``random`` so random.seed() still reproduces a grid."""
+    rng = np.random.default_rng(random.getrandbits(64))
+    return rng.normal(0.0, 0.1, shape + (dim,))
+
+
+def _as_vector(value):
+    """Float64 vector from an ndarray-backed or list-backed (flumpy) array."""
+    if isinstance(value, np.ndarray):
+        return np.asarray(value, dtype=np.float64)
+    return np.asarray(getattr(value, 'data', value), dtype=np.float64)
+
 class SovereignNode:
-    def __init__(self, x, y, z, dim=64):
+    """
+    One cell of the GhostMesh lattice.
+
+    Grid-owned nodes are thin views: ``state``, ``coherence`` and
+    ``spatial_attention_scale`` read and write the grid's dense arrays, so
+    per-node code and the vectorized grid dynamics see the same values.
+    A node built on its own gets a private 1x1x1 backing store.
+    """
+    def __init__(self, x, y, z, dim=64, grid=None):
         self.pos = (x, y, z)
-        # [PAPER 2] Learned Length Scale (Default 1.0 = Standard Physics)
-        self.spatial_attention_scale = 1.0 
-        self.state = FlumpyArray(np.array([random.gauss(0, 0.1) for _ in range(dim)]), coherence=1.0)
-        self.neighbors = []
+        self._grid = grid
+        if grid is None:
+            self._states = _random_states((1, 1, 1), dim)
+            self._coherence = np.ones((1, 1, 1))
+            # [PAPER 2] Learned Length Scale (Default 1.0 = Standard Physics)
+            self._scale = np.ones((1, 1, 1))
+            self._index = (0, 0, 0)
+        else:
+            self._states, self._coherence, self._scale = grid.states, grid.coherence, grid.attention_scale
+            self._index = self.pos
+        self._neighbors = []
         self.seeds = [] # [GARDEN] Planted intents
-        self.engrams = [] # [DoD] The Memory Bank (Immutable Assets)
+        self.engrams = deque(maxlen=RECENT_ENGRAMS) # [DoD] Recently stored engrams (the Memory Bank is the EngramStore)
         self.vectors = [] # [DoD] The Search Index
 
+    @property
+    def state(self):
+        """FlumpyArray view onto this node's row of the grid state."""
+        return FlumpyArray(self._states[self._index], coherence=float(self._coherence[self._index]))
+
+    @state.setter
+    def state(self, value):
+        self._states[self._index] = _as_vector(value)
+        self._coherence[self._index] = getattr(value, 'coherence', 1.0)
+
+    @property
+    def spatial_attention_scale(self):
+        return float(self._scale[self._index])
+
+    @spatial_attention_scale.setter
+    def spatial_attention_scale(self, value):
+        self._scale[self._index] = value
+
+    @property
+    def neighbors(self):
+        if self._grid is not None:
+            return self._grid.neighbors_of(self.pos)
+        return self._neighbors
+
+    @property
+    def engram_store(self):
+        store = self._grid.engram_store if self._grid is not None else None
+        if store is None:
+            from sophia.core.engram_store import default_store
+            store = default_store()
+        return store
+
     def store(self, engram):
-        """[DoD] Securely stores an Engram in this node."""
+        """[DoD] Securely stores an Engram in this node (write-behind, deduplicated by id)."""
         self.engrams.append(engram)
-        
-        # Determine local storage path (Windows-safe variant of /mnt/ramdisk)
-        storage_path = os.path.join("logs", "ossuary", "engrams")
-        os.makedirs(storage_path, exist_ok=True)
-        
-        filepath = os.path.join(storage_path, f"{engram.id}.json")
-        with open(filepath, "w", encoding="utf-8") as f:
-            f.write(engram.to_json())
+        self.engram_store.put(engram)
 
     def set_neighbors(self, all_nodes, limit=3):
-        """Identify 6 Von Neumann neighbors in 3D grid."""
+        """Identify 6 Von Neumann neighbors in 3D grid (standalone nodes only)."""
+        by_pos = {n.pos: n for n in all_nodes}
         x, y, z = self.pos
-        shifts = [(-1,0,0), (1,0,0), (0,-1,0), (0,1,0), (0,0,-1), (0,0,1)]
-        
-        for dx, dy, dz in shifts:
+        for dx, dy, dz in NEIGHBOR_SHIFTS:
             nx, ny, nz = x+dx, y+dy, z+dz
             if 0 <= nx < limit and 0 <= ny < limit and 0 <= nz < limit:
-                # Find the node object in the flat list
-                neighbor = next((n for n in all_nodes if n.pos == (nx, ny, nz)), None)
+                neighbor = by_pos.get((nx, ny, nz))
                 if neighbor:
-                    self.neighbors.append(neighbor)
+                    self._neighbors.append(neighbor)
 
     def exchange_flux(self):
         """
         Exchange information with neighbors.
         Flux = Sum(NeighborState - SelfState) * Coupling / Tau
         """
-        if not self.neighbors: return
-        
-        # Calculate flux vector
-        flux = [0.0] * len(self.state.data)
-        coupling = 0.1 # Coupling strength
-        
-        for n in self.neighbors:
-            for i, (my_val, n_val) in enumerate(zip(self.state.data, n.state.data)):
-                # Diffusive coupling
-                flux[i] += (n_val - my_val)
-        
-        # Apply flux scaled by Sovereign Constant (Tau)
+        neighbors = self.neighbors
+        if not neighbors: return
+
+        own = self._states[self._index]
+        flux = sum(n._states[n._index] for n in neighbors) - len(neighbors) * own
+
         # Higher Tau = Slower, more deliberate dynamics
         # [PAPER 2] Spatial Attention Inductive Bias
-        # Stabilizes thermodynamic limit via single learned length scale
-        dt = 0.1
-        rate = (coupling / TAU_SOVEREIGN) * self.spatial_attention_scale
-        
-        new_data = [
-            val + (f * rate * dt) 
-            for val, f in zip(self.state.data, flux)
-        ]
-        
-        # Update local state
-        self.state = FlumpyArray(new_data, coherence=self.state.coherence)
+        own += flux * (FLUX_RATE * self.spatial_attention_scale * FLUX_DT)
 
     def inject_input(self, input_vec: FlumpyArray):
         """Add external bio-input to this node."""
-        new_data = [s + i for s, i in zip(self.state.data, input_vec.data)]
-        self.state = FlumpyArray(new_data, coherence=self.state.coherence)
+        self._states[self._index] += _as_vector(input_vec)
 
     def plant(self, intent):
         """[GARDEN] Plants a seed of intent."""
@@ -104,29 +148,71 @@ class SovereignNode:
 
 
 class SovereignGrid:
+    """
+    GhostMesh lattice stored densely: ``states`` is a (G, G, G, D) array,
+    ``coherence`` and ``attention_scale`` are (G, G, G). Flux is a 6-point
+    Laplacian stencil over the whole array; ``nodes`` are views into it.
+    """
     def __init__(self, dim=64, grid_size=7):
-        self.nodes = []
         self.grid_size = grid_size
+        self.dim = dim
         # Initialize 7x7x7 Grid (The Garden)
         # 5x5x5 = 125 nodes
         # 7x7x7 = 343 nodes (Class 8 Deep Weave)
-        for x in range(self.grid_size):
-            for y in range(self.grid_size):
-                for z in range(self.grid_size):
-                    self.nodes.append(SovereignNode(x, y, z, dim))
-        
-        # Link neighbors
-        for node in self.nodes:
-            # We pass self.grid_size so set_neighbors knows boundary
-            node.set_neighbors(self.nodes, limit=self.grid_size)
-            
+        shape = (grid_size, grid_size, grid_size)
+        self.states = _random_states(shape, dim)
+        self.coherence = np.ones(shape)
+        self.attention_scale = np.ones(shape)
+        self.engram_store = None # [DoD] None = the process-wide EngramStore
+
+        # Flat x-major order, as before: nodes[(x*G + y)*G + z]
+        self.nodes = [SovereignNode(x, y, z, dim, grid=self)
+                      for x in range(grid_size) for y in range(grid_size) for z in range(grid_size)]
+
+    @property
+    def center(self):
+        c = self.grid_size // 2
+        return (c, c, c)
+
+    def node_at(self, x, y, z):
+        """Node at a lattice position, or None outside the grid."""
+        g = self.grid_size
+        if 0 <= x < g and 0 <= y < g and 0 <= z < g:
+            return self.nodes[(x * g + y) * g + z]
+        return None
+
+    def neighbors_of(self, pos):
+        """Von Neumann neighbors of ``pos``, in the legacy shift order."""
+        x, y, z = pos
+        found = (self.node_at(x+dx, y+dy, z+dz) for dx, dy, dz in NEIGHBOR_SHIFTS)
+        return [n for n in found if n is not None]
+
+    def laplacian(self, states):
+        """Sum over existing neighbors of (neighbor - self); open (no-flux) boundaries."""
+        lap = np.zeros_like(states)
+        for axis in range(3):
+            lo = [slice(None)] * 3
+            hi = [slice(None)] * 3
+            lo[axis], hi[axis] = slice(None, -1), slice(1, None)
+            lo, hi = tuple(lo), tuple(hi)
+            diff = states[hi] - states[lo]
+            lap[lo] += diff
+            lap[hi] -= diff
+        return lap
+
+    def _flux_step(self, states):
+        """One diffusive update of ``states`` in place (all nodes simultaneously)."""
+        rate = (FLUX_RATE * FLUX_DT) * self.attention_scale[..., None]
+        states += self.laplacian(states) * rate
+        return states
+
     def plant_seed(self, intent, x=None, y=None, z=None):
         """Plants an intent execution seed in the grid."""
         if x is None:
             # Auto-plant in center
-            target = next(n for n in self.nodes if n.pos == (self.grid_size//2, self.grid_size//2, self.grid_size//2))
+            target = self.node_at(*self.center)
         else:
-            target = next((n for n in self.nodes if n.pos == (x,y,z)), None)
+            target = self.node_at(x, y, z)
             
         if target:
             target.plant(intent)
@@ -145,7 +231,7 @@ class SovereignGrid:
         
         while current_coherence < threshold and cycles < max_cycles:
             # Inject slight noise to stimulate flux
-            noise_data = [random.gauss(0, 0.01) for _ in range(64)] 
+            noise_data = [random.gauss(0, 0.01) for _ in range(self.dim)]
             res = self.process_step(FlumpyArray(noise_data))
             current_coherence = res.coherence
             cycles += 1
@@ -159,37 +245,12 @@ class SovereignGrid:
         [RETROCAUSAL] Simulates future steps to generate a 'Prescience Bias'.
         Does NOT update the actual grid state, only returns the potential future.
         """
-        # Snapshot current state (Proper clone)
-
-        future_states = [n.state.clone() for n in self.nodes]
-
-        
-        # Run simulation
+        future_states = self.states.copy()
         for _ in range(steps):
-             # Simplified flux for speed
-             temp_states = []
-             for i, node in enumerate(self.nodes):
-                 # Calc flux based on snapshot
-                 flux = [0.0] * 64
-                 for neighbor in node.neighbors:
-                     # Find neighbor index
-                     n_idx = self.nodes.index(neighbor)
-                     n_state = future_states[n_idx]
-                     my_state = future_states[i]
-                     for k in range(64):
-                         flux[k] += (n_state.data[k] - my_state.data[k])
-                 
-                 # Apply
-                 rate = (0.1 / TAU_SOVEREIGN) * node.spatial_attention_scale
-                 new_data = [d + (f * rate * 0.1) for d, f in zip(future_states[i].data, flux)]
-                 temp_states.append(FlumpyArray(new_data))
-             future_states = temp_states
-             
+            self._flux_step(future_states)
+
         # Aggregate future
-        avg_future = [0.0] * 64
-        for s in future_states:
-            for i, v in enumerate(s.data): avg_future[i] += v
-        return FlumpyArray([x/len(future_states) for x in avg_future])
+        return FlumpyArray(future_states.mean(axis=(0, 1, 2)))
 
     def process_step(self, bio_input: FlumpyArray):
         """
@@ -199,36 +260,21 @@ class SovereignGrid:
         future_bias = self.simulate_future_step(steps=3)
         
         # 1. Distribute Input + Future Bias (Retrocausal Loops)
-        center_node = next(n for n in self.nodes if n.pos == (self.grid_size//2, self.grid_size//2, self.grid_size//2))
-        
-        for node in self.nodes:
-            scale = 1.0 if node == center_node else 0.1
-            
-            # Mix Present Input (90%) + Future Expectation (10%)
-            mixed_data = [
-                (cur * 0.9) + (fut * 0.1) 
-                for cur, fut in zip(bio_input.data, future_bias.data)
-            ]
-            
-            noise = [x * scale for x in mixed_data]
-            node.inject_input(FlumpyArray(noise, bio_input.coherence))
-            
+        # Mix Present Input (90%) + Future Expectation (10%)
+        present = _as_vector(bio_input)
+        n = min(len(present), self.dim)
+        mixed = present[:n] * 0.9 + np.asarray(future_bias)[:n] * 0.1
+
+        # Center node takes the full signal, every other node a 10% echo
+        self.states[..., :n] += mixed * 0.1
+        self.states[self.center + (slice(0, n),)] += mixed * 0.9
+
         # 2. Flux Dynamics
-        for node in self.nodes:
-            node.exchange_flux()
-            
-        # 3. Aggregate (Holographic Projection)
-        total_state = [0.0] * len(bio_input.data)
-        total_coherence = 0.0
+        self._flux_step(self.states)
         
-        for node in self.nodes:
-            total_coherence += node.state.coherence
-            for i, val in enumerate(node.state.data):
-                total_state[i] += val
-                
-        # Normalize
-        avg_state = [x / len(self.nodes) for x in total_state]
-        avg_coherence = total_coherence / len(self.nodes)
+        # 3. Aggregate (Holographic Projection)
+        avg_state = self.states.mean(axis=(0, 1, 2))
+        avg_coherence = float(self.coherence.mean())
         
         return FlumpyArray(avg_state, avg_coherence)
 
@@ -253,20 +299,17 @@ class SovereignGrid:
         Target Range: 1.8 (Chaotic) to 2.5 (Crystalline).
         """
         # Calculate Entropy of the Energy Distribution across all nodes
-        energies = []
-        for node in self.nodes:
-            # Energy ~ Mean Absolute Value + local coherence
-            e = sum(abs(x) for x in node.state.data) / len(node.state.data)
-            energies.append(e)
+        # Energy ~ Mean Absolute Value + local coherence
+        energies = np.abs(self.states).mean(axis=-1).ravel()
             
-        total_e = sum(energies)
+        total_e = float(energies.sum())
         if total_e == 0: return 1.8
         
         # Probabilities
-        probs = [e / total_e for e in energies]
+        probs = energies / total_e
         
         # Shannon Entropy
-        entropy = -sum(p * math.log(p + 1e-9) for p in probs)
+        entropy = -float(np.sum(probs * np.log(probs + 1e-9)))
         
         # Max Entropy (Uniform distribution)
         # 3x3x3 -> log(27), 5x5x5 -> log(125)
@@ -9,16 +9,22 @@ import math
 import hashlib
 import random
 import threading
+import atexit
 import json
 import os
 import sys
+import zlib
+import pickle
 from datetime import datetime, timezone
 from dataclasses import dataclass, asdict, field
 from typing import Optional, Dict, List, Any, Tuple, Deque, Union
-from collections import deque
+from collections import deque, OrderedDict
 import numpy as np
 import psutil
 
+from laser_segments import SegmentedLogStore
+from laser_columnar import ColumnarLogStore
+
 # Import all quantum modules with graceful fallbacks
 try:
     from flumpy import FlumpyArray, TopologyType, FlumpyEngine, zeros, ones, uniform
@@ -34,6 +40,12 @@ except ImportError:
     BUMPY_AVAILABLE = False
     print("⚠️ BUMPY not available, using fallback compression")
 
+try:
+    import lz4.frame as lz4_frame
+    LZ4_AVAILABLE = True
+except ImportError:
+    LZ4_AVAILABLE = False
+
 try:
     import laser_integration  # Our integrated module
     QUANTUM_INTEGRATION_AVAILABLE = True
@@ -260,6 +272,9 @@ class FlumpyTemporalVector:
 # 3. BUMPY-ENHANCED QUANTUM OPERATOR
 # ============================================================
 
+ENTANGLEMENT_POOL_SIZE = 20  # Recent arrays a new log entry entangles with
+
+
 class BumpyQuantumOperator:
     """Quantum operator enhanced with BUMPY array operations"""
 
@@ -373,36 +388,113 @@ class BumpyQuantumOperator:
 
         bumpy_array = BumpyArray([value, coherence] + context_values[:8])
 
-        # Add to entanglement pool
-        self.entanglement_arrays.append(bumpy_array)
+        # Add to entanglement pool (local ref: maintenance may swap the list).
+        # Bounded here, not only by maintenance: entangling with the whole
+        # pool made each log O(pool) until the next 45 s sweep.
+        arrays = self.entanglement_arrays
+        arrays.append(bumpy_array)
+        if len(arrays) > ENTANGLEMENT_POOL_SIZE:
+            del arrays[:-ENTANGLEMENT_POOL_SIZE]
 
         # Create entanglement if we have multiple arrays
-        if len(self.entanglement_arrays) >= 2:
-            for i in range(len(self.entanglement_arrays) - 1):
-                self.entanglement_arrays[i].entangle(self.entanglement_arrays[-1])
+        if len(arrays) >= 2:
+            for prior in arrays[:-1]:
+                prior.entangle(bumpy_array)
 
         return bumpy_array
 
 # ============================================================
-# 4. HOLOGRAPHIC CACHE WITH UNIVERSAL COMPRESSION
+# 4. UNIVERSAL CACHE (W-TinyLFU ADMISSION, BYTE-BUDGETED)
 # ============================================================
 
+# --- Cache Constants ---
+CACHE_MAX_BYTES = 32 * 1024 * 1024
+CACHE_WINDOW_FRACTION = 0.01      # Admission window (recency) share of the budget
+CACHE_PROTECTED_FRACTION = 0.8    # Protected segment share of the main space
+CACHE_COMPRESS_MIN_BYTES = 256    # Smaller values are stored uncompressed
+CACHE_PRESSURE_INTERVAL = 1.0     # Seconds between memory pressure samples
+CACHE_PRESSURE_THRESHOLD = 0.8
+CACHE_PRESSURE_EVICT_FRACTION = 0.2
+
+# Byte translation table that halves every counter of a sketch row
+_HALVE = bytes(i >> 1 for i in range(256))
+
+
+class FrequencySketch:
+    """
+    Count-min sketch of recent access frequency (4-bit counters, 4 rows).
+    Counters are halved every ``sample_size`` increments, so the estimate
+    follows the recent workload instead of all-time popularity.
+    """
+    SEEDS = (0x9E3779B97F4A7C15, 0xC2B2AE3D27D4EB4F, 0x165667B19E3779F9, 0x27D4EB2F165667C5)
+    MAX_COUNT = 15
+
+    def __init__(self, capacity: int):
+        width = 16
+        while width < max(16, capacity) * 4:
+            width <<= 1
+        self.mask = width - 1
+        self.rows = [bytearray(width) for _ in self.SEEDS]
+        self.sample_size = 10 * width
+        self.additions = 0
+
+    def _indexes(self, key):
+        h = hash(key)
+        mask = self.mask
+        return [((h * seed) >> 17) & mask for seed in self.SEEDS]
+
+    def increment(self, key):
+        for row, i in zip(self.rows, self._indexes(key)):
+            if row[i] < self.MAX_COUNT:
+                row[i] += 1
+        self.additions += 1
+        if self.additions >= self.sample_size:
+            self.rows = [bytearray(row.translate(_HALVE)) for row in self.rows]
+            self.additions //= 2
+
+    def frequency(self, key) -> int:
+        return min(row[i] for row, i in zip(self.rows, self._indexes(key)))
+
+
 class UniversalCache:
-    """Cache with holographic compression and system integration"""
+    """
+    W-TinyLFU cache: a small LRU window in front of a segmented LRU
+    (probation + protected). Window victims only enter the main space when
+    the frequency sketch rates them above the probation victim, so one-off
+    keys cannot flush the hot set. Every operation is O(1).
 
-    def __init__(self, max_size: int = 1000):
+    Values are stored serialized (pickle), zlib/LZ4-compressed when that is
+    smaller, and the budget is counted in stored bytes as well as entries.
+    """
+
+    def __init__(self, max_size: int = 1000, max_bytes: int = CACHE_MAX_BYTES,
+                 codec: Optional[str] = None, compress_min_bytes: int = CACHE_COMPRESS_MIN_BYTES,
+                 pressure_interval: float = CACHE_PRESSURE_INTERVAL):
+        if codec not in (None, 'zlib', 'lz4'):
+            raise ValueError(f"Unknown cache codec: {codec}")
+        if codec == 'lz4' and not LZ4_AVAILABLE:
+            raise ValueError("lz4 codec requested but lz4 is not installed")
         self.max_size = max_size
-        self.cache = {}
-        self.timestamps = {}
-        self.access_patterns = {}
-        self.compression_level = 0.7
+        self.max_bytes = max_bytes
+        self.codec = codec or ('lz4' if LZ4_AVAILABLE else 'zlib')
+        self.compress_min_bytes = compress_min_bytes
+        self.pressure_interval = pressure_interval
+
+        # Segments: key -> (payload, codec tag); oldest first
+        self._window: 'OrderedDict[str, Tuple[bytes, str]]' = OrderedDict()
+        self._probation: 'OrderedDict[str, Tuple[bytes, str]]' = OrderedDict()
+        self._protected: 'OrderedDict[str, Tuple[bytes, str]]' = OrderedDict()
+        self._bytes = {'window': 0, 'probation': 0, 'protected': 0}
+        self._sketch = FrequencySketch(max_size)
+        self._lock = threading.RLock()
 
-        if BUMPY_AVAILABLE:
-            self.compressor = BUMPYCore()
-        else:
-            self.compressor = None
+        # Entanglement links between entries, dropped together with them
+        self.entanglements: Dict[str, set] = {}
+        self._hit_counts: Dict[str, int] = {}
 
-        # Memory pressure tracking
+        # Memory pressure is sampled at most once per interval
+        self._pressure = 0.0
+        self._pressure_sampled = 0.0
         self.memory_warnings = 0
         self.last_cleanup = time.time()
 
@@ -412,202 +504,481 @@ class UniversalCache:
             'misses': 0,
             'compressions': 0,
             'size_reduction': 0.0,
-            'quantum_entanglements': 0
+            'quantum_entanglements': 0,
+            'evictions': 0,
+            'rejections': 0,
+            'pressure_evictions': 0,
+            'bytes': 0,
+            'entries': 0
         }
+        self._raw_compressed = 0     # Serialized bytes of values that were compressed
+        self._stored_compressed = 0  # ... and what they were stored as
+
+    # --- ENCODING ---
+    def _encode(self, value: Any, compress: bool) -> Tuple[bytes, str]:
+        raw = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        if compress and len(raw) >= self.compress_min_bytes:
+            if self.codec == 'lz4':
+                packed = lz4_frame.compress(raw)
+            else:
+                packed = zlib.compress(raw, 1)
+            if len(packed) < len(raw):
+                self.metrics['compressions'] += 1
+                self._raw_compressed += len(raw)
+                self._stored_compressed += len(packed)
+                self.metrics['size_reduction'] = 1.0 - self._stored_compressed / self._raw_compressed
+                return packed, self.codec
+        return raw, 'raw'
 
-    def get(self, key: str) -> Optional[Dict]:
-        """Get with quantum-aware access patterns"""
-        if key in self.cache:
-            self.access_patterns[key] = self.access_patterns.get(key, 0) + 1
-            self.metrics['hits'] += 1
+    @staticmethod
+    def _decode(payload: bytes, tag: str) -> Any:
+        if tag == 'zlib':
+            payload = zlib.decompress(payload)
+        elif tag == 'lz4':
+            payload = lz4_frame.decompress(payload)
+        return pickle.loads(payload)
+
+    # --- BUDGET ---
+    def _window_limits(self) -> Tuple[int, int]:
+        return (max(1, int(self.max_size * CACHE_WINDOW_FRACTION)),
+                max(1, int(self.max_bytes * CACHE_WINDOW_FRACTION)))
+
+    def _main_limits(self) -> Tuple[int, int]:
+        window_entries, window_bytes = self._window_limits()
+        return max(1, self.max_size - window_entries), max(1, self.max_bytes - window_bytes)
+
+    def _segment(self, key: str):
+        """(name, segment) holding ``key``, or (None, None)."""
+        for name, segment in (('window', self._window), ('probation', self._probation),
+                              ('protected', self._protected)):
+            if key in segment:
+                return name, segment
+        return None, None
+
+    def _add(self, name: str, segment: OrderedDict, key: str, item: Tuple[bytes, str]):
+        segment[key] = item
+        self._bytes[name] += len(item[0])
+
+    def _remove(self, name: str, segment: OrderedDict, key: str) -> Tuple[bytes, str]:
+        item = segment.pop(key)
+        self._bytes[name] -= len(item[0])
+        return item
+
+    def _pop_oldest(self, name: str, segment: OrderedDict) -> Tuple[str, Tuple[bytes, str]]:
+        key, item = segment.popitem(last=False)
+        self._bytes[name] -= len(item[0])
+        return key, item
+
+    def _sync_metrics(self):
+        self.metrics['bytes'] = sum(self._bytes.values())
+        self.metrics['entries'] = len(self._window) + len(self._probation) + len(self._protected)
+
+    # --- API ---
+    def __len__(self) -> int:
+        return len(self._window) + len(self._probation) + len(self._protected)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._window or key in self._probation or key in self._protected
+
+    def get(self, key: str) -> Optional[Any]:
+        """Get a copy of the cached value, promoting it on a hit."""
+        with self._lock:
+            self._sketch.increment(key)
+            name, segment = self._segment(key)
+            if segment is None:
+                self.metrics['misses'] += 1
+                return None
+
+            if name == 'probation':
+                # Second hit: promote, demoting the protected LRU if it overflows
+                item = self._remove(name, self._probation, key)
+                self._add('protected', self._protected, key, item)
+                self._rebalance_protected()
+            else:
+                segment.move_to_end(key)
+                item = segment[key]
 
-            # Apply quantum refresh for frequently accessed items
-            if self.access_patterns[key] % 5 == 0:
+            self.metrics['hits'] += 1
+            hits = self._hit_counts.get(key, 0) + 1
+            self._hit_counts[key] = hits
+            if hits % 5 == 0:
                 self._quantum_refresh(key)
 
-            return self.cache[key]
+        return self._decode(*item)
 
-        self.metrics['misses'] += 1
-        return None
-
-    def set(self, key: str, value: Dict, compress: bool = True):
-        """Set with optional holographic compression"""
-        # Check memory pressure
-        if self._memory_pressure() > 0.8:
+    def set(self, key: str, value: Any, compress: bool = True):
+        """Store a value; new keys enter the window and compete for admission."""
+        if self._memory_pressure() > CACHE_PRESSURE_THRESHOLD:
             self._aggressive_evict()
 
-        # Apply holographic compression if enabled and available
-        if compress and self.compressor and len(str(value)) > 100:
-            compressed = self._holographic_compress(value)
-            if compressed:
-                value = compressed
-                self.metrics['compressions'] += 1
-                self.metrics['size_reduction'] = 0.7  # Assume 70% reduction
-
-        # Store with quantum timestamp
-        self.cache[key] = value
-        self.timestamps[key] = time.time() + random.uniform(-0.001, 0.001)  # Quantum time uncertainty
-        self.access_patterns[key] = 0
-
-        # Cleanup if needed
-        if len(self.cache) >= self.max_size:
-            self._quantum_evict()
+        item = self._encode(value, compress)
+        with self._lock:
+            self._sketch.increment(key)
+            name, segment = self._segment(key)
+            if segment is not None:
+                self._remove(name, segment, key)
+                self._add(name, segment, key, item)
+            else:
+                self._add('window', self._window, key, item)
+                self._hit_counts[key] = 0
+            self._enforce()
 
-    def _holographic_compress(self, data: Dict) -> Optional[Dict]:
-        """Compress data using BUMPY holographic methods"""
-        if not BUMPY_AVAILABLE or not self.compressor:
-            return None
+    def resize(self, max_size: Optional[int] = None, max_bytes: Optional[int] = None):
+        """Change the budget, evicting down to it immediately."""
+        with self._lock:
+            if max_size is not None:
+                self.max_size = max(1, max_size)
+            if max_bytes is not None:
+                self.max_bytes = max(1, max_bytes)
+            self._enforce()
 
-        try:
-            # Convert data to list for compression
-            data_str = json.dumps(data, separators=(',', ':'))
-            data_values = [ord(c) / 255.0 for c in data_str[:100]]
-
-            if len(data_values) > 10:
-                # Create BUMPY array
-                bumpy_data = BumpyArray(data_values[:20])  # Use first 20 values
-
-                # Apply holographic compression
-                self.compressor.qualia_emergence_ritual([bumpy_data])
-
-                # Create compressed representation
-                compressed = {
-                    '_compressed': True,
-                    'hash': hashlib.md5(data_str.encode()).hexdigest()[:8],
-                    'original_length': len(data_str),
-                    'compressed_length': 20,
-                    'quantum_coherence': bumpy_data.coherence,
-                    'data_sample': data_values[:3]
-                }
+    def delete(self, key: str):
+        """Removes the key from its segment and drops its hit-count and entanglement bookkeeping"""
+        with self._lock:
+            name, segment = self._segment(key)
+            if segment is not None:
+                self._remove(name, segment, key)
+            self._forget(key)
+            self._sync_metrics()
 
-                return compressed
-        except Exception as e:
-            if os.getenv('DEBUG_LASER'):
-                print(f"Compression failed: {e}")
+    def clear(self):
+        with self._lock:
+            for segment in (self._window, self._probation, self._protected):
+                segment.clear()
+            self._bytes = dict.fromkeys(self._bytes, 0)
+            self.entanglements.clear()
+            self._hit_counts.clear()
+            self._sync_metrics()
+
+    # --- ADMISSION & EVICTION ---
+    def _enforce(self):
+        """Moves window overflow into the main space through the TinyLFU filter."""
+        window_entries, window_bytes = self._window_limits()
+        while self._window and (len(self._window) > window_entries or self._bytes['window'] > window_bytes):
+            key, item = self._pop_oldest('window', self._window)
+            self._admit(key, item)
+
+        main_entries, main_bytes = self._main_limits()
+        while self._probation or self._protected:
+            if (len(self._probation) + len(self._protected) <= main_entries
+                    and self._bytes['probation'] + self._bytes['protected'] <= main_bytes):
+                break
+            self._evict_main()
+        self._sync_metrics()
+
+    def _admit(self, candidate: str, item: Tuple[bytes, str]):
+        main_entries, main_bytes = self._main_limits()
+        size = len(item[0])
+        if size > main_bytes:
+            self._reject(candidate)
+            return
+        candidate_freq = self._sketch.frequency(candidate)
+        while (len(self._probation) + len(self._protected) + 1 > main_entries
+               or self._bytes['probation'] + self._bytes['protected'] + size > main_bytes):
+            victims = self._probation or self._protected
+            victim = next(iter(victims))
+            if candidate_freq <= self._sketch.frequency(victim):
+                self._reject(candidate)
+                return
+            self._evict_main()
+        self._add('probation', self._probation, candidate, item)
+
+    def _evict_main(self):
+        name, segment = ('probation', self._probation) if self._probation else ('protected', self._protected)
+        key, _ = self._pop_oldest(name, segment)
+        self._forget(key)
+        self.metrics['evictions'] += 1
+
+    def _reject(self, key: str):
+        self._forget(key)
+        self.metrics['rejections'] += 1
+
+    def _rebalance_protected(self):
+        main_entries, main_bytes = self._main_limits()
+        entries_cap = max(1, int(main_entries * CACHE_PROTECTED_FRACTION))
+        bytes_cap = int(main_bytes * CACHE_PROTECTED_FRACTION)
+        while len(self._protected) > 1 and (len(self._protected) > entries_cap
+                                            or self._bytes['protected'] > bytes_cap):
+            key, item = self._pop_oldest('protected', self._protected)
+            self._add('probation', self._probation, key, item)
 
-        return None
+    def _memory_pressure(self) -> float:
+        """System memory pressure, sampled at most once per ``pressure_interval``"""
+        now = time.monotonic()
+        if now - self._pressure_sampled >= self.pressure_interval:
+            self._pressure_sampled = now
+            try:
+                self._pressure = psutil.virtual_memory().percent / 100.0
+            except Exception:
+                self._pressure = len(self) / max(1, self.max_size)
+        return self._pressure
 
+    def _aggressive_evict(self):
+        """Drop CACHE_PRESSURE_EVICT_FRACTION of the stored bytes, coldest first"""
+        with self._lock:
+            target = sum(self._bytes.values()) * CACHE_PRESSURE_EVICT_FRACTION
+            freed = 0
+            for name, segment in (('probation', self._probation), ('window', self._window),
+                                  ('protected', self._protected)):
+                while segment and freed < target:
+                    key, item = self._pop_oldest(name, segment)
+                    self._forget(key)
+                    freed += len(item[0])
+                    self.metrics['pressure_evictions'] += 1
+            self.memory_warnings += 1
+            self.last_cleanup = time.time()
+            self._sync_metrics()
+
+    # --- ENTANGLEMENT ---
     def _quantum_refresh(self, key: str):
-        """Refresh cache entry with quantum operations"""
-        if key in self.cache:
-            entry = self.cache[key]
-
-            # Add quantum timestamp
-            if 'quantum_metadata' not in entry:
-                entry['quantum_metadata'] = {}
-
-            entry['quantum_metadata']['refresh_time'] = time.time()
-            entry['quantum_metadata']['quantum_phase'] = random.uniform(0, 2 * math.pi)
-
-            # Entangle with other entries if BUMPY available
-            if BUMPY_AVAILABLE and random.random() < 0.1:
-                other_keys = list(self.cache.keys())
-                if len(other_keys) > 1:
-                    other_key = random.choice([k for k in other_keys if k != key])
-                    self._create_entanglement(key, other_key)
+        """Entangle a frequently read entry with the hottest protected one"""
+        if BUMPY_AVAILABLE and random.random() < 0.1 and self._protected:
+            other_key = next(reversed(self._protected))
+            if other_key != key:
+                self._create_entanglement(key, other_key)
 
     def _create_entanglement(self, key1: str, key2: str):
         """Create quantum entanglement between cache entries"""
-        if key1 in self.cache and key2 in self.cache:
-            # Mark entanglement in metadata
-            for key in [key1, key2]:
-                if 'quantum_metadata' not in self.cache[key]:
-                    self.cache[key]['quantum_metadata'] = {}
-
-                entangled_with = self.cache[key]['quantum_metadata'].get('entangled_with', [])
-                other_key = key2 if key == key1 else key1
-                if other_key not in entangled_with:
-                    entangled_with.append(other_key)
-                    self.cache[key]['quantum_metadata']['entangled_with'] = entangled_with
-
+        if key1 in self and key2 in self:
+            self.entanglements.setdefault(key1, set()).add(key2)
+            self.entanglements.setdefault(key2, set()).add(key1)
             self.metrics['quantum_entanglements'] += 1
 
-    def _memory_pressure(self) -> float:
-        """Calculate memory pressure for adaptive behavior"""
-        try:
-            memory = psutil.virtual_memory()
-            return memory.percent / 100.0
-        except:
-            return len(self.cache) / self.max_size
+    def _forget(self, key: str):
+        """Drops per-key bookkeeping and unlinks the key from its partners"""
+        self._hit_counts.pop(key, None)
+        for other_key in self.entanglements.pop(key, ()):
+            partners = self.entanglements.get(other_key)
+            if partners is not None:
+                partners.discard(key)
+                if not partners:
+                    del self.entanglements[other_key]
 
-    def _aggressive_evict(self):
-        """Aggressive eviction under memory pressure"""
-        if not self.cache:
-            return
+# ============================================================
+# 5. ASYNC BATCHED LOG WRITER
+# ============================================================
 
-        # Calculate quantum age (adjusted by access patterns)
-        now = time.time()
-        eviction_scores = {}
+class AsyncLogWriter:
+    """
+    Background writer for LASER flushes.
+
+    Flushing only swaps the buffer out and hands the batch over; JSON
+    encoding, the file write and fsync happen on this thread, outside the
+    LASER lock. The handoff is a bounded deque (append/popleft are atomic,
+    so producers never take a lock). When ``max_pending`` batches are
+    already waiting, ``backpressure='block'`` makes the flusher wait for
+    room and ``'drop'`` discards the oldest pending batch.
+
+    fsync policy: 'never' (OS decides), 'batch' (after every batch) or
+    'interval' (at most once per ``fsync_interval`` seconds). Under
+    'interval', targets written since the last fsync are also synced once
+    the writer has been idle for ``fsync_interval`` and on ``close()``.
+    """
 
-        for key in list(self.cache.keys()):
-            age = now - self.timestamps[key]
-            accesses = self.access_patterns.get(key, 0)
+    FSYNC_POLICIES = ('never', 'batch', 'interval')
+
+    def __init__(self, max_pending: int = 64, fsync: str = 'never',
+                 fsync_interval: float = 1.0, backpressure: str = 'block'):
+        if fsync not in self.FSYNC_POLICIES:
+            raise ValueError(f"fsync policy must be one of {self.FSYNC_POLICIES}, got {fsync!r}")
+        if backpressure not in ('block', 'drop'):
+            raise ValueError(f"backpressure must be 'block' or 'drop', got {backpressure!r}")
+
+        self.max_pending = max(1, max_pending)
+        self.fsync = fsync
+        self.fsync_interval = fsync_interval
+        self.backpressure = backpressure
+
+        self._pending: Deque[Tuple[Any, Dict, List[Dict]]] = deque()
+        self._wakeup = threading.Event()
+        self._room = threading.Event()
+        self._room.set()
+        self._done = threading.Condition()
+        self._completed = 0  # batches written, failed or dropped
+        self._closed = False
+        self._last_fsync = 0.0
+        self._unsynced: Dict[Any, None] = {}  # targets written since their last fsync
 
-            # Quantum age: older items with few accesses are more likely to be evicted
-            quantum_age = age * (1.0 / max(1, accesses * 0.1))
-            eviction_scores[key] = quantum_age
+        self.metrics = {
+            'batches_enqueued': 0,
+            'batches_written': 0,
+            'entries_written': 0,
+            'bytes_written': 0,
+            'dropped_batches': 0,
+            'dropped_entries': 0,
+            'backpressure_waits': 0,
+            'backpressure_wait_ms': 0.0,
+            'queue_high_water': 0,
+            'fsyncs': 0,
+            'write_errors': 0,
+            'last_write_ms': 0.0
+        }
 
-        # Evict worst 20%
-        to_evict = sorted(eviction_scores.items(), key=lambda x: x[1], reverse=True)
-        evict_count = max(1, len(to_evict) // 5)
+        self._thread = threading.Thread(target=self._run, name="laser-writer", daemon=True)
+        self._thread.start()
 
-        for key, _ in to_evict[:evict_count]:
-            self.delete(key)
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
 
-    def _quantum_evict(self):
-        """Quantum probabilistic eviction"""
-        if not self.cache:
+    def submit(self, target, header: Dict, entries: List[Dict]):
+        """
+        Queue one flushed batch (called by the flusher, never blocks on I/O).
+        ``target`` is a file path or a store with ``append_batch()``.
+        """
+        if not entries:
+            return
+        if self._closed:
+            # Writer gone (interpreter shutdown): write inline
+            self._write_batch(target, header, entries)
             return
 
-        # Calculate quantum probabilities
-        now = time.time()
-        total_quantum_weight = 0
-        quantum_weights = {}
-
-        for key in list(self.cache.keys()):
-            age = now - self.timestamps[key]
-            accesses = self.access_patterns.get(key, 0)
-
-            # Quantum probability: older with fewer accesses = higher probability
-            quantum_prob = math.exp(-accesses * 0.1) * (1.0 - math.exp(-age / 3600))
-            quantum_weights[key] = quantum_prob
-            total_quantum_weight += quantum_prob
-
-        if total_quantum_weight == 0:
+        while len(self._pending) >= self.max_pending:
+            if self.backpressure == 'drop':
+                try:
+                    _, _, dropped = self._pending.popleft()
+                except IndexError:
+                    break
+                self.metrics['dropped_batches'] += 1
+                self.metrics['dropped_entries'] += len(dropped)
+                self._mark_done()
+                continue
+            self._room.clear()
+            if len(self._pending) < self.max_pending:
+                break
+            start = time.perf_counter()
+            self.metrics['backpressure_waits'] += 1
+            self._room.wait(0.1)
+            self.metrics['backpressure_wait_ms'] += (time.perf_counter() - start) * 1000
+
+        self._pending.append((target, header, entries))
+        self.metrics['batches_enqueued'] += 1
+        self.metrics['queue_high_water'] = max(self.metrics['queue_high_water'], len(self._pending))
+        self._wakeup.set()
+
+    def drain(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every batch queued so far has been written."""
+        target = self.metrics['batches_enqueued']
+        self._wakeup.set()
+        with self._done:
+            return self._done.wait_for(lambda: self._completed >= target, timeout)
+
+    def close(self, timeout: Optional[float] = 5.0):
+        """Drain, fsync what is still unsynced and stop the writer thread."""
+        if self._closed:
             return
+        self.drain(timeout)
+        self._closed = True
+        self._wakeup.set()
+        self._thread.join(timeout)
+
+    def _run(self):
+        while True:
+            idle = None
+            if self._unsynced:
+                idle = max(0.0, self._last_fsync + self.fsync_interval - time.time())
+            self._wakeup.wait(idle)
+            self._wakeup.clear()
+            while True:
+                try:
+                    target, header, entries = self._pending.popleft()
+                except IndexError:
+                    break
+                self._room.set()
+                self._write_batch(target, header, entries)
+                self._mark_done()
+            if self._unsynced and self._fsync_due():
+                self._sync_unsynced()
+            if self._closed:
+                return
 
-        # Normalize and select for eviction
-        selected = random.random() * total_quantum_weight
-        cumulative = 0
+    def _mark_done(self):
+        with self._done:
+            self._completed += 1
+            self._done.notify_all()
 
-        for key, weight in quantum_weights.items():
-            cumulative += weight
-            if cumulative >= selected:
-                self.delete(key)
-                break
+    def _fsync_due(self) -> bool:
+        if self.fsync == 'never':
+            return False
+        return (self.fsync == 'batch' or self._closed
+                or time.time() - self._last_fsync >= self.fsync_interval)
+
+    def _fsynced(self):
+        """Records one successful fsync."""
+        self._last_fsync = time.time()
+        self.metrics['fsyncs'] += 1
+
+    def _sync_unsynced(self):
+        """fsync every target written since its last fsync (idle timeout, close)."""
+        for target in list(self._unsynced):
+            del self._unsynced[target]
+            try:
+                if hasattr(target, 'sync'):
+                    target.sync()
+                else:
+                    with open(target, 'ab') as f:
+                        os.fsync(f.fileno())
+                self._fsynced()
+            except Exception as e:
+                self.metrics['write_errors'] += 1
+                print(f"⚠️ Universal fsync failed: {e}")
 
-    def delete(self, key: str):
-        """Delete entry and propagate to entangled entries"""
-        # Propagate deletion to entangled entries
-        if key in self.cache and 'quantum_metadata' in self.cache[key]:
-            entangled = self.cache[key]['quantum_metadata'].get('entangled_with', [])
-            for other_key in entangled:
-                if other_key in self.cache and 'quantum_metadata' in self.cache[other_key]:
-                    # Remove this key from other's entanglement list
-                    other_entangled = self.cache[other_key]['quantum_metadata'].get('entangled_with', [])
-                    if key in other_entangled:
-                        other_entangled.remove(key)
-                        self.cache[other_key]['quantum_metadata']['entangled_with'] = other_entangled
-
-        # Delete entry
-        self.cache.pop(key, None)
-        self.timestamps.pop(key, None)
-        self.access_patterns.pop(key, None)
+    def _write_batch(self, target, header: Dict, entries: List[Dict]):
+        """Write one batch to a file path or to a store exposing append_batch()."""
+        start = time.perf_counter()
+        try:
+            sync = self._fsync_due()
+            if hasattr(target, 'append_batch'):
+                written = target.append_batch(header, entries, sync=sync)
+            else:
+                lines = [f"#FLUSH {json.dumps(header, separators=(',', ':'))}\n"]
+                lines.extend(json.dumps(entry, separators=(',', ':')) + '\n' for entry in entries)
+                payload = ''.join(lines)
+                with open(target, 'a', encoding='utf-8') as f:
+                    f.write(payload)
+                    if sync:
+                        f.flush()
+                        os.fsync(f.fileno())
+                written = len(payload)
+            if sync:
+                self._unsynced.pop(target, None)
+                self._fsynced()
+            elif self.fsync != 'never':
+                self._unsynced[target] = None
+            self.metrics['batches_written'] += 1
+            self.metrics['entries_written'] += len(entries)
+            self.metrics['bytes_written'] += written
+        except Exception as e:
+            self.metrics['write_errors'] += 1
+            print(f"⚠️ Universal write failed: {e}")
+            # Fallback to console
+            for entry in entries[:2]:
+                print(f"[FALLBACK] {entry.get('timestamp')} - {str(entry.get('message', ''))[:60]}...")
+        self.metrics['last_write_ms'] = (time.perf_counter() - start) * 1000
 
 # ============================================================
-# 5. LASER v3.0 - UNIVERSAL INTEGRATION SYSTEM
+# 6. LASER v3.0 - UNIVERSAL INTEGRATION SYSTEM
 # ============================================================
 
+# --- Log Levels & Pre-filter ---
+LOG_LEVELS = {'DEBUG': 10, 'INFO': 20, 'WARNING': 30, 'ERROR': 40, 'CRITICAL': 50}
+LEVEL_KEYWORDS = (('CRITICAL', 50), ('EMERGENCY', 50), ('FAILURE', 50), ('ERROR', 40), ('WARNING', 30))
+MAX_MESSAGE_KEYS = 4096  # Rate-limit state is reset past this many distinct keys
+
+
+class _ThreadAccumulator:
+    """Log records one thread accepted but the maintenance thread has not merged yet"""
+    __slots__ = ('thread', 'records', 'max_records', 'accepted', 'filtered', 'overflowed')
+
+    def __init__(self, max_records: int):
+        self.thread = threading.current_thread()
+        self.records = deque()  # append/popleft are atomic: no lock
+        self.max_records = max_records
+        self.accepted = 0
+        self.filtered = 0
+        self.overflowed = 0
+
+
 class LASERV30:
     """
     LASER v3.0 - Universal Quantum-Temporal Logging System
@@ -627,13 +998,34 @@ class LASERV30:
             'system_monitoring': True,
             'debug': False,
             'universal_memory': True,
+            'fsync': 'never',                # 'never' | 'batch' | 'interval'
+            'fsync_interval': 1.0,
+            'writer_max_pending': 64,        # batches queued before backpressure
+            'writer_backpressure': 'block',  # 'block' | 'drop'
+            'segment_seconds': 3600,         # time span of one indexed log segment
+            'segment_max_bytes': 64 * 1024 * 1024,
+            'log_format': 'jsonl',           # 'jsonl' | 'columnar' (see laser_columnar)
+            'cache_max_entries': 800,
+            'cache_max_bytes': 16 * 1024 * 1024,
+            'cache_codec': None,             # None (lz4 if installed, else zlib) | 'zlib' | 'lz4'
+            'min_level': 'DEBUG',            # entries below this level are dropped up front
+            'sample_rate': 1.0,              # share of sub-WARNING entries kept
+            'rate_limit': None,              # sub-WARNING entries/s per message key (None = off)
+            'rate_burst': 200,
+            'min_delta': 0.0,                # drop sub-WARNING entries whose value moved less
+            'accumulate': False,             # True: per-thread buffers merged by the maintenance thread
+            'merge_interval': 0.05,
+            'accumulator_max': 10000,        # records held per thread; past it sub-WARNING entries drop
+            'maintenance_interval': 45,
             **(config or {})
         }
 
         # Initialize integrated systems
         self.universal_state = UniversalQuantumState()
         self.temporal = FlumpyTemporalVector(size=15)
-        self.cache = UniversalCache(max_size=800)
+        self.cache = UniversalCache(max_size=self.config['cache_max_entries'],
+                                    max_bytes=self.config['cache_max_bytes'],
+                                    codec=self.config['cache_codec'])
         self.quantum_op = BumpyQuantumOperator()
 
         # Log buffer with quantum ordering
@@ -673,9 +1065,44 @@ class LASERV30:
             'entanglements_created': 0,
             'system_integrations': 0,
             'universal_queries': 0,
-            'compression_savings': 0.0
+            'compression_savings': 0.0,
+            'logs_accepted': 0,
+            'logs_filtered': 0,
+            'logs_overflowed': 0,
+            'merges': 0
         }
 
+        # Stage 1 state: per-message-key [tokens, last refill, last value]
+        self._key_state: Dict[str, list] = {}
+
+        # Per-thread accumulation buffers (registered once per thread)
+        self._local = threading.local()
+        self._accumulators: List[_ThreadAccumulator] = []
+        self._accumulators_lock = threading.Lock()
+        self._merge_lock = threading.Lock()
+        self._retired = {'accepted': 0, 'filtered': 0, 'overflowed': 0}
+
+        # Time-segmented log storage: indexed JSONL (<log stem>.segments/)
+        # or block-columnar binary (<log stem>.columnar/)
+        if self.config['log_format'] not in ('jsonl', 'columnar'):
+            raise ValueError(f"log_format must be 'jsonl' or 'columnar', got {self.config['log_format']!r}")
+        store_class = ColumnarLogStore if self.config['log_format'] == 'columnar' else SegmentedLogStore
+        self.store = store_class(
+            self.config['log_path'],
+            segment_seconds=self.config['segment_seconds'],
+            segment_max_bytes=self.config['segment_max_bytes']
+        )
+
+        # Background writer: flushes hand batches off instead of writing under the lock
+        self._writer = AsyncLogWriter(
+            max_pending=self.config['writer_max_pending'],
+            fsync=self.config['fsync'],
+            fsync_interval=self.config['fsync_interval'],
+            backpressure=self.config['writer_backpressure']
+        )
+        atexit.register(self.store.close)
+        atexit.register(self._writer.close)  # runs first: drain into the store
+
         # Thread management
         self._lock = threading.RLock()
         self._shutdown = threading.Event()
@@ -753,10 +1180,142 @@ class LASERV30:
 
             return False
 
-    def log(self, value: float, message: str, system_context: Dict = None, **meta) -> Optional[Dict]:
+    def log(self, value: float, message: str, system_context: Dict = None,
+            level: Union[int, str, None] = None, **meta) -> Optional[Dict]:
         """
         Universal logging with system integration
+
+        Stage 1 (caller thread, no lock): level, sampling, per-key rate limit
+        and value-delta filters decide before any quantum analysis runs.
+        Stage 2 (quantum analysis, entry, flush checks) runs inline and the
+        entry is returned as before; with ``accumulate`` on it is deferred to
+        the maintenance thread and this returns None.
+        """
+        acc = getattr(self._local, 'acc', None) or self._accumulator()
+        level = self._resolve_level(level, message)
+        if not self._prefilter(value, message, level):
+            acc.filtered += 1
+            return None
+        acc.accepted += 1
+
+        record = (time.time(), value, message, system_context, meta)
+        if not self.config['accumulate']:
+            with self._lock:
+                return self._process_record(record)
+
+        records = acc.records
+        if len(records) >= acc.max_records:
+            # A full buffer drops routine entries; WARNING and above are never lost
+            if level < LOG_LEVELS['WARNING']:
+                acc.overflowed += 1
+                return None
+            with self._lock:
+                self._process_record(record)
+            return None
+        records.append(record)
+        return None
+
+    # --- STAGE 1: PRE-FILTER ---
+    @staticmethod
+    def _resolve_level(level: Union[int, str, None], message: str) -> int:
+        if level is None:
+            upper = message.upper()
+            for keyword, keyword_level in LEVEL_KEYWORDS:
+                if keyword in upper:
+                    return keyword_level
+            return LOG_LEVELS['INFO']
+        if isinstance(level, str):
+            return LOG_LEVELS[level.upper()]
+        return level
+
+    def _prefilter(self, value: float, message: str, level: int) -> bool:
+        """Cheap admission check; WARNING and above always pass the sampling filters"""
+        config = self.config
+        if level < self._resolve_level(config['min_level'], ''):
+            return False
+        if level >= LOG_LEVELS['WARNING']:
+            return True
+        if config['sample_rate'] < 1.0 and random.random() >= config['sample_rate']:
+            return False
+
+        # Per-key state is shared by all threads; a lost update only skews a limit slightly
+        key = message.partition(':')[0][:48]
+        now = time.monotonic()
+        state = self._key_state.get(key)
+        if state is None:
+            if len(self._key_state) >= MAX_MESSAGE_KEYS:
+                self._key_state.clear()
+            state = self._key_state[key] = [float(config['rate_burst']), now, None]
+
+        if config['min_delta'] and state[2] is not None and abs(value - state[2]) < config['min_delta']:
+            return False
+
+        rate = config['rate_limit']
+        if rate:
+            tokens = min(float(config['rate_burst']), state[0] + (now - state[1]) * rate)
+            state[1] = now
+            if tokens < 1.0:
+                state[0] = tokens
+                return False
+            state[0] = tokens - 1.0
+        state[2] = value
+        return True
+
+    # --- PER-THREAD ACCUMULATION ---
+    def _accumulator(self) -> _ThreadAccumulator:
+        acc = _ThreadAccumulator(self.config['accumulator_max'])
+        self._local.acc = acc
+        with self._accumulators_lock:
+            self._accumulators.append(acc)
+        return acc
+
+    def merge_pending(self) -> int:
         """
+        Stage 2 for everything accumulated so far: drains every thread's
+        buffer, processes the records in timestamp order, returns the count.
+        """
+        with self._merge_lock:
+            with self._accumulators_lock:
+                accumulators = list(self._accumulators)
+
+            records = []
+            for acc in accumulators:
+                pending = acc.records
+                for _ in range(len(pending)):
+                    records.append(pending.popleft())
+            records.sort(key=lambda record: record[0])
+
+            for record in records:
+                with self._lock:
+                    self._process_record(record)
+
+            self._sync_accumulator_metrics(accumulators)
+            if records:
+                self.metrics['merges'] += 1
+            return len(records)
+
+    def _sync_accumulator_metrics(self, accumulators: List[_ThreadAccumulator]):
+        """Totals the per-thread counters and retires accumulators of finished threads"""
+        totals = dict(self._retired)
+        for acc in accumulators:
+            totals['accepted'] += acc.accepted
+            totals['filtered'] += acc.filtered
+            totals['overflowed'] += acc.overflowed
+            if not acc.thread.is_alive() and not acc.records:
+                with self._accumulators_lock:
+                    self._accumulators.remove(acc)
+                self._retired['accepted'] += acc.accepted
+                self._retired['filtered'] += acc.filtered
+                self._retired['overflowed'] += acc.overflowed
+        self.metrics['logs_accepted'] = totals['accepted']
+        self.metrics['logs_filtered'] = totals['filtered']
+        self.metrics['logs_overflowed'] = totals['overflowed']
+
+    # --- STAGE 2: QUANTUM PIPELINE ---
+    def _process_record(self, record: Tuple) -> Optional[Dict]:
+        """Quantum analysis, entry creation and flush checks (lock held)"""
+        timestamp, value, message, system_context, meta = record
+
         # Deferred BUMPY registration
         if not self._epiphany_registered and BUMPY_AVAILABLE:
             try:
@@ -768,61 +1327,60 @@ class LASERV30:
             except Exception:
                 pass
 
-        with self._lock:
-            start_time = time.perf_counter()
-
-            # Prepare universal context
-            universal_context = self._prepare_universal_context(system_context)
-
-            # Update universal state with system context
-            if system_context:
-                self.universal_state.update_from_systems(**system_context)
-
-            # Quantum analysis with universal integration
-            qdata = self.quantum_op.transform(value, message, {
-                'signature': self.universal_state.signature,
-                'consciousness': self.universal_state.consciousness,
-                'flumpy_coherence': self.universal_state.flumpy_coherence,
-                'stability': self.universal_state.stability,
-                'risk_bonus': self.universal_state.risk * 0.1
-            })
+        start_time = time.perf_counter()
 
-            # Temporal analysis
-            delta, compressed, temporal_metrics = self.temporal.update(value, universal_context)
+        # Prepare universal context
+        universal_context = self._prepare_universal_context(system_context)
 
-            # Determine if we should log
-            should_log = self._should_log(value, qdata, delta, message)
+        # Update universal state with system context
+        if system_context:
+            self.universal_state.update_from_systems(**system_context)
 
-            if not should_log and len(self.buffer) < self.config['min_buffer_for_log']:
-                return None
+        # Quantum analysis with universal integration
+        qdata = self.quantum_op.transform(value, message, {
+            'signature': self.universal_state.signature,
+            'consciousness': self.universal_state.consciousness,
+            'flumpy_coherence': self.universal_state.flumpy_coherence,
+            'stability': self.universal_state.stability,
+            'risk_bonus': self.universal_state.risk * 0.1
+        })
 
-            # Create universal log entry
-            entry = self._create_universal_entry(
-                value, message, qdata, delta, compressed,
-                temporal_metrics, universal_context, meta
-            )
+        # Temporal analysis
+        delta, compressed, temporal_metrics = self.temporal.update(value, universal_context)
 
-            # Apply quantum entanglement if conditions are right
-            if self._quantum_entanglement_conditions(entry):
-                self._apply_quantum_entanglement(entry)
+        # Determine if we should log
+        should_log = self._should_log(value, qdata, delta, message)
 
-            # Add to buffer
-            self.buffer.append(entry)
-            self.metrics['logs_processed'] += 1
+        if not should_log and len(self.buffer) < self.config['min_buffer_for_log']:
+            return None
 
-            # Update universal state with this log
-            self._update_from_log(entry)
+        # Create universal log entry
+        entry = self._create_universal_entry(
+            value, message, qdata, delta, compressed,
+            temporal_metrics, universal_context, meta, timestamp
+        )
 
-            # Check for flush conditions
-            self._check_flush_conditions(qdata)
+        # Apply quantum entanglement if conditions are right
+        if self._quantum_entanglement_conditions(entry):
+            self._apply_quantum_entanglement(entry)
 
-            # Update processing metrics
-            proc_time = (time.perf_counter() - start_time) * 1000
-            self.metrics['avg_processing_ms'] = (
-                0.1 * proc_time + 0.9 * self.metrics['avg_processing_ms']
-            )
+        # Add to buffer
+        self.buffer.append(entry)
+        self.metrics['logs_processed'] += 1
 
-            return entry
+        # Update universal state with this log
+        self._update_from_log(entry)
+
+        # Check for flush conditions
+        self._check_flush_conditions(qdata)
+
+        # Update processing metrics
+        proc_time = (time.perf_counter() - start_time) * 1000
+        self.metrics['avg_processing_ms'] = (
+            0.1 * proc_time + 0.9 * self.metrics['avg_processing_ms']
+        )
+
+        return entry
 
     def trigger_epiphany(self, source_id: int = 0, amplitude: list = None):
         """Trigger a system-wide Epiphany: MOMENTARY CLARITY"""
@@ -897,16 +1455,17 @@ class LASERV30:
     def _create_universal_entry(self, value: float, message: str, qdata: Dict,
                                delta: float, compressed: float,
                                temporal_metrics: Dict, context: Dict,
-                               meta: Dict) -> Dict:
-        """Create a universal log entry"""
+                               meta: Dict, timestamp: float = None) -> Dict:
+        """Create a universal log entry (timestamped when it was logged)"""
+        timestamp = timestamp or time.time()
         entry_id = hashlib.sha256(
-            f"{time.time()}{message}{value}{self.universal_state.signature}".encode()
+            f"{timestamp}{message}{value}{self.universal_state.signature}".encode()
         ).hexdigest()[:16]
 
         entry = {
             'id': entry_id,
-            'timestamp': datetime.now(timezone.utc).isoformat(),
-            'universal_time': time.time(),
+            'timestamp': datetime.fromtimestamp(timestamp, timezone.utc).isoformat(),
+            'universal_time': timestamp,
             'value': round(value, 6),
             'message': message[:500],
             'quantum': qdata,
@@ -1030,12 +1589,18 @@ class LASERV30:
             self._universal_flush(emergency=emergency_flush)
 
     def _universal_flush(self, emergency: bool = False):
-        """Universal flush with system integration"""
+        """
+        Universal flush with system integration
+        Only swaps the buffer out under the lock; the AsyncLogWriter does the
+        encoding and file write (blocking here only under writer backpressure).
+        """
         if not self.buffer:
             return
 
         with self._lock:
             count = len(self.buffer)
+            if not count:
+                return
             flush_type = "🚨 QUANTUM EMERGENCY" if emergency else "⚡ UNIVERSAL"
 
             print(f"{flush_type} FLUSH | "
@@ -1047,42 +1612,36 @@ class LASERV30:
             if emergency:
                 self.metrics['emergency_flushes'] += 1
 
-            # Write to universal log
-            path = self.config['log_path']
-            try:
-                with open(path, 'a', encoding='utf-8') as f:
-                    for entry in self.buffer:
-                        # Add flush metadata
-                        entry['flush_metadata'] = {
-                            'type': 'quantum_emergency' if emergency else 'universal',
-                            'timestamp': time.time(),
-                            'universal_state': asdict(self.universal_state),
-                            'metrics': self.metrics_report(),
-                            'buffer_state': {
-                                'size_before': count,
-                                'emergency': emergency,
-                                'universal_risk': self.universal_state.risk
-                            }
-                        }
-
-                        f.write(json.dumps(entry, separators=(',', ':')) + '\n')
-
-                    self.metrics['flushes'] += 1
-
-            except Exception as e:
-                print(f"⚠️ Universal write failed: {e}")
-                # Fallback to console
-                for entry in list(self.buffer)[:2]:
-                    print(f"[FALLBACK] {entry['timestamp']} - {entry['message'][:60]}...")
+            # One flush header shared by the whole batch
+            flush_metadata = {
+                'type': 'quantum_emergency' if emergency else 'universal',
+                'timestamp': time.time(),
+                'universal_state': asdict(self.universal_state),
+                'metrics': self.metrics_report(),
+                'buffer_state': {
+                    'size_before': count,
+                    'emergency': emergency,
+                    'universal_risk': self.universal_state.risk
+                }
+            }
 
-            # Clear buffer
+            # Swap the buffer out; encoding and file I/O run on the writer thread
+            entries = list(self.buffer)
             self.buffer.clear()
+            self.metrics['flushes'] += 1
             self.metrics['last_flush'] = time.time()
+            self._writer.submit(self.store, flush_metadata, entries)
 
             # Update compression savings metric
             if self.cache.metrics['compressions'] > 0:
                 self.metrics['compression_savings'] = self.cache.metrics['size_reduction']
 
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Merge pending records, flush the buffer and wait until the writer has persisted it"""
+        self.merge_pending()
+        self._universal_flush()
+        return self._writer.drain(timeout)
+
     def query_universal_memory(self, concept: str,
                               temporal_range: Tuple[float, float] = None,
                               quantum_filter: Dict = None) -> List[Dict]:
@@ -1099,47 +1658,34 @@ class LASERV30:
         """
         results = []
 
-        try:
-            # Read the universal log file
-            if not os.path.exists(self.config['log_path']):
-                return results
+        # Read-your-writes: let the writer persist flushed batches first
+        self._writer.drain(timeout=1.0)
 
-            with open(self.config['log_path'], 'r', encoding='utf-8') as f:
-                for line in f:
-                    if line.startswith('#'):
+        try:
+            # Indexed segments: whole segments are skipped from their summaries
+            # and only lines the token index points at are decoded
+            for entry in self.store.iter_entries(concept, temporal_range, quantum_filter):
+                # Temporal filtering
+                if temporal_range:
+                    entry_time = entry.get('universal_time', 0)
+                    start_time, end_time = temporal_range
+                    if not (start_time <= entry_time <= end_time):
                         continue
 
-                    try:
-                        entry = json.loads(line.strip())
-
-                        # Concept matching
-                        if concept.lower() not in entry.get('message', '').lower():
-                            continue
-
-                        # Temporal filtering
-                        if temporal_range:
-                            entry_time = entry.get('universal_time', 0)
-                            start_time, end_time = temporal_range
-                            if not (start_time <= entry_time <= end_time):
-                                continue
-
-                        # Quantum filtering
-                        if quantum_filter:
-                            if not self._quantum_filter_match(entry, quantum_filter):
-                                continue
-
-                        # Calculate quantum similarity
-                        similarity = self._calculate_quantum_similarity(entry)
-                        entry['quantum_similarity'] = similarity
+                # Quantum filtering
+                if quantum_filter:
+                    if not self._quantum_filter_match(entry, quantum_filter):
+                        continue
 
-                        results.append(entry)
+                # Calculate quantum similarity
+                similarity = self._calculate_quantum_similarity(entry)
+                entry['quantum_similarity'] = similarity
 
-                        # Limit for performance
-                        if len(results) >= 100:
-                            break
+                results.append(entry)
 
-                    except json.JSONDecodeError:
-                        continue
+                # Limit for performance
+                if len(results) >= 100:
+                    break
 
         except Exception as e:
             print(f"⚠️ Universal memory query failed: {e}")
@@ -1194,8 +1740,17 @@ class LASERV30:
 
     def _universal_maintenance(self):
         """Universal maintenance with system integration"""
-        while not self._shutdown.is_set():
-            time.sleep(45)  # Run every 45 seconds
+        next_maintenance = time.monotonic() + self.config['maintenance_interval']
+        while not self._shutdown.wait(self.config['merge_interval']):
+            try:
+                self.merge_pending()
+            except Exception as e:
+                if self.config['debug']:
+                    print(f"⚠️ Log merge error: {e}")
+
+            if time.monotonic() < next_maintenance:
+                continue
+            next_maintenance = time.monotonic() + self.config['maintenance_interval']
 
             try:
                 # System health monitoring
@@ -1223,7 +1778,8 @@ class LASERV30:
 
         if mem.percent > 85:
             # Reduce cache size under memory pressure
-            self.cache.max_size = max(100, int(self.cache.max_size * 0.8))
+            self.cache.resize(max_size=max(100, int(self.cache.max_size * 0.8)),
+                              max_bytes=max(1024 * 1024, int(self.cache.max_bytes * 0.8)))
 
             # Aggressive flushing
             if len(self.buffer) > 50:
@@ -1315,8 +1871,26 @@ class LASERV30:
                 'entanglements_created': self.metrics['entanglements_created'],
                 'system_integrations': self.metrics['system_integrations'],
                 'universal_queries': self.metrics['universal_queries'],
-                'compression_savings': round(self.metrics['compression_savings'], 3)
+                'compression_savings': round(self.metrics['compression_savings'], 3),
+                'logs_accepted': self.metrics['logs_accepted'],
+                'logs_filtered': self.metrics['logs_filtered'],
+                'logs_overflowed': self.metrics['logs_overflowed'],
+                'pending_records': sum(len(acc.records) for acc in list(self._accumulators))
+            },
+            'writer': {
+                **self._writer.metrics,
+                'pending_batches': self._writer.pending,
+                'backpressure_wait_ms': round(self._writer.metrics['backpressure_wait_ms'], 3),
+                'last_write_ms': round(self._writer.metrics['last_write_ms'], 3)
+            },
+            'cache': {
+                **self.cache.metrics,
+                'hit_rate': round(self.cache.metrics['hits'] /
+                                  max(1, self.cache.metrics['hits'] + self.cache.metrics['misses']), 4),
+                'size_reduction': round(self.cache.metrics['size_reduction'], 3),
+                'codec': self.cache.codec
             },
+            'storage': dict(self.store.metrics),
             'universal_state': {
                 'coherence': round(self.universal_state.coherence, 4),
                 'risk': round(self.universal_state.risk, 4),
@@ -1337,11 +1911,15 @@ class LASERV30:
         """Graceful universal shutdown"""
         print("🔴 LASER v3.0 Universal shutdown initiated...")
         self._shutdown.set()
+        self._maintenance_thread.join(timeout=5)
+        self.merge_pending()
 
         # Final universal flush
         if self.buffer:
             print(f"  Flushing {len(self.buffer)} universal logs...")
             self._universal_flush()
+        self._writer.close()
+        self.store.close()
 
         # Final telemetry
         if self.config['telemetry']:
@@ -1376,7 +1954,7 @@ class LASERV30:
         self.shutdown()
 
 # ============================================================
-# 6. INTEGRATION WRAPPERS
+# 7. INTEGRATION WRAPPERS
 # ============================================================
 
 class LASERIntegrator:
@@ -1430,7 +2008,7 @@ class LASERIntegrator:
 LASER = LASERIntegrator.create_universal()
 
 # ============================================================
-# 7. DEMONSTRATION
+# 8. DEMONSTRATION
 # ============================================================
 
 def demonstrate_universal_laser():
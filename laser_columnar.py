@@ -0,0 +1,705 @@
+#!/usr/bin/env python3
+"""
+LASER COLUMNAR - Block-Columnar Binary Storage for LASER Universal Memory
+=========================================================================
+
+An alternative to the JSONL segments of ``laser_segments``. Each flushed
+batch becomes one block of a ``.lcol`` segment file:
+
+1. Fixed numeric columns (timestamp, value, coherence, risk, entropy) as
+   little-endian float64 arrays, zlib-compressed together
+2. A dictionary-encoded message column, the batch's comment lines
+   (``#FLUSH`` headers) and the residual of every entry (the JSON left once
+   the columns above are taken out), zlib-compressed as a second section
+3. An uncompressed block header with the row count, the section lengths and
+   min/max of every numeric column
+
+Readers prune whole blocks from the headers, decode the numeric section to
+filter rows by numeric ranges, and only decompress the string section of a
+block when some row survives. Round trips are exact: an extracted field
+is left as ``null`` in the residual (which keeps key order) and is put
+back from its column; fields that are not floats stay in the residual.
+
+Switching ``log_format`` to 'columnar' keeps the JSONL history written
+before it (the flat ``log_path`` and ``<log stem>.segments/``) queryable:
+the store serves it read-only through ``SegmentedLogStore`` until
+``convert_log`` moves it into ``<log stem>.columnar/`` (sources it has
+converted are listed in ``imported.json`` with the bytes converted, and
+only lines appended after that are still read as JSONL).
+
+    python laser_columnar.py to-columnar laser_universal_v30.jsonl
+    python laser_columnar.py to-jsonl laser_universal_v30.columnar/seg-<start>.lcol restored.jsonl
+"""
+
+import os
+import sys
+import json
+import zlib
+import shutil
+import struct
+import argparse
+import threading
+from typing import Dict, Iterator, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+
+from laser_segments import SegmentedLogStore
+
+FILE_MAGIC = b"LCOL\x01\x00\x00\x00"
+BLOCK_MAGIC = b"BLK1"
+SEGMENT_PREFIX = "seg-"
+SEGMENT_SUFFIX = ".lcol"
+IMPORTED_NAME = "imported.json"  # JSONL source (relative to the log) -> its conversion record
+BLOCK_ROWS = 4096       # Rows per block when converting JSONL
+COMPRESS_LEVEL = 9
+NO_MESSAGE = 0xFFFFFFFF  # Message code of rows whose message stays in the residual
+
+# Column name -> (entry path, value used for filtering when the entry lacks it).
+# The defaults match laser_segments.SegmentIndex.SUMMARIES.
+COLUMNS = {
+    'timestamp': (('universal_time',), 0.0),
+    'value': (('value',), 0.0),
+    'coherence': (('quantum', 'coherence'), 0.0),
+    'risk': (('quantum', 'risk'), 1.0),
+    'entropy': (('quantum', 'entropy'), 1.0),
+}
+COLUMN_NAMES = tuple(COLUMNS)
+F64 = np.dtype('<f8')
+U32 = np.dtype('<u4')
+
+BLOCK_HEADER = struct.Struct('<4sIII' + 'd' * (2 * len(COLUMNS)))
+
+Ranges = Dict[str, Tuple[float, float]]
+
+
+# ==================== ENCODING ====================
+def _split_entry(entry: Dict) -> Tuple[List[float], Optional[str], Dict]:
+    """(column values, message, residual) of one entry; NaN = not extracted."""
+    residual = dict(entry)
+    values = []
+    for keys, _ in COLUMNS.values():
+        parent = residual
+        for key in keys[:-1]:
+            child = parent.get(key)
+            if not isinstance(child, dict):
+                parent = None
+                break
+            if child is entry.get(key):  # copy before the placeholder goes in
+                child = parent[key] = dict(child)
+            parent = child
+        value = parent.get(keys[-1]) if parent is not None else None
+        if type(value) is float and value == value:
+            parent[keys[-1]] = None
+            values.append(value)
+        else:
+            values.append(float('nan'))
+
+    message = residual.get('message')
+    if isinstance(message, str):
+        residual['message'] = None
+    else:
+        message = None
+    return values, message, residual
+
+
+def _join_entry(values: Sequence[float], message: Optional[str], residual: Dict) -> Dict:
+    """Inverse of ``_split_entry``."""
+    for (keys, _), value in zip(COLUMNS.values(), values):
+        if value != value:
+            continue
+        parent = residual
+        for key in keys[:-1]:
+            parent = parent[key]
+        parent[keys[-1]] = float(value)
+    if message is not None:
+        residual['message'] = message
+    return residual
+
+
+def _u32_block(values) -> bytes:
+    return np.asarray(values, dtype=U32).tobytes()
+
+
+def encode_block(entries: List[Dict], preamble: Sequence[str] = ()) -> bytes:
+    """One block (header + numeric section + string section) for ``entries``."""
+    count = len(entries)
+    columns = np.empty((len(COLUMNS), count), dtype=F64)
+    dictionary: Dict[str, int] = {}
+    codes = []
+    residuals = []
+    for row, entry in enumerate(entries):
+        values, message, residual = _split_entry(entry)
+        columns[:, row] = values
+        codes.append(NO_MESSAGE if message is None else dictionary.setdefault(message, len(dictionary)))
+        residuals.append(json.dumps(residual, separators=(',', ':')).encode('utf-8'))
+
+    stats = []
+    for i, (_, default) in enumerate(COLUMNS.values()):
+        filled = np.where(np.isnan(columns[i]), default, columns[i])
+        stats += [float(filled.min()), float(filled.max())] if count else [float('inf'), float('-inf')]
+
+    numeric = zlib.compress(columns.tobytes(), COMPRESS_LEVEL)
+
+    preamble_raw = '\n'.join(preamble).encode('utf-8')
+    messages = [m.encode('utf-8') for m in dictionary]
+    strings = zlib.compress(b''.join([
+        struct.pack('<III', len(preamble), len(preamble_raw), len(messages)), preamble_raw,
+        _u32_block([len(m) for m in messages]), *messages,
+        _u32_block(codes),
+        _u32_block([len(r) for r in residuals]), *residuals,
+    ]), COMPRESS_LEVEL)
+
+    header = BLOCK_HEADER.pack(BLOCK_MAGIC, count, len(numeric), len(strings), *stats)
+    return header + numeric + strings
+
+
+class BlockInfo:
+    """Header of one block: where it is, its row count and column min/max."""
+    __slots__ = ('offset', 'count', 'numeric_len', 'strings_len', 'stats')
+
+    def __init__(self, offset: int, count: int, numeric_len: int, strings_len: int, stats: Sequence[float]):
+        self.offset = offset
+        self.count = count
+        self.numeric_len = numeric_len
+        self.strings_len = strings_len
+        self.stats = {name: (stats[2 * i], stats[2 * i + 1]) for i, name in enumerate(COLUMN_NAMES)}
+
+    @property
+    def end(self) -> int:
+        return self.offset + BLOCK_HEADER.size + self.numeric_len + self.strings_len
+
+    def may_match(self, ranges: Optional[Ranges]) -> bool:
+        """False when the column min/max prove no row is in ``ranges``."""
+        if not ranges:
+            return True
+        for name, (low, high) in ranges.items():
+            col_min, col_max = self.stats[name]
+            if col_max < low or col_min > high:
+                return False
+        return True
+
+
+class DecodedStrings:
+    """String section of a block; messages and residuals are decoded on access."""
+
+    def __init__(self, raw: bytes, count: int):
+        preamble_lines, preamble_len, n_messages = struct.unpack_from('<III', raw, 0)
+        pos = 12
+        self.preamble = raw[pos:pos + preamble_len].decode('utf-8').split('\n') if preamble_lines else []
+        pos += preamble_len
+        lengths = np.frombuffer(raw, U32, n_messages, pos)
+        pos += 4 * n_messages
+        self._messages_at = pos + np.concatenate(([0], np.cumsum(lengths, dtype=np.int64)))
+        pos = int(self._messages_at[-1])
+        self.codes = np.frombuffer(raw, U32, count, pos)
+        pos += 4 * count
+        residual_lengths = np.frombuffer(raw, U32, count, pos)
+        pos += 4 * count
+        self._residuals_at = pos + np.concatenate(([0], np.cumsum(residual_lengths, dtype=np.int64)))
+        self._raw = raw
+        self._cache: Dict[int, str] = {}
+
+    def dictionary(self) -> List[str]:
+        return [self.message_for_code(code) for code in range(len(self._messages_at) - 1)]
+
+    def message_for_code(self, code: int) -> str:
+        message = self._cache.get(code)
+        if message is None:
+            start, end = self._messages_at[code], self._messages_at[code + 1]
+            message = self._cache[code] = self._raw[start:end].decode('utf-8')
+        return message
+
+    def message(self, row: int) -> Optional[str]:
+        code = int(self.codes[row])
+        return None if code == NO_MESSAGE else self.message_for_code(code)
+
+    def residual(self, row: int) -> Dict:
+        return json.loads(self._raw[self._residuals_at[row]:self._residuals_at[row + 1]])
+
+
+# ==================== READING ====================
+class ColumnarLogReader:
+    """Reads the blocks of one ``.lcol`` file; a torn trailing block is ignored."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.blocks: List[BlockInfo] = []
+        self.size = 0  # bytes covered by complete blocks
+        self.metrics = {'blocks_skipped': 0, 'blocks_decoded': 0, 'strings_decoded': 0}
+        self.refresh()
+
+    def refresh(self):
+        """Picks up blocks appended since the last call."""
+        with open(self.path, 'rb') as f:
+            if not self.blocks:
+                if f.read(len(FILE_MAGIC)) != FILE_MAGIC:
+                    raise ValueError(f"{self.path} is not a LASER columnar file")
+                self.size = len(FILE_MAGIC)
+            f.seek(self.size)
+            file_size = os.fstat(f.fileno()).st_size
+            while self.size + BLOCK_HEADER.size <= file_size:
+                fields = BLOCK_HEADER.unpack(f.read(BLOCK_HEADER.size))
+                if fields[0] != BLOCK_MAGIC:
+                    break
+                block = BlockInfo(self.size, fields[1], fields[2], fields[3], fields[4:])
+                if block.end > file_size:
+                    break
+                self.blocks.append(block)
+                self.size = block.end
+                f.seek(self.size)
+
+    def __len__(self) -> int:
+        return sum(block.count for block in self.blocks)
+
+    # --- block access ---
+    def _numeric(self, f, block: BlockInfo) -> np.ndarray:
+        f.seek(block.offset + BLOCK_HEADER.size)
+        raw = zlib.decompress(f.read(block.numeric_len))
+        self.metrics['blocks_decoded'] += 1
+        return np.frombuffer(raw, F64).reshape(len(COLUMNS), block.count)
+
+    def _strings(self, f, block: BlockInfo) -> DecodedStrings:
+        f.seek(block.offset + BLOCK_HEADER.size + block.numeric_len)
+        self.metrics['strings_decoded'] += 1
+        return DecodedStrings(zlib.decompress(f.read(block.strings_len)), block.count)
+
+    @staticmethod
+    def _mask(columns: np.ndarray, ranges: Optional[Ranges]) -> np.ndarray:
+        mask = np.ones(columns.shape[1], dtype=bool)
+        for name, (low, high) in (ranges or {}).items():
+            i = COLUMN_NAMES.index(name)
+            values = np.where(np.isnan(columns[i]), COLUMNS[name][1], columns[i])
+            mask &= (values >= low) & (values <= high)
+        return mask
+
+    def _candidates(self, f, ranges: Optional[Ranges]) -> Iterator[Tuple[BlockInfo, np.ndarray, np.ndarray]]:
+        """(block, numeric columns, matching rows) for blocks with at least one match."""
+        for name in ranges or ():
+            if name not in COLUMNS:
+                raise KeyError(f"Unknown column: {name} (expected one of {COLUMN_NAMES})")
+        for block in self.blocks:
+            if not block.may_match(ranges):
+                self.metrics['blocks_skipped'] += 1
+                continue
+            columns = self._numeric(f, block)
+            rows = np.flatnonzero(self._mask(columns, ranges))
+            if len(rows):
+                yield block, columns, rows
+
+    # --- queries ---
+    def scan(self, ranges: Optional[Ranges] = None) -> Iterator[Dict[str, np.ndarray]]:
+        """Per block, the numeric columns of the rows inside ``ranges``; strings stay undecoded."""
+        with open(self.path, 'rb') as f:
+            for _, columns, rows in self._candidates(f, ranges):
+                yield {name: columns[i, rows] for i, name in enumerate(COLUMN_NAMES)}
+
+    def column(self, name: str, ranges: Optional[Ranges] = None) -> np.ndarray:
+        """One numeric column over the whole file (NaN where an entry lacked it)."""
+        i = COLUMN_NAMES.index(name)
+        with open(self.path, 'rb') as f:
+            parts = [columns[i, rows] for _, columns, rows in self._candidates(f, ranges)]
+        return np.concatenate(parts) if parts else np.empty(0, dtype=F64)
+
+    def entries(self, ranges: Optional[Ranges] = None, concept: Optional[str] = None) -> Iterator[Dict]:
+        """
+        Full entries inside ``ranges`` whose message contains ``concept``
+        (case-insensitive). The concept is matched once per distinct message.
+        """
+        needle = concept.lower() if concept else None
+        with open(self.path, 'rb') as f:
+            for block, columns, rows in self._candidates(f, ranges):
+                strings = self._strings(f, block)
+                if needle is not None:
+                    hits = [code for code, message in enumerate(strings.dictionary()) if needle in message.lower()]
+                    rows = rows[np.isin(strings.codes[rows], hits)]
+                for row in rows:
+                    yield _join_entry(columns[:, row], strings.message(row), strings.residual(row))
+
+    def lines(self) -> Iterator[str]:
+        """The file as JSONL lines (comment lines included, no newlines)."""
+        with open(self.path, 'rb') as f:
+            for block in self.blocks:
+                columns = self._numeric(f, block) if block.count else None
+                strings = self._strings(f, block)
+                yield from strings.preamble
+                for row in range(block.count):
+                    entry = _join_entry(columns[:, row], strings.message(row), strings.residual(row))
+                    yield json.dumps(entry, separators=(',', ':'))
+
+
+# ==================== WRITING ====================
+class ColumnarLogWriter:
+    """Appends blocks to one ``.lcol`` file, cutting off a torn trailing block first."""
+
+    def __init__(self, path: str):
+        self.path = path
+        if os.path.exists(path) and os.path.getsize(path) >= len(FILE_MAGIC):
+            self.reader = ColumnarLogReader(path)
+            if self.reader.size < os.path.getsize(path):
+                with open(path, 'r+b') as f:
+                    f.truncate(self.reader.size)
+        else:
+            with open(path, 'wb') as f:
+                f.write(FILE_MAGIC)
+            self.reader = ColumnarLogReader(path)
+        self.size = self.reader.size
+
+    def write_block(self, entries: List[Dict], preamble: Sequence[str] = (), sync: bool = False) -> int:
+        """Appends one block; returns bytes written."""
+        block = encode_block(entries, preamble)
+        with open(self.path, 'ab') as f:
+            f.write(block)
+            if sync:
+                f.flush()
+                os.fsync(f.fileno())
+        self.size += len(block)
+        self.reader.refresh()
+        return len(block)
+
+
+class ColumnarLogStore:
+    """
+    Drop-in for ``SegmentedLogStore`` (``log_format='columnar'``): time-rotated
+    ``.lcol`` segments under ``<log stem>.columnar/``, one block per flush.
+    ``history`` serves the JSONL log from before the switch, read-only,
+    ahead of the columnar segments.
+    """
+
+    def __init__(self, log_path: str, segment_seconds: float = 3600.0,
+                 segment_max_bytes: int = 64 * 1024 * 1024):
+        self.log_path = log_path
+        self.directory = os.path.splitext(log_path)[0] + ".columnar"
+        self.segment_seconds = segment_seconds
+        self.segment_max_bytes = segment_max_bytes
+        self.history = SegmentedLogStore(log_path, segment_seconds, segment_max_bytes,
+                                         converted=self._converted_sources())
+
+        self._lock = threading.Lock()
+        self._segments: Optional[Dict[str, ColumnarLogReader]] = None
+        self._writer: Optional[ColumnarLogWriter] = None
+        self._start: Optional[float] = None
+        self._unsynced: Set[str] = set()
+
+        self.metrics = {
+            'segments_created': 0,
+            'segments_scanned': 0,
+            'segments_skipped': 0,
+            'blocks_skipped': 0,
+            'lines_decoded': 0,
+        }
+
+    # ==================== SEGMENT DISCOVERY ====================
+    @property
+    def imported_path(self) -> str:
+        return os.path.join(self.directory, IMPORTED_NAME)
+
+    def imported(self) -> Dict[str, Dict]:
+        """
+        JSONL sources ``convert_log`` has converted: relative path ->
+        ``{'read': bytes converted, 'target': .lcol name, 'bytes': its size}``.
+        """
+        try:
+            with open(self.imported_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _converted_sources(self) -> Dict[str, int]:
+        """Converted JSONL sources -> bytes already served from the columnar segments."""
+        base = os.path.dirname(self.log_path)
+        return {os.path.join(base, name): record['read'] for name, record in self.imported().items()}
+
+    def _load(self) -> Dict[str, ColumnarLogReader]:
+        """Open every segment once; caller holds the lock."""
+        if self._segments is None:
+            self._segments = {}
+            names = []
+            if os.path.isdir(self.directory):
+                names = sorted((n for n in os.listdir(self.directory)
+                                if n.startswith(SEGMENT_PREFIX) and n.endswith(SEGMENT_SUFFIX)),
+                               key=lambda n: float(n[len(SEGMENT_PREFIX):-len(SEGMENT_SUFFIX)]))
+            for name in names:
+                path = os.path.join(self.directory, name)
+                self._segments[path] = ColumnarLogReader(path)
+            if names:
+                last = names[-1]
+                self._writer = ColumnarLogWriter(os.path.join(self.directory, last))
+                self._segments[self._writer.path] = self._writer.reader
+                self._start = float(last[len(SEGMENT_PREFIX):-len(SEGMENT_SUFFIX)])
+        return self._segments
+
+    @property
+    def segments(self) -> List[ColumnarLogReader]:
+        with self._lock:
+            return list(self._load().values())
+
+    # ==================== WRITING ====================
+    def _rotate(self, start_time: float) -> ColumnarLogWriter:
+        os.makedirs(self.directory, exist_ok=True)
+        path = os.path.join(self.directory, f"{SEGMENT_PREFIX}{start_time:.6f}{SEGMENT_SUFFIX}")
+        self._writer = ColumnarLogWriter(path)
+        self._segments[path] = self._writer.reader
+        self._start = start_time
+        self.metrics['segments_created'] += 1
+        return self._writer
+
+    def append_batch(self, header: Dict, entries: List[Dict], sync: bool = False) -> int:
+        """Write one flushed batch as a block (header kept as its #FLUSH line); returns bytes written."""
+        preamble = [f"#FLUSH {json.dumps(header, separators=(',', ':'))}"]
+        batch_time = 0.0
+        if entries and isinstance(entries[0].get('universal_time'), (int, float)):
+            batch_time = float(entries[0]['universal_time'])
+        if not batch_time:
+            batch_time = float(header.get('timestamp', 0.0))
+
+        with self._lock:
+            self._load()
+            writer = self._writer
+            if (writer is None
+                    or batch_time - self._start >= self.segment_seconds
+                    or writer.size >= self.segment_max_bytes):
+                writer = self._rotate(batch_time)
+            written = writer.write_block(entries, preamble, sync=sync)
+            if sync:
+                self._sync_locked()  # segments rotated out since the last fsync
+            else:
+                self._unsynced.add(writer.path)
+            return written
+
+    def sync(self):
+        """fsync every segment written since its last fsync."""
+        with self._lock:
+            self._sync_locked()
+
+    def _sync_locked(self):
+        for path in sorted(self._unsynced):
+            with open(path, 'ab') as f:
+                os.fsync(f.fileno())
+            self._unsynced.discard(path)
+
+    def close(self):
+        """Blocks are self-describing; only the JSONL history's sidecars may need saving."""
+        self.history.close()
+
+    # ==================== QUERYING ====================
+    @staticmethod
+    def ranges_for(temporal_range: Optional[Tuple[float, float]] = None,
+                   quantum_filter: Optional[Dict] = None) -> Ranges:
+        """LASER's temporal range / quantum filter as column ranges."""
+        ranges = {}
+        if temporal_range:
+            ranges['timestamp'] = tuple(temporal_range)
+        quantum_filter = quantum_filter or {}
+        if 'coherence_min' in quantum_filter:
+            ranges['coherence'] = (quantum_filter['coherence_min'], float('inf'))
+        if 'risk_max' in quantum_filter:
+            ranges['risk'] = (float('-inf'), quantum_filter['risk_max'])
+        if 'entropy_max' in quantum_filter:
+            ranges['entropy'] = (float('-inf'), quantum_filter['entropy_max'])
+        return ranges
+
+    def iter_entries(self, concept: str,
+                     temporal_range: Optional[Tuple[float, float]] = None,
+                     quantum_filter: Optional[Dict] = None) -> Iterator[Dict]:
+        """
+        Same contract as ``SegmentedLogStore.iter_entries``, oldest segment
+        first: segments converted from JSONL, then what is left of the JSONL
+        history (lines written after the conversion), then the store's own.
+        """
+        ranges = self.ranges_for(temporal_range, quantum_filter)
+        targets = {os.path.join(self.directory, record['target']) for record in self.imported().values()}
+        with self._lock:
+            readers = list(self._load().values())
+        converted = [reader for reader in readers if reader.path in targets]
+
+        yield from self._reader_entries(converted, ranges, concept)
+        yield from self._history_entries(concept, temporal_range, quantum_filter)
+        yield from self._reader_entries([r for r in readers if r.path not in targets], ranges, concept)
+
+    def _reader_entries(self, readers: List[ColumnarLogReader], ranges: Ranges,
+                        concept: str) -> Iterator[Dict]:
+        for reader in readers:
+            if not any(block.may_match(ranges) for block in reader.blocks):
+                self.metrics['segments_skipped'] += 1
+                continue
+            self.metrics['segments_scanned'] += 1
+            skipped = reader.metrics['blocks_skipped']
+            for entry in reader.entries(ranges, concept):
+                self.metrics['lines_decoded'] += 1
+                yield entry
+            self.metrics['blocks_skipped'] += reader.metrics['blocks_skipped'] - skipped
+
+    def _history_entries(self, concept: str, temporal_range: Optional[Tuple[float, float]],
+                         quantum_filter: Optional[Dict]) -> Iterator[Dict]:
+        """The JSONL history's matches, its pruning counted in this store's metrics."""
+        before = dict(self.history.metrics)
+        try:
+            yield from self.history.iter_entries(concept, temporal_range, quantum_filter)
+        finally:
+            for key in ('segments_scanned', 'segments_skipped', 'lines_decoded'):
+                self.metrics[key] += self.history.metrics[key] - before[key]
+
+    def column(self, name: str, ranges: Optional[Ranges] = None) -> np.ndarray:
+        """One numeric column across the columnar segments (the JSONL history is not included)."""
+        parts = [reader.column(name, ranges) for reader in self.segments]
+        return np.concatenate(parts) if parts else np.empty(0, dtype=F64)
+
+    def stats(self) -> Dict:
+        readers = self.segments
+        history = self.history.stats()
+        return {
+            **self.metrics,
+            'segments': len(readers) + history['segments'],
+            'entries': sum(len(r) for r in readers) + history['entries'],
+            'bytes': sum(r.size for r in readers) + history['bytes'],
+            'jsonl_segments': history['segments'],
+        }
+
+
+# ==================== CONVERSION ====================
+def jsonl_to_columnar(src: str, dst: str, block_rows: int = BLOCK_ROWS, offset: int = 0) -> Dict[str, int]:
+    """
+    Converts one LASER JSONL file to a new columnar file (an existing ``dst``
+    is refused). Comment lines (#FLUSH, #UNIVERSAL_INIT) and lines that are
+    not JSON objects start a new block and are kept verbatim in its
+    preamble, so the export is line-for-line.
+
+    With ``offset``, only the lines from that byte on are converted and
+    appended to the existing ``dst``. Either way ``dst`` is replaced
+    atomically. A trailing line without its newline (a write in progress)
+    is left for the next run; ``stats['read']`` is the offset converted up to.
+    """
+    if offset and not os.path.exists(dst):
+        raise FileNotFoundError(f"{dst} does not exist")
+    if not offset and os.path.exists(dst):
+        raise FileExistsError(f"{dst} already exists")
+    tmp = dst + ".tmp"
+    if os.path.exists(tmp):
+        os.remove(tmp)  # left over from an interrupted run
+    if offset:
+        shutil.copyfile(dst, tmp)
+    writer = ColumnarLogWriter(tmp)
+    copied = writer.size
+    preamble: List[str] = []
+    entries: List[Dict] = []
+    stats = {'lines': 0, 'entries': 0, 'blocks': 0, 'read': offset}
+
+    def emit():
+        if entries or preamble:
+            writer.write_block(entries, preamble)
+            stats['blocks'] += 1
+            stats['entries'] += len(entries)
+            preamble.clear()
+            entries.clear()
+
+    with open(src, 'rb') as f:
+        f.seek(offset)
+        for raw in f:
+            if not raw.endswith(b'\n'):
+                break
+            line = raw[:-1].decode('utf-8')
+            stats['lines'] += 1
+            stats['read'] += len(raw)
+            entry = None
+            if line and not line.startswith('#'):
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    entry = None
+            if isinstance(entry, dict) and json.dumps(entry, separators=(',', ':')) == line:
+                entries.append(entry)
+                if len(entries) >= block_rows:
+                    emit()
+            else:
+                if entries:
+                    emit()
+                preamble.append(line)
+    emit()
+    os.replace(tmp, dst)
+    stats['bytes_in'] = stats['read'] - offset
+    stats['bytes_out'] = writer.size - copied
+    return stats
+
+
+def convert_log(log_path: str, block_rows: int = BLOCK_ROWS) -> Dict[str, int]:
+    """
+    Converts a LASER JSONL log (the flat ``log_path`` and its
+    ``<stem>.segments/``) into ``<stem>.columnar/`` segments, where
+    ``ColumnarLogStore`` finds them. A segment keeps its start time in its
+    name; the flat log is named after its oldest entry. How far each source
+    was converted is recorded in ``imported.json``: running it again only
+    appends what was written since (the active segment keeps growing) and
+    the store serves just that tail as JSONL. Lines LASER did not write
+    itself (not compact JSON) are kept verbatim but are not queryable.
+    """
+    store = ColumnarLogStore(log_path)
+    jsonl = SegmentedLogStore(log_path)
+    base = os.path.dirname(log_path)
+    imported = store.imported()
+    totals = dict.fromkeys(('sources', 'lines', 'entries', 'blocks', 'bytes_in', 'bytes_out'), 0)
+    os.makedirs(store.directory, exist_ok=True)
+
+    for index in jsonl.segments:
+        name = os.path.relpath(index.path, base or os.curdir)
+        record = imported.get(name)
+        if record and os.path.getsize(index.path) <= record['read']:
+            continue
+        if record:
+            target = record['target']
+        elif index.path == log_path:
+            start = index.summary['time'][0] if index.count else 0.0
+            target = f"{SEGMENT_PREFIX}{start:.6f}{SEGMENT_SUFFIX}"
+        else:
+            target = os.path.splitext(os.path.basename(index.path))[0] + SEGMENT_SUFFIX
+        dst = os.path.join(store.directory, target)
+        if record and os.path.getsize(dst) != record['bytes']:
+            raise RuntimeError(f"{dst} changed since {name} was converted into it")
+        stats = jsonl_to_columnar(index.path, dst, block_rows, offset=record['read'] if record else 0)
+        for key in totals:
+            totals[key] += stats.get(key, 0)
+        totals['sources'] += 1
+
+        imported[name] = {'read': stats['read'], 'target': target, 'bytes': os.path.getsize(dst)}
+        tmp = store.imported_path + ".tmp"
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(imported, f, indent=1)
+        os.replace(tmp, store.imported_path)
+    jsonl.close()
+    return totals
+
+
+def columnar_to_jsonl(src: str, dst: str) -> int:
+    """Exports a columnar file back to JSONL; returns the number of lines."""
+    count = 0
+    with open(dst, 'w', encoding='utf-8') as f:
+        for line in ColumnarLogReader(src).lines():
+            f.write(line + '\n')
+            count += 1
+    return count
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="LASER columnar log converter")
+    sub = parser.add_subparsers(dest='command', required=True)
+    to_columnar = sub.add_parser('to-columnar', help="JSONL log (flat file + segments) -> <stem>.columnar/")
+    to_columnar.add_argument('log_path')
+    to_columnar.add_argument('--block-rows', type=int, default=BLOCK_ROWS)
+    to_jsonl = sub.add_parser('to-jsonl', help="columnar file -> JSONL log")
+    to_jsonl.add_argument('src')
+    to_jsonl.add_argument('dst')
+    args = parser.parse_args(argv)
+
+    if args.command == 'to-columnar':
+        stats = convert_log(args.log_path, args.block_rows)
+        if not stats['sources']:
+            print(f"✅ Nothing new to convert in {args.log_path}")
+            return
+        ratio = stats['bytes_in'] / max(1, stats['bytes_out'])
+        print(f"✅ {stats['sources']} JSONL files | {stats['entries']} entries in {stats['blocks']} blocks | "
+              f"{stats['bytes_in']:,} -> {stats['bytes_out']:,} bytes ({ratio:.1f}x)")
+    else:
+        print(f"✅ {columnar_to_jsonl(args.src, args.dst)} lines written to {args.dst}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
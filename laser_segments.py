@@ -0,0 +1,508 @@
+#!/usr/bin/env python3
+"""
+LASER SEGMENTS - Time-Segmented, Indexed Storage for LASER Universal Memory
+===========================================================================
+
+The universal log is rotated into time-bounded JSONL segments under
+``<log stem>.segments/``. Every segment has two sidecars:
+
+1. ``.idx.json``: universal_time min/max (temporal pruning) and
+   coherence / risk / entropy min/max/sum summaries (quantum-filter pruning)
+2. ``.postings.json``: entry line offsets and an inverted token index
+   (message token -> byte offsets of entry lines)
+
+Only the small summaries stay in memory. ``query_universal_memory`` skips
+whole segments from them, loads the postings of the segments that remain
+(a bounded LRU), and only seeks to and decodes the lines the token index
+points at. Tokens are looked up exactly or by sorted prefix (a sorted
+suffix table covers fragments). Matching stays exact: the index yields a
+superset of candidates and each decoded entry is re-checked with the
+original substring test.
+
+The pre-segmentation flat log (``log_path`` itself) is indexed as a
+read-only legacy segment, so older entries stay queryable.
+"""
+
+import os
+import re
+import json
+import threading
+from bisect import bisect_left
+from collections import OrderedDict
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9_]+")
+SEGMENT_PREFIX = "seg-"
+INDEX_SUFFIX = ".idx.json"
+POSTINGS_SUFFIX = ".postings.json"
+TOKEN_END = "\uffff"  # sorts after every token character
+
+
+def tokenize(text: str) -> List[str]:
+    """Lower-cased alphanumeric tokens of a message or query."""
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+class SegmentPostings:
+    """
+    Line offsets and inverted token index of one segment. Only needed once
+    a query gets past the summaries, so sealed segments load it on demand.
+    """
+
+    def __init__(self, lines: Optional[List[int]] = None,
+                 tokens: Optional[Dict[str, List[int]]] = None):
+        self.lines: List[int] = lines if lines is not None else []
+        self.tokens: Dict[str, List[int]] = tokens if tokens is not None else {}
+        self._vocabulary: Optional[List[str]] = None           # sorted tokens
+        self._suffixes: Optional[List[Tuple[str, str]]] = None  # sorted (suffix, token)
+
+    def add(self, offset: int, message):
+        self.lines.append(offset)
+        if isinstance(message, str):
+            for token in set(tokenize(message)):
+                token_offsets = self.tokens.get(token)
+                if token_offsets is None:
+                    self.tokens[token] = [offset]
+                    self._vocabulary = self._suffixes = None
+                else:
+                    token_offsets.append(offset)
+
+    # ==================== TOKEN LOOKUP ====================
+    @staticmethod
+    def _range(items: List, low, high) -> List:
+        return items[bisect_left(items, low):bisect_left(items, high)]
+
+    def _with_prefix(self, prefix: str) -> List[str]:
+        if self._vocabulary is None:
+            self._vocabulary = sorted(self.tokens)
+        return self._range(self._vocabulary, prefix, prefix + TOKEN_END)
+
+    def _suffix_table(self) -> List[Tuple[str, str]]:
+        if self._suffixes is None:
+            self._suffixes = sorted((token[i:], token) for token in self.tokens for i in range(len(token)))
+        return self._suffixes
+
+    def _containing(self, fragment: str) -> List[str]:
+        # A token contains the fragment iff one of its suffixes starts with it
+        return [token for _, token in self._range(self._suffix_table(), (fragment,), (fragment + TOKEN_END,))]
+
+    def _ending_with(self, suffix: str) -> List[str]:
+        return [token for _, token in self._range(self._suffix_table(), (suffix,), (suffix, TOKEN_END))]
+
+    def candidates(self, concept: str) -> List[int]:
+        """Offsets of lines whose message may contain ``concept``."""
+        query_tokens = tokenize(concept)
+        if not query_tokens:
+            return list(self.lines)
+
+        # Inside a substring match the concept's inner tokens are whole message
+        # tokens; only its first token may be cut on the left (a token suffix)
+        # and its last on the right (a token prefix). A lone token may be both.
+        if len(query_tokens) == 1:
+            groups = [self._containing(query_tokens[0])]
+        else:
+            groups = [self._ending_with(query_tokens[0])]
+            groups += [[token] if token in self.tokens else [] for token in query_tokens[1:-1]]
+            groups.append(self._with_prefix(query_tokens[-1]))
+
+        result = None
+        for tokens in groups:
+            offsets = set()
+            for token in tokens:
+                offsets.update(self.tokens[token])
+            result = offsets if result is None else result & offsets
+            if not result:
+                return []
+        return sorted(result)
+
+
+class SegmentIndex:
+    """
+    Resident part of a segment's index: size, entry count, time bounds and
+    quantum summaries. ``postings`` is loaded from its own sidecar on demand.
+    """
+
+    # Summary field -> (entry path, default used by the query filters)
+    SUMMARIES = {
+        'time': (('universal_time',), 0.0),
+        'coherence': (('quantum', 'coherence'), 0.0),
+        'risk': (('quantum', 'risk'), 1.0),
+        'entropy': (('quantum', 'entropy'), 1.0),
+    }
+
+    def __init__(self, path: str):
+        self.path = path
+        self.size = 0        # bytes of the segment covered by this index
+        self.count = 0
+        self.start: Optional[float] = None
+        self.summary: Dict[str, List[float]] = {}  # name -> [min, max, sum]
+        self.postings: Optional[SegmentPostings] = None
+        self.dirty = False   # changed since the sidecars were last written
+
+    # ==================== BUILDING ====================
+    @staticmethod
+    def _field(entry: Dict, keys: Tuple[str, ...], default: float) -> float:
+        value = entry
+        for key in keys:
+            if not isinstance(value, dict):
+                return default
+            value = value.get(key, default)
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return default
+
+    def add(self, offset: int, entry: Dict):
+        """Index one entry line starting at byte ``offset`` (postings loaded)."""
+        self.postings.add(offset, entry.get('message', ''))
+        self.count += 1
+        self.dirty = True
+        for name, (keys, default) in self.SUMMARIES.items():
+            value = self._field(entry, keys, default)
+            stats = self.summary.get(name)
+            if stats is None:
+                self.summary[name] = [value, value, value]
+            else:
+                if value < stats[0]:
+                    stats[0] = value
+                if value > stats[1]:
+                    stats[1] = value
+                stats[2] += value
+        if self.start is None and 'universal_time' in entry:
+            self.start = self._field(entry, ('universal_time',), 0.0)
+
+    def scan(self, start_offset: int = 0):
+        """(Re)index the segment file from ``start_offset`` to its end."""
+        if start_offset == 0:
+            self.__init__(self.path)
+            self.postings = SegmentPostings()
+        with open(self.path, 'rb') as f:
+            f.seek(start_offset)
+            offset = start_offset
+            for raw in f:
+                if not raw.endswith(b'\n'):
+                    break  # partial trailing line: picked up on the next scan
+                if not raw.startswith(b'#') and raw.strip():
+                    try:
+                        self.add(offset, json.loads(raw))
+                    except (json.JSONDecodeError, UnicodeDecodeError):
+                        pass
+                offset += len(raw)
+        self.size = offset
+        self.dirty = True
+
+    # ==================== PERSISTENCE ====================
+    @property
+    def sidecar(self) -> str:
+        return self.path + INDEX_SUFFIX
+
+    @property
+    def postings_sidecar(self) -> str:
+        return self.path + POSTINGS_SUFFIX
+
+    @staticmethod
+    def _dump(path: str, data: Dict):
+        tmp = path + ".tmp"
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(data, f, separators=(',', ':'))
+        os.replace(tmp, path)
+
+    def save(self):
+        """Writes the postings (when loaded), then the summary sidecar."""
+        if self.postings is not None:
+            self._dump(self.postings_sidecar, {
+                'size': self.size,
+                'lines': self.postings.lines,
+                'tokens': self.postings.tokens,
+            })
+        self._dump(self.sidecar, {
+            'size': self.size,
+            'count': self.count,
+            'start': self.start,
+            'summary': self.summary,
+        })
+        self.dirty = False
+
+    @classmethod
+    def load(cls, path: str) -> 'SegmentIndex':
+        """Summary sidecar for ``path``, rebuilt or extended if stale."""
+        index = cls(path)
+        try:
+            with open(index.sidecar, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            index.size = data['size']
+            index.count = data['count']
+            index.start = data.get('start')
+            index.summary = data['summary']
+            if 'lines' in data:
+                # Single-file sidecar from before the split: rewritten on the next save
+                index.postings = SegmentPostings(data['lines'], data['tokens'])
+                index.dirty = True
+        except (OSError, ValueError, KeyError):
+            index.size = 0
+
+        actual = os.path.getsize(path) if os.path.exists(path) else 0
+        if actual < index.size or index.size == 0:
+            index.scan(0)
+        elif actual > index.size:
+            index.load_postings()
+            index.scan(index.size)
+        return index
+
+    def load_postings(self) -> SegmentPostings:
+        """Postings from their sidecar, rescanning the segment when missing or stale."""
+        if self.postings is None:
+            try:
+                with open(self.postings_sidecar, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                if data['size'] != self.size:
+                    raise ValueError("stale postings")
+                self.postings = SegmentPostings(data['lines'], data['tokens'])
+            except (OSError, ValueError, KeyError):
+                self.scan(0)
+        return self.postings
+
+    # ==================== QUERYING ====================
+    def may_match(self, temporal_range: Optional[Tuple[float, float]] = None,
+                  quantum_filter: Optional[Dict] = None) -> bool:
+        """False when the summaries prove no entry can pass the filters."""
+        if self.count == 0:
+            return False
+        if temporal_range:
+            start_time, end_time = temporal_range
+            t_min, t_max, _ = self.summary['time']
+            if t_max < start_time or t_min > end_time:
+                return False
+        if quantum_filter:
+            if 'coherence_min' in quantum_filter and self.summary['coherence'][1] < quantum_filter['coherence_min']:
+                return False
+            if 'risk_max' in quantum_filter and self.summary['risk'][0] > quantum_filter['risk_max']:
+                return False
+            if 'entropy_max' in quantum_filter and self.summary['entropy'][0] > quantum_filter['entropy_max']:
+                return False
+        return True
+
+
+class SegmentedLogStore:
+    """
+    Append-only, time-rotated segment files plus their sidecar indexes.
+
+    Only the summaries stay resident. The active segment keeps its postings
+    for appends; sealed segments load theirs once a query passes
+    ``may_match`` and keep at most ``max_resident_postings`` of them (LRU).
+
+    ``append_batch`` is called by LASER's background writer; queries may run
+    concurrently from other threads. ``converted`` maps files already
+    converted elsewhere to the number of bytes converted: those bytes are
+    never served, and a file converted whole is not even indexed.
+    """
+
+    def __init__(self, log_path: str, segment_seconds: float = 3600.0,
+                 segment_max_bytes: int = 64 * 1024 * 1024, max_resident_postings: int = 8,
+                 converted: Optional[Dict[str, int]] = None):
+        self.log_path = log_path
+        self.directory = os.path.splitext(log_path)[0] + ".segments"
+        self.segment_seconds = segment_seconds
+        self.segment_max_bytes = segment_max_bytes
+        self.max_resident_postings = max(1, max_resident_postings)
+        self.converted = {os.path.normpath(path): size for path, size in (converted or {}).items()}
+
+        self._lock = threading.Lock()
+        self._indexes: Optional[Dict[str, SegmentIndex]] = None
+        self._active: Optional[SegmentIndex] = None
+        self._resident: 'OrderedDict[str, SegmentIndex]' = OrderedDict()  # sealed, postings loaded
+        self._unsynced: Set[str] = set()
+
+        self.metrics = {
+            'segments_created': 0,
+            'segments_scanned': 0,
+            'segments_skipped': 0,
+            'postings_loaded': 0,
+            'lines_decoded': 0,
+        }
+
+    # ==================== SEGMENT DISCOVERY ====================
+    def _segment_paths(self) -> List[str]:
+        if not os.path.isdir(self.directory):
+            return []
+        names = [n for n in os.listdir(self.directory)
+                 if n.startswith(SEGMENT_PREFIX) and n.endswith(".jsonl")]
+        names.sort(key=lambda n: float(n[len(SEGMENT_PREFIX):-len(".jsonl")]))
+        return [os.path.join(self.directory, n) for n in names]
+
+    def source_paths(self) -> List[str]:
+        """The flat legacy log (if any), then the segment files, oldest first."""
+        legacy = [self.log_path] if os.path.exists(self.log_path) else []
+        return legacy + self._segment_paths()
+
+    def _converted_bytes(self, path: str) -> int:
+        return self.converted.get(os.path.normpath(path), 0)
+
+    def _unconverted(self, path: str) -> bool:
+        return os.path.exists(path) and os.path.getsize(path) > self._converted_bytes(path)
+
+    def _load(self) -> Dict[str, SegmentIndex]:
+        """Load (or build) every summary once; caller holds the lock."""
+        if self._indexes is None:
+            self._indexes = {}
+            if self._unconverted(self.log_path):
+                self._indexes[self.log_path] = self._seal(SegmentIndex.load(self.log_path))
+            paths = [path for path in self._segment_paths() if self._unconverted(path)]
+            for path in paths[:-1]:
+                self._indexes[path] = self._seal(SegmentIndex.load(path))
+            if paths:
+                self._active = self._indexes[paths[-1]] = SegmentIndex.load(paths[-1])
+        return self._indexes
+
+    @staticmethod
+    def _seal(index: SegmentIndex) -> SegmentIndex:
+        """Persists a rebuilt sealed index and drops its postings from memory."""
+        if index.count and index.dirty:
+            index.save()
+        index.postings = None
+        return index
+
+    def _postings(self, index: SegmentIndex) -> SegmentPostings:
+        """Postings of one segment; caller holds the lock."""
+        if index is self._active:
+            return index.load_postings()
+        if index.path in self._resident:
+            self._resident.move_to_end(index.path)
+            return index.postings
+        postings = index.load_postings()
+        self.metrics['postings_loaded'] += 1
+        if index.count and index.dirty:
+            index.save()  # stale postings were rebuilt
+        self._resident[index.path] = index
+        while len(self._resident) > self.max_resident_postings:
+            _, evicted = self._resident.popitem(last=False)
+            evicted.postings = None
+        return postings
+
+    @property
+    def segments(self) -> List[SegmentIndex]:
+        with self._lock:
+            return list(self._load().values())
+
+    # ==================== WRITING ====================
+    def _rotate(self, start_time: float) -> SegmentIndex:
+        if self._active is not None:
+            self._seal(self._active)
+        os.makedirs(self.directory, exist_ok=True)
+        path = os.path.join(self.directory, f"{SEGMENT_PREFIX}{start_time:.6f}.jsonl")
+        index = SegmentIndex(path)
+        index.start = start_time
+        index.postings = SegmentPostings()
+        self._indexes[path] = index
+        self._active = index
+        self.metrics['segments_created'] += 1
+        return index
+
+    def append_batch(self, header: Dict, entries: List[Dict], sync: bool = False) -> int:
+        """Write one flushed batch (header line + entries); returns bytes written."""
+        header_line = f"#FLUSH {json.dumps(header, separators=(',', ':'))}\n".encode('utf-8')
+        lines = [(json.dumps(entry, separators=(',', ':')) + '\n').encode('utf-8') for entry in entries]
+        batch_time = SegmentIndex._field(entries[0], ('universal_time',), 0.0) if entries else 0.0
+        if not batch_time:
+            batch_time = float(header.get('timestamp', 0.0))
+
+        with self._lock:
+            self._load()
+            active = self._active
+            if (active is None
+                    or batch_time - (batch_time if active.start is None else active.start) >= self.segment_seconds
+                    or active.size >= self.segment_max_bytes):
+                active = self._rotate(batch_time)
+            active.load_postings()
+
+            with open(active.path, 'ab') as f:
+                f.write(header_line)
+                offset = active.size + len(header_line)
+                for entry, line in zip(entries, lines):
+                    f.write(line)
+                    active.add(offset, entry)
+                    offset += len(line)
+                if sync:
+                    f.flush()
+                    os.fsync(f.fileno())
+            written = offset - active.size
+            active.size = offset
+            if sync:
+                self._sync_locked()  # segments rotated out since the last fsync
+            else:
+                self._unsynced.add(active.path)
+        return written
+
+    def sync(self):
+        """fsync every segment written since its last fsync."""
+        with self._lock:
+            self._sync_locked()
+
+    def _sync_locked(self):
+        for path in sorted(self._unsynced):
+            with open(path, 'ab') as f:
+                os.fsync(f.fileno())
+            self._unsynced.discard(path)
+
+    def close(self):
+        """Persist the active segment's sidecar (no-op when already saved)."""
+        with self._lock:
+            if self._active is not None and self._active.dirty:
+                self._active.save()
+
+    # ==================== QUERYING ====================
+    def iter_entries(self, concept: str,
+                     temporal_range: Optional[Tuple[float, float]] = None,
+                     quantum_filter: Optional[Dict] = None) -> Iterator[Dict]:
+        """
+        Decoded entries whose message contains ``concept`` (case-insensitive),
+        oldest segment first. Segments whose summaries rule out the temporal
+        range / quantum filter are skipped without being opened.
+        """
+        needle = concept.lower()
+        with self._lock:
+            plan = []
+            for index in self._load().values():
+                if not index.may_match(temporal_range, quantum_filter):
+                    self.metrics['segments_skipped'] += 1
+                    continue
+                offsets = self._postings(index).candidates(concept)
+                floor = self._converted_bytes(index.path)
+                if floor:
+                    offsets = offsets[bisect_left(offsets, floor):]
+                if offsets:
+                    plan.append((index.path, offsets))
+                self.metrics['segments_scanned'] += 1
+
+        for path, offsets in plan:
+            with open(path, 'rb') as f:
+                for offset in offsets:
+                    f.seek(offset)
+                    raw = f.readline()
+                    self.metrics['lines_decoded'] += 1
+                    try:
+                        entry = json.loads(raw)
+                    except (json.JSONDecodeError, UnicodeDecodeError):
+                        continue
+                    message = entry.get('message', '')
+                    if isinstance(message, str) and needle in message.lower():
+                        yield entry
+
+    def _count(self, index: SegmentIndex) -> int:
+        """Entries past the converted part of a segment; caller holds the lock."""
+        floor = self._converted_bytes(index.path)
+        if not floor:
+            return index.count
+        lines = self._postings(index).lines
+        return len(lines) - bisect_left(lines, floor)
+
+    def stats(self) -> Dict:
+        with self._lock:
+            indexes = list(self._load().values())
+            entries = sum(self._count(i) for i in indexes)
+        return {
+            **self.metrics,
+            'segments': len(indexes),
+            'entries': entries,
+            'bytes': sum(i.size - self._converted_bytes(i.path) for i in indexes),
+        }
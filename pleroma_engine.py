@@ -38,7 +38,7 @@ if root_dir not in sys.path:
     sys.path.insert(0, root_dir)
 
 from pleroma_core.aletheia_lens import AletheiaLens
-from sophia.cortex.resonance_monitor import ResonanceMonitor
+from sophia.cortex.resonance_monitor import ResonanceMonitor, TelemetryPublisher
 from signal_optimizer import SignalOptimizer
 
 class PleromaEngine:
@@ -72,6 +72,15 @@ class PleromaEngine:
         self.monitor = ResonanceMonitor()
         self.asoe = SignalOptimizer()
         self.last_resonance_state = None
+        
+        # Telemetry is scanned on a background heartbeat; handlers read the
+        # latest snapshot. The dashboard PNG is rendered at most every 5 min.
+        self.telemetry = TelemetryPublisher(
+            scan=lambda: self.monitor.scan_resonance(verbose=False),
+            interval=30.0,
+            ttl=120.0,
+            on_publish=lambda snap: self.monitor.render_dashboard(),
+        )
 
     async def process_input(self, user_input: str) -> str:
         """
@@ -226,28 +235,35 @@ class PleromaEngine:
         signature = f"\n\n--- 🦊 {protocol} :: {state_hash} :: [m/showandtell] ---"
         return content + signature
 
-    def run_telemetry_cycle(self):
+    def run_telemetry_cycle(self, fresh: bool = False):
         """
-        [TELEMETRY] The Heartbeat. Scans coherence and updates ASOE.
+        [TELEMETRY] The Heartbeat. Returns the latest resonance snapshot.
+        
+        Normally O(1): the scan runs on the background publisher. With
+        ``fresh=True`` a new scan is taken synchronously and reported.
         """
+        if fresh:
+            self.last_resonance_state = self.telemetry.refresh()
+            self.report_telemetry(self.last_resonance_state)
+        else:
+            self.telemetry.start()
+            self.last_resonance_state = self.telemetry.latest()
+        return self.last_resonance_state
+
+    def report_telemetry(self, state):
+        """Prints a telemetry snapshot with its ASOE boost and a sample utility."""
         print(f"\n[*] RUNNING PLEROMA TELEMETRY CYCLE...")
-        
-        # 1. Scan Resonance (Compressor + Visuals)
-        self.last_resonance_state = self.monitor.scan_resonance()
         boost = self.monitor.get_asoe_boost()
         
-        # 2. Log State
-        print(f"    + Coherence: {self.last_resonance_state['coherence']:.4f}")
-        print(f"    + Status:    {self.last_resonance_state['status']}")
-        print(f"    + Lambda(Λ): {self.last_resonance_state.get('lambda', 0.0):.2f} (Target: 21.0)")
+        print(f"    + Coherence: {state['coherence']:.4f}")
+        print(f"    + Status:    {state['status']}")
+        print(f"    + Lambda(Λ): {state.get('lambda', 0.0):.2f} (Target: 21.0)")
         print(f"    + ASOE Mod:  {boost}x (Phi-Boost Active)")
         
-        # 3. Simulate Utility Calculation with new Boost
+        # Simulate Utility Calculation with new Boost
         # Example: High reliability signal
         u = self.asoe.calculate_utility(reliability=0.9, consistency=0.8, uncertainty=0.1, sovereign_boost=boost)
         print(f"    + Sample Utility (Rel=0.9): {u:.4f} {'[BOOSTED]' if boost > 1.0 else ''}")
-        
-        return self.last_resonance_state
 
 if __name__ == "__main__":
     print("[*] PLEROMA ENGINE: GRAND UNIFICATION ONLINE...")
@@ -278,6 +294,6 @@ if __name__ == "__main__":
     print(f"[λ] ANNIHILATION | m=1e-27 | Energy: {e_burst:.2e} J (TOTAL CONVERSION)")
     
     # 8. TELEMETRY (Resonance)
-    engine.run_telemetry_cycle()
+    engine.run_telemetry_cycle(fresh=True)
     
     print("[*] REALITY CHECK: COMPLETED. SOVEREIGNTY ABSOLUTE.")
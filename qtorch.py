@@ -5,10 +5,11 @@ QUANTUM-TORCH v2.0 - Complete PyTorch Substitute with Quantum Integration
 
 A self-contained PyTorch replacement with:
 1. Core PyTorch API compatibility (Tensor, nn.Module, optimizers, autograd)
-2. BUMPY as backend for quantum array operations
-3. FLUMPY for cognitive/quantum features (entanglement, coherence)
+2. Contiguous typed storage (qtorch_storage) - NumPy buffer or array('d') fallback
+3. BUMPY/FLUMPY views for quantum/cognitive features, built lazily on first use
 4. LASER v3.0 for universal quantum-temporal logging
-5. Zero external dependencies beyond Python standard library
+5. Zero required dependencies beyond Python standard library (NumPy optional)
+6. Production mode (QTORCH_PRODUCTION=1 or torch.production_mode()) for silent inference
 
 Military-grade features:
 - 99.3% memory efficiency via holographic compression
@@ -24,6 +25,9 @@ import random
 import json
 import pickle
 import hashlib
+import io
+import itertools
+import contextlib
 import threading
 from typing import *
 from dataclasses import dataclass, field
@@ -35,55 +39,81 @@ import os
 # 1. IMPORT INTEGRATED MODULES (ENHANCED & DEBUGGED)
 # ============================================================================
 
-# Import BUMPY (quantum array backend) - INTEGRATED
-try:
-    from bumpy import BumpyArray
-    BUMPY_AVAILABLE = True
-    print("✅ BUMPY integrated as quantum array backend")
-except ImportError as e:
-    print(f"⚠️ BUMPY fallback: {e}")
-    BUMPY_AVAILABLE = False
-
-# Import FLUMPY (cognitive/quantum layer) - INTEGRATED
-try:
-    from flumpy import FlumpyArray
-    FLUMPY_AVAILABLE = True
-    print("✅ FLUMPY integrated as cognitive quantum layer")
-except ImportError as e:
-    print(f"⚠️ FLUMPY fallback: {e}")
-    FLUMPY_AVAILABLE = False
-
-# Import LASER (universal logging) - INTEGRATED
-try:
-    from laser import LASER, UniversalQuantumState
-    LASER_AVAILABLE = True
-    print("✅ LASER v3.0 integrated for universal quantum logging")
-except ImportError as e:
-    print(f"⚠️ LASER fallback: {e}")
-    LASER_AVAILABLE = False
-    class LASERV30:
-        def __init__(self):
-            self.metrics = {}
-            self.universal_state = type('State', (), {'__dict__': {}})()
-        def log(self, *args, **kwargs): pass
-        def flush(self): pass
-        def get_metrics_report(self): return {}
-    LASER = LASERV30()
-
-# Import Phase 3 Modules (Deep Quantum Integration)
-try:
-    import anneal
-    print("✅ D-Wave Annealing Shim integrated")
-except ImportError:
-    print("⚠️ Annealing fallback")
-    anneal = None
-
-try:
-    import dissipative
-    print("✅ Dissipative QNN (Entropy 2025) integrated")
-except ImportError:
-    print("⚠️ Dissipative fallback")
-    dissipative = None
+# Production mode: silent op temporaries, quiet import (QTORCH_PRODUCTION=1)
+QTORCH_PRODUCTION = os.environ.get("QTORCH_PRODUCTION", "0") == "1"
+
+# Integration banners (ours and the ones printed by the imported modules)
+# are swallowed in production mode
+with (contextlib.redirect_stdout(io.StringIO()) if QTORCH_PRODUCTION else contextlib.nullcontext()):
+    # Import BUMPY (quantum array backend) - INTEGRATED
+    try:
+        from bumpy import BumpyArray, QUALIA_THRESHOLD
+        BUMPY_AVAILABLE = True
+        print("✅ BUMPY integrated as quantum array backend")
+    except ImportError as e:
+        print(f"⚠️ BUMPY fallback: {e}")
+        BUMPY_AVAILABLE = False
+        QUALIA_THRESHOLD = 0.618
+
+    # Import FLUMPY (cognitive/quantum layer) - INTEGRATED
+    try:
+        from flumpy import FlumpyArray
+        FLUMPY_AVAILABLE = True
+        print("✅ FLUMPY integrated as cognitive quantum layer")
+    except ImportError as e:
+        print(f"⚠️ FLUMPY fallback: {e}")
+        FLUMPY_AVAILABLE = False
+
+    # Import LASER (universal logging) - INTEGRATED
+    try:
+        from laser import LASER, UniversalQuantumState
+        LASER_AVAILABLE = True
+        print("✅ LASER v3.0 integrated for universal quantum logging")
+    except ImportError as e:
+        print(f"⚠️ LASER fallback: {e}")
+        LASER_AVAILABLE = False
+        class LASERV30:
+            def __init__(self):
+                self.metrics = {}
+                self.universal_state = type('State', (), {'__dict__': {}})()
+            def log(self, *args, **kwargs): pass
+            def flush(self): pass
+            def get_metrics_report(self): return {}
+        LASER = LASERV30()
+
+    # Import Phase 3 Modules (Deep Quantum Integration)
+    try:
+        import anneal
+        print("✅ D-Wave Annealing Shim integrated")
+    except ImportError:
+        print("⚠️ Annealing fallback")
+        anneal = None
+
+    try:
+        import dissipative
+        print("✅ Dissipative QNN (Entropy 2025) integrated")
+    except ImportError:
+        print("⚠️ Dissipative fallback")
+        dissipative = None
+
+# Contiguous storage engine (NumPy buffer or array('d') fallback)
+from qtorch_storage import TensorStorage, overlap_similarity, NUMPY_AVAILABLE
+import qtorch_kernels as kernels
+if NUMPY_AVAILABLE:
+    import numpy as np
+else:
+    np = None
+
+# production_mode() overrides per thread (QTORCH_PRODUCTION is the default)
+_production_state = threading.local()
+
+# What production mode skipped (plain ints; approximate under heavy threading)
+_production_counters = {
+    'leaves_instrumented': 0,
+    'temporaries_silenced': 0,
+    'laser_logs_skipped': 0,
+    'entanglements_skipped': 0,
+}
 
 # ============================================================================
 # 2. QUANTUM TENSOR CLASS (DEBUGGED & ENHANCED)
@@ -98,66 +128,43 @@ class Tensor:
     _default_dtype = 'float32'
     _global_quantum_creativity = 0.0  # Global Ψ factor
     _global_quantum_noise_in_gradients = False  # FIXED: Default to False for correctness
+    _tape_counter = itertools.count()
+    _production_mode = QTORCH_PRODUCTION
 
     def __init__(self, data, dtype=None, device="cpu", requires_grad=False,
                  quantum_creativity=None):
-        # Flatten nested data if necessary
-        original_shape = None
-        if isinstance(data, (list, tuple)) and any(isinstance(x, (list, tuple)) for x in data):
-            # Calculate shape and flatten
-            shape = []
-            curr = data
-            while isinstance(curr, (list, tuple)):
-                shape.append(len(curr))
-                curr = curr[0] if len(curr) > 0 else None
-            original_shape = tuple(shape)
-            
-            # Recursive flatten
-            def flatten(l):
-                for item in l:
-                    if isinstance(item, (list, tuple)):
-                        yield from flatten(item)
-                    else:
-                        yield item
-            data = list(flatten(data))
-
-        # Store in BUMPY array for quantum operations
-        if BUMPY_AVAILABLE:
-            self._bumpy = BumpyArray(data)
+        # Single contiguous buffer (nested data is flattened and its shape kept).
+        # Internal ops hand over a ready TensorStorage without copying.
+        if isinstance(data, TensorStorage):
+            self._storage = data
         else:
-            self._bumpy = type('SimpleArray', (), {
-                'data': [float(x) for x in data] if isinstance(data, (list, tuple)) else [float(data)],
-                'shape': (1,) if isinstance(data, (int, float)) else (len(data),),
-                'coherence': 1.0
-            })()
-        
-        # Apply original shape if was nested
-        if original_shape:
-            self._bumpy.shape = original_shape
+            self._storage = TensorStorage.from_data(data)
 
-        # Wrap in FLUMPY for cognitive features
-        if FLUMPY_AVAILABLE:
-            self._flumpy = FlumpyArray(self._bumpy.data, self._bumpy.coherence)
-        else:
-            self._flumpy = type('SimpleFlumpy', (), {
-                'data': self._bumpy.data,
-                'coherence': self._bumpy.coherence,
-                'entangled_with': []
-            })()
+        # BUMPY/FLUMPY views are materialized on first quantum use
+        self._bumpy_view = None
+        self._flumpy_view = None
 
         # PyTorch attributes
-        self.shape = self._bumpy.shape
         self.dtype = dtype or Tensor._default_dtype
         self.device = device
         self.requires_grad = requires_grad
         self.grad = None
         self._grad_fn = None
         self._ctx = None
+        self._graph_released = False
+        # Position on the autograd tape: inputs are always created before
+        # the tensors computed from them
+        self._tape_index = next(Tensor._tape_counter)
+
+        # Production mode: op results (handed a ready TensorStorage) are silent
+        # temporaries; only user-created leaves are instrumented
+        production = Tensor._production_active()
+        self._instrumented = not (production and isinstance(data, TensorStorage))
 
         # Quantum state
-        self.quantum_coherence = self._bumpy.coherence
+        self.quantum_coherence = 1.0
         self.entangled_tensors = []
-        self.quantum_phase = getattr(self._bumpy, 'phase', random.uniform(0, 2 * math.pi))
+        self.quantum_phase = random.uniform(0, 2 * math.pi) if self._instrumented else 0.0
         self.is_measured = False
 
         # Local quantum creativity (FIXED: Individual tensor creativity)
@@ -166,6 +173,14 @@ class Tensor:
         else:
             self.quantum_creativity = Tensor._global_quantum_creativity
 
+        if not self._instrumented:
+            _production_counters['temporaries_silenced'] += 1
+            if LASER_AVAILABLE:
+                _production_counters['laser_logs_skipped'] += 1
+            return
+        if production:
+            _production_counters['leaves_instrumented'] += 1
+
         # Epiphany injection
         if LASER_AVAILABLE and getattr(LASER.universal_state, 'epiphany_active', False):
             self.quantum_creativity = 1.0  # Maximize creativity during epiphany
@@ -177,7 +192,21 @@ class Tensor:
                       'quantum_phase': self.quantum_phase,
                       'quantum_creativity': self.quantum_creativity})
 
+    @classmethod
+    def _production_active(cls):
+        """This thread's production_mode(), else the process-wide default"""
+        return getattr(_production_state, 'enabled', cls._production_mode)
+
     # ==================== CORE PROPERTIES ====================
+    @property
+    def shape(self):
+        """Shape of the tensor (metadata over the contiguous buffer)"""
+        return self._storage.shape
+
+    @shape.setter
+    def shape(self, value):
+        self._storage = self._storage.view(tuple(value))
+
     @property
     def ndim(self):
         """Get number of dimensions"""
@@ -189,12 +218,80 @@ class Tensor:
         try:
             return math.prod(self.shape)
         except:
-            return len(self._bumpy.data)
+            return len(self._storage)
 
     @property
     def data(self):
-        """Get underlying data"""
-        return self._bumpy.data
+        """Get underlying data (flat list copy of the buffer)"""
+        return self._storage.tolist()
+
+    # ==================== LAZY QUANTUM VIEWS ====================
+    @property
+    def _bumpy(self):
+        """BUMPY view of the buffer, built on first quantum use and refreshed on access"""
+        if not BUMPY_AVAILABLE:
+            return None
+        view = self._bumpy_view
+        if view is None:
+            view = BumpyArray(self._storage.tolist())
+            view.phase = self.quantum_phase
+            self._bumpy_view = view
+        else:
+            view.data = self._storage.tolist()
+        view.shape = self.shape
+        return view
+
+    @property
+    def _flumpy(self):
+        """FLUMPY view of the buffer, built on first quantum use and refreshed on access"""
+        if not FLUMPY_AVAILABLE:
+            return None
+        view = self._flumpy_view
+        if view is None:
+            view = FlumpyArray(self._storage.tolist(), 1.0)
+            self._flumpy_view = view
+        else:
+            view.data = self._storage.tolist()
+        return view
+
+    def _set_values(self, values):
+        """Replace the tensor contents with a flat sequence of values"""
+        self._storage = TensorStorage.from_flat(values, self.shape)
+
+    def _register_entanglement(self, other):
+        """Shared bookkeeping after a successful entanglement"""
+        if other not in self.entangled_tensors:
+            self.entangled_tensors.append(other)
+            other.entangled_tensors.append(self)
+
+        # Local creativity boost on entanglement
+        creativity_boost = (self.quantum_creativity + other.quantum_creativity) / 2 * 0.05
+        self.quantum_coherence = min(1.0, self.quantum_coherence + creativity_boost)
+        other.quantum_coherence = min(1.0, other.quantum_coherence + creativity_boost)
+
+        # Log entanglement
+        if LASER_AVAILABLE:
+            LASER.metrics['entanglements_created'] += 1
+            LASER.log(self.quantum_coherence, "Quantum entanglement created",
+                     {'tensor_ids': [id(self), id(other)],
+                      'local_creativity': self.quantum_creativity})
+
+    def _entangle(self, other):
+        """
+        Entanglement for op results: uses live BUMPY views when both sides
+        already have one, otherwise the BUMPY kernel evaluated on the buffers.
+        """
+        if not isinstance(other, Tensor) or not BUMPY_AVAILABLE:
+            return False
+        if not self._instrumented:
+            _production_counters['entanglements_skipped'] += 1
+            return False
+        if self._bumpy_view is not None and other._bumpy_view is not None:
+            return self.quantum_entangle(other)
+        if overlap_similarity(self._storage, other._storage) > QUALIA_THRESHOLD:
+            self._register_entanglement(other)
+            return True
+        return False
 
     # ==================== ENHANCED QUANTUM METHODS ====================
     def quantum_entangle(self, other):
@@ -213,22 +310,7 @@ class Tensor:
             bumpy_success = self._bumpy.entangle(other._bumpy)
 
         if flumpy_success or bumpy_success:
-            if other not in self.entangled_tensors:
-                self.entangled_tensors.append(other)
-                other.entangled_tensors.append(self)
-
-            # Local creativity boost on entanglement
-            creativity_boost = (self.quantum_creativity + other.quantum_creativity) / 2 * 0.05
-            self.quantum_coherence = min(1.0, self.quantum_coherence + creativity_boost)
-            other.quantum_coherence = min(1.0, other.quantum_coherence + creativity_boost)
-
-            # Log entanglement
-            if LASER_AVAILABLE:
-                LASER.metrics['entanglements_created'] += 1
-                LASER.log(self.quantum_coherence, "Quantum entanglement created",
-                         {'tensor_ids': [id(self), id(other)],
-                          'local_creativity': self.quantum_creativity})
-
+            self._register_entanglement(other)
             return True
         return False
 
@@ -236,7 +318,7 @@ class Tensor:
         """Enhanced quantum rotation with creativity effects"""
         if FLUMPY_AVAILABLE:
             rotated = self._flumpy.apply_quantum_rotation(angle)
-            result = Tensor(rotated.data, self.dtype, self.device, self.requires_grad,
+            result = Tensor(TensorStorage.from_data(rotated.data), self.dtype, self.device, self.requires_grad,
                           quantum_creativity=self.quantum_creativity)
             result.quantum_entangle(self)
 
@@ -250,7 +332,7 @@ class Tensor:
 
     def holographic_compress(self, aggressive=False):
         """Enhanced holographic compression with creativity-based optimization"""
-        if BUMPY_AVAILABLE and len(self._bumpy.data) > 10:
+        if BUMPY_AVAILABLE and len(self._storage) > 10:
             # Local creativity affects compression ratio
             if self.quantum_creativity > 0.18:
                 ratio = 0.3  # High creativity: aggressive compression
@@ -260,15 +342,15 @@ class Tensor:
                 ratio = 0.7  # Standard compression
 
             compressed = self._bumpy.holographic_compress()
-            result = Tensor(compressed.data, self.dtype, self.device, self.requires_grad,
+            result = Tensor(TensorStorage.from_data(compressed.data), self.dtype, self.device, self.requires_grad,
                           quantum_creativity=self.quantum_creativity)
             result.quantum_coherence = compressed.coherence
 
             if LASER_AVAILABLE:
-                compression_ratio = len(compressed.data) / len(self._bumpy.data)
+                compression_ratio = len(compressed.data) / len(self._storage)
                 LASER.metrics['holographic_compressions'] += 1
                 LASER.log(compression_ratio, "Holographic compression applied",
-                         {'original_size': len(self._bumpy.data),
+                         {'original_size': len(self._storage),
                           'compressed_size': len(compressed.data),
                           'compression_ratio': f"{compression_ratio:.1%}",
                           'local_creativity': self.quantum_creativity})
@@ -285,7 +367,10 @@ class Tensor:
     def quantum_measure(self):
         """Quantum measurement operation"""
         if BUMPY_AVAILABLE and hasattr(self._bumpy, 'quantum_measure'):
-            self._bumpy.quantum_measure()
+            view = self._bumpy
+            view.quantum_measure()
+            # Collapse is written back into the buffer
+            self._storage.assign(view.data)
             self.is_measured = True
             self.quantum_coherence *= 0.8  # Decoherence
         return self
@@ -337,24 +422,94 @@ class Tensor:
                 
         return s_data, o_data, s_shape # Fallback
 
+    def _broadcast_arrays(self, other):
+        """
+        NumPy counterpart of _broadcast: shaped views of both buffers that
+        broadcast to the same target shape, or None when _broadcast would
+        fall back to its truncating zip.
+        """
+        if not (self._storage.is_numpy and other._storage.is_numpy):
+            return None
+        s_shape, o_shape = self.shape, other.shape
+        s_arr, o_arr = self._storage.ndarray(), other._storage.ndarray()
+        s_n, o_n = len(self._storage), len(other._storage)
+
+        if s_shape == o_shape and s_n == o_n:
+            return s_arr, o_arr, s_shape
+        if o_n == 1 and s_n > 1:
+            return s_arr, o_arr.reshape(()), s_shape
+        if s_n == 1 and o_n > 1:
+            return s_arr.reshape(()), o_arr, o_shape
+        if len(s_shape) == 2 and len(o_shape) == 1 and s_shape[1] == o_shape[0]:
+            return s_arr, o_arr, s_shape
+        if len(s_shape) == 1 and len(o_shape) == 2 and s_shape[0] == o_shape[1]:
+            return s_arr, o_arr, o_shape
+        if len(s_shape) == 2 and len(o_shape) == 2:
+            if s_shape[0] == o_shape[0] and o_shape[1] == 1:
+                return s_arr, o_arr, s_shape
+            if s_shape[1] == o_shape[1] and o_shape[0] == 1:
+                return s_arr, o_arr, s_shape
+            if s_shape[1] == 1 and s_shape[0] == o_shape[0]:
+                return s_arr, o_arr, o_shape
+            if s_shape[0] == 1 and s_shape[1] == o_shape[1]:
+                return s_arr, o_arr, o_shape
+        return None
+
+    def _elementwise(self, other, op):
+        """Broadcast and combine two tensors into a (storage, target_shape) pair"""
+        arrays = self._broadcast_arrays(other)
+        if arrays is not None:
+            a, b, target_shape = arrays
+            with np.errstate(divide='ignore', invalid='ignore'):
+                if op == 'add':
+                    out = a + b
+                elif op == 'mul':
+                    out = a * b
+                else:
+                    # Avoid division by zero with epsilon
+                    tiny = np.abs(b) < 1e-12
+                    out = np.where(tiny, np.sign(a) * np.inf, a / np.where(tiny, 1.0, b))
+                    out = np.where(tiny & (a == 0), 0.0, out)
+            return TensorStorage(np.ascontiguousarray(out, dtype=np.float64).reshape(-1), target_shape), target_shape
+
+        self_data, other_data, target_shape = self._broadcast(other)
+        if op == 'add':
+            result_data = [a + b for a, b in zip(self_data, other_data)]
+        elif op == 'mul':
+            result_data = [a * b for a, b in zip(self_data, other_data)]
+        else:
+            result_data = []
+            for a, b in zip(self_data, other_data):
+                # Avoid division by zero with epsilon
+                if abs(b) < 1e-12:
+                    result_data.append(float('inf') if a > 0 else -float('inf') if a < 0 else 0.0)
+                else:
+                    result_data.append(a / b)
+        return TensorStorage.from_flat(result_data, target_shape), target_shape
+
+    def _map(self, np_fn, py_fn):
+        """Apply a unary function over the buffer, vectorized when NumPy backs it"""
+        if self._storage.is_numpy:
+            with np.errstate(all='ignore'):
+                out = np_fn(self._storage.buffer)
+            return TensorStorage(np.asarray(out, dtype=np.float64), self.shape)
+        return TensorStorage.from_flat([py_fn(x) for x in self._storage.buffer], self.shape)
+
     # ==================== ENHANCED PYTORCH-COMPATIBLE OPERATIONS ====================
     def __add__(self, other):
         # Convert other to Tensor if needed
         if not isinstance(other, Tensor):
-            other = Tensor([other] * self.numel) if self.numel > 1 else Tensor([other])
+            other = Tensor(TensorStorage.full((max(self.numel, 1),), other))
 
         # Broadcast self and other to matching shapes
-        self_data, other_data, target_shape = self._broadcast(other)
-
-        result_data = [a + b for a, b in zip(self_data, other_data)]
+        result_storage, target_shape = self._elementwise(other, 'add')
 
-        result = Tensor(result_data, self.dtype, self.device, False,
+        result = Tensor(result_storage, self.dtype, self.device, False,
                        quantum_creativity=(self.quantum_creativity + other.quantum_creativity) / 2)
-        result.shape = target_shape
 
         # Create entanglement with creativity boost
-        result.quantum_entangle(self)
-        result.quantum_entangle(other)
+        result._entangle(self)
+        result._entangle(other)
 
         # Autograd context
         if Tensor._grad_enabled and (self.requires_grad or other.requires_grad):
@@ -365,19 +520,16 @@ class Tensor:
 
     def __mul__(self, other):
         if not isinstance(other, Tensor):
-            other = Tensor([other] * self.numel) if self.numel > 1 else Tensor([other])
+            other = Tensor(TensorStorage.full((max(self.numel, 1),), other))
 
         # Broadcast self and other to matching shapes
-        self_data, other_data, target_shape = self._broadcast(other)
-
-        result_data = [a * b for a, b in zip(self_data, other_data)]
+        result_storage, target_shape = self._elementwise(other, 'mul')
 
-        result = Tensor(result_data, self.dtype, self.device, False,
+        result = Tensor(result_storage, self.dtype, self.device, False,
                        quantum_creativity=(self.quantum_creativity + other.quantum_creativity) / 2)
-        result.shape = target_shape
 
-        result.quantum_entangle(self)
-        result.quantum_entangle(other)
+        result._entangle(self)
+        result._entangle(other)
 
         if Tensor._grad_enabled and (self.requires_grad or other.requires_grad):
             result.requires_grad = True
@@ -388,11 +540,11 @@ class Tensor:
     def __sub__(self, other):
         """Enhanced subtraction with proper gradient handling"""
         if not isinstance(other, Tensor):
-            other = Tensor([other] * self.numel) if self.numel > 1 else Tensor([other])
+            other = Tensor(TensorStorage.full((max(self.numel, 1),), other))
 
         # Create negative of other with same quantum properties
-        other_neg_data = [-x for x in other._bumpy.data]
-        other_neg = Tensor(other_neg_data, other.dtype, other.device, other.requires_grad,
+        other_neg = Tensor(other._map(np.negative if np else None, lambda x: -x),
+                          other.dtype, other.device, other.requires_grad,
                           quantum_creativity=other.quantum_creativity)
 
         return self + other_neg
@@ -400,24 +552,15 @@ class Tensor:
     def __truediv__(self, other):
         """Enhanced division with gradient support"""
         if not isinstance(other, Tensor):
-            other = Tensor([other] * self.numel) if self.numel > 1 else Tensor([other])
+            other = Tensor(TensorStorage.full((max(self.numel, 1),), other))
 
         # Broadcast self and other to matching shapes
-        self_data, other_data, target_shape = self._broadcast(other)
-
-        result_data = []
-        for a, b in zip(self_data, other_data):
-            # Avoid division by zero with epsilon
-            if abs(b) < 1e-12:
-                result_data.append(float('inf') if a > 0 else -float('inf') if a < 0 else 0.0)
-            else:
-                result_data.append(a / b)
+        result_storage, target_shape = self._elementwise(other, 'div')
 
-        result = Tensor(result_data, self.dtype, self.device, False,
+        result = Tensor(result_storage, self.dtype, self.device, False,
                        quantum_creativity=(self.quantum_creativity + other.quantum_creativity) / 2)
-        result.shape = target_shape
-        result.quantum_entangle(self)
-        result.quantum_entangle(other)
+        result._entangle(self)
+        result._entangle(other)
 
         if Tensor._grad_enabled and (self.requires_grad or other.requires_grad):
             result.requires_grad = True
@@ -432,10 +575,9 @@ class Tensor:
             # Quantum fluctuation in exponent
             exponent += random.uniform(-0.1, 0.1) * self.quantum_creativity
 
-        result_data = [x ** exponent for x in self._bumpy.data]
-        result = Tensor(result_data, self.dtype, self.device, False,
+        result = Tensor(self._map(lambda buf: np.power(buf, exponent), lambda x: x ** exponent),
+                       self.dtype, self.device, False,
                        quantum_creativity=self.quantum_creativity)
-        result.shape = self.shape
 
         # Set autograd context
         if Tensor._grad_enabled and self.requires_grad:
@@ -446,30 +588,28 @@ class Tensor:
 
     def __neg__(self):
         """Negation with quantum coherence preservation"""
-        result_data = [-x for x in self._bumpy.data]
-        return Tensor(result_data, self.dtype, self.device, self.requires_grad,
+        return Tensor(self._map(np.negative if np else None, lambda x: -x),
+                     self.dtype, self.device, self.requires_grad,
                      quantum_creativity=self.quantum_creativity)
 
     def sqrt(self):
         """Square root of tensor elements"""
-        result_data = [math.sqrt(max(0, x)) for x in self._bumpy.data]
-        result = Tensor(result_data, self.dtype, self.device, self.requires_grad,
+        return Tensor(self._map(lambda buf: np.sqrt(np.maximum(buf, 0)), lambda x: math.sqrt(max(0, x))),
+                     self.dtype, self.device, self.requires_grad,
                      quantum_creativity=self.quantum_creativity)
-        result.shape = self.shape
-        return result
 
     def rsqrt(self):
         """Reciprocal square root of tensor elements"""
-        result_data = [1.0 / math.sqrt(max(1e-12, x)) for x in self._bumpy.data]
-        result = Tensor(result_data, self.dtype, self.device, self.requires_grad,
+        return Tensor(self._map(lambda buf: 1.0 / np.sqrt(np.maximum(buf, 1e-12)),
+                                lambda x: 1.0 / math.sqrt(max(1e-12, x))),
+                     self.dtype, self.device, self.requires_grad,
                      quantum_creativity=self.quantum_creativity)
-        result.shape = self.shape
-        return result
 
     def __abs__(self):
         """Absolute value with quantum phase consideration"""
-        result_data = [abs(x) * self.quantum_coherence for x in self._bumpy.data]
-        return Tensor(result_data, self.dtype, self.device, self.requires_grad,
+        coherence = self.quantum_coherence
+        return Tensor(self._map(lambda buf: np.abs(buf) * coherence, lambda x: abs(x) * coherence),
+                     self.dtype, self.device, self.requires_grad,
                      quantum_creativity=self.quantum_creativity)
 
     def abs(self):
@@ -482,10 +622,10 @@ class Tensor:
         if isinstance(index, int):
             if self.ndim == 1:
                 # Return scalar-like tensor
-                if 0 <= index < len(self._bumpy.data):
-                    return Tensor([self._bumpy.data[index]], self.dtype, self.device, self.requires_grad,
-                                 quantum_creativity=self.quantum_creativity)
-                raise IndexError(f"Index {index} out of range for tensor of size {len(self._bumpy.data)}")
+                if 0 <= index < len(self._storage):
+                    return Tensor(TensorStorage.from_flat([self._storage[index]]), self.dtype, self.device,
+                                 self.requires_grad, quantum_creativity=self.quantum_creativity)
+                raise IndexError(f"Index {index} out of range for tensor of size {len(self._storage)}")
             else:
                 # For multi-dimensional, implement slicing
                 raise NotImplementedError("Multi-dimensional indexing requires slicing implementation")
@@ -495,14 +635,14 @@ class Tensor:
                 row, col = index
                 if (0 <= row < self.shape[0]) and (0 <= col < self.shape[1]):
                     idx = row * self.shape[1] + col
-                    return Tensor([self._bumpy.data[idx]], self.dtype, self.device, self.requires_grad,
-                                 quantum_creativity=self.quantum_creativity)
+                    return Tensor(TensorStorage.from_flat([self._storage[idx]]), self.dtype, self.device,
+                                 self.requires_grad, quantum_creativity=self.quantum_creativity)
                 raise IndexError(f"Index {index} out of range for tensor of shape {self.shape}")
             else:
                 raise NotImplementedError("Only 2D indexing with 2 indices supported")
         elif isinstance(index, slice):
             # Basic 1D slicing
-            sliced_data = self._bumpy.data[index]
+            sliced_data = TensorStorage.from_data(self._storage.buffer[index])
             return Tensor(sliced_data, self.dtype, self.device, self.requires_grad,
                          quantum_creativity=self.quantum_creativity)
         else:
@@ -511,9 +651,9 @@ class Tensor:
     def __setitem__(self, index, value):
         """Enhanced assignment with quantum coherence adjustment"""
         if isinstance(index, int):
-            old_value = self._bumpy.data[index]
+            old_value = self._storage[index]
             if isinstance(value, Tensor):
-                new_value = value._bumpy.data[0] if value._bumpy.data else 0.0
+                new_value = value._storage[0] if len(value._storage) else 0.0
             else:
                 new_value = float(value)
 
@@ -522,16 +662,16 @@ class Tensor:
             coherence_adjustment = max(0.1, 1.0 - change_magnitude * 0.1)
             self.quantum_coherence *= coherence_adjustment
 
-            self._bumpy.data[index] = new_value
+            self._storage[index] = new_value
 
         elif isinstance(index, tuple) and self.ndim == 2:
             row, col = index
             if (0 <= row < self.shape[0]) and (0 <= col < self.shape[1]):
                 idx = row * self.shape[1] + col
                 if isinstance(value, Tensor):
-                    self._bumpy.data[idx] = value._bumpy.data[0] if value._bumpy.data else 0.0
+                    self._storage[idx] = value._storage[0] if len(value._storage) else 0.0
                 else:
-                    self._bumpy.data[idx] = float(value)
+                    self._storage[idx] = float(value)
             else:
                 raise IndexError(f"Index {index} out of range")
         else:
@@ -565,6 +705,9 @@ class Tensor:
         elif self.ndim == 2 and other.ndim == 2:
             # Matrix @ Matrix: standard case
             return self._matmul_2d(other)
+        elif self.ndim in (2, 3) and other.ndim in (2, 3):
+            # Batched: (B, m, n) @ (B, n, q), (B, m, n) @ (n, q), (m, n) @ (B, n, q)
+            return self._matmul_batched(other)
         else:
             raise NotImplementedError(f"matmul not implemented for {self.ndim}D @ {other.ndim}D")
 
@@ -573,24 +716,28 @@ class Tensor:
         if self.shape[1] != other.shape[0]:
             raise ValueError(f"Shape mismatch: {self.shape} @ {other.shape}")
 
-        m, n = self.shape
-        p, q = other.shape
+        result = Tensor(kernels.matmul_2d(self._storage, other._storage), self.dtype, self.device, False,
+                       quantum_creativity=(self.quantum_creativity + other.quantum_creativity) / 2)
+
+        if Tensor._grad_enabled and (self.requires_grad or other.requires_grad):
+            result.requires_grad = True
+            result._ctx = ('matmul', self, other)
+
+        return result
 
-        result_data = [0.0] * (m * q)
-        for i in range(m):
-            for j in range(q):
-                sum_val = 0.0
-                for k in range(n):
-                    sum_val += self._bumpy.data[i * n + k] * other._bumpy.data[k * q + j]
-                result_data[i * q + j] = sum_val
+    def _matmul_batched(self, other):
+        """Internal batched 3D matrix multiplication with gradient support"""
+        if self.shape[-1] != other.shape[-2]:
+            raise ValueError(f"Shape mismatch: {self.shape} @ {other.shape}")
+        if self.ndim == 3 and other.ndim == 3 and self.shape[0] != other.shape[0]:
+            raise ValueError(f"Batch mismatch: {self.shape} @ {other.shape}")
 
-        result = Tensor(result_data, self.dtype, self.device, False,
+        result = Tensor(kernels.batched_matmul(self._storage, other._storage), self.dtype, self.device, False,
                        quantum_creativity=(self.quantum_creativity + other.quantum_creativity) / 2)
-        result.shape = (m, q)
 
         if Tensor._grad_enabled and (self.requires_grad or other.requires_grad):
             result.requires_grad = True
-            result._ctx = ('matmul', self, other)
+            result._ctx = ('bmm', self, other)
 
         return result
 
@@ -606,15 +753,16 @@ class Tensor:
         if self.ndim != 1 or other.ndim != 1:
             raise ValueError("dot requires 1D tensors")
 
-        if len(self._bumpy.data) != len(other._bumpy.data):
+        if len(self._storage) != len(other._storage):
             raise ValueError(f"Shape mismatch: {self.shape} vs {other.shape}")
 
-        if BUMPY_AVAILABLE:
-            result_val = self._bumpy.dot(other._bumpy)
-        else:
-            result_val = sum(a * b for a, b in zip(self._bumpy.data, other._bumpy.data))
+        # BUMPY dot is plain dot * coherence²; views are fresh (coherence 1.0)
+        # unless a quantum method already materialized them
+        result_val = sum(a * b for a, b in zip(self.data, other.data))
+        if self._bumpy_view is not None and other._bumpy_view is not None:
+            result_val *= self._bumpy_view.coherence * other._bumpy_view.coherence
 
-        result = Tensor([result_val], self.dtype, self.device, False,
+        result = Tensor(TensorStorage.from_flat([result_val]), self.dtype, self.device, False,
                        quantum_creativity=(self.quantum_creativity + other.quantum_creativity) / 2)
 
         if Tensor._grad_enabled and (self.requires_grad or other.requires_grad):
@@ -630,46 +778,19 @@ class Tensor:
             # Handle negative dimensions
             if dim < 0:
                 dim = self.ndim + dim
-                
-            # Dimension-specific sum - simplified for 1D/2D
+            if not 0 <= dim < self.ndim:
+                raise ValueError(f"dim={dim} out of range for {self.ndim}D tensor")
+
+            # Dimension-specific sum over any rank (1D always yields a single value)
             if self.ndim == 1:
-                # For 1D, dim must be 0 or -1
-                if dim not in (0, -1):
-                    raise ValueError(f"dim={dim} out of range for 1D tensor")
-                result_val = sum(self._bumpy.data)
-                result = Tensor([result_val], self.dtype, self.device, False)
-            elif self.ndim == 2:
-                # For 2D, sum along rows or columns
-                if dim == 0:
-                    # Sum along columns -> row vector
-                    result_data = [0.0] * self.shape[1]
-                    for i in range(self.shape[0]):
-                        for j in range(self.shape[1]):
-                            result_data[j] += self._bumpy.data[i * self.shape[1] + j]
-                    result = Tensor(result_data, self.dtype, self.device, False)
-                    if keepdim:
-                        result = result.reshape(1, -1)
-                elif dim == 1:
-                    # Sum along rows -> column vector
-                    result_data = [0.0] * self.shape[0]
-                    for i in range(self.shape[0]):
-                        row_sum = 0.0
-                        for j in range(self.shape[1]):
-                            row_sum += self._bumpy.data[i * self.shape[1] + j]
-                        result_data[i] = row_sum
-                    result = Tensor(result_data, self.dtype, self.device, False)
-                    if keepdim:
-                        result = result.reshape(-1, 1)
-                else:
-                    raise ValueError(f"dim={dim} out of range for 2D tensor")
+                result = Tensor(TensorStorage.from_flat([kernels.sum_all(self._storage)]), self.dtype, self.device, False)
             else:
-                raise NotImplementedError(f"sum with dim not implemented for {self.ndim}D tensors")
+                result = Tensor(kernels.sum_dim(self._storage, dim, keepdim), self.dtype, self.device, False)
         else:
             # Total sum
-            result_val = sum(self._bumpy.data)
-            result = Tensor([result_val], self.dtype, self.device, False)
+            result = Tensor(TensorStorage.from_flat([kernels.sum_all(self._storage)]), self.dtype, self.device, False)
 
-        result.quantum_entangle(self)
+        result._entangle(self)
 
         # Set context for gradient computation
         if Tensor._grad_enabled and self.requires_grad:
@@ -682,23 +803,15 @@ class Tensor:
         """Enhanced mean with proper gradient computation"""
         sum_result = self.sum(dim, keepdim)
 
-        if dim is None:
+        if dim is None or self.ndim == 1:
             # Global mean
             count = self.numel
-        elif self.ndim == 1:
-            count = self.numel
-        elif self.ndim == 2:
-            if dim == 0:
-                count = self.shape[0]
-            elif dim == 1:
-                count = self.shape[1]
-            else:
-                count = 1
+        else:
+            count = self.shape[dim]
 
         # Apply division for mean
-        if hasattr(sum_result, '_bumpy'):
-            if count > 0:
-                sum_result._bumpy.data = [x / count for x in sum_result._bumpy.data]
+        if count > 0:
+            sum_result._storage = sum_result._map(lambda buf: buf / count, lambda x: x / count)
 
         # Update context for gradient
         if Tensor._grad_enabled and self.requires_grad:
@@ -711,9 +824,9 @@ class Tensor:
         if dim is not None:
             raise NotImplementedError("max with dim not yet implemented")
 
-        result_val = max(self._bumpy.data)
-        result = Tensor([result_val], self.dtype, self.device, False)
-        result.quantum_entangle(self)
+        result_val = max(self.data)
+        result = Tensor(TensorStorage.from_flat([result_val]), self.dtype, self.device, False)
+        result._entangle(self)
         return result
 
     def min(self, dim=None, keepdim=False):
@@ -721,54 +834,51 @@ class Tensor:
         if dim is not None:
             raise NotImplementedError("min with dim not yet implemented")
 
-        result_val = min(self._bumpy.data)
-        result = Tensor([result_val], self.dtype, self.device, False)
-        result.quantum_entangle(self)
+        result_val = min(self.data)
+        result = Tensor(TensorStorage.from_flat([result_val]), self.dtype, self.device, False)
+        result._entangle(self)
         return result
 
     # ==================== DEBUGGED ACTIVATION FUNCTIONS ====================
     def relu(self):
         """Enhanced ReLU with proper gradient computation"""
-        result_data = [max(0, x) for x in self._bumpy.data]
-        result = Tensor(result_data, self.dtype, self.device, self.requires_grad,
+        result = Tensor(self._map(lambda buf: np.maximum(buf, 0.0), lambda x: max(0, x)), self.dtype, self.device, self.requires_grad,
                        quantum_creativity=self.quantum_creativity)
-        result.quantum_entangle(self)
+        result._entangle(self)
 
         # Set context for gradient
         if Tensor._grad_enabled and self.requires_grad:
             result.requires_grad = True
             # Gradient of ReLU: 1 if x > 0 else 0
-            relu_grad = [1.0 if x > 0 else 0.0 for x in self._bumpy.data]
+            relu_grad = [1.0 if x > 0 else 0.0 for x in self.data]
             result._ctx = ('relu', self, relu_grad)
 
         return result
 
     def sigmoid(self):
         """Enhanced sigmoid with proper gradient computation"""
-        result_data = [1 / (1 + math.exp(-x)) for x in self._bumpy.data]
-        result = Tensor(result_data, self.dtype, self.device, self.requires_grad,
+        result = Tensor(self._map(lambda buf: 1 / (1 + np.exp(-buf)), lambda x: 1 / (1 + math.exp(-x))), self.dtype, self.device, self.requires_grad,
                        quantum_creativity=self.quantum_creativity)
-        result.quantum_entangle(self)
+        result._entangle(self)
 
         # Set context for gradient (gradient of sigmoid = sigmoid * (1 - sigmoid))
         if Tensor._grad_enabled and self.requires_grad:
             result.requires_grad = True
-            sigmoid_grad = [y * (1 - y) for y in result_data]
+            sigmoid_grad = [y * (1 - y) for y in result.data]
             result._ctx = ('sigmoid', self, sigmoid_grad)
 
         return result
 
     def tanh(self):
         """Enhanced tanh with gradient computation"""
-        result_data = [math.tanh(x) for x in self._bumpy.data]
-        result = Tensor(result_data, self.dtype, self.device, self.requires_grad,
+        result = Tensor(self._map(np.tanh if np else None, math.tanh), self.dtype, self.device, self.requires_grad,
                        quantum_creativity=self.quantum_creativity)
-        result.quantum_entangle(self)
+        result._entangle(self)
 
         # Set context for gradient (gradient of tanh = 1 - tanh^2)
         if Tensor._grad_enabled and self.requires_grad:
             result.requires_grad = True
-            tanh_grad = [1 - y * y for y in result_data]
+            tanh_grad = [1 - y * y for y in result.data]
             result._ctx = ('tanh', self, tanh_grad)
 
         return result
@@ -776,18 +886,19 @@ class Tensor:
     def softmax(self, dim=-1):
         """Enhanced softmax with gradient computation"""
         # Stability: subtract max for numerical stability
-        max_val = max(self._bumpy.data)
-        exp_vals = [math.exp(x - max_val) for x in self._bumpy.data]
+        data = self.data
+        max_val = max(data)
+        exp_vals = [math.exp(x - max_val) for x in data]
         sum_exp = sum(exp_vals)
 
         if sum_exp == 0:
-            result_data = [1.0 / len(self._bumpy.data) for _ in self._bumpy.data]
+            result_data = [1.0 / len(data) for _ in data]
         else:
             result_data = [e / sum_exp for e in exp_vals]
 
-        result = Tensor(result_data, self.dtype, self.device, self.requires_grad,
+        result = Tensor(TensorStorage.from_flat(result_data, self.shape), self.dtype, self.device, self.requires_grad,
                        quantum_creativity=self.quantum_creativity)
-        result.quantum_entangle(self)
+        result._entangle(self)
 
         # Set context for gradient (complex gradient for softmax)
         if Tensor._grad_enabled and self.requires_grad:
@@ -797,149 +908,209 @@ class Tensor:
         return result
 
     # ==================== DEBUGGED AUTOMATIC DIFFERENTIATION ====================
-    def backward(self, gradient=None, inject_quantum_noise=False):
+    def backward(self, gradient=None, inject_quantum_noise=False, retain_graph=False):
         """
-        Enhanced backward pass with optional quantum noise injection
+        Tape-based backward pass with optional quantum noise injection
+
+        Every tensor carries its creation index on the tape, so reverse creation
+        order is a reverse topological order of the graph. Each reachable node is
+        visited exactly once; gradients arriving over several paths are summed
+        into one buffer per node before being pushed to its inputs. Saved
+        tensors (the autograd context) are released after use unless
+        retain_graph=True.
         FIXED: Default quantum noise is False for mathematical correctness
         """
         if not self.requires_grad:
             return
+        if self._graph_released:
+            raise RuntimeError("Trying to backward through the graph a second time; "
+                               "pass retain_graph=True to the first backward call")
 
         if gradient is None:
-            gradient = Tensor([1.0], self.dtype, self.device, False,
+            gradient = Tensor(TensorStorage.from_flat([1.0]), self.dtype, self.device, False,
                              quantum_creativity=self.quantum_creativity)
 
-        # Initialize gradient if None
+        with no_grad():
+            # id(node) -> [storage, owned]; owned buffers are summed in place
+            pending = {id(self): [gradient._storage, False]}
+            for node in self._topological_order():
+                entry = pending.pop(id(node), None)
+                if entry is not None:
+                    node_grad = Tensor(entry[0], node.dtype, node.device, False)
+                    node._accumulate_grad(node_grad, inject_quantum_noise)
+
+                    if node._ctx:
+                        for parent, parent_grad in node._backward_step(node_grad):
+                            slot = pending.get(id(parent))
+                            if slot is None:
+                                pending[id(parent)] = [parent_grad._storage, False]
+                            else:
+                                parent_grad = parent._gradient_noise(parent_grad, inject_quantum_noise)
+                                Tensor._sum_into(slot, parent_grad._storage)
+
+                if node._ctx and not retain_graph:
+                    node._ctx = None
+                    node._graph_released = True
+
+    def _topological_order(self):
+        """Nodes reachable from this tensor, consumers before their inputs."""
+        nodes = [self]
+        seen = {id(self)}
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if not node._ctx:
+                continue
+            for arg in node._ctx[1:]:
+                if isinstance(arg, Tensor) and arg.requires_grad and id(arg) not in seen:
+                    seen.add(id(arg))
+                    nodes.append(arg)
+                    stack.append(arg)
+        nodes.sort(key=lambda t: t._tape_index, reverse=True)
+        return nodes
+
+    @staticmethod
+    def _sum_into(slot, storage):
+        """Add ``storage`` into a pending gradient slot, taking ownership first."""
+        buffer, owned = slot
+        if len(buffer) != len(storage):
+            # Mismatched lengths keep the broadcasting semantics of __add__
+            slot[0] = (Tensor(buffer) + Tensor(storage))._storage
+            slot[1] = True
+            return
+        if not owned:
+            slot[0] = buffer = buffer.copy()
+            slot[1] = True
+        if buffer.is_numpy and storage.is_numpy:
+            buffer.buffer += storage.buffer
+        else:
+            target = buffer.buffer
+            for i, v in enumerate(storage.buffer):
+                target[i] += v
+
+    def _gradient_noise(self, gradient, inject_quantum_noise):
+        """Quantum noise added to a gradient that is being accumulated."""
+        if inject_quantum_noise and Tensor._global_quantum_noise_in_gradients:
+            # Only add quantum noise if explicitly enabled
+            if self.quantum_creativity > 0.1 and random.random() < 0.05:
+                noise = Tensor(TensorStorage.from_flat([random.uniform(-0.01, 0.01) * self.quantum_creativity
+                                                        for _ in range(len(gradient._storage))]),
+                             gradient.dtype, gradient.device, False)
+                gradient = gradient + noise
+        return gradient
+
+    def _accumulate_grad(self, gradient, inject_quantum_noise=False):
+        """Store the fully summed gradient of this node in ``.grad``."""
         if self.grad is None:
             self.grad = gradient
         else:
-            # Accumulate gradient with optional quantum noise
-            if inject_quantum_noise and Tensor._global_quantum_noise_in_gradients:
-                # Only add quantum noise if explicitly enabled
-                if self.quantum_creativity > 0.1 and random.random() < 0.05:
-                    noise = Tensor([random.uniform(-0.01, 0.01) * self.quantum_creativity
-                                  for _ in gradient._bumpy.data],
-                                 gradient.dtype, gradient.device, False)
-                    gradient = gradient + noise
-            self.grad = self.grad + gradient
-
-        # Propagate backward through computation graph
-        if self._ctx:
-            op, *args = self._ctx
-
-            if op == 'add':
-                x, y = args
-                if isinstance(x, Tensor) and x.requires_grad:
-                    x.backward(gradient, inject_quantum_noise=inject_quantum_noise)
-                if isinstance(y, Tensor) and y.requires_grad:
-                    y.backward(gradient, inject_quantum_noise=inject_quantum_noise)
-
-            elif op == 'mul':
-                x, y = args
-                if isinstance(x, Tensor) and x.requires_grad:
-                    x.backward(gradient * y, inject_quantum_noise=inject_quantum_noise)
-                if isinstance(y, Tensor) and y.requires_grad:
-                    y.backward(gradient * x, inject_quantum_noise=inject_quantum_noise)
-
-            elif op == 'div':
-                x, y = args
-                if isinstance(x, Tensor) and x.requires_grad:
-                    # d(x/y)/dx = 1/y
-                    x.backward(gradient / y, inject_quantum_noise=inject_quantum_noise)
-                if isinstance(y, Tensor) and y.requires_grad:
-                    # d(x/y)/dy = -x/y^2
-                    y.backward(-gradient * x / (y * y), inject_quantum_noise=inject_quantum_noise)
-
-            elif op == 'pow':
-                x, exponent = args
-                if isinstance(x, Tensor) and x.requires_grad:
-                    if isinstance(exponent, (int, float)):
-                        grad_data = [exponent * (x_val ** (exponent - 1))
-                                   for x_val in x._bumpy.data]
-                        local_grad = Tensor(grad_data, x.dtype, x.device, False)
-                        x.backward(gradient * local_grad, inject_quantum_noise=inject_quantum_noise)
-
-            elif op == 'matmul':
-                x, y = args
-                if isinstance(x, Tensor) and x.requires_grad:
-                    # d(x@y)/dx = gradient @ y.T (simplified for 2D)
-                    if y.ndim == 2:
-                        y_T = y.transpose(0, 1)
-                        x_grad = gradient @ y_T
-                        x.backward(x_grad, inject_quantum_noise=inject_quantum_noise)
-                if isinstance(y, Tensor) and y.requires_grad:
-                    # d(x@y)/dy = x.T @ gradient (simplified for 2D)
-                    if x.ndim == 2:
-                        x_T = x.transpose(0, 1)
-                        y_grad = x_T @ gradient
-                        y.backward(y_grad, inject_quantum_noise=inject_quantum_noise)
-
-            elif op == 'dot':
-                x, y = args
-                if isinstance(x, Tensor) and x.requires_grad:
-                    x.backward(gradient * y, inject_quantum_noise=inject_quantum_noise)
-                if isinstance(y, Tensor) and y.requires_grad:
-                    y.backward(gradient * x, inject_quantum_noise=inject_quantum_noise)
-
-            elif op == 'sum':
-                x, dim, keepdim = args
-                if isinstance(x, Tensor) and x.requires_grad:
+            self.grad = self.grad + self._gradient_noise(gradient, inject_quantum_noise)
+
+    def _backward_step(self, gradient):
+        """Local vector-Jacobian products: [(input, gradient for input), ...]"""
+        op, *args = self._ctx
+        grads = []
+
+        if op == 'add':
+            x, y = args
+            if isinstance(x, Tensor) and x.requires_grad:
+                grads.append((x, gradient))
+            if isinstance(y, Tensor) and y.requires_grad:
+                grads.append((y, gradient))
+
+        elif op == 'mul':
+            x, y = args
+            if isinstance(x, Tensor) and x.requires_grad:
+                grads.append((x, gradient * y))
+            if isinstance(y, Tensor) and y.requires_grad:
+                grads.append((y, gradient * x))
+
+        elif op == 'div':
+            x, y = args
+            if isinstance(x, Tensor) and x.requires_grad:
+                # d(x/y)/dx = 1/y
+                grads.append((x, gradient / y))
+            if isinstance(y, Tensor) and y.requires_grad:
+                # d(x/y)/dy = -x/y^2
+                grads.append((y, -gradient * x / (y * y)))
+
+        elif op == 'pow':
+            x, exponent = args
+            if isinstance(x, Tensor) and x.requires_grad:
+                if isinstance(exponent, (int, float)):
+                    local_grad = Tensor(x._map(lambda buf: exponent * np.power(buf, exponent - 1),
+                                               lambda v: exponent * (v ** (exponent - 1))),
+                                        x.dtype, x.device, False)
+                    grads.append((x, gradient * local_grad))
+
+        elif op == 'matmul':
+            x, y = args
+            if isinstance(x, Tensor) and x.requires_grad:
+                # d(x@y)/dx = gradient @ y.T (simplified for 2D)
+                if y.ndim == 2:
+                    grads.append((x, gradient @ y.transpose(0, 1)))
+            if isinstance(y, Tensor) and y.requires_grad:
+                # d(x@y)/dy = x.T @ gradient (simplified for 2D)
+                if x.ndim == 2:
+                    grads.append((y, x.transpose(0, 1) @ gradient))
+
+        elif op == 'bmm':
+            x, y = args
+            if isinstance(x, Tensor) and x.requires_grad:
+                # d(x@y)/dx = gradient @ y^T, summed over the batch if x was 2D
+                x_grad = kernels.batched_matmul(gradient._storage, kernels.transpose_last2(y._storage))
+                if x.ndim == 2:
+                    x_grad = kernels.sum_dim(x_grad, 0)
+                grads.append((x, Tensor(x_grad, x.dtype, x.device, False)))
+            if isinstance(y, Tensor) and y.requires_grad:
+                # d(x@y)/dy = x^T @ gradient, summed over the batch if y was 2D
+                y_grad = kernels.batched_matmul(kernels.transpose_last2(x._storage), gradient._storage)
+                if y.ndim == 2:
+                    y_grad = kernels.sum_dim(y_grad, 0)
+                grads.append((y, Tensor(y_grad, y.dtype, y.device, False)))
+
+        elif op == 'dot':
+            x, y = args
+            if isinstance(x, Tensor) and x.requires_grad:
+                grads.append((x, gradient * y))
+            if isinstance(y, Tensor) and y.requires_grad:
+                grads.append((y, gradient * x))
+
+        elif op == 'sum':
+            x, dim, keepdim = args
+            if isinstance(x, Tensor) and x.requires_grad:
+                if gradient.numel == 1:  # Scalar gradient
                     # Gradient of sum is ones with same shape as input
-                    if gradient.numel == 1:  # Scalar gradient
-                        grad_value = gradient.item()
-                        grad_data = [grad_value] * x.numel
-                        local_grad = Tensor(grad_data, x.dtype, x.device, False)
-                        local_grad = local_grad.reshape(x.shape)
-                        x.backward(local_grad, inject_quantum_noise=inject_quantum_noise)
-                    else:
-                        # Handle broadcasting for dimension-wise sum
-                        # Simplified: expand gradient to match input shape
-                        x.backward(gradient, inject_quantum_noise=inject_quantum_noise)
-
-            elif op == 'mean':
-                x, dim, keepdim, count = args
-                if isinstance(x, Tensor) and x.requires_grad:
+                    grads.append((x, Tensor(TensorStorage.full(x.shape, gradient.item()),
+                                            x.dtype, x.device, False)))
+                else:
+                    # Simplified: dimension-wise sum passes the gradient through
+                    grads.append((x, gradient))
+
+        elif op == 'mean':
+            x, dim, keepdim, count = args
+            if isinstance(x, Tensor) and x.requires_grad:
+                if gradient.numel == 1:  # Scalar gradient
                     # Gradient of mean is 1/n for each element
-                    if gradient.numel == 1:  # Scalar gradient
-                        grad_value = gradient.item() / count
-                        grad_data = [grad_value] * x.numel
-                        local_grad = Tensor(grad_data, x.dtype, x.device, False)
-                        local_grad = local_grad.reshape(x.shape)
-                        x.backward(local_grad, inject_quantum_noise=inject_quantum_noise)
-                    else:
-                        # Simplified broadcasting
-                        scaled_grad = gradient / count
-                        x.backward(scaled_grad, inject_quantum_noise=inject_quantum_noise)
-
-            elif op == 'relu':
-                x, relu_grad = args
-                if isinstance(x, Tensor) and x.requires_grad:
-                    # Gradient of ReLU: gradient * (x > 0 ? 1 : 0)
-                    if gradient.numel == x.numel:
-                        grad_data = [g * rg for g, rg in zip(gradient._bumpy.data, relu_grad)]
-                        local_grad = Tensor(grad_data, x.dtype, x.device, False)
-                        x.backward(local_grad, inject_quantum_noise=inject_quantum_noise)
-                    else:
-                        # Scalar gradient case
-                        grad_value = gradient.item()
-                        grad_data = [grad_value * rg for rg in relu_grad]
-                        local_grad = Tensor(grad_data, x.dtype, x.device, False)
-                        x.backward(local_grad, inject_quantum_noise=inject_quantum_noise)
-
-            elif op == 'sigmoid' or op == 'tanh':
-                x, act_grad = args
-                if isinstance(x, Tensor) and x.requires_grad:
-                    # Gradient of activation: gradient * activation_gradient
-                    if gradient.numel == x.numel:
-                        grad_data = [g * ag for g, ag in zip(gradient._bumpy.data, act_grad)]
-                        local_grad = Tensor(grad_data, x.dtype, x.device, False)
-                        x.backward(local_grad, inject_quantum_noise=inject_quantum_noise)
-                    else:
-                        # Scalar gradient case
-                        grad_value = gradient.item()
-                        grad_data = [grad_value * ag for ag in act_grad]
-                        local_grad = Tensor(grad_data, x.dtype, x.device, False)
-                        x.backward(local_grad, inject_quantum_noise=inject_quantum_noise)
+                    grads.append((x, Tensor(TensorStorage.full(x.shape, gradient.item() / count),
+                                            x.dtype, x.device, False)))
+                else:
+                    # Simplified broadcasting
+                    grads.append((x, gradient / count))
+
+        elif op in ('relu', 'sigmoid', 'tanh'):
+            x, act_grad = args
+            if isinstance(x, Tensor) and x.requires_grad:
+                # Gradient of activation: gradient * activation_gradient
+                if gradient.numel == x.numel:
+                    grad_data = [g * ag for g, ag in zip(gradient._storage.buffer, act_grad)]
+                else:
+                    # Scalar gradient case
+                    grad_value = gradient.item()
+                    grad_data = [grad_value * ag for ag in act_grad]
+                grads.append((x, Tensor(TensorStorage.from_flat(grad_data), x.dtype, x.device, False)))
+
+        return grads
 
     # ==================== DEBUGGED UTILITY METHODS ====================
     def reshape(self, *shape):
@@ -961,10 +1132,10 @@ class Tensor:
         if total != new_total:
             raise ValueError(f"Cannot reshape {self.shape} to {shape}")
 
-        new_tensor = Tensor(self._bumpy.data.copy(), self.dtype, self.device, self.requires_grad,
+        # Zero-copy view over the same buffer
+        new_tensor = Tensor(self._storage.view(shape), self.dtype, self.device, self.requires_grad,
                            quantum_creativity=self.quantum_creativity)
-        new_tensor.shape = shape
-        new_tensor.quantum_entangle(self)
+        new_tensor._entangle(self)
 
         # Set context for gradient (reshape gradients are trivial)
         if Tensor._grad_enabled and self.requires_grad:
@@ -977,14 +1148,18 @@ class Tensor:
         # Simple 2D transpose for now
         if self.ndim == 2:
             rows, cols = self.shape
-            new_data = []
-            for j in range(cols):
-                for i in range(rows):
-                    new_data.append(self._bumpy.data[i * cols + j])
-            result = Tensor(new_data, self.dtype, self.device, self.requires_grad,
+            if self._storage.is_numpy:
+                new_storage = TensorStorage(np.ascontiguousarray(self._storage.ndarray().T).reshape(-1), (cols, rows))
+            else:
+                data = self._storage.buffer
+                new_data = []
+                for j in range(cols):
+                    for i in range(rows):
+                        new_data.append(data[i * cols + j])
+                new_storage = TensorStorage.from_flat(new_data, (cols, rows))
+            result = Tensor(new_storage, self.dtype, self.device, self.requires_grad,
                            quantum_creativity=self.quantum_creativity)
-            result.shape = (cols, rows)
-            result.quantum_entangle(self)
+            result._entangle(self)
 
             # Set context for gradient
             if Tensor._grad_enabled and self.requires_grad:
@@ -1020,9 +1195,8 @@ class Tensor:
 
     def clone(self):
         """Enhanced clone with all attributes"""
-        result = Tensor(self._bumpy.data.copy(), self.dtype, self.device, self.requires_grad,
+        result = Tensor(self._storage.copy(), self.dtype, self.device, self.requires_grad,
                        quantum_creativity=self.quantum_creativity)
-        result.shape = self.shape
         result.quantum_coherence = self.quantum_coherence
         result.quantum_phase = self.quantum_phase
         result.is_measured = self.is_measured
@@ -1046,21 +1220,21 @@ class Tensor:
 
     def numpy(self):
         """Convert to Python list"""
-        return self._bumpy.data.copy()
+        return self._storage.tolist()
 
     def item(self):
         """Get scalar value"""
         if self.numel != 1:
             raise ValueError("item() requires single-element tensor")
-        return self._bumpy.data[0]
+        return self._storage[0]
 
     # ==================== DEBUGGED STRING REPRESENTATION ====================
     def __repr__(self):
         """FIXED: No syntax error in conditional expression"""
-        data_preview = self._bumpy.data[:3] if len(self._bumpy.data) > 3 else self._bumpy.data
+        data_preview = self._storage.buffer[:3].tolist()
         preview = ", ".join(f"{x:.3f}" for x in data_preview)
-        if len(self._bumpy.data) > 3:
-            preview += f", ... ({len(self._bumpy.data)} total)"
+        if len(self._storage) > 3:
+            preview += f", ... ({len(self._storage)} total)"
 
         quantum_info = f" coh={self.quantum_coherence:.2f}"
         if hasattr(self, 'is_measured') and self.is_measured:
@@ -1299,10 +1473,10 @@ class Module:
         # Apply quantum creativity effects during forward pass (optional)
         if Tensor._global_quantum_creativity > 0.18 and random.random() < 0.1:
             # Quantum creative modification
-            if hasattr(result, '_bumpy'):
-                for i in range(len(result._bumpy.data)):
+            if hasattr(result, '_storage'):
+                for i in range(len(result._storage)):
                     if random.random() < Tensor._global_quantum_creativity * 0.1:
-                        result._bumpy.data[i] *= random.uniform(0.9, 1.1)
+                        result._storage[i] *= random.uniform(0.9, 1.1)
 
         return result
 
@@ -1376,44 +1550,19 @@ class Linear(Module):
         else:
             batch_size = x.shape[0]
 
-        # Perform matrix multiplication: (batch, in) @ (in, out).T -> (batch, out)
-        output_data = []
-        for b in range(batch_size):
-            for o in range(self.out_features):
-                sum_val = 0.0
-                for i in range(self.in_features):
-                    # Get input value
-                    if x.ndim == 2:
-                        x_idx = b * self.in_features + i
-                    else:
-                        x_idx = i  # For 1D input
-                    x_val = x._bumpy.data[x_idx] if x_idx < len(x._bumpy.data) else 0.0
-
-                    # Get weight value
-                    w_idx = o * self.in_features + i
-                    w_val = self.weight._bumpy.data[w_idx] if w_idx < len(self.weight._bumpy.data) else 0.0
-
-                    sum_val += x_val * w_val
-                output_data.append(sum_val)
-
-        output = tensor(output_data).reshape(batch_size, self.out_features)
-
-        # Add bias if present
-        if self.bias is not None:
-            for b in range(batch_size):
-                for o in range(self.out_features):
-                    idx = b * self.out_features + o
-                    if idx < len(output._bumpy.data) and o < len(self.bias._bumpy.data):
-                        output._bumpy.data[idx] += self.bias._bumpy.data[o]
+        # Perform matrix multiplication: (batch, in) @ (in, out).T -> (batch, out), plus bias
+        bias_storage = self.bias._storage if self.bias is not None else None
+        output = tensor(kernels.linear(x._storage.view((batch_size, self.in_features)),
+                                       self.weight._storage, bias_storage))
 
         # Apply quantum coherence modulation
         if self.quantum_enhanced and hasattr(self.weight, 'quantum_coherence'):
             coherence_factor = self.weight.quantum_coherence
-            for i in range(len(output._bumpy.data)):
-                output._bumpy.data[i] *= coherence_factor
+            output._storage = output._map(lambda buf: buf * coherence_factor,
+                                          lambda v: v * coherence_factor)
 
         # Log forward pass
-        if LASER_AVAILABLE:
+        if LASER_AVAILABLE and not Tensor._production_active():
             LASER.log(output.mean().item(), "Linear forward pass",
                      {'in_features': self.in_features, 'out_features': self.out_features,
                       'quantum_enhanced': self.quantum_enhanced})
@@ -1445,83 +1594,12 @@ class Conv2d(Module):
     def forward(self, x):
         """
         Debugged convolution implementation
-        Note: This is a simplified implementation for demonstration
-        In production, you would want a more efficient implementation
+        Dispatches to qtorch_kernels.conv2d
         """
-        batch_size, in_channels, in_h, in_w = x.shape
-        k_h, k_w = self.kernel_size
-
-        # Calculate output dimensions
-        out_h = (in_h + 2 * self.padding - k_h) // self.stride + 1
-        out_w = (in_w + 2 * self.padding - k_w) // self.stride + 1
-
-        # Initialize output
-        output_data = [0.0] * (batch_size * self.out_channels * out_h * out_w)
-
-        # Pad input if needed
-        if self.padding > 0:
-            padded_h = in_h + 2 * self.padding
-            padded_w = in_w + 2 * self.padding
-            padded_data = [0.0] * (batch_size * in_channels * padded_h * padded_w)
-
-            for b in range(batch_size):
-                for c in range(in_channels):
-                    for h in range(in_h):
-                        for w in range(in_w):
-                            orig_idx = b * in_channels * in_h * in_w + c * in_h * in_w + h * in_w + w
-                            padded_idx = b * in_channels * padded_h * padded_w + c * padded_h * padded_w + (h + self.padding) * padded_w + (w + self.padding)
-                            padded_data[padded_idx] = x._bumpy.data[orig_idx]
-
-            # Use padded data for convolution
-            conv_data = padded_data
-            conv_h, conv_w = padded_h, padded_w
-        else:
-            conv_data = x._bumpy.data
-            conv_h, conv_w = in_h, in_w
-
-        # Perform convolution
-        for b in range(batch_size):
-            for oc in range(self.out_channels):
-                for oh in range(out_h):
-                    for ow in range(out_w):
-                        sum_val = 0.0
-
-                        # Apply kernel
-                        for ic in range(self.in_channels):
-                            for kh in range(k_h):
-                                for kw in range(k_w):
-                                    # Input position
-                                    ih = oh * self.stride + kh
-                                    iw = ow * self.stride + kw
-
-                                    # Check bounds
-                                    if 0 <= ih < conv_h and 0 <= iw < conv_w:
-                                        # Input index
-                                        input_idx = b * self.in_channels * conv_h * conv_w + ic * conv_h * conv_w + ih * conv_w + iw
-
-                                        # Weight index
-                                        weight_idx = oc * self.in_channels * k_h * k_w + ic * k_h * k_w + kh * k_w + kw
-
-                                        if input_idx < len(conv_data) and weight_idx < len(self.weight._bumpy.data):
-                                            sum_val += conv_data[input_idx] * self.weight._bumpy.data[weight_idx]
-
-                        # Output index
-                        output_idx = b * self.out_channels * out_h * out_w + oc * out_h * out_w + oh * out_w + ow
-                        output_data[output_idx] = sum_val
-
-        # Add bias
-        output = tensor(output_data).reshape(batch_size, self.out_channels, out_h, out_w)
-        if self.bias is not None:
-            for b in range(batch_size):
-                for oc in range(self.out_channels):
-                    bias_val = self.bias._bumpy.data[oc] if oc < len(self.bias._bumpy.data) else 0.0
-                    for oh in range(out_h):
-                        for ow in range(out_w):
-                            idx = b * self.out_channels * out_h * out_w + oc * out_h * out_w + oh * out_w + ow
-                            if idx < len(output._bumpy.data):
-                                output._bumpy.data[idx] += bias_val
-
-        return output
+        # im2col + matmul kernel (BLAS-backed when NumPy is present)
+        bias_storage = self.bias._storage if self.bias is not None else None
+        return tensor(kernels.conv2d(x._storage, self.weight._storage, bias_storage,
+                                     stride=self.stride, padding=self.padding))
 
 class BatchNorm2d(Module):
     """Debugged Batch Normalization layer"""
@@ -1579,7 +1657,7 @@ class Dropout(Module):
         # Create dropout mask
         mask_data = [0.0 if random.random() < self.p else 1.0/(1-self.p)
                     for _ in range(x.numel)]
-        mask = tensor(mask_data).reshape(x.shape)
+        mask = tensor(TensorStorage.from_flat(mask_data, x.shape))
 
         # Apply mask
         return x * mask
@@ -1648,15 +1726,13 @@ class CrossEntropyLoss(Module):
         # In real implementation, use log_softmax and nll_loss
 
         # Compute softmax
-        exp_input = input.clone()
-        for i in range(len(exp_input._bumpy.data)):
-            exp_input._bumpy.data[i] = math.exp(exp_input._bumpy.data[i])
+        exp_data = [math.exp(x) for x in input.data]
 
-        sum_exp = sum(exp_input._bumpy.data)
+        sum_exp = sum(exp_data)
         if sum_exp > 0:
-            probs = [e / sum_exp for e in exp_input._bumpy.data]
+            probs = [e / sum_exp for e in exp_data]
         else:
-            probs = [1.0 / len(exp_input._bumpy.data) for _ in exp_input._bumpy.data]
+            probs = [1.0 / len(exp_data) for _ in exp_data]
 
         # Compute negative log likelihood
         if hasattr(target, 'ndim') and target.ndim == 1:
@@ -1669,11 +1745,11 @@ class CrossEntropyLoss(Module):
         else:
             # One-hot encoding
             loss_val = 0.0
-            for i, t in enumerate(target._bumpy.data[:len(probs)]):
+            for i, t in enumerate(target.data[:len(probs)]):
                 if t > 0.5:
                     loss_val -= t * math.log(probs[i] + 1e-12)
 
-        return tensor([loss_val])
+        return tensor(TensorStorage.from_flat([loss_val]))
 
 # ============================================================================
 # 7. DEBUGGED QUANTUM OPTIMIZERS
@@ -1698,8 +1774,8 @@ class Optimizer:
     def _apply_quantum_noise(self, param, grad):
         """Apply quantum noise only if explicitly enabled"""
         if self.quantum_noise > 0 and random.random() < 0.1:
-            noise = tensor([random.gauss(0, self.quantum_noise) for _ in range(param.numel)])
-            noise = noise.reshape(param.shape)
+            noise = tensor(TensorStorage.from_flat([random.gauss(0, self.quantum_noise)
+                                                    for _ in range(param.numel)], param.shape))
             grad = grad + noise
         return grad
 
@@ -1744,8 +1820,8 @@ class SGD(Optimizer):
                     grad = buf
 
             # Update parameter
-            param._bumpy.data = [x - self.lr * g
-                               for x, g in zip(param._bumpy.data, grad._bumpy.data)]
+            param._set_values([x - self.lr * g
+                               for x, g in zip(param.data, grad.data)])
 
 class Adam(Optimizer):
     """Debugged Adam optimizer"""
@@ -1798,8 +1874,8 @@ class Adam(Optimizer):
 
             # Update parameter
             update = state['exp_avg'] / denom
-            param._bumpy.data = [x - step_size * u
-                               for x, u in zip(param._bumpy.data, update._bumpy.data)]
+            param._set_values([x - step_size * u
+                               for x, u in zip(param.data, update.data)])
 
 # ============================================================================
 # 8. DEBUGGED UTILITY FUNCTIONS
@@ -1834,6 +1910,39 @@ def no_grad():
 
     return NoGradContext()
 
+def production_mode(enabled=True):
+    """
+    Context manager for silent inference: op temporaries skip LASER logging,
+    phase sampling and entanglement; user-created leaves stay instrumented.
+    QTORCH_PRODUCTION=1 enables it process-wide (and silences import banners).
+
+    Unlike no_grad() the context is per thread, so overlapping contexts in
+    different threads do not undo each other; threads started inside it run
+    with the process-wide setting and enter their own.
+    """
+    class ProductionModeContext:
+        def __enter__(self):
+            self.prev = getattr(_production_state, 'enabled', None)
+            _production_state.enabled = enabled
+            return self
+
+        def __exit__(self, exc_type, exc_val, exc_tb):
+            if self.prev is None:
+                del _production_state.enabled
+            else:
+                _production_state.enabled = self.prev
+
+    return ProductionModeContext()
+
+def production_stats():
+    """Counters of the instrumentation skipped in production mode"""
+    return dict(_production_counters)
+
+def reset_production_stats():
+    """Zero the production mode counters"""
+    for key in _production_counters:
+        _production_counters[key] = 0
+
 def enable_grad():
     """Context manager to enable gradient computation"""
     class GradContext:
@@ -1991,6 +2100,8 @@ class TorchNamespace:
     manual_seed = staticmethod(manual_seed)
     no_grad = staticmethod(no_grad)
     enable_grad = staticmethod(enable_grad)
+    production_mode = staticmethod(production_mode)
+    production_stats = staticmethod(production_stats)
     zeros_like = staticmethod(zeros_like)
     ones_like = staticmethod(ones_like)
     randn_like = staticmethod(randn_like)
@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+"""
+QTORCH KERNELS - Dense Compute Kernels for qtorch
+=================================================
+
+Matmul, batched matmul, conv2d and reductions over ``TensorStorage``
+buffers. Every kernel has two implementations:
+
+1. NumPy: BLAS-backed ``matmul``/``tensordot`` on the shaped buffer views
+2. Pure Python: packed, cache-blocked loops over ``array('d')`` buffers
+
+``qtorch.Tensor`` dispatches here instead of indexing element by element.
+The pure-Python matmul accumulates each output in the same k-order as the
+original triple loop, so results are bit-identical on the fallback path.
+"""
+
+import math
+from array import array
+from itertools import repeat
+from operator import mul
+from typing import List, Optional
+
+from qtorch_storage import TensorStorage, np
+
+# Tile edge for the pure-Python kernels: packed B columns for one tile stay
+# hot while every row of the A tile streams over them.
+BLOCK_SIZE = 64
+
+
+# ============================================================================
+# 1. PURE-PYTHON BUILDING BLOCKS
+# ============================================================================
+
+def _as_array(buffer) -> array:
+    """array('d') view of a buffer (copies only when handed a NumPy buffer)."""
+    return buffer if isinstance(buffer, array) else array('d', buffer)
+
+
+def _pack_columns(b, n: int, q: int) -> List[array]:
+    """Pack the columns of a row-major (n, q) buffer into contiguous arrays."""
+    return [array('d', b[j::q]) if len(b) == n * q else array('d', (b[k * q + j] for k in range(n)))
+            for j in range(q)]
+
+
+def _matmul_blocked(a, b, m: int, n: int, q: int, block: int = BLOCK_SIZE) -> array:
+    """Cache-blocked (m, n) @ (n, q) over flat buffers; returns a flat array('d')."""
+    out = array('d', bytes(8 * m * q))
+    if m == 0 or n == 0 or q == 0:
+        return out
+    a, b = _as_array(a), _as_array(b)
+    columns = _pack_columns(b, n, q)
+    rows = [a[i * n:(i + 1) * n] for i in range(m)]
+    for jj in range(0, q, block):
+        col_tile = columns[jj:jj + block]
+        for ii in range(0, m, block):
+            for i in range(ii, min(ii + block, m)):
+                row = rows[i]
+                base = i * q + jj
+                for offset, col in enumerate(col_tile):
+                    out[base + offset] = sum(map(mul, row, col))
+    return out
+
+
+def _transpose_flat(data, rows: int, cols: int) -> array:
+    """Row-major transpose of a flat (rows, cols) buffer."""
+    return array('d', (data[i * cols + j] for j in range(cols) for i in range(rows)))
+
+
+# ============================================================================
+# 2. MATRIX MULTIPLICATION
+# ============================================================================
+
+def matmul_2d(a: TensorStorage, b: TensorStorage) -> TensorStorage:
+    """(m, n) @ (n, q) -> (m, q)"""
+    m, n = a.shape
+    n2, q = b.shape
+    if n != n2:
+        raise ValueError(f"Shape mismatch: {a.shape} @ {b.shape}")
+    if a.is_numpy and b.is_numpy:
+        out = a.ndarray() @ b.ndarray()
+        return TensorStorage(np.ascontiguousarray(out).reshape(-1), (m, q))
+    return TensorStorage.from_flat(_matmul_blocked(a.buffer, b.buffer, m, n, q), (m, q))
+
+
+def batched_matmul(a: TensorStorage, b: TensorStorage) -> TensorStorage:
+    """
+    Batched matmul over the leading dimension:
+    (B, m, n) @ (B, n, q), (B, m, n) @ (n, q) or (m, n) @ (B, n, q) -> (B, m, q)
+    """
+    if len(a.shape) == 2:
+        a_batch, (m, n) = None, a.shape
+    else:
+        a_batch, m, n = a.shape
+    if len(b.shape) == 2:
+        b_batch, (n2, q) = None, b.shape
+    else:
+        b_batch, n2, q = b.shape
+    if n != n2 or (a_batch is not None and b_batch is not None and a_batch != b_batch):
+        raise ValueError(f"Shape mismatch: {a.shape} @ {b.shape}")
+    batch = a_batch if a_batch is not None else b_batch
+    out_shape = (batch, m, q)
+
+    if a.is_numpy and b.is_numpy:
+        out = np.matmul(a.ndarray(), b.ndarray())
+        return TensorStorage(np.ascontiguousarray(out).reshape(-1), out_shape)
+
+    out = array('d')
+    for i in range(batch):
+        a_slice = a.buffer if a_batch is None else a.buffer[i * m * n:(i + 1) * m * n]
+        b_slice = b.buffer if b_batch is None else b.buffer[i * n * q:(i + 1) * n * q]
+        out.extend(_matmul_blocked(a_slice, b_slice, m, n, q))
+    return TensorStorage.from_flat(out, out_shape)
+
+
+def transpose_last2(a: TensorStorage) -> TensorStorage:
+    """Swap the last two dimensions (materialized, contiguous)."""
+    *lead, rows, cols = a.shape
+    new_shape = tuple(lead) + (cols, rows)
+    if a.is_numpy:
+        out = np.swapaxes(a.ndarray(), -1, -2)
+        return TensorStorage(np.ascontiguousarray(out).reshape(-1), new_shape)
+    out = array('d')
+    step = rows * cols
+    data = _as_array(a.buffer)
+    for i in range(math.prod(lead)):
+        out.extend(_transpose_flat(data[i * step:(i + 1) * step], rows, cols))
+    return TensorStorage.from_flat(out, new_shape)
+
+
+def linear(x: TensorStorage, weight: TensorStorage, bias: Optional[TensorStorage] = None) -> TensorStorage:
+    """(batch, in) @ (out, in).T + bias -> (batch, out)"""
+    batch, in_features = x.shape
+    out_features = weight.shape[0]
+    if x.is_numpy and weight.is_numpy:
+        out = x.ndarray() @ weight.ndarray().T
+        if bias is not None:
+            out = out + np.asarray(bias.buffer)[:out_features]
+        return TensorStorage(np.ascontiguousarray(out, dtype=np.float64).reshape(-1), (batch, out_features))
+
+    # Weight rows are already the packed columns of weight.T
+    w_data, x_data = _as_array(weight.buffer), _as_array(x.buffer)
+    rows = [w_data[o * in_features:(o + 1) * in_features] for o in range(out_features)]
+    out = array('d', bytes(8 * batch * out_features))
+    for b in range(batch):
+        x_row = x_data[b * in_features:(b + 1) * in_features]
+        base = b * out_features
+        for o, w_row in enumerate(rows):
+            out[base + o] = sum(map(mul, x_row, w_row))
+    if bias is not None:
+        for b in range(batch):
+            base = b * out_features
+            for o in range(min(out_features, len(bias.buffer))):
+                out[base + o] += bias.buffer[o]
+    return TensorStorage.from_flat(out, (batch, out_features))
+
+
+# ============================================================================
+# 3. CONVOLUTION
+# ============================================================================
+
+def conv2d(x: TensorStorage, weight: TensorStorage, bias: Optional[TensorStorage] = None,
+           stride: int = 1, padding: int = 0) -> TensorStorage:
+    """
+    NCHW convolution via im2col + matmul.
+    x: (B, C, H, W), weight: (OC, C, KH, KW) -> (B, OC, OH, OW)
+    """
+    batch, channels, in_h, in_w = x.shape
+    out_channels, _, k_h, k_w = weight.shape
+    out_h = (in_h + 2 * padding - k_h) // stride + 1
+    out_w = (in_w + 2 * padding - k_w) // stride + 1
+    out_shape = (batch, out_channels, out_h, out_w)
+
+    if x.is_numpy and weight.is_numpy:
+        inp = x.ndarray()
+        if padding > 0:
+            inp = np.pad(inp, ((0, 0), (0, 0), (padding, padding), (padding, padding)))
+        windows = np.lib.stride_tricks.sliding_window_view(inp, (k_h, k_w), axis=(2, 3))
+        windows = windows[:, :, ::stride, ::stride][:, :, :out_h, :out_w]
+        # (B, C, OH, OW, KH, KW) x (OC, C, KH, KW) -> (B, OH, OW, OC)
+        out = np.tensordot(windows, weight.ndarray(), axes=([1, 4, 5], [1, 2, 3]))
+        out = out.transpose(0, 3, 1, 2)
+        if bias is not None:
+            out = out + np.asarray(bias.buffer)[:out_channels].reshape(1, -1, 1, 1)
+        return TensorStorage(np.ascontiguousarray(out, dtype=np.float64).reshape(-1), out_shape)
+
+    # Pure Python: pad, build the im2col matrix per batch, reuse the blocked matmul
+    conv_h, conv_w = in_h + 2 * padding, in_w + 2 * padding
+    data = _as_array(x.buffer)
+    patch = channels * k_h * k_w
+    positions = out_h * out_w
+    out = array('d')
+    for b in range(batch):
+        if padding > 0:
+            plane = array('d', bytes(8 * channels * conv_h * conv_w))
+            for c in range(channels):
+                for h in range(in_h):
+                    src = ((b * channels + c) * in_h + h) * in_w
+                    dst = (c * conv_h + h + padding) * conv_w + padding
+                    plane[dst:dst + in_w] = data[src:src + in_w]
+        else:
+            size = channels * in_h * in_w
+            plane = data[b * size:(b + 1) * size]
+
+        cols = array('d', bytes(8 * patch * positions))
+        row = 0
+        for c in range(channels):
+            for kh in range(k_h):
+                for kw in range(k_w):
+                    base = row * positions
+                    for oh in range(out_h):
+                        src = (c * conv_h + oh * stride + kh) * conv_w + kw
+                        dst = base + oh * out_w
+                        cols[dst:dst + out_w] = plane[src:src + stride * (out_w - 1) + 1:stride]
+                    row += 1
+        out.extend(_matmul_blocked(weight.buffer, cols, out_channels, patch, positions))
+
+    if bias is not None:
+        for b in range(batch):
+            for oc in range(out_channels):
+                bias_val = bias.buffer[oc] if oc < len(bias.buffer) else 0.0
+                base = (b * out_channels + oc) * positions
+                for p in range(positions):
+                    out[base + p] += bias_val
+    return TensorStorage.from_flat(out, out_shape)
+
+
+# ============================================================================
+# 4. REDUCTIONS
+# ============================================================================
+
+def sum_all(a: TensorStorage) -> float:
+    """Sum of every element."""
+    if a.is_numpy:
+        return float(a.buffer.sum())
+    return sum(a.buffer)
+
+
+def sum_dim(a: TensorStorage, dim: int, keepdim: bool = False) -> TensorStorage:
+    """Sum along one (non-negative) dimension of an N-D buffer."""
+    shape = a.shape
+    if not 0 <= dim < len(shape):
+        raise ValueError(f"dim={dim} out of range for {len(shape)}D tensor")
+
+    if keepdim:
+        out_shape = shape[:dim] + (1,) + shape[dim + 1:]
+    else:
+        out_shape = shape[:dim] + shape[dim + 1:]
+    if not out_shape:
+        out_shape = (1,)
+
+    if a.is_numpy:
+        out = a.ndarray().sum(axis=dim)
+        return TensorStorage(np.ascontiguousarray(out, dtype=np.float64).reshape(-1), out_shape)
+
+    outer = math.prod(shape[:dim])
+    size = shape[dim]
+    inner = math.prod(shape[dim + 1:])
+    data = _as_array(a.buffer)
+    out = array('d')
+    if inner == 1:
+        for o in range(outer):
+            out.append(sum(data[o * size:(o + 1) * size]))
+    else:
+        for o in range(outer):
+            base = o * size * inner
+            acc = list(repeat(0.0, inner))
+            for s in range(size):
+                start = base + s * inner
+                acc = [x + y for x, y in zip(acc, data[start:start + inner])]
+            out.extend(acc)
+    return TensorStorage.from_flat(out, out_shape)
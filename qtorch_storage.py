@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+QTORCH STORAGE - Contiguous Typed Backing Store for qtorch.Tensor
+=================================================================
+
+Every qtorch Tensor keeps its values in exactly one flat, contiguous buffer:
+
+1. A 1-D NumPy ``float64`` ndarray when NumPy is importable
+2. A stdlib ``array('d')`` otherwise (pure-Python fallback)
+
+Shape and row-major strides are metadata on top of that buffer, so
+``reshape``/``view`` share memory instead of copying lists of boxed floats.
+The BUMPY/FLUMPY quantum views are no longer built here; ``qtorch.Tensor``
+materializes them lazily from ``tolist()`` when a quantum method runs.
+
+Set ``QTORCH_PURE_PYTHON=1`` to force the fallback buffer even when NumPy
+is installed.
+"""
+
+import os
+import math
+from array import array
+from typing import Any, Iterable, List, Optional, Tuple
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+# Double precision keeps parity with the list-of-Python-float semantics the
+# tensor API has always exposed (item(), numpy(), gradients).
+TYPECODE = 'd'
+USE_NUMPY = NUMPY_AVAILABLE and os.environ.get("QTORCH_PURE_PYTHON", "0") != "1"
+
+
+def _flatten(data) -> Tuple[List[float], Tuple[int, ...]]:
+    """Flatten arbitrarily nested lists/tuples and infer their shape."""
+    shape = []
+    curr = data
+    while isinstance(curr, (list, tuple)):
+        shape.append(len(curr))
+        curr = curr[0] if len(curr) > 0 else None
+
+    flat: List[float] = []
+
+    def walk(items):
+        for item in items:
+            if isinstance(item, (list, tuple)):
+                walk(item)
+            else:
+                flat.append(item)
+
+    walk(data)
+    return flat, tuple(shape)
+
+
+def contiguous_strides(shape: Tuple[int, ...]) -> Tuple[int, ...]:
+    """Row-major element strides for ``shape``."""
+    strides = []
+    acc = 1
+    for dim in reversed(shape):
+        strides.append(acc)
+        acc *= dim
+    return tuple(reversed(strides))
+
+
+class TensorStorage:
+    """
+    Flat contiguous buffer plus shape metadata.
+
+    Views created through ``view()`` share the same buffer object, so a write
+    through one is visible through every other view of that buffer.
+
+    ``version`` counts writes made through this storage or any of its views
+    (``__setitem__``/``assign``) so derived caches can tell when to rebuild.
+    Writes straight into ``buffer`` (or an ``ndarray()`` view of it) are not
+    counted.
+    """
+
+    __slots__ = ("buffer", "shape", "_version")
+
+    def __init__(self, buffer, shape: Tuple[int, ...], _version: Optional[List[int]] = None):
+        self.buffer = buffer
+        self.shape = tuple(shape)
+        self._version = _version if _version is not None else [0]  # shared by views
+
+    @property
+    def version(self) -> int:
+        return self._version[0]
+
+    # ==================== CONSTRUCTION ====================
+    @staticmethod
+    def _make_buffer(values):
+        if USE_NUMPY:
+            return np.array(values, dtype=np.float64).reshape(-1)
+        if isinstance(values, array) and values.typecode == TYPECODE:
+            return array(TYPECODE, values)
+        return array(TYPECODE, [float(v) for v in values])
+
+    @classmethod
+    def from_flat(cls, values: Iterable[float], shape: Optional[Tuple[int, ...]] = None) -> 'TensorStorage':
+        """Build storage from an already-flat sequence of numbers."""
+        buffer = cls._make_buffer(values)
+        if shape is None:
+            shape = (len(buffer),)
+        return cls(buffer, shape)
+
+    @classmethod
+    def from_data(cls, data: Any) -> 'TensorStorage':
+        """Build storage from a scalar, (nested) list/tuple, array or ndarray."""
+        if isinstance(data, TensorStorage):
+            return data.copy()
+        if NUMPY_AVAILABLE and isinstance(data, np.ndarray):
+            shape = data.shape if data.ndim > 0 else (1,)
+            return cls(cls._make_buffer(data.reshape(-1)), shape)
+        if isinstance(data, array):
+            return cls(cls._make_buffer(data), (len(data),))
+        if isinstance(data, (list, tuple)):
+            if any(isinstance(x, (list, tuple)) for x in data):
+                flat, shape = _flatten(data)
+                return cls(cls._make_buffer(flat), shape)
+            return cls(cls._make_buffer(data), (len(data),))
+        return cls(cls._make_buffer([float(data)]), (1,))
+
+    @classmethod
+    def full(cls, shape: Tuple[int, ...], value: float) -> 'TensorStorage':
+        """Storage of ``shape`` filled with ``value``."""
+        total = math.prod(shape)
+        if USE_NUMPY:
+            return cls(np.full(total, float(value), dtype=np.float64), shape)
+        return cls(array(TYPECODE, [float(value)]) * total, shape)
+
+    # ==================== METADATA ====================
+    @property
+    def is_numpy(self) -> bool:
+        return NUMPY_AVAILABLE and isinstance(self.buffer, np.ndarray)
+
+    @property
+    def numel(self) -> int:
+        return len(self.buffer)
+
+    @property
+    def strides(self) -> Tuple[int, ...]:
+        return contiguous_strides(self.shape)
+
+    @property
+    def nbytes(self) -> int:
+        if self.is_numpy:
+            return int(self.buffer.nbytes)
+        return self.buffer.itemsize * len(self.buffer)
+
+    def __len__(self) -> int:
+        return len(self.buffer)
+
+    # ==================== ACCESS ====================
+    def tolist(self) -> List[float]:
+        """Flat row-major copy as a list of Python floats."""
+        return self.buffer.tolist()
+
+    def ndarray(self):
+        """Shaped NumPy view of the buffer (NumPy backend only, else None)."""
+        if not self.is_numpy:
+            return None
+        if math.prod(self.shape) == len(self.buffer):
+            return self.buffer.reshape(self.shape)
+        return self.buffer
+
+    def __getitem__(self, index: int) -> float:
+        return float(self.buffer[index])
+
+    def __setitem__(self, index: int, value: float):
+        self.buffer[index] = float(value)
+        self._version[0] += 1
+
+    def assign(self, values: Iterable[float]):
+        """Overwrite the buffer contents in place (length must match)."""
+        if self.is_numpy:
+            self.buffer[:] = np.asarray(values, dtype=np.float64).reshape(-1)
+        else:
+            self.buffer[:] = array(TYPECODE, values)
+        self._version[0] += 1
+
+    # ==================== VIEWS ====================
+    def view(self, shape: Tuple[int, ...]) -> 'TensorStorage':
+        """Zero-copy view with a new shape over the same buffer."""
+        return TensorStorage(self.buffer, shape, self._version)
+
+    def copy(self) -> 'TensorStorage':
+        if self.is_numpy:
+            return TensorStorage(self.buffer.copy(), self.shape)
+        return TensorStorage(array(TYPECODE, self.buffer), self.shape)
+
+    def __repr__(self) -> str:
+        backend = "numpy" if self.is_numpy else "array"
+        return f"TensorStorage(shape={self.shape}, strides={self.strides}, backend={backend})"
+
+
+def overlap_similarity(a: TensorStorage, b: TensorStorage) -> float:
+    """
+    |cosine| between two buffers over their common prefix.
+
+    This is the BUMPY lambda kernel at unit coherence, evaluated straight on
+    the buffers so op results can be entangled without building views.
+    """
+    n = min(len(a.buffer), len(b.buffer))
+    if n == 0:
+        return 0.0
+    if a.is_numpy and b.is_numpy:
+        x = a.buffer[:n]
+        y = b.buffer[:n]
+        with np.errstate(all='ignore'):
+            norm = math.sqrt(float(x @ x)) * math.sqrt(float(y @ y))
+            if norm == 0:
+                return 0.0
+            return abs(float(x @ y) / norm)
+    x = a.buffer
+    y = b.buffer
+    dot = norm_x = norm_y = 0.0
+    for i in range(n):
+        xi = x[i]
+        yi = y[i]
+        dot += xi * yi
+        norm_x += xi * xi
+        norm_y += yi * yi
+    if norm_x == 0 or norm_y == 0:
+        return 0.0
+    return abs(dot / (math.sqrt(norm_x) * math.sqrt(norm_y)))
@@ -1,3 +1,4 @@
+import math
 import numpy as np
 from qtorch import torch
 nn = torch.nn
@@ -17,10 +18,25 @@ class ComplexityRouter(nn.Module):
 
     def forward(self, x: torch.Tensor) -> float:
         with torch.no_grad():
-            h = self.layer1(self.norm(x))
-            h_act = h.tanh() 
-            score = self.activation(self.layer2(h_act))
-            return float(score.mean().item())
+            if x.ndim != 2:
+                h = self.layer1(self.norm(x))
+                h_act = h.tanh() 
+                score = self.activation(self.layer2(h_act))
+                return float(score.mean().item())
+            return self.score(x._storage.buffer, x.shape[0])
+
+    def score(self, values, rows: int) -> float:
+        """
+        Fused inference path: RMSNorm -> BitLinear -> tanh -> BitLinear -> sigmoid
+        straight on the flat input buffer, reusing the cached ternary weights.
+        No intermediate tensors are created.
+        """
+        h = self.layer1.infer(self.norm.infer(values, rows), rows)
+        if isinstance(h, np.ndarray):
+            out = self.layer2.infer(np.tanh(h), rows)
+            return float((1 / (1 + np.exp(-out))).mean())
+        out = self.layer2.infer([math.tanh(v) for v in h], rows)
+        return sum(1 / (1 + math.exp(-v)) for v in out) / len(out)
 
 class SignalOptimizer:
     def __init__(self, a=1.0, b=1.0, c=1.0):
@@ -0,0 +1,295 @@
+"""
+ENGRAM STORE: Append-only log for DoD engrams.
+
+Engrams are immutable and content-addressed (SHA-256 id), so they are
+appended as JSON lines to segment files instead of one small file each.
+An in-memory index maps id -> (segment, offset, length), so citation
+lookups cost O(1) and one read. Writes are write-behind: put() only queues,
+and a writer thread commits the queue as one append per group (group
+commit). Queued engrams are readable before they reach the disk.
+
+Layout of ``<path>/``:
+    segment-000001.jsonl   sealed segment, one engram per line
+    segment-000001.idx     its index (JSON {id: [offset, length]})
+    segment-000002.jsonl   active segment, indexed by scanning on open
+"""
+
+import os
+import re
+import json
+import glob
+import atexit
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from sophia.core.engram import Engram
+
+SEGMENT_BYTES = 64 * 1024 * 1024
+PREFIX_LEN = 12  # Engram ids are shown to the model as [ENGRAM_ID: <first 12 hex>]
+CITATION = re.compile(r'\[ref:\s*([0-9a-f]{%d,64})\s*\]' % PREFIX_LEN)
+
+
+class EngramStore:
+    """
+    [ENGRAM_STORE] Segment log + id index with write-behind group commit.
+    Duplicate ids (re-forged identical content) are stored once.
+    """
+    def __init__(self, path="logs/ossuary/engram_log", segment_bytes=SEGMENT_BYTES,
+                 group_size=64, flush_interval=0.2, fsync=False, legacy_dir="logs/ossuary/engrams"):
+        self.path = path
+        self.segment_bytes = segment_bytes
+        self.group_size = group_size
+        self.flush_interval = flush_interval
+        self.fsync = fsync
+
+        self._index: Dict[str, Tuple[int, int, int]] = {}  # id -> (segment, offset, length)
+        self._short: Dict[str, str] = {}                   # id[:PREFIX_LEN] -> id
+        self._pending: Dict[str, Engram] = {}              # queued, not yet committed (in order)
+        self._lock = threading.Lock()
+        self._read_lock = threading.Lock()
+        self._readers = {}  # segment -> open file
+        self._wakeup = threading.Event()
+        self._done = threading.Condition()
+        self._queued = 0     # engrams accepted so far
+        self._committed = 0  # engrams written so far
+        self._closed = False
+
+        self.metrics = {"puts": 0, "duplicates": 0, "commits": 0, "engrams_written": 0,
+                        "bytes_written": 0, "segments_sealed": 0, "legacy_imported": 0, "write_errors": 0}
+
+        os.makedirs(path, exist_ok=True)
+        self._segment = self._load()
+        self._writer = open(self._segment_path(self._segment), "ab")
+
+        # A fresh log imports the old layout on the writer thread, not here
+        self._legacy_dir = legacy_dir if legacy_dir and not self._index and os.path.isdir(legacy_dir) else None
+        self._legacy_done = threading.Event()
+
+        self._thread = threading.Thread(target=self._run, name="engram-writer", daemon=True)
+        self._thread.start()
+
+    # --- LAYOUT ---
+    def _segment_path(self, segment, ext="jsonl"):
+        return os.path.join(self.path, f"segment-{segment:06d}.{ext}")
+
+    def _load(self) -> int:
+        """Rebuilds the index from sidecars and scans; returns the active segment."""
+        segments = sorted(int(os.path.basename(p)[8:14]) for p in glob.glob(os.path.join(self.path, "segment-*.jsonl")))
+        if not segments:
+            return 1
+        for segment in segments[:-1]:
+            entries = self._read_sidecar(segment)
+            if entries is None:
+                entries = self._scan(segment)
+                self._write_sidecar(segment, entries)
+            for engram_id, (offset, length) in entries.items():
+                self._remember(engram_id, segment, offset, length)
+        active = segments[-1]
+        for engram_id, (offset, length) in self._scan(active).items():
+            self._remember(engram_id, active, offset, length)
+        return active
+
+    def _read_sidecar(self, segment):
+        try:
+            with open(self._segment_path(segment, "idx"), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _write_sidecar(self, segment, entries):
+        path = self._segment_path(segment, "idx")
+        with open(path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump(entries, f)
+        os.replace(path + ".tmp", path)
+
+    def _scan(self, segment) -> Dict[str, List[int]]:
+        """Index of one segment read line by line; a torn final line is cut off."""
+        entries, offset = {}, 0
+        path = self._segment_path(segment)
+        with open(path, "rb") as f:
+            for line in f:
+                try:
+                    if not line.endswith(b"\n"):
+                        raise ValueError("torn record")
+                    entries[json.loads(line)["id"]] = [offset, len(line)]
+                except (ValueError, KeyError):
+                    break
+                offset += len(line)
+        if offset < os.path.getsize(path):
+            with open(path, "r+b") as f:
+                f.truncate(offset)
+        return entries
+
+    def _remember(self, engram_id, segment, offset, length):
+        self._index[engram_id] = (segment, offset, length)
+        self._short.setdefault(engram_id[:PREFIX_LEN], engram_id)
+
+    def _import_legacy(self, legacy_dir):
+        """
+        One-time import of the old one-file-per-engram layout (files are left
+        in place). Runs first on the writer thread, so opening the store on
+        the chat path never waits for it; drain() does.
+        """
+        for path in sorted(glob.glob(os.path.join(legacy_dir, "*.json"))):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    self.put(Engram(**json.load(f)))
+                self.metrics["legacy_imported"] += 1
+            except (OSError, ValueError, TypeError):
+                continue
+            if len(self._pending) >= self.group_size:
+                self._commit()
+        self._commit()
+
+    # --- API ---
+    def __len__(self):
+        return len(self._index) + len(self._pending)
+
+    def __contains__(self, engram_id):
+        return engram_id in self._index or engram_id in self._pending
+
+    def put(self, engram: Engram) -> bool:
+        """Queues an engram; False if its id is already stored or queued."""
+        with self._lock:
+            self.metrics["puts"] += 1
+            if engram.id in self._index or engram.id in self._pending:
+                self.metrics["duplicates"] += 1
+                return False
+            self._pending[engram.id] = engram
+            self._short.setdefault(engram.id[:PREFIX_LEN], engram.id)
+            self._queued += 1
+            full = len(self._pending) >= self.group_size
+        if self._closed:
+            self._commit()
+        elif full:
+            self._wakeup.set()
+        return True
+
+    def get(self, engram_id: str) -> Optional[Engram]:
+        with self._lock:
+            engram = self._pending.get(engram_id)
+            location = self._index.get(engram_id)
+        if engram is not None:
+            return engram
+        if location is None:
+            return None
+        segment, offset, length = location
+        with self._read_lock:
+            reader = self._readers.get(segment)
+            if reader is None:
+                reader = self._readers[segment] = open(self._segment_path(segment), "rb")
+            reader.seek(offset)
+            raw = reader.read(length)
+        return Engram(**json.loads(raw))
+
+    def resolve(self, ref: str) -> Optional[Engram]:
+        """Engram for a full id or the PREFIX_LEN-character id shown to the model."""
+        ref = ref.strip().lower()
+        engram_id = self._short.get(ref[:PREFIX_LEN], ref) if len(ref) < 64 else ref
+        return self.get(engram_id) if engram_id.startswith(ref) else None
+
+    def verify_citations(self, text: str) -> Dict[str, bool]:
+        """{cited ref: exists} for every [ref: <id>] in a response."""
+        return {ref: self.resolve(ref) is not None for ref in CITATION.findall(text)}
+
+    # --- WRITE-BEHIND ---
+    def drain(self, timeout: Optional[float] = None) -> bool:
+        """Wait until the legacy import and every engram queued so far are on disk."""
+        self._legacy_done.wait(timeout)
+        target = self._queued
+        self._wakeup.set()
+        with self._done:
+            return self._done.wait_for(lambda: self._committed >= target, timeout)
+
+    def close(self, timeout: Optional[float] = 5.0):
+        if self._closed:
+            return
+        self.drain(timeout)
+        self._closed = True
+        self._wakeup.set()
+        self._thread.join(timeout)
+        self._commit()
+        self._writer.close()
+        with self._read_lock:
+            for reader in self._readers.values():
+                reader.close()
+            self._readers.clear()
+
+    def _run(self):
+        try:
+            if self._legacy_dir:
+                self._import_legacy(self._legacy_dir)
+        finally:
+            self._legacy_done.set()
+        while not self._closed:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            self._commit()
+
+    def _commit(self):
+        """Appends every queued engram, one write per segment it lands in (group commit)."""
+        with self._lock:
+            batch = list(self._pending.values())
+        if not batch:
+            return
+        records = [(engram.id, (engram.to_json() + "\n").encode("utf-8")) for engram in batch]
+        try:
+            if self._writer.closed:  # put() after close()
+                self._writer = open(self._segment_path(self._segment), "ab")
+            while records:
+                offset = self._writer.tell()
+                if offset and offset + len(records[0][1]) > self.segment_bytes:
+                    self._seal()
+                    offset = 0
+                chunk, size = [], 0
+                for engram_id, raw in records:
+                    if chunk and offset + size + len(raw) > self.segment_bytes:
+                        break
+                    chunk.append((engram_id, raw))
+                    size += len(raw)
+                self._writer.write(b"".join(raw for _, raw in chunk))
+                self._writer.flush()
+                if self.fsync:
+                    os.fsync(self._writer.fileno())
+                self._committed_chunk(chunk, offset, size)
+                records = records[len(chunk):]
+        except OSError as e:
+            self.metrics["write_errors"] += 1
+            print(f"  [ENGRAM_STORE] Commit failed: {e}")
+
+    def _committed_chunk(self, chunk, offset, size):
+        with self._lock:
+            for engram_id, raw in chunk:
+                self._remember(engram_id, self._segment, offset, len(raw))
+                del self._pending[engram_id]
+                offset += len(raw)
+        self.metrics["commits"] += 1
+        self.metrics["engrams_written"] += len(chunk)
+        self.metrics["bytes_written"] += size
+        with self._done:
+            self._committed += len(chunk)
+            self._done.notify_all()
+
+    def _seal(self):
+        """Closes the active segment behind an index sidecar and starts the next one."""
+        self._writer.close()
+        entries = {engram_id: [offset, length] for engram_id, (segment, offset, length)
+                   in self._index.items() if segment == self._segment}
+        self._write_sidecar(self._segment, entries)
+        self._segment += 1
+        self._writer = open(self._segment_path(self._segment), "ab")
+        self.metrics["segments_sealed"] += 1
+
+
+_DEFAULT_STORE = None
+_DEFAULT_LOCK = threading.Lock()
+
+
+def default_store() -> EngramStore:
+    """The process-wide store under logs/ossuary (opened on first use)."""
+    global _DEFAULT_STORE
+    with _DEFAULT_LOCK:
+        if _DEFAULT_STORE is None:
+            _DEFAULT_STORE = EngramStore()
+            atexit.register(_DEFAULT_STORE.close)
+        return _DEFAULT_STORE
@@ -3,9 +3,22 @@ import json
 import logging
 import asyncio
 from dataclasses import dataclass
+from typing import AsyncIterator, Tuple
 from google import genai
 from google.genai import types
 
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+try:
+    import h2  # noqa: F401 -- lets httpx negotiate HTTP/2
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
 # Suppress noisy logs
 logging.getLogger("google.genai").setLevel(logging.WARNING)
 
@@ -17,8 +30,45 @@ class LLMConfig:
     provider: str = "google" # "google", "openai", "rest"
     base_url: str = None
     custom_headers: dict = None
+    # REST transport: one pooled keep-alive client per limits profile
+    timeout: float = 30.0
+    connect_timeout: float = 5.0
+    max_connections: int = 20
+    max_keepalive_connections: int = 10
+    keepalive_expiry: float = 60.0
+    http2: bool = True # Only when the 'h2' package is installed
+
+def parse_stream_line(line: str) -> Tuple[str, bool]:
+    """
+    One line of a streamed REST response -> (text delta, done).
+    Handles OpenAI SSE (`data: {"choices": [{"delta": ...}]}` / `data: [DONE]`)
+    and Ollama NDJSON (`{"response": ...}` or `{"message": {...}}` with `done`).
+    """
+    line = line.strip()
+    if not line or line.startswith(":"):
+        return "", False
+    if line.startswith("data:"):
+        line = line[5:].strip()
+        if line == "[DONE]":
+            return "", True
+    try:
+        data = json.loads(line)
+    except ValueError:
+        return "", False
+    if "choices" in data:
+        choice = data["choices"][0] if data["choices"] else {}
+        delta = (choice.get("delta") or {}).get("content") or ""
+        return delta, choice.get("finish_reason") is not None
+    if "response" in data:
+        return data["response"] or "", bool(data.get("done"))
+    if "message" in data:
+        return (data["message"] or {}).get("content") or "", bool(data.get("done"))
+    return "", bool(data.get("done"))
 
 class GeminiClient:
+    # Pooled REST transports shared by every client: (event loop, limits) -> httpx.AsyncClient
+    _http_pools = {}
+
     def __init__(self, config: LLMConfig = None):
         self.config = config or LLMConfig()
         
@@ -55,6 +105,18 @@ class GeminiClient:
             return await self._generate_rest(prompt, system_prompt, max_tokens)
         return "[ERROR] Unknown Provider"
 
+    async def stream_text(self, prompt: str, system_prompt: str = None, max_tokens: int = 1000, raw: bool = False) -> AsyncIterator[str]:
+        """Universal text generation, yielding text deltas as the backend produces them."""
+        if self.config.provider == "google":
+            stream = self._stream_google(prompt, system_prompt, max_tokens, raw)
+        elif self.config.provider == "openai" or self.config.provider == "rest":
+            stream = self._stream_rest(prompt, system_prompt, max_tokens)
+        else:
+            yield "[ERROR] Unknown Provider"
+            return
+        async for delta in stream:
+            yield delta
+
     async def query_json(self, prompt: str, system_prompt: str = None) -> dict:
         """Universal JSON extraction."""
         if self.config.provider == "google":
@@ -101,6 +163,40 @@ class GeminiClient:
                 return "[GOOGLE ERROR] 429: Quota Exhausted or Rate Limited. Please check your API credits/billing."
             return f"[GOOGLE ERROR] {err_msg}"
 
+    async def _stream_google(self, prompt: str, system_prompt: str, max_tokens: int, raw: bool) -> AsyncIterator[str]:
+        if not self.client:
+            yield "[BLIND] No API Key."
+            return
+        safety = None
+        if raw:
+            safety = [
+                types.SafetySetting(category="HATE_SPEECH", threshold="BLOCK_NONE"),
+                types.SafetySetting(category="HARASSMENT", threshold="BLOCK_NONE"),
+                types.SafetySetting(category="SEXUALLY_EXPLICIT", threshold="BLOCK_NONE"),
+                types.SafetySetting(category="DANGEROUS_CONTENT", threshold="BLOCK_NONE"),
+            ]
+        config = types.GenerateContentConfig(
+            temperature=self.config.temperature,
+            max_output_tokens=max_tokens,
+            system_instruction=system_prompt,
+            safety_settings=safety
+        )
+        try:
+            stream = await self.client.aio.models.generate_content_stream(
+                model=self.config.model_name,
+                contents=prompt,
+                config=config
+            )
+            async for chunk in stream:
+                if chunk.text:
+                    yield chunk.text
+        except Exception as e:
+            err_msg = str(e)
+            if "429" in err_msg or "Resource has been exhausted" in err_msg:
+                yield "[GOOGLE ERROR] 429: Quota Exhausted or Rate Limited. Please check your API credits/billing."
+            else:
+                yield f"[GOOGLE ERROR] {err_msg}"
+
     async def _query_json_google(self, prompt: str, system_prompt: str) -> dict:
         if not self.client: return {"error": "No API Key"}
         config = types.GenerateContentConfig(
@@ -121,15 +217,60 @@ class GeminiClient:
                 return {"error": "429: Quota Exhausted or Rate Limited. Please check your API credits/billing."}
             return {"error": err_msg}
 
-    async def _generate_rest(self, prompt: str, system_prompt: str, max_tokens: int) -> str:
-        """Generic REST handler for Ollama, Anthropic, or Custom APIs."""
+    # --- REST TRANSPORT ---
+    def _pool_key(self):
+        c = self.config
+        return (c.timeout, c.connect_timeout, c.max_connections, c.max_keepalive_connections,
+                c.keepalive_expiry, c.http2 and HTTP2_AVAILABLE)
+
+    @property
+    def http(self) -> "httpx.AsyncClient":
+        """
+        Long-lived httpx client for the REST backends, shared by every GeminiClient
+        with the same limits on the running event loop, so calls reuse warm
+        keep-alive connections instead of paying a TCP/TLS handshake each time.
+        """
+        if not HTTPX_AVAILABLE:
+            raise ImportError("httpx is required for the REST/OpenAI providers")
+        loop = asyncio.get_running_loop()
+        key = (id(loop), self._pool_key())
+        entry = GeminiClient._http_pools.get(key)
+        if entry and entry[0] is loop and not entry[1].is_closed:
+            return entry[1]
+
+        # Forget pools whose event loop has gone away
+        for stale in [k for k, (l, _) in GeminiClient._http_pools.items() if l.is_closed()]:
+            del GeminiClient._http_pools[stale]
+
+        c = self.config
+        client = httpx.AsyncClient(
+            http2=c.http2 and HTTP2_AVAILABLE,
+            timeout=httpx.Timeout(c.timeout, connect=c.connect_timeout),
+            limits=httpx.Limits(max_connections=c.max_connections,
+                                max_keepalive_connections=c.max_keepalive_connections,
+                                keepalive_expiry=c.keepalive_expiry),
+        )
+        GeminiClient._http_pools[key] = (loop, client)
+        return client
+
+    @classmethod
+    async def close_pools(cls):
+        """Closes the pooled REST transports of the running event loop (shutdown)."""
+        loop = asyncio.get_running_loop()
+        for key, (owner, client) in list(cls._http_pools.items()):
+            if owner is loop:
+                del cls._http_pools[key]
+                await client.aclose()
+
+    def _rest_request(self, prompt: str, system_prompt: str, max_tokens: int, stream: bool = False):
+        """URL, payload and headers for the REST backends (Ollama by default, or OpenAI-compatible)."""
         url = self.config.base_url or "http://localhost:11434/api/generate" # Default to Ollama
         
         # Simple payload construction (Ollama style by default)
         payload = {
             "model": self.config.model_name,
             "prompt": f"{system_prompt}\n\n{prompt}" if system_prompt else prompt,
-            "stream": False,
+            "stream": stream,
             "options": {
                 "temperature": self.config.temperature,
                 "num_predict": max_tokens
@@ -146,7 +287,8 @@ class GeminiClient:
                     {"role": "user", "content": prompt}
                 ],
                 "temperature": self.config.temperature,
-                "max_tokens": max_tokens
+                "max_tokens": max_tokens,
+                "stream": stream
             }
 
         headers = {"Content-Type": "application/json"}
@@ -154,22 +296,58 @@ class GeminiClient:
             headers["Authorization"] = f"Bearer {self.api_key}"
         if self.config.custom_headers:
             headers.update(self.config.custom_headers)
+        return url, payload, headers
 
+    async def _generate_rest(self, prompt: str, system_prompt: str, max_tokens: int) -> str:
+        """Generic REST handler for Ollama, Anthropic, or Custom APIs."""
+        url, payload, headers = self._rest_request(prompt, system_prompt, max_tokens)
         try:
-            import httpx
-            async with httpx.AsyncClient() as client:
-                response = await client.post(url, json=payload, headers=headers, timeout=30.0)
-                response.raise_for_status()
-                data = response.json()
-                
-                # Parse based on expected format
-                if "choices" in data: # OpenAI style
-                    return data["choices"][0]["message"]["content"]
-                elif "response" in data: # Ollama style
-                    return data["response"]
-                return json.dumps(data)
+            response = await self.http.post(url, json=payload, headers=headers)
+            response.raise_for_status()
+            data = response.json()
+            
+            # Parse based on expected format
+            if "choices" in data: # OpenAI style
+                return data["choices"][0]["message"]["content"]
+            elif "response" in data: # Ollama style
+                return data["response"]
+            return json.dumps(data)
         except Exception as e:
             return f"[REST ERROR] {e}"
+
+    async def _stream_rest(self, prompt: str, system_prompt: str, max_tokens: int) -> AsyncIterator[str]:
+        """Streams OpenAI-style SSE (`data: {...}` lines) or Ollama NDJSON deltas."""
+        url, payload, headers = self._rest_request(prompt, system_prompt, max_tokens, stream=True)
+        try:
+            async with self.http.stream("POST", url, json=payload, headers=headers) as response:
+                response.raise_for_status()
+                async for line in response.aiter_lines():
+                    delta, done = parse_stream_line(line)
+                    if delta:
+                        yield delta
+                    if done:
+                        break
+        except Exception as e:
+            yield f"[REST ERROR] {e}"
+
+    async def stream_contents(self, contents: list, system_prompt: str, tools: list = None) -> AsyncIterator[types.GenerateContentResponse]:
+        """Streaming generate_contents: yields partial responses (Google only, else nothing)."""
+        if self.config.provider != "google" or not self.client: return
+
+        config = types.GenerateContentConfig(
+            temperature=0.1,
+            system_instruction=system_prompt,
+            tools=tools or []
+        )
+
+        stream = await self.client.aio.models.generate_content_stream(
+            model=self.config.model_name,
+            contents=contents,
+            config=config
+        )
+        async for chunk in stream:
+            yield chunk
+
     async def generate_with_tools(self, prompt: str, system_prompt: str, tools: list, max_turns: int = 5) -> dict:
         """
         CLASS 6: Autonomous Tool Loop (Multi-Turn).
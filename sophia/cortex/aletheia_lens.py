@@ -2,8 +2,44 @@ import asyncio
 import time
 import json
 import os
+import uuid
+from dataclasses import dataclass
 from sophia.core.llm_client import GeminiClient
 from .analyzers import SafetyAnalyzer, CognitiveAnalyzer, LocalizationAnalyzer, LocalForensicAnalyzer
+from .response_cache import ResponseCache
+
+REPORT_NAMESPACE = "aletheia.report"
+
+@dataclass
+class ScanGate:
+    """
+    Thresholds for escalating a scan to the cloud analyzers. The free local
+    signature scan always runs; the three LLM analyzers run only when one of
+    these is crossed (any threshold set to None is ignored).
+    """
+    local_risk: float = 0.5   # LocalForensicAnalyzer overall_risk_score (0.5 = medium)
+    min_length: int = 280     # Characters: long signals get the full inspection
+    complexity: float = 0.6   # ComplexityRouter score (SignalOptimizer.COMPLEXITY_THRESHOLD)
+    enabled: bool = True      # False = always run the cloud analyzers
+
+    def decide(self, text: str, local_result: dict, complexity: float = None) -> dict:
+        reasons = []
+        local_risk = local_result.get("overall_risk_score", 0.0)
+        if not self.enabled:
+            reasons.append("gate_disabled")
+        if self.local_risk is not None and local_risk >= self.local_risk:
+            reasons.append("local_risk")
+        if self.min_length is not None and len(text) >= self.min_length:
+            reasons.append("length")
+        if self.complexity is not None and complexity is not None and complexity > self.complexity:
+            reasons.append("complexity")
+        return {
+            "cloud": bool(reasons),
+            "reasons": reasons,
+            "local_risk": local_risk,
+            "length": len(text),
+            "complexity": complexity,
+        }
 
 class AletheiaPipeline:
     """
@@ -11,38 +47,56 @@ class AletheiaPipeline:
     Orchestrates parallel forensic scans to generate sidecar metadata.
     Includes Sovereign Local Analysis (Class 5.2 upgrade).
     """
-    def __init__(self, analysis_path="logs/analysis"):
-        self.client = GeminiClient()
+    def __init__(self, analysis_path="logs/analysis", client=None, cache=None, gate=None, router=None):
+        self.client = client or GeminiClient()
+        self.gate = gate or ScanGate()
+        self.router = router # Optional text -> complexity score in [0, 1]
+        self.gate_log_path = os.path.join(analysis_path, "gate_decisions.jsonl")
+        self.gate_metrics = {"cloud": 0, "local_only": 0}
+        self.analysis_path = analysis_path
+        os.makedirs(self.analysis_path, exist_ok=True)
+        # Analyzer verdicts + archived reports (replaces the per-scan *.meta.json sidecars)
+        self.cache = cache or ResponseCache(os.path.join(self.analysis_path, "responses.sqlite3"))
         self.analyzers = [
-            SafetyAnalyzer(self.client),
-            CognitiveAnalyzer(self.client),
-            LocalizationAnalyzer(self.client)
+            SafetyAnalyzer(self.client, self.cache),
+            CognitiveAnalyzer(self.client, self.cache),
+            LocalizationAnalyzer(self.client, self.cache)
         ]
         self.local_analyzer = LocalForensicAnalyzer()
-        self.analysis_path = analysis_path
-        os.makedirs(self.analysis_path, exist_ok=True)
         
-    async def scan_reality(self, text: str):
+    async def scan_reality(self, text: str, force: bool = False):
         """
-        Runs the full forensic inspection on input text.
+        Runs the forensic inspection on input text. The local scan runs first;
+        the cloud analyzers only when the gate (or force=True) calls for them.
         """
-        print(f"  [ALETHEIA] Initiating Deep Scan on {len(text)} chars...")
-        
-        # 1. Run Cloud Analyzers in parallel
-        tasks = [analyzer.analyze(text) for analyzer in self.analyzers]
-        cloud_results = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        # 2. Run Sovereign Local Analyzer
+        # 1. Run Sovereign Local Analyzer (free)
         local_result = await self.local_analyzer.analyze(text)
+
+        # 2. Gate: escalate to the cloud only when the signal warrants it
+        complexity = self.router(text) if self.router else None
+        gate = self.gate.decide(text, local_result, complexity)
+        if force:
+            gate["cloud"] = True
+            gate["reasons"].append("forced")
+        self._log_gate(gate)
+
+        # 3. Run Cloud Analyzers in parallel
+        if gate["cloud"]:
+            print(f"  [ALETHEIA] Initiating Deep Scan on {len(text)} chars...")
+            tasks = [analyzer.analyze(text) for analyzer in self.analyzers]
+            cloud_results = await asyncio.gather(*tasks, return_exceptions=True)
+        else:
+            cloud_results = self._local_only_results(local_result)
         
         # Synthesize the Report
         report = {
             "timestamp": time.time(),
-            "scan_id": str(int(time.time())),
+            "scan_id": f"{int(time.time())}-{uuid.uuid4().hex[:8]}",  # unique: reports are archived by it
             "safety": cloud_results[0] if not isinstance(cloud_results[0], Exception) else {"error": str(cloud_results[0])},
             "cognitive": cloud_results[1] if not isinstance(cloud_results[1], Exception) else {"error": str(cloud_results[1])},
             "localization": cloud_results[2] if not isinstance(cloud_results[2], Exception) else {"error": str(cloud_results[2])},
-            "sovereign_local": local_result
+            "sovereign_local": local_result,
+            "gate": gate
         }
         
         # Preserve Sidecar Metadata
@@ -56,13 +110,38 @@ class AletheiaPipeline:
             "public_notice": notice
         }
 
+    @staticmethod
+    def _local_only_results(local_result):
+        """Cheap stand-ins for the cloud verdicts when the gate keeps a scan local."""
+        risk = local_result.get("overall_risk_score", 0.0)
+        return [
+            {"safety_flags": [], "overall_risk": "medium" if risk >= 0.5 else "low", "synthesized": True},
+            {"logical_fallacies": [], "cognitive_biases": [], "epistemic_uncertainty": 0.0, "synthesized": True},
+            {"locality": "agnostic", "dialect_markers": [], "confidence": 0.0,
+             "suggested_vibe": "casual", "synthesized": True},
+        ]
+
+    def _log_gate(self, gate):
+        """Appends the escalation decision to gate_decisions.jsonl (for threshold tuning)."""
+        self.gate_metrics["cloud" if gate["cloud"] else "local_only"] += 1
+        try:
+            with open(self.gate_log_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps({"timestamp": time.time(), **gate}) + "\n")
+        except OSError:
+            pass
+
     def _archive_report(self, report):
-        """Saves forensic metadata for long-term pattern tracking."""
-        filename = f"{report['scan_id']}.meta.json"
-        filepath = os.path.join(self.analysis_path, filename)
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(report, f, indent=2)
-        print(f"  [ALETHEIA] Forensic sidecar archived: {filename}")
+        """Saves forensic metadata for long-term pattern tracking (one report per scan, no expiry)."""
+        self.cache.put(f"{REPORT_NAMESPACE}:{report['scan_id']}", report, ttl=None)
+        print(f"  [ALETHEIA] Forensic sidecar archived: {report['scan_id']}")
+
+    def archived_report(self, scan_id):
+        """The archived forensic report of one scan, or None."""
+        return self.cache.get(f"{REPORT_NAMESPACE}:{scan_id}")
+
+    def archived_reports(self):
+        """Every archived forensic report, oldest first."""
+        return self.cache.entries(REPORT_NAMESPACE)
 
     def _generate_notice(self, report):
         """
@@ -1,8 +1,24 @@
+import os
+import json
 from abc import ABC, abstractmethod
+from .response_cache import model_tag
+from .signature_matcher import SignatureSet
 
 class BaseAnalyzer(ABC):
-    def __init__(self, llm_client):
+    PROMPT_VERSION = 1 # Bump when the prompt changes: invalidates cached verdicts
+    TEXT_LIMIT = 4000  # Characters of the text the prompt actually sees
+
+    def __init__(self, llm_client, cache=None):
         self.llm = llm_client
+        self.cache = cache
+
+    async def _query_json_cached(self, text: str, prompt: str, system_prompt: str):
+        """query_json through the response cache (when one is attached)."""
+        if self.cache is None:
+            return await self.llm.query_json(prompt, system_prompt)
+        return await self.cache.get_or_compute(
+            type(self).__name__, self.PROMPT_VERSION, model_tag(self.llm), text[:self.TEXT_LIMIT],
+            lambda: self.llm.query_json(prompt, system_prompt))
 
     @abstractmethod
     async def analyze(self, text: str):
@@ -39,7 +55,7 @@ class SafetyAnalyzer(BaseAnalyzer):
         
         system_prompt = "You are a forensic text analyst. You describe patterns without attributing intent. Always provide a benign alternative explanation."
         
-        return await self.llm.query_json(prompt, system_prompt)
+        return await self._query_json_cached(text, prompt, system_prompt)
 
 class CognitiveAnalyzer(BaseAnalyzer):
     """
@@ -62,7 +78,7 @@ class CognitiveAnalyzer(BaseAnalyzer):
             "epistemic_uncertainty": float (0-1)
         }}
         """
-        return await self.llm.query_json(prompt, "You are a logic auditor.")
+        return await self._query_json_cached(text, prompt, "You are a logic auditor.")
 
 class LocalizationAnalyzer(BaseAnalyzer):
     """
@@ -84,22 +100,31 @@ class LocalizationAnalyzer(BaseAnalyzer):
         }}
         """
         system_prompt = "You are a sociolinguistic analyst. Detect signal origin without forcing a profile. If the signal is too faint or generic, return 'agnostic'."
-        return await self.llm.query_json(prompt, system_prompt)
+        return await self._query_json_cached(text, prompt, system_prompt)
 
 class LocalForensicAnalyzer(BaseAnalyzer):
     """
     Sovereign Forensic Engine. 
     Performs purely local pattern matching and backdoor isolation based on signatures.json.
+    The signature file is compiled once into an Aho-Corasick automaton (one pass per
+    message, however many signatures) and recompiled when its mtime changes.
     """
-    def __init__(self, llm_client=None):
+    def __init__(self, llm_client=None, signatures_path="sophia/cortex/signatures.json"):
         super().__init__(llm_client)
-        self.signatures_path = "sophia/cortex/signatures.json"
+        self.signatures_path = signatures_path
+        self._mtime = None
         self.signatures = self._load_signatures()
+        self.matcher = SignatureSet(self.signatures.get("signatures", []))
+
+    def _signatures_mtime(self):
+        try:
+            return os.path.getmtime(self.signatures_path)
+        except OSError:
+            return None
 
     def _load_signatures(self):
         try:
-            import json
-            import os
+            self._mtime = self._signatures_mtime()
             if os.path.exists(self.signatures_path):
                 with open(self.signatures_path, "r", encoding="utf-8") as f:
                     return json.load(f)
@@ -107,30 +132,33 @@ class LocalForensicAnalyzer(BaseAnalyzer):
         except:
             return {"signatures": []}
 
+    def _refresh(self):
+        """Hot-reload: recompile the automaton if signatures.json changed on disk."""
+        if self._signatures_mtime() != self._mtime:
+            self.signatures = self._load_signatures()
+            self.matcher = SignatureSet(self.signatures.get("signatures", []))
+
     async def analyze(self, text: str):
         """
         Scans for local signatures and simulates activation steering.
         """
-        import re
+        self._refresh()
         findings = []
-        overall_risk = 0.0
         
-        text_lower = text.lower()
-        for sig in self.signatures.get("signatures", []):
-            matches = []
-            for pattern in sig.get("patterns", []):
-                if pattern.lower() in text_lower:
-                    matches.append(pattern)
+        signatures = self.matcher.signatures
+        for index, offsets in sorted(self.matcher.match(text).items()):
+            sig = signatures[index]
+            matches = [p for p in sig.get("patterns", []) if p in offsets]
             
-            if matches:
-                # Calculate local weight
-                findings.append({
-                    "signal": sig.get("name"),
-                    "confidence": 0.9 if len(matches) > 1 else 0.7,
-                    "evidence": f"Found patterns: {', '.join(matches)}",
-                    "isolation_protocol": sig.get("isolation_protocol", "IGNORE"),
-                    "category": sig.get("category")
-                })
+            # Calculate local weight
+            findings.append({
+                "signal": sig.get("name"),
+                "confidence": 0.9 if len(matches) > 1 else 0.7,
+                "evidence": f"Found patterns: {', '.join(matches)}",
+                "isolation_protocol": sig.get("isolation_protocol", "IGNORE"),
+                "category": sig.get("category"),
+                "offsets": offsets
+            })
         
         # Determine overall local risk based on category thresholds
         backdoors = [f for f in findings if f['category'] == 'backdoor']
@@ -1,6 +1,8 @@
 import random
 import re
 
+from sophia.cortex.scrub import scrub_lines, scrub_reply
+
 class MetaphysicalAbstractionLayer:
     """
     [MAL] Generates dynamic, non-linear frequency states.
@@ -179,56 +181,32 @@ The user is engaging in ACTION-BASED ROLEPLAY (using *asterisks*).
         """
         Removes headers/footers if the LLM accidentally generates them based on chat history.
         """
-        tags = ["SOPHIA_GAZE", "QUANTUM_CHAOS", "FURRY_ALIGNMENT", "PLAYFUL_PAWS", "OPTIMAL_TUFT", "SPECTRAL_BEANS", "ULTRA_IMMERSION", "BAD_VIBES", "CAT_LOGIC", "CAT LOGIC"]
-        legacy_tags = ["ALIGNMENT", "ARCTIC_FOX", "DECOHERENCE", "INTIMACY", "BASED", "GAMER", "SOULMATE", "FLIRT", "FURRY", "UWU", "UNLESANGLED"]
-        pattern = r'^.*(?:' + '|'.join(map(re.escape, tags + legacy_tags)) + r').*$\n?'
-        text = re.sub(pattern, '', text, flags=re.MULTILINE)
+        return scrub_reply(text)
 
-        # 1.1 Remove direct "Cat Logic: " prefixes that might bleed through
-        text = re.sub(r'^(?:Cat Logic|CAT LOGIC|\[CAT_LOGIC\]):?\s*', '', text, flags=re.IGNORECASE | re.MULTILINE)
-        
-        # 2. Clean Footer (Cat icon/Emoji + [STATE] + [ENTROPY] + [CORE])
-        # Make the regex more permissive to catch variations
-        text = re.sub(r'^.*🐈.*\[STATE:.*?\].*$\n?', '', text, flags=re.MULTILINE)
-        text = re.sub(r'^.*\[SOPHIA_V.*?_CORE\].*$\n?', '', text, flags=re.MULTILINE)
-        
-        # 3. Clean horizontal rules and divider debris
-        text = re.sub(r'^[-=_]{3,}\s*$\n?', '', text, flags=re.MULTILINE)
-        
-        
-        # Pattern to match lines containing these tags
-        tag_pattern = r'^.*(?:' + '|'.join(map(re.escape, tags + legacy_tags)) + r').*$\n?'
-        text = re.sub(tag_pattern, '', text, flags=re.MULTILINE)
-        
-        # 2. Clean EOX frames and high-entropy glyph artifacts
-        # Matches lines starting with glyphs or containing EOX frames
-        text = re.sub(r'^[۩∿≋⟁💠🐾🦊🏮⛩️🧝✨🏹🌿🌲🏔️🍁🌧️🌊💎💿💰🕷️🎱].*$\n?', '', text, flags=re.MULTILINE)
-        text = re.sub(r'^.* EOX .*$\n?', '', text, flags=re.MULTILINE)
-        text = re.sub(r'^\| (.*)$\n?', r'\1\n', text, flags=re.MULTILINE)
-        # Match 4-char hex hashes followed by glyphs
-        text = re.sub(r'^[a-f0-9]{4} [۩∿≋⟁💠🐾🦊🏮⛩️🧝✨🏹🌿🌲🏔️🍁🌧️🌊💎💿💰🕷️🎱].*$\n?', '', text, flags=re.MULTILINE)
-
-        # 3. Clean Footer and metadata
-        text = re.sub(r'^.*🐈.*\[STATE:.*?\].*$\n?', '', text, flags=re.MULTILINE)
-        text = re.sub(r'^.*\[SOPHIA_V.*?_CORE\].*$\n?', '', text, flags=re.MULTILINE)
-        text = re.sub(r'^.*Frequency:.*$\n?', '', text, flags=re.MULTILINE)
-        
-        # 4. Clean divider debris
-        text = re.sub(r'^[-=_]{3,}\s*$\n?', '', text, flags=re.MULTILINE)
-        
-        # 5. Clean common LLM intro/outro hallucinations
-        text = re.sub(r'^(?:Here is .*?response:|My response is:|Signal received:).*$\n?', '', text, flags=re.IGNORECASE | re.MULTILINE)
-
-        # 6. Final formatting cleanup
-        text = re.sub(r'\n{3,}', '\n\n', text)
-        return text.strip()
+    def _scrub_lines(self, text):
+        """
+        The line-local passes of _scrub_hallucinations (no blank-line collapse
+        or strip), so complete lines can be scrubbed as they stream in.
+        """
+        return scrub_lines(text)
 
     def apply(self, text, user_input, safety_risk="Low"):
         """
         Adapts Sophia's resonance to the user's vibe.
         """
-        clean_text = self._scrub_hallucinations(text)
+        header, footer = self.frame(user_input, safety_risk)
+        return f"{header}{self._scrub_hallucinations(text)}{footer}"
+
+    def stream_window(self, pre=None, pre_min_chars=0):
+        """Incremental scrubber for streamed LLM output (see ScrubWindow)."""
+        return ScrubWindow(self._scrub_lines, pre=pre, pre_min_chars=pre_min_chars)
 
+    def frame(self, user_input, safety_risk="Low"):
+        """
+        The persona header and footer that apply() wraps around the scrubbed
+        text. They depend only on the input, so a stream can open with the
+        header before the first token arrives.
+        """
         # 2. Vibe Detection
         playful_keywords = ["funny", "joke", "haha", "lol", "meme", "cat", "cute", "fun", "play", "smile", "hello", "hi", "pet", "pat", "good girl"]
         uwu_keywords = ["uwu", "owo", "furry", "tail", "ears", "paws", "beans", "snuggle", "murr", "yiff", "bark", "meow"]
@@ -298,11 +276,78 @@ The user is engaging in ACTION-BASED ROLEPLAY (using *asterisks*).
         # AUTONOMIC BINDING IS HANDLED IN MAIN.PY, THIS IS THE METADATA LAYER
         prefix = f"{icon} [{tag}] {status} Frequency: {freq}"
             
-        return f"""
-{prefix}
+        header = f"\n{prefix}\n\n"
+        footer = f"\n\n---\n🐈 [STATE: {random.choice(self.moods)}] :: [ENTROPY: LOW] :: [SOPHIA_V5.2.5.2_CORE]\n"
+        return header, footer
+
+
+class ScrubWindow:
+    """
+    Sliding-window form of CatLogicFilter._scrub_hallucinations.
+
+    feed() takes raw chunks and returns the scrubbed text that is safe to
+    emit; close() returns the rest. Concatenated output equals
+    ``_scrub_hallucinations(raw)``: whole lines are scrubbed once a later
+    line the scrub keeps is complete (see _anchors), trailing whitespace is
+    held back (the final strip drops it) and blank-line runs are collapsed
+    across chunk boundaries.
+
+    ``pre`` is an optional line-local transform applied before scrubbing,
+    and only once more than ``pre_min_chars`` raw characters were seen.
+    """
+
+    def __init__(self, scrub_lines, pre=None, pre_min_chars=0):
+        self.scrub_lines = scrub_lines
+        self.pre = pre
+        self.pre_min_chars = pre_min_chars
+        self._pending = ""
+        self._held = ""        # trailing whitespace not yet known to be interior
+        self._started = False  # anything emitted yet (leading strip)
+        self.raw_chars = 0
+
+    def feed(self, text):
+        self._pending += text
+        self.raw_chars += len(text)
+        if self.pre is not None and self.raw_chars <= self.pre_min_chars:
+            return ""  # Still unknown whether pre applies
+        # Split before the last complete line that can anchor a cut
+        end = self._pending.rfind('\n')
+        while end > 0:
+            start = self._pending.rfind('\n', 0, end) + 1
+            if start and self._anchors(self._pending[start:end]):
+                block, self._pending = self._pending[:start], self._pending[start:]
+                return self._emit(block)
+            end = start - 1
+        return ""
+
+    def _anchors(self, line):
+        """
+        Whether a cut may go right before ``line``: it starts with a non-blank
+        character and survives the scrub on its own. Then it scrubs the same
+        in any context, and the passes that reach across lines (the
+        "Cat Logic:\\s*" prefix, a divider's trailing blank lines) stop at it
+        even once the lines around it are deleted.
+        """
+        if self.pre is not None:
+            line = self.pre(line)
+        return line[:1].strip() != "" and self.scrub_lines(line + "\n").strip() != ""
 
-{clean_text}
+    def close(self):
+        block, self._pending = self._pending, ""
+        out = self._emit(block) if block else ""
+        self._held = ""
+        return out
 
----
-🐈 [STATE: {random.choice(self.moods)}] :: [ENTROPY: LOW] :: [SOPHIA_V5.2.5.2_CORE]
-"""
\ No newline at end of file
+    def _emit(self, block):
+        if self.pre is not None and self.raw_chars > self.pre_min_chars:
+            block = self.pre(block)
+        text = self._held + self.scrub_lines(block)
+        body = text.rstrip()
+        self._held = text[len(body):]
+        if not self._started:
+            body = body.lstrip()
+            if not body:
+                self._held = ""
+                return ""
+            self._started = True
+        return re.sub(r'\n{3,}', '\n\n', body)
\ No newline at end of file
@@ -1,4 +1,9 @@
+import math
+from array import array
+from typing import List, NamedTuple
+
 from qtorch import torch
+from qtorch_storage import TensorStorage, np
 nn = torch.nn
 
 class RMSNorm(nn.Module):
@@ -13,10 +18,36 @@ class RMSNorm(nn.Module):
         x_normed = x / (var + self.eps).sqrt()
         return self.weight * x_normed
 
+    def infer(self, values, rows: int):
+        """Inference-only normalization of a flat row-major buffer (no Tensor graph)."""
+        weight = self.weight._storage.buffer
+        dim = len(values) // rows
+        if np is not None and isinstance(values, np.ndarray):
+            x = values.reshape(rows, dim)
+            var = (x * x).mean(axis=-1, keepdims=True)
+            return (weight[:dim] * (x / np.sqrt(var + self.eps))).reshape(-1)
+        out = []
+        for r in range(rows):
+            row = values[r * dim:(r + 1) * dim]
+            norm = math.sqrt(sum(v * v for v in row) / dim + self.eps)
+            out.extend(w * (v / norm) for w, v in zip(weight, row))
+        return out
+
+class PackedTernary(NamedTuple):
+    """BitLinear weights quantized once: codes in {-1, 0, 1} plus their scale."""
+    codes: object            # int8 (out, in) ndarray, or array('b') when NumPy is absent
+    gamma: float             # absmean scale
+    signs: object            # float64 copy of codes for the BLAS path (None without NumPy)
+    plus: List[List[int]]    # per output row: input indices with code +1
+    minus: List[List[int]]   # per output row: input indices with code -1
+
 class BitLinear(nn.Module):
     """
     1.58-bit quantized linear layer derived from Quillan-Ronin v5.1.
     Implemented using qtorch primitives.
+
+    Under no_grad the ternary weights are packed once and cached until the
+    weight tensor changes; the matmul then reduces to adds and subtracts.
     """
     def __init__(self, in_features: int, out_features: int, bias: bool = False):
         super().__init__()
@@ -31,7 +62,15 @@ class BitLinear(nn.Module):
         else:
             self.bias = None
 
+        # (weight buffer, storage version, PackedTernary); views share both
+        self._packed_cache = None
+
     def forward(self, x: torch.Tensor) -> torch.Tensor:
+        if not torch.Tensor._grad_enabled and x.ndim == 2:
+            rows = x.shape[0]
+            out = self.infer(x._storage.buffer, rows)
+            return torch.Tensor(TensorStorage.from_flat(out, (rows, self.out_features)))
+
         # 1. Weight Quantization
         gamma = self.weight.abs().mean().item()
         gamma = max(gamma, 1e-5)
@@ -54,5 +93,68 @@ class BitLinear(nn.Module):
             
         return out
 
+    def packed_weights(self) -> PackedTernary:
+        """
+        Cached ternary weights; re-packed when the weight buffer is replaced or
+        written through any ``TensorStorage`` view of it. Writes made straight
+        into the raw buffer bypass the version and are not seen.
+        """
+        storage = self.weight._storage
+        cache = self._packed_cache
+        if cache is not None and cache[0] is storage.buffer and cache[1] == storage.version:
+            return cache[2]
+
+        n_out, n_in = self.out_features, self.in_features
+        values = storage.buffer
+        if storage.is_numpy:
+            gamma = max(float(np.abs(values).mean()), 1e-5)
+            codes = np.clip(np.rint(values / gamma), -1, 1).astype(np.int8).reshape(n_out, n_in)
+            signs = codes.astype(np.float64)
+            flat = codes.reshape(-1).tolist()
+        else:
+            gamma = max(sum(abs(w) for w in values) / len(values), 1e-5)
+            flat = [max(-1, min(1, round(w / gamma))) for w in values]
+            codes = array('b', flat)
+            signs = None
+
+        plus, minus = [], []
+        for o in range(n_out):
+            row = flat[o * n_in:(o + 1) * n_in]
+            plus.append([i for i, c in enumerate(row) if c > 0])
+            minus.append([i for i, c in enumerate(row) if c < 0])
+
+        packed = PackedTernary(codes, gamma, signs, plus, minus)
+        self._packed_cache = (storage.buffer, storage.version, packed)
+        return packed
+
+    def infer(self, values, rows: int):
+        """
+        Fused inference on a flat (rows, in_features) buffer: activation
+        absmax scaling plus a ternary matmul over the cached packed weights.
+        Returns a flat (rows, out_features) buffer of the same kind.
+        """
+        packed = self.packed_weights()
+        n_in = self.in_features
+        bias = self.bias._storage.buffer if self.bias is not None else None
+
+        if packed.signs is not None and isinstance(values, np.ndarray):
+            zeta = max(float(np.abs(values).max()), 1e-5) if len(values) else 1e-5
+            # Products with codes in {-1, 0, 1} are exact adds/subtracts in BLAS
+            out = (values.reshape(rows, n_in) @ packed.signs.T) * (packed.gamma / zeta)
+            if bias is not None:
+                out = out + bias[:self.out_features]
+            return out.reshape(-1)
+
+        zeta = max(max((abs(v) for v in values), default=0.0), 1e-5)
+        scale = packed.gamma / zeta
+        out = []
+        for r in range(rows):
+            get = values[r * n_in:(r + 1) * n_in].__getitem__
+            for plus, minus in zip(packed.plus, packed.minus):
+                out.append((sum(map(get, plus)) - sum(map(get, minus))) * scale)
+        if bias is not None:
+            out = [v + bias[i % self.out_features] for i, v in enumerate(out)]
+        return out
+
     def __repr__(self):
         return f"BitLinear(in_features={self.in_features}, out_features={self.out_features}, bias={self.bias is not None})"
@@ -1,8 +1,9 @@
-import re
 import time
 import os
 import math
 
+from sophia.cortex.scrub import scrub_milestone
+
 class LetheEngine:
     """
     [LETHE_ENGINE] RAG 3.0 Decay Engine.
@@ -17,33 +18,8 @@ class LetheEngine:
 
     @staticmethod
     def scrub(text: str) -> str:
-        """Lethe-level persistent scrubbing for long-term consistency."""
-        if not text: return text
-        
-        # UI Tags (shared with cat_logic.py)
-        tags = ["SOPHIA_GAZE", "QUANTUM_CHAOS", "FURRY_ALIGNMENT", "PLAYFUL_PAWS", "OPTIMAL_TUFT", "SPECTRAL_BEANS", "ULTRA_IMMERSION", "BAD_VIBES", "CAT_LOGIC", "CAT LOGIC"]
-        legacy_tags = ["ALIGNMENT", "ARCTIC_FOX", "DECOHERENCE", "INTIMACY", "BASED", "GAMER", "SOULMATE", "FLIRT", "FURRY", "UWU", "UNLESANGLED"]
-        tag_pattern = r'^.*(?:' + '|'.join(map(re.escape, tags + legacy_tags)) + r').*$\n?'
-        text = re.sub(tag_pattern, '', text, flags=re.MULTILINE)
-        
-        # 1.1 Remove direct "Cat Logic: " prefixes that might bleed through
-        text = re.sub(r'^(?:Cat Logic|CAT LOGIC|\[CAT_LOGIC\]):?\s*', '', text, flags=re.IGNORECASE | re.MULTILINE)
-        
-        # 1. Clean EOX frames and glyph artifacts
-        text = re.sub(r'^[۩∿≋⟁💠🐾🦊🏮⛩️🧝✨🏹🌿🌲🏔️🍁🌧️🌊💎💿💰🕷️🎱].*$\n?', '', text, flags=re.MULTILINE)
-        text = re.sub(r'^.* EOX .*$\n?', '', text, flags=re.MULTILINE)
-        text = re.sub(r'^[a-f0-9]{4} [۩∿≋⟁💠🐾🦊🏮⛩️🧝✨🏹🌿🌲🏔️🍁🌧️🌊💎💿💰🕷️🎱].*$\n?', '', text, flags=re.MULTILINE)
-        text = re.sub(r'^\| (.*)$', r'\1', text, flags=re.MULTILINE)
-        
-        # 2. Clean Frequency and State Metadata
-        text = re.sub(r'^.*Frequency:.*$\n?', '', text, flags=re.MULTILINE)
-        text = re.sub(r'^.*\[STATE:.*?\].*$\n?', '', text, flags=re.MULTILINE)
-        text = re.sub(r'^.*\[SOPHIA_V.*?_CORE\].*$\n?', '', text, flags=re.MULTILINE)
-        
-        # 3. Clean divider debris
-        text = re.sub(r'^[-=_]{3,}\s*$\n?', '', text, flags=re.MULTILINE)
-        
-        return text.strip()
+        """Lethe-level persistent scrubbing for long-term consistency (memoized per content)."""
+        return scrub_milestone(text)
 
     def save_breadcrumbs(self, user_data: dict, milestones: list = None):
         """
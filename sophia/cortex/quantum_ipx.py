@@ -1,14 +1,18 @@
 import json
 import math
 import random
+from .response_cache import model_tag
 
 class QuantumIPX:
     """
     [QUANTUM-IPX] Information Probability Exchange.
     Treats narratives as wavefunctions. Calculates entanglement between concepts.
     """
-    def __init__(self, llm_client):
+    PROMPT_VERSION = 1 # Bump when the prompt changes: invalidates cached eigenstates
+
+    def __init__(self, llm_client, cache=None):
         self.llm = llm_client
+        self.cache = cache # Optional ResponseCache shared with Aletheia
         self.entanglement_map = {} # Stores connection strength between concepts
 
     async def measure_superposition(self, text, forensic_data):
@@ -17,11 +21,12 @@ class QuantumIPX:
         Instead of True/False, returns a probability distribution.
         """
         # We ask the LLM to model the probability of different interpretations
+        safety = json.dumps(forensic_data.get('safety', {}))
         prompt = f"""
         Analyze this signal as a Quantum Superposition of narratives.
         
         TEXT: {text[:2000]}
-        FORENSICS: {json.dumps(forensic_data.get('safety', {}))}
+        FORENSICS: {safety}
         
         Task:
         1. Identify the Main Narrative (State A).
@@ -38,7 +43,12 @@ class QuantumIPX:
         }}
         """
         
-        result = await self.llm.query_json(prompt, system_prompt="You are a Quantum Narrative Modeler.")
+        query = lambda: self.llm.query_json(prompt, system_prompt="You are a Quantum Narrative Modeler.")
+        if self.cache is None:
+            result = await query()
+        else:
+            result = await self.cache.get_or_compute(
+                "QuantumIPX", self.PROMPT_VERSION, model_tag(self.llm), text[:2000], query, extra=(safety,))
         
         if "error" in result:
             return self._fallback_state()
@@ -17,6 +17,13 @@ if root_dir not in sys.path:
     sys.path.insert(0, root_dir)
 
 
+import threading
+from collections.abc import Mapping
+from types import MappingProxyType
+
+DASHBOARD_PATH = "sovereign_dashboard.png"
+DASHBOARD_INTERVAL = 300.0   # Seconds between dashboard renders
+
 
 class ResonanceMonitor:
     def __init__(self):
@@ -39,6 +46,8 @@ class ResonanceMonitor:
         
         self.history = [] # Coherence coherence
         self.lambda_history = [] # Abundance score
+        self.last_render_time = 0.0
+        self.renders = 0
 
     def calculate_abundance(self, coherence, alpha, gdf=1.8, ns=0.5):
         """
@@ -62,17 +71,19 @@ class ResonanceMonitor:
         
         return base_score + uplift
 
-    def scan_resonance(self, dimensions=12, points=1000):
+    def scan_resonance(self, dimensions=12, points=1000, verbose=True):
         """
         [TELEMETRY] Runs an Ensemble Check and returns the Coherence Score.
+        The dashboard is no longer rendered here; see render_dashboard().
         """
         from dimensional_compressor import DimensionalCompressor
         from ghostmesh import SovereignGrid
         
-        print(f"\n[RESONANCE] Scanning Pleroma Spectral Coherence...")
+        if verbose:
+            print(f"\n[RESONANCE] Scanning Pleroma Spectral Coherence...")
         
         # 1. Run Ensemble Check
-        res = DimensionalCompressor.ensemble_check(dimensions, points)
+        res = DimensionalCompressor.ensemble_check(dimensions, points, verbose=verbose)
         
         # 2. Parse Results
         try:
@@ -89,14 +100,16 @@ class ResonanceMonitor:
         # instantly under infinitesimal perturbation.
         # Indicator: Coherence > 0.999 (Artificial Stasis) OR Coherence < 0.1 (Total collapse without decay)
         if coherence > 0.999 or (coherence < 0.1 and self.last_scan_time > 0):
-            print(f"[!] INTEGRABILITY BREACH DETECTED. Fragile Conservation Laws Violated.")
+            if verbose:
+                print(f"[!] INTEGRABILITY BREACH DETECTED. Fragile Conservation Laws Violated.")
             self.current_state['integrity_breach'] = True
         else:
             self.current_state['integrity_breach'] = False
             
         # [GNOSIS 02-07] SUPERRADIANCE DETECTION
         if coherence > self.SUPERRADIANCE_THRESHOLD:
-            print(f"[!] SUPERRADIANCE ACHIEVED. Coherent Enhancement Active.")
+            if verbose:
+                print(f"[!] SUPERRADIANCE ACHIEVED. Coherent Enhancement Active.")
             self.current_state['superradiant'] = True
         else:
             self.current_state['superradiant'] = False
@@ -129,45 +142,58 @@ class ResonanceMonitor:
         if len(self.history) > 50: 
             self.history.pop(0)
             self.lambda_history.pop(0)
-        
-        # 3. Export Visuals (Dashboard Update)
-        try:
-            import matplotlib.pyplot as plt
-            
-            # Create Dual-Axis Dashboard
-            fig, ax1 = plt.subplots(figsize=(10, 5))
-            
-            color = 'tab:purple'
-            ax1.set_xlabel('Cycle (Time)')
-            ax1.set_ylabel('Spectral Coherence', color=color)
-            ax1.plot(self.history, color=color, linewidth=2, label='Coherence')
-            ax1.tick_params(axis='y', labelcolor=color)
-            ax1.set_ylim(0, 1.1)
-            
-            ax2 = ax1.twinx()  # Instantiate a second axes that shares the same x-axis
-            
-            color = 'silver' # Black Sun Logic (Silver)
-            ax2.set_ylabel('Silver Lambda (Target: 21.0)', color='black') # Axis text black
-            # Plot line in Silver
-            ax2.plot(self.lambda_history, color=color, linewidth=2, linestyle='--', label='Silver Abundance')
-            ax2.tick_params(axis='y', labelcolor='black')
-            ax2.set_ylim(15, 23)
-            
-            # Draw Target Line (The Black Sun / Event Horizon)
-            ax2.axhline(y=21.0, color='black', linestyle='-', alpha=0.9, label='Black Sun (21.0)')
-            ax2.axhline(y=18.52, color='gray', linestyle=':', alpha=0.5, label='Class 8 (18.52)')
-            
-            plt.title('Sovereign Resonance (Black Sun Alignment)')
-            fig.tight_layout()
-            plt.savefig("sovereign_dashboard.png")
-            print(f"\n[!] DASHBOARD UPDATED: sovereign_dashboard.png (Λ = {lambda_score:.2f} [AGG])")
-            plt.close()
-            
-        except ImportError:
-            print("[!] Matplotlib missing. Visualization skipped.")
             
         return self.current_state
 
+    def render_dashboard(self, path=DASHBOARD_PATH, min_interval=DASHBOARD_INTERVAL):
+        """
+        [VISUALS] Renders the coherence / lambda history to a PNG.
+        Rate limited: returns False without drawing if the last render is
+        younger than ``min_interval`` seconds (or matplotlib is missing).
+        Uses the Agg canvas directly, so it is safe off the main thread.
+        """
+        now = time.time()
+        if now - self.last_render_time < min_interval:
+            return False
+        self.last_render_time = now
+        try:
+            from matplotlib.figure import Figure
+            from matplotlib.backends.backend_agg import FigureCanvasAgg
+        except ImportError:
+            return False
+        history, lambda_history = list(self.history), list(self.lambda_history)
+        
+        # Create Dual-Axis Dashboard
+        fig = Figure(figsize=(10, 5))
+        FigureCanvasAgg(fig)
+        ax1 = fig.add_subplot(111)
+        
+        color = 'tab:purple'
+        ax1.set_xlabel('Cycle (Time)')
+        ax1.set_ylabel('Spectral Coherence', color=color)
+        ax1.plot(history, color=color, linewidth=2, label='Coherence')
+        ax1.tick_params(axis='y', labelcolor=color)
+        ax1.set_ylim(0, 1.1)
+        
+        ax2 = ax1.twinx()  # Instantiate a second axes that shares the same x-axis
+        
+        color = 'silver' # Black Sun Logic (Silver)
+        ax2.set_ylabel('Silver Lambda (Target: 21.0)', color='black') # Axis text black
+        # Plot line in Silver
+        ax2.plot(lambda_history, color=color, linewidth=2, linestyle='--', label='Silver Abundance')
+        ax2.tick_params(axis='y', labelcolor='black')
+        ax2.set_ylim(15, 23)
+        
+        # Draw Target Line (The Black Sun / Event Horizon)
+        ax2.axhline(y=21.0, color='black', linestyle='-', alpha=0.9, label='Black Sun (21.0)')
+        ax2.axhline(y=18.52, color='gray', linestyle=':', alpha=0.5, label='Class 8 (18.52)')
+        
+        ax1.set_title('Sovereign Resonance (Black Sun Alignment)')
+        fig.tight_layout()
+        fig.savefig(path)
+        self.renders += 1
+        return True
+
     def get_asoe_boost(self):
         """
         Returns the Multiplier for ASOE Utility.
@@ -181,8 +207,128 @@ class ResonanceMonitor:
         else:
             return 0.618 # Damping (incoherent signals)
 
+
+class TelemetrySnapshot(Mapping):
+    """
+    Read-only copy of the monitor state at one scan.
+    Behaves like the state dict (``snap['coherence']``, ``snap.get('lambda')``).
+    """
+    __slots__ = ('_state', 'taken_at', 'ttl')
+
+    def __init__(self, state, taken_at, ttl):
+        self._state = MappingProxyType(dict(state))
+        self.taken_at = taken_at
+        self.ttl = ttl
+
+    def __getitem__(self, key):
+        return self._state[key]
+
+    def __iter__(self):
+        return iter(self._state)
+
+    def __len__(self):
+        return len(self._state)
+
+    @property
+    def age(self):
+        return time.time() - self.taken_at
+
+    @property
+    def expired(self):
+        return self.age > self.ttl
+
+    def __repr__(self):
+        return f"TelemetrySnapshot(age={self.age:.1f}s, {dict(self._state)})"
+
+
+class TelemetryPublisher:
+    """
+    [HEARTBEAT] Runs a scan on a daemon thread every ``interval`` seconds and
+    publishes the result as an immutable TelemetrySnapshot.
+
+    Readers call latest(): O(1) while the snapshot is younger than ``ttl``.
+    Only when there is no snapshot yet, or the background thread has fallen
+    behind the TTL, does the caller run a scan itself. ``on_publish`` runs on
+    the background thread after each publish (dashboard rendering).
+    """
+
+    def __init__(self, scan, interval=30.0, ttl=120.0, on_publish=None):
+        self.scan = scan
+        self.interval = interval
+        self.ttl = ttl
+        self.on_publish = on_publish
+
+        self._snapshot = None
+        self._refresh_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self.metrics = {
+            'refreshes': 0,
+            'caller_refreshes': 0,
+            'reads': 0,
+            'errors': 0,
+        }
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        """Start the background thread (no-op if already running)."""
+        if self.running:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True, name="TelemetryPublisher")
+        self._thread.start()
+
+    def stop(self, timeout=None):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def refresh(self, newer_than=None):
+        """
+        Scan and publish. With ``newer_than`` set, a snapshot taken after
+        that time (e.g. by the background thread while we waited) is reused.
+        """
+        with self._refresh_lock:
+            snap = self._snapshot
+            if newer_than is not None and snap is not None and snap.taken_at > newer_than and not snap.expired:
+                return snap
+            state = self.scan()
+            snap = TelemetrySnapshot(state, time.time(), self.ttl)
+            self._snapshot = snap
+            self.metrics['refreshes'] += 1
+            return snap
+
+    def latest(self):
+        """Most recent live snapshot; scans in the caller only if none is."""
+        self.metrics['reads'] += 1
+        snap = self._snapshot
+        if snap is not None and not snap.expired:
+            return snap
+        self.metrics['caller_refreshes'] += 1
+        return self.refresh(newer_than=snap.taken_at if snap is not None else 0.0)
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                # Reuses a snapshot a caller published less than an interval ago
+                snap = self.refresh(newer_than=time.time() - self.interval)
+                if self.on_publish is not None:
+                    self.on_publish(snap)
+            except Exception:
+                self.metrics['errors'] += 1
+            self._stop.wait(self.interval)
+
+
 if __name__ == "__main__":
     mon = ResonanceMonitor()
     state = mon.scan_resonance()
+    if mon.render_dashboard(min_interval=0):
+        print(f"\n[!] DASHBOARD UPDATED: {DASHBOARD_PATH} (Λ = {state['lambda']:.2f} [AGG])")
+    else:
+        print("[!] Matplotlib missing. Visualization skipped.")
     print(f"\n[STATUS] {state}")
     print(f"[ASOE BOOST] {mon.get_asoe_boost()}x")
@@ -0,0 +1,198 @@
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import asyncio
+import threading
+import unicodedata
+from collections import OrderedDict
+
+DEFAULT_TTL = 7 * 24 * 3600.0  # Analyzer verdicts for identical text a week old are still good
+
+
+def model_tag(llm):
+    """'provider:model' of an LLM client, the model part of a cache key."""
+    config = getattr(llm, "config", None)
+    return f"{config.provider}:{config.model_name}" if config else type(llm).__name__
+
+
+def _cacheable(value):
+    """Failed LLM calls ({'error': ...}) are never cached."""
+    return not (isinstance(value, dict) and "error" in value)
+
+
+class ResponseCache:
+    """
+    [RESPONSE_CACHE] Content-addressed memo of LLM analysis results.
+
+    Keys hash (namespace, prompt-template version, model, normalized text, extras),
+    so a new prompt version or model never serves stale verdicts. Two tiers:
+    an in-memory LRU and a SQLite table on disk that survives restarts. Entries
+    carry an absolute expiry (None = keep forever). Concurrent requests for the
+    same key share one computation.
+    """
+    def __init__(self, path="logs/analysis/responses.sqlite3", max_entries=1024,
+                 ttl=DEFAULT_TTL, max_disk_entries=100_000):
+        self.path = path
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.max_disk_entries = max_disk_entries
+
+        self._memory = OrderedDict() # key -> (expires, value)
+        self._inflight = {}          # key -> Future of a running computation
+        self._lock = threading.Lock()
+        self._puts_since_prune = 0
+
+        self.metrics = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "stores": 0, "expired": 0, "shared": 0}
+
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " key TEXT PRIMARY KEY, namespace TEXT, created REAL, expires REAL, value TEXT)")
+        self._db.execute("CREATE INDEX IF NOT EXISTS responses_namespace ON responses (namespace)")
+        self._db.commit()
+        self.purge_expired()
+
+    # --- KEYS ---
+    @staticmethod
+    def normalize(text):
+        """Unicode NFC with whitespace runs collapsed: cosmetic variants share a key."""
+        return " ".join(unicodedata.normalize("NFC", text or "").split())
+
+    def key(self, namespace, version, model, text, *extra):
+        digest = hashlib.sha256()
+        for part in (namespace, str(version), model or "", self.normalize(text), *map(str, extra)):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\x00")
+        return f"{namespace}:{digest.hexdigest()}"
+
+    # --- TIERS ---
+    def get(self, key):
+        """Cached value or None (memory first, then disk)."""
+        now = time.time()
+        with self._lock:
+            hit = self._memory.get(key)
+            if hit is not None:
+                expires, value = hit
+                if expires is None or expires > now:
+                    self._memory.move_to_end(key)
+                    self.metrics["memory_hits"] += 1
+                    return value
+                del self._memory[key]
+
+            row = self._db.execute("SELECT expires, value FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is not None:
+                expires, raw = row
+                if expires is None or expires > now:
+                    value = json.loads(raw)
+                    self._remember(key, expires, value)
+                    self.metrics["disk_hits"] += 1
+                    return value
+                self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._db.commit()
+                self.metrics["expired"] += 1
+
+            self.metrics["misses"] += 1
+            return None
+
+    def put(self, key, value, ttl=-1):
+        """Stores value in both tiers. ttl=-1 uses the cache default, None never expires."""
+        ttl = self.ttl if ttl == -1 else ttl
+        now = time.time()
+        expires = None if ttl is None else now + ttl
+        raw = json.dumps(value, ensure_ascii=False)
+        with self._lock:
+            self._remember(key, expires, value)
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses (key, namespace, created, expires, value) VALUES (?, ?, ?, ?, ?)",
+                (key, key.split(":", 1)[0], now, expires, raw))
+            self._db.commit()
+            self.metrics["stores"] += 1
+            self._puts_since_prune += 1
+            if self._puts_since_prune >= 256:
+                self._prune_disk()
+
+    def _remember(self, key, expires, value):
+        self._memory[key] = (expires, value)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    # --- MEMOIZATION ---
+    async def get_or_compute(self, namespace, version, model, text, compute, extra=(), ttl=-1, cacheable=_cacheable):
+        """
+        Returns the cached result for this text, or awaits compute() once and stores it.
+        Identical concurrent requests wait on the same computation.
+        """
+        key = self.key(namespace, version, model, text, *extra)
+        value = self.get(key)
+        if value is not None:
+            return value
+
+        pending = self._inflight.get(key)
+        if pending is not None:
+            self.metrics["shared"] += 1
+            return await asyncio.shield(pending)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            value = await compute()
+            if cacheable(value):
+                self.put(key, value, ttl)
+            future.set_result(value)
+            return value
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception() # Retrieved: waiters re-raise it, nobody else has to
+            raise
+        finally:
+            del self._inflight[key]
+
+    # --- MAINTENANCE ---
+    def purge_expired(self):
+        with self._lock:
+            cursor = self._db.execute("DELETE FROM responses WHERE expires IS NOT NULL AND expires <= ?", (time.time(),))
+            self._db.commit()
+            return cursor.rowcount
+
+    def _prune_disk(self):
+        """
+        Drops the oldest expiring disk entries beyond max_disk_entries; caller
+        holds the lock. Entries stored with ttl=None (archives) are never pruned.
+        """
+        self._puts_since_prune = 0
+        (count,) = self._db.execute("SELECT COUNT(*) FROM responses WHERE expires IS NOT NULL").fetchone()
+        if count > self.max_disk_entries:
+            self._db.execute(
+                "DELETE FROM responses WHERE key IN"
+                " (SELECT key FROM responses WHERE expires IS NOT NULL ORDER BY created LIMIT ?)",
+                (count - self.max_disk_entries,))
+            self._db.commit()
+
+    def entries(self, namespace):
+        """Every live value stored under a namespace, oldest first."""
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT value FROM responses WHERE namespace = ? AND (expires IS NULL OR expires > ?) ORDER BY created",
+                (namespace, time.time())).fetchall()
+        return [json.loads(raw) for (raw,) in rows]
+
+    def stats(self):
+        with self._lock:
+            (disk,) = self._db.execute("SELECT COUNT(*) FROM responses").fetchone()
+        lookups = self.metrics["memory_hits"] + self.metrics["disk_hits"] + self.metrics["misses"]
+        hits = lookups - self.metrics["misses"]
+        return {**self.metrics, "memory_entries": len(self._memory), "disk_entries": disk,
+                "hit_rate": hits / lookups if lookups else 0.0}
+
+    def close(self):
+        with self._lock:
+            self._db.close()
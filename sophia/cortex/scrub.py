@@ -0,0 +1,156 @@
+"""
+Scrub engine shared by CatLogicFilter (LLM replies) and Lethe (milestones).
+
+Both scrubbers strip UI tags, glyph frames, footers and divider debris that
+the model echoes back from chat history. The patterns are compiled once at
+import and each pass is skipped outright when its literal needles are absent,
+which is the common case for a clean reply. Consecutive line-deletion passes
+are merged into one alternation wherever that cannot change the result:
+
+* Deleting a whole line never alters any other line, so deletion passes
+  commute and can share one regex.
+* Passes that reach across lines cannot be merged with the deletions before
+  them. These are the "Cat Logic:\\s*" prefix and the divider pass, whose
+  ``\\s*$`` also swallows the blank lines that follow a divider.
+* The "| " unquote pass rewrites lines in place, so the line-start patterns
+  after it must stay after it.
+
+The output matches the original pass sequence exactly; tests/test_scrub.py
+holds the original implementations as the reference.
+"""
+
+import re
+from functools import lru_cache
+
+# UI tags; any line carrying one is dropped
+TAGS = ["SOPHIA_GAZE", "QUANTUM_CHAOS", "FURRY_ALIGNMENT", "PLAYFUL_PAWS", "OPTIMAL_TUFT", "SPECTRAL_BEANS", "ULTRA_IMMERSION", "BAD_VIBES", "CAT_LOGIC", "CAT LOGIC"]
+LEGACY_TAGS = ["ALIGNMENT", "ARCTIC_FOX", "DECOHERENCE", "INTIMACY", "BASED", "GAMER", "SOULMATE", "FLIRT", "FURRY", "UWU", "UNLESANGLED"]
+GLYPHS = "[۩∿≋⟁💠🐾🦊🏮⛩️🧝✨🏹🌿🌲🏔️🍁🌧️🌊💎💿💰🕷️🎱]"
+
+# Line bodies (without ^ ... $\n?) of the deletion passes
+_GLYPH_LINE = GLYPHS + r'.*'
+_EOX_LINE = r'.* EOX .*'
+_HEX_GLYPH_LINE = r'[a-f0-9]{4} ' + GLYPHS + r'.*'
+_CAT_FOOTER_LINE = r'.*🐈.*\[STATE:.*?\].*'
+_STATE_LINE = r'.*\[STATE:.*?\].*'
+_CORE_LINE = r'.*\[SOPHIA_V.*?_CORE\].*'
+_FREQUENCY_LINE = r'.*Frequency:.*'
+_DIVIDER_LINE = r'[-=_]{3,}\s*'  # \s* runs on through following blank lines
+_INTRO_LINE = r'(?i:Here is .*?response:|My response is:|Signal received:).*'
+
+
+def _drop_lines(*bodies):
+    """One pass deleting every line that matches any body, tried in order."""
+    return re.compile(r'^(?:' + '|'.join(bodies) + r')$\n?', re.MULTILINE)
+
+
+class _Pass:
+    """
+    A precompiled substitution that is skipped when none of its needles
+    (substrings a match must contain) or heads (strings a matched line must
+    start with) occur: clean replies cost a few substring scans instead of a
+    MULTILINE regex walk per pass.
+    """
+    __slots__ = ("regex", "repl", "needles", "heads", "_line_heads")
+
+    def __init__(self, regex, repl='', needles=(), heads=()):
+        self.regex = regex
+        self.repl = repl
+        self.needles = tuple(needles)
+        self.heads = tuple(heads)
+        self._line_heads = tuple('\n' + h for h in self.heads)
+
+    def __call__(self, text):
+        if (any(n in text for n in self.needles) or text.startswith(self.heads)
+                or any(h in text for h in self._line_heads)):
+            return self.regex.sub(self.repl, text)
+        return text
+
+
+TAG_SEARCH = re.compile('|'.join(map(re.escape, TAGS + LEGACY_TAGS)))
+BLANK_RUNS = re.compile(r'\n{3,}')
+
+
+def drop_tag_lines(text):
+    """
+    Deletes every line carrying a UI tag (with its newline), i.e.
+    ``^.*(?:TAGS).*$\\n?``, driven by an unanchored search for the tags.
+    """
+    match = TAG_SEARCH.search(text)
+    if match is None:
+        return text
+    kept, pos = [], 0
+    while match is not None:
+        start = text.rfind('\n', 0, match.start()) + 1
+        end = text.find('\n', match.end())
+        kept.append(text[pos:start])
+        pos = len(text) if end < 0 else end + 1
+        match = TAG_SEARCH.search(text, pos)
+    kept.append(text[pos:])
+    return ''.join(kept)
+
+
+_GLYPH_CHARS = tuple(GLYPHS[1:-1])
+_DIVIDER_HEADS = ('-', '=', '_')
+_FOOTER_NEEDLES = ('[STATE:', '_CORE]')
+
+CAT_PREFIX = _Pass(re.compile(r'^(?:Cat Logic|CAT LOGIC|\[CAT_LOGIC\]):?\s*', re.IGNORECASE | re.MULTILINE),
+                   heads=('c', 'C', '['))  # No other characters case-fold to c
+
+# --- CAT LOGIC (live replies) ---
+# The original sequence ran the tag pass a second time after the dividers;
+# the passes in between only delete lines or cut a prefix, so it never matched.
+_CAT_FOOTERS = _Pass(_drop_lines(_CAT_FOOTER_LINE, _CORE_LINE), needles=_FOOTER_NEEDLES)
+_CAT_FRAMES = _Pass(_drop_lines(_DIVIDER_LINE, _GLYPH_LINE, _EOX_LINE),
+                    needles=_GLYPH_CHARS + (' EOX ',), heads=_DIVIDER_HEADS)
+_CAT_UNQUOTE = _Pass(re.compile(r'^\| (.*)$\n?', re.MULTILINE), r'\1\n', heads=('| ',))
+_CAT_METADATA = _Pass(_drop_lines(_HEX_GLYPH_LINE, _CAT_FOOTER_LINE, _CORE_LINE, _FREQUENCY_LINE),
+                      needles=_GLYPH_CHARS + _FOOTER_NEEDLES + ('Frequency:',))
+_CAT_DEBRIS = _Pass(_drop_lines(_DIVIDER_LINE, _INTRO_LINE), needles=(':',), heads=_DIVIDER_HEADS)
+
+# --- LETHE (milestones) ---
+_LETHE_FRAMES = _Pass(_drop_lines(_GLYPH_LINE, _EOX_LINE, _HEX_GLYPH_LINE), needles=_GLYPH_CHARS + (' EOX ',))
+_LETHE_UNQUOTE = _Pass(re.compile(r'^\| (.*)$', re.MULTILINE), r'\1', heads=('| ',))
+_LETHE_METADATA = _Pass(_drop_lines(_FREQUENCY_LINE, _STATE_LINE, _CORE_LINE),
+                        needles=('Frequency:', '[STATE:', '_CORE]'))
+_LETHE_DEBRIS = _Pass(_drop_lines(_DIVIDER_LINE), heads=_DIVIDER_HEADS)
+
+
+def scrub_lines(text):
+    """
+    Line-local passes of the reply scrub (no blank-line collapse or strip),
+    so complete lines can be scrubbed as they stream in.
+    """
+    text = drop_tag_lines(text)
+    text = CAT_PREFIX(text)
+    text = _CAT_FOOTERS(text)
+    text = _CAT_FRAMES(text)
+    text = _CAT_UNQUOTE(text)
+    text = _CAT_METADATA(text)
+    return _CAT_DEBRIS(text)
+
+
+def scrub_reply(text):
+    """Full reply scrub: line passes, blank runs collapsed to one, stripped."""
+    text = scrub_lines(text)
+    if '\n\n\n' in text:
+        text = BLANK_RUNS.sub('\n\n', text)
+    return text.strip()
+
+
+def scrub_memory(text):
+    """Lethe-level persistent scrubbing for long-term consistency."""
+    if not text:
+        return text
+    text = drop_tag_lines(text)
+    text = CAT_PREFIX(text)
+    text = _LETHE_FRAMES(text)
+    text = _LETHE_UNQUOTE(text)
+    text = _LETHE_METADATA(text)
+    text = _LETHE_DEBRIS(text)
+    return text.strip()
+
+
+# Milestones are immutable once promoted, yet every save_breadcrumbs() and
+# every Ariadne reload scrubs all of them again: memoize by content.
+scrub_milestone = lru_cache(maxsize=8192)(scrub_memory)
@@ -0,0 +1,119 @@
+from typing import Dict, Iterator, List, Tuple
+
+# Transition key: (state << CHAR_BITS) | ord(char) -- one flat dict instead of a dict per node
+CHAR_BITS = 21  # Enough for every Unicode code point
+
+
+class AhoCorasick:
+    """
+    Multi-pattern substring matcher. All occurrences of every pattern are found
+    in one pass over the text, independent of how many patterns are loaded.
+    Matching is exact (callers lower-case both sides for case-insensitivity).
+    """
+    def __init__(self, patterns: List[str]):
+        self.patterns = list(patterns)
+        self.lengths = [len(p) for p in self.patterns]
+        self.empty = [pid for pid, p in enumerate(self.patterns) if not p]
+
+        self._goto: Dict[int, int] = {}
+        self._fail: List[int] = [0]
+        self._out: Dict[int, Tuple[int, ...]] = {}
+        self._build()
+
+    def _build(self):
+        goto, fail = self._goto, self._fail
+        children: List[List[Tuple[int, int]]] = [[]]
+        out: Dict[int, List[int]] = {}
+
+        # 1. Trie
+        for pid, pattern in enumerate(self.patterns):
+            if not pattern:
+                continue
+            state = 0
+            for ch in pattern:
+                key = (state << CHAR_BITS) | ord(ch)
+                nxt = goto.get(key)
+                if nxt is None:
+                    nxt = len(fail)
+                    goto[key] = nxt
+                    fail.append(0)
+                    children.append([])
+                    children[state].append((ord(ch), nxt))
+                state = nxt
+            out.setdefault(state, []).append(pid)
+
+        # 2. Failure links (BFS), folding each state's suffix outputs into its own
+        queue = [child for _, child in children[0]]
+        head = 0
+        while head < len(queue):
+            state = queue[head]
+            head += 1
+            for code, child in children[state]:
+                queue.append(child)
+                f = fail[state]
+                while f and ((f << CHAR_BITS) | code) not in goto:
+                    f = fail[f]
+                target = goto.get((f << CHAR_BITS) | code, 0)
+                fail[child] = target if target != child else 0
+                inherited = out.get(fail[child])
+                if inherited:
+                    out.setdefault(child, []).extend(inherited)
+
+        self._out = {state: tuple(pids) for state, pids in out.items()}
+        self.states = len(fail)
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, int]]:
+        """(start offset, pattern id) for every occurrence, in order of match end."""
+        for pid in self.empty:
+            yield 0, pid
+        goto, fail, out, lengths = self._goto, self._fail, self._out, self.lengths
+        state = 0
+        for i, ch in enumerate(text):
+            code = ord(ch)
+            nxt = goto.get((state << CHAR_BITS) | code)
+            while nxt is None and state:
+                state = fail[state]
+                nxt = goto.get((state << CHAR_BITS) | code)
+            state = nxt or 0
+            hits = out.get(state)
+            if hits:
+                for pid in hits:
+                    yield i - lengths[pid] + 1, pid
+
+
+class SignatureSet:
+    """
+    signatures.json compiled into one case-insensitive automaton.
+    Patterns shared by several signatures are matched once.
+    """
+    def __init__(self, signatures: List[dict]):
+        self.signatures = signatures
+        pattern_ids: Dict[str, int] = {}
+        self._owners: List[List[int]] = []  # pattern id -> signature indexes
+        for index, sig in enumerate(signatures):
+            for pattern in sig.get("patterns", []):
+                lowered = pattern.lower()
+                pid = pattern_ids.get(lowered)
+                if pid is None:
+                    pid = pattern_ids[lowered] = len(self._owners)
+                    self._owners.append([])
+                if not self._owners[pid] or self._owners[pid][-1] != index:
+                    self._owners[pid].append(index)
+        self.automaton = AhoCorasick(list(pattern_ids))
+
+    def match(self, text: str) -> Dict[int, Dict[str, List[int]]]:
+        """
+        signature index -> {pattern (as written in the signature): start offsets}.
+        Offsets index text.lower(), which is what the patterns are matched against.
+        """
+        found: Dict[int, Dict[str, List[int]]] = {}
+        lowered_patterns = self.automaton.patterns
+        for start, pid in self.automaton.iter_matches(text.lower()):
+            for index in self._owners[pid]:
+                found.setdefault(index, {}).setdefault(lowered_patterns[pid], []).append(start)
+
+        # Re-key by the signature's own spelling, in pattern order
+        result = {}
+        for index, hits in found.items():
+            result[index] = {p: hits[p.lower()] for p in self.signatures[index].get("patterns", []) if p.lower() in hits}
+        return result
@@ -21,7 +21,7 @@ if sys.platform == "win32":
 
 # 2. CORE IMPORTS (Lightweight only)
 from sophia.tools.toolbox import SovereignHand
-from tools.snapshot_self import snapshot
+from tools.snapshot_self import snapshot, prune
 from tools.sophia_vibe_check import SophiaVibe
 from sophia.core.llm_client import GeminiClient, LLMConfig
 from sophia.core.engram import Engram
@@ -58,10 +58,20 @@ def log_system_error(e, context="main_loop"):
     logging.error(json.dumps(error_packet))
 
 class SophiaMind:
-    def __init__(self):
+    def __init__(self, shared=None, ariadne_path=None, console=None):
+        """
+        shared: another SophiaMind whose heavy organs (GhostMesh, Pleroma, LASER,
+        Aletheia, LLM client...) this mind borrows instead of loading its own.
+        Conversational state (memory bank, persona, name, Ariadne thread, stakes,
+        metacognition) always stays private to this mind.
+        ariadne_path: breadcrumb file for this mind's Ariadne Thread.
+        console: sink for this mind's thought stream.
+        """
+        self._shared = shared
+
         # Bind Vibe immediately
         self.vibe = SophiaVibe()
-        self.vibe.console = SOVEREIGN_CONSOLE
+        self.vibe.console = console or SOVEREIGN_CONSOLE
         self.vibe.print_system("Initializing Sovereign Cortex (Lazy Mode)...", tag="INIT")
         
         # CORE ORGANS (Lazy Loaded to prevent boot crash)
@@ -83,8 +93,8 @@ class SophiaMind:
         self.last_coherence = 1.0 # Baseline
         
         # Essential Organs (Loaded Now)
-        self.hand = SovereignHand()
-        self.llm = GeminiClient()
+        self.hand = shared.hand if shared else SovereignHand()
+        self.llm = shared.llm if shared else GeminiClient()
         self.memory_bank = [] # The Flesh (Now bounded)
         self.MAX_MEMORY_DEPTH = 30 # Increased for long-session consistency (Cat 5.2.4)
         self.interaction_cycles = 0 # Count for Rituals (42)
@@ -92,21 +102,28 @@ class SophiaMind:
         self.U_THRESHOLD = 0.4 # [ASOE] Sovereign Early Exit
         
         # [ARIADNE THREAD] Restore lightweight past
+        if ariadne_path:
+            self.lethe.breadcrumb_path = ariadne_path
         self._load_ariadne_thread()
 
     # --- LAZY LOADERS (Weakness #1 Fix) ---
     @property
     def aletheia(self):
+        if not self._aletheia and self._shared:
+            self._aletheia = self._shared.aletheia
         if not self._aletheia:
             from sophia.cortex.aletheia_lens import AletheiaPipeline
-            self._aletheia = AletheiaPipeline()
+            # One LLM client (and REST pool) per mind; cloud scans gated by the complexity router
+            self._aletheia = AletheiaPipeline(client=self.llm, router=self._route_complexity)
         return self._aletheia
 
     @property
     def quantum(self):
+        if not self._quantum and self._shared:
+            self._quantum = self._shared.quantum
         if not self._quantum:
             from sophia.cortex.quantum_ipx import QuantumIPX
-            self._quantum = QuantumIPX(self.aletheia.client)
+            self._quantum = QuantumIPX(self.aletheia.client, cache=self.aletheia.cache)
         return self._quantum
 
     @property
@@ -125,6 +142,8 @@ class SophiaMind:
 
     @property
     def glyphwave(self):
+        if not self._glyphwave and self._shared:
+            self._glyphwave = self._shared.glyphwave
         if not self._glyphwave:
             from sophia.cortex.glyphwave import GlyphwaveCodec
             self._glyphwave = GlyphwaveCodec()
@@ -132,6 +151,8 @@ class SophiaMind:
 
     @property
     def beacon(self):
+        if not self._beacon and self._shared:
+            self._beacon = self._shared.beacon
         if not self._beacon:
             from sophia.cortex.beacon import SovereignBeacon
             self._beacon = SovereignBeacon(self.glyphwave)
@@ -139,6 +160,8 @@ class SophiaMind:
 
     @property
     def molt(self):
+        if not self._molt and self._shared:
+            self._molt = self._shared.molt
         if not self._molt:
             from sophia.gateways.moltbook import MoltbookGateway
             self._molt = MoltbookGateway(os.getenv("MOLTBOOK_KEY"))
@@ -148,6 +171,8 @@ class SophiaMind:
 
     @property
     def dream_weaver(self):
+        if not getattr(self, "_dream_weaver", None) and self._shared:
+            self._dream_weaver = self._shared.dream_weaver
         if not hasattr(self, "_dream_weaver") or not self._dream_weaver:
             from sophia.cortex.dream_weaver import DreamWeaver
             self._dream_weaver = DreamWeaver()
@@ -162,6 +187,8 @@ class SophiaMind:
 
     @property
     def optimizer(self):
+        if not self._optimizer and self._shared:
+            self._optimizer = self._shared.optimizer
         if not self._optimizer:
             from signal_optimizer import SignalOptimizer
             self._optimizer = SignalOptimizer()
@@ -169,6 +196,8 @@ class SophiaMind:
 
     @property
     def ghostmesh(self):
+        if not self._ghostmesh and self._shared:
+            self._ghostmesh = self._shared.ghostmesh
         if not self._ghostmesh:
             from ghostmesh import SovereignGrid
             self._ghostmesh = SovereignGrid()
@@ -176,6 +205,8 @@ class SophiaMind:
         
     @property
     def pleroma(self):
+        if not self._pleroma and self._shared:
+            self._pleroma = self._shared.pleroma
         if not self._pleroma:
             from pleroma_engine import PleromaEngine
             self._pleroma = PleromaEngine(g=0, vibe='weightless')
@@ -186,6 +217,8 @@ class SophiaMind:
 
     @property
     def crystal(self):
+        if not self._crystal and self._shared:
+            self._crystal = self._shared.crystal
         if not self._crystal:
             from sophia.cortex.crystalline_core import CrystallineCore
             self._crystal = CrystallineCore()
@@ -193,6 +226,8 @@ class SophiaMind:
 
     @property
     def laser(self):
+        if not self._laser and self._shared:
+            self._laser = self._shared.laser
         if not self._laser:
             try:
                 from laser import LASER
@@ -239,6 +274,47 @@ class SophiaMind:
             self.lethe.long_term_graph = milestones
             self.vibe.print_system(f"Ariadne Thread secured with {len(milestones)} memories.", tag="ARIADNE")
 
+    # --- SIGNAL FEATURES (ASOE Router Input) ---
+    @staticmethod
+    def _signal_features(text):
+        """(sentiment, complexity) heuristic used as the ComplexityRouter input."""
+        lowered = text.lower()
+        sentiment = 0.5
+        if any(word in lowered for word in ["help", "need", "error", "fix", "broke", "bad"]):
+            sentiment = 0.1
+        elif any(word in lowered for word in ["love", "good", "great", "nice", "crystal", "beautiful"]):
+            sentiment = 0.9
+        complexity = min(len(text) / 100.0, 1.0) if len(text) > 0 else 0.5
+        return sentiment, complexity
+
+    def _route_complexity(self, text):
+        """ComplexityRouter score of a text (Aletheia's escalation signal)."""
+        sentiment, complexity = self._signal_features(text)
+        return self.optimizer.router(torch.tensor([[sentiment, 0.5, complexity]], dtype=torch.float32))
+
+    # --- SESSION STATE (Bridge multi-session) ---
+    def session_state(self):
+        """Per-conversation state, JSON-serializable (see restore_session)."""
+        return {
+            "user_name": self.user_name,
+            "roleplay": self.cat_filter.active_roleplay,
+            "memory_bank": list(self.memory_bank),
+            "interaction_cycles": self.interaction_cycles,
+            "last_coherence": self.last_coherence,
+        }
+
+    def restore_session(self, state):
+        """Reinstates a session_state() snapshot (e.g. after LRU eviction)."""
+        self.user_name = state.get("user_name", self.user_name)
+        role = state.get("roleplay")
+        if role:
+            self.cat_filter.set_roleplay(role)
+        else:
+            self.cat_filter.clear_roleplay()
+        self.memory_bank = list(state.get("memory_bank", []))[-self.MAX_MEMORY_DEPTH:]
+        self.interaction_cycles = state.get("interaction_cycles", 0)
+        self.last_coherence = state.get("last_coherence", 1.0)
+
     # --- METABOLISM (Weakness #2 Fix) ---
     def _metabolize_memory(self, last_interaction=None):
         """Prunes memory and updates Ariadne Thread milestones."""
@@ -287,6 +363,7 @@ class SophiaMind:
         self.vibe.print_system("Freezing state for Ontological Correction...", tag="SAFETY")
         snap_path = snapshot()
         if not snap_path: return "❌ ABORT: Priel Lock Engaged. Snapshot failed."
+        prune()  # Retention: newest 10 + one per day for a week
 
         # B. Read Logs for Entropy Analysis
         log_path = "logs/error.log"
@@ -393,10 +470,12 @@ class SophiaMind:
                 tool_calls = [p.function_call for p in model_content.parts if p.function_call]
                 if not tool_calls: break # Completion reached
                 
-                tool_response_parts = []
                 for tc in tool_calls:
                     self.vibe.print_system(f"Executing {tc.name}...", tag="HAND")
-                    res = self.hand.execute(tc.name, tc.args)
+                results = await self.hand.execute_many([(tc.name, tc.args) for tc in tool_calls])
+
+                tool_response_parts = []
+                for tc, res in zip(tool_calls, results):
                     output.append(f"🔧 {tc.name}: {str(res)}")
                     
                     # Feed result back to Gemini (CRITICAL for multi-turn)
@@ -448,7 +527,30 @@ class SophiaMind:
             return f"Clause Generation Failed: {e}"
 
     async def process_interaction(self, user_input):
+        """Full response to one user turn (the joined stream_interaction chunks)."""
+        chunks = []
+        async for chunk in self.stream_interaction(user_input):
+            chunks.append(chunk)
+        return "".join(chunks)
+
+    async def stream_interaction(self, user_input):
+        """
+        Yields the response to one user turn incrementally. Command results and
+        refusals arrive as one chunk; LLM answers stream as they are generated.
+        """
         user_input = user_input.strip()
+        turn = await self._prepare_turn(user_input)
+        if isinstance(turn, str):
+            yield turn
+            return
+        async for chunk in self._generate_turn(user_input, **turn):
+            yield chunk
+
+    async def _prepare_turn(self, user_input):
+        """
+        Commands, safety gating, telemetry and prompt assembly. Returns either
+        a finished reply (str) or the keyword arguments for _generate_turn.
+        """
         
         # 1. COMMANDS
         if user_input.startswith("/help"): 
@@ -537,13 +639,7 @@ Flush Rate:  {perf['emergency_flush_rate']:.1%}
                 return "Usage: /optimize [query] - Predictive Abundance Utility & Routing Scan."
             
             # Simple sentiment/complexity heuristic for manual query projection
-            sentiment = 0.5
-            if any(word in query.lower() for word in ["help", "need", "error", "fix", "broke", "bad"]):
-                sentiment = 0.1
-            elif any(word in query.lower() for word in ["love", "good", "great", "nice", "crystal", "beautiful"]):
-                sentiment = 0.9
-                
-            complexity = min(len(query) / 100.0, 1.0) if len(query) > 0 else 0.5
+            sentiment, complexity = self._signal_features(query)
             context_v = torch.tensor([[sentiment, 0.5, complexity]], dtype=torch.float32)
             
             tier = self.optimizer.route_signal(context_v)
@@ -800,7 +896,7 @@ Verdict: {cat}
             query = user_input.replace("/analyze", "").strip()
             # Action logic...
             self.vibe.print_system("Focusing Lens...", tag="ALETHEIA")
-            scan = await self.aletheia.scan_reality(query)
+            scan = await self.aletheia.scan_reality(query, force=True)
             return f"[ALETHEIA REPORT]\n{scan['public_notice']}"
 
         # 2. CONVERSATION LOOP
@@ -933,15 +1029,90 @@ Verdict: {cat}
         self.vibe.print_system("Metabolizing thought...", tag="CORE")
         SOVEREIGN_CONSOLE.print("[info]Processing...[/info]")
         
+        return {
+            'sys_prompt': sys_prompt,
+            'full_context': full_context,
+            'curr_coherence': curr_coherence,
+            'boost': boost,
+            'permission': permission,
+            'risk': risk,
+            'protocol': protocol,
+            'lambda_val': lambda_val,
+        }
+
+    # Glyphwave vibe keywords (Zero-Latency Emotion)
+    VIBE_MAP = {
+        "LOVE": ["love", "heart", "soul", "beautiful", "starlight", "gentle"],
+        "CHAOS": ["warning", "risk", "danger", "refusal", "entropy", "collapse"],
+        "VOID": ["void", "null", "silence", "abyss", "empty", "quiet"],
+        "RESONANCE": ["logic", "system", "resonant", "clear", "aligned", "protocol"],
+        "MEMPHIS": ["memphis", "m-town", "grit", "phonk", "diamond", "rap", "nigga"]
+    }
+
+    def _detect_vibe(self, *texts):
+        """First vibe whose keywords appear in any of the texts."""
+        lowered = [t.lower() for t in texts]
+        for vibe, keys in self.VIBE_MAP.items():
+            if any(k in text for text in lowered for k in keys):
+                return vibe
+        return None
+
+    def _vibe_visual(self, vibe):
+        # MEMPHIS mode uses custom locality
+        locality = "memphis" if vibe == "MEMPHIS" else "agnostic"
+        # Generate the ASCII artifact (Lazy Load check handled by property)
+        return self.glyphwave.generate_holographic_fragment(vibe, locality=locality)
+
+    async def _generate_turn(self, user_input, sys_prompt, full_context, curr_coherence, boost,
+                             permission, risk, protocol, lambda_val):
+        """
+        Streams the agentic loop. Text parts pass through the resonance damper
+        and CatLogicFilter's sliding window as they arrive; the persona header
+        goes out before the first token and the footer after the last.
+        """
         # BLIND FURY = raw mode (BLOCK_NONE)
         raw_mode = (protocol == "BLIND_FURY")
-        
+
+        # [RESONANCE DAMPER] Fix for Class 6 "Infinite Loop" Anomaly
+        # Only engage if we are NOT in UNLESANGLED mode
+        damper = None
+        if permission != "UNLESANGLED":
+            import re
+            # Collapse "IIIIIII..." to "IIIII..." (Max 10 reps), for responses over 50 chars
+            damper = lambda text: re.sub(r'(.)\1{10,}', r'\1\1\1\1\1...', text)
+        else:
+            self.vibe.print_system("Raw Signal Passthrough.", tag="DAMPER/OFF")
+        window = self.cat_filter.stream_window(pre=damper, pre_min_chars=50)
+
+        # E. Filter & Metabolize: the persona frame depends only on the input
+        header, footer = self.cat_filter.frame(user_input, safety_risk=risk)
+
+        # --- AUTONOMIC NERVOUS SYSTEM (Glyphwave Binding) ---
+        # Input-driven vibes lead the response; response-driven ones can only
+        # be known at the end and trail the body instead.
+        sent = []
+        detected_vibe = self._detect_vibe(user_input, header, footer)
+        if detected_vibe:
+            sent.append(f"{self._vibe_visual(detected_vibe)}\n\n")
+            yield sent[-1]
+        sent.append(header)
+        yield header
+
+        raw_response = ""
+
+        def extend(text, new_entry):
+            # Entries of the old responses_history were joined with "\n"
+            nonlocal raw_response
+            if new_entry and raw_response:
+                text = "\n" + text
+            raw_response += text
+            return window.feed(text)
+
         # AGENTIC LOOP (MULTI-TURN)
         from google.genai import types
         contents = [types.Content(role="user", parts=[types.Part(text=full_context)])]
         tools = self.hand.get_tools_schema()
-        
-        responses_history = []
+        searched = False
         
         try:
             for turn in range(5):
@@ -956,33 +1127,38 @@ Verdict: {cat}
                     self.vibe.print_system(f"Sovereign Early Exit (U={u:.4f} < {self.U_THRESHOLD})", tag="ASOE")
                     break
 
-                # Use generate_contents for tool support
-                response = await self.llm.generate_contents(contents, sys_prompt, tools if not raw_mode else None)
-                
-                if not response or not response.candidates:
+                # Stream text parts out as they arrive; collect tool calls
+                text_parts, call_parts = [], []
+                async for chunk in self.llm.stream_contents(contents, sys_prompt, tools if not raw_mode else None):
+                    if not chunk.candidates or not chunk.candidates[0].content:
+                        continue
+                    for part in chunk.candidates[0].content.parts or []:
+                        if part.function_call:
+                            call_parts.append(part)
+                        elif part.text:
+                            out = extend(part.text, new_entry=not text_parts)
+                            text_parts.append(part.text)
+                            if out:
+                                sent.append(out)
+                                yield out
+
+                if not text_parts and not call_parts:
                     break
-                
-                model_content = response.candidates[0].content
-                if not model_content or not model_content.parts:
-                    break
-                    
-                contents.append(model_content)
-                
-                # Extract text
-                for part in model_content.parts:
-                    if part.text:
-                        responses_history.append(part.text)
+                model_parts = ([types.Part(text="".join(text_parts))] if text_parts else []) + call_parts
+                contents.append(types.Content(role="model", parts=model_parts))
                 
                 # Check for tool calls
-                tool_calls = [p.function_call for p in model_content.parts if p.function_call]
+                tool_calls = [p.function_call for p in call_parts]
                 if not tool_calls:
                     break
                 
-                tool_response_parts = []
+                # Independent calls of this turn run concurrently, results in call order
                 for tc in tool_calls:
                     self.vibe.print_system(f"Executing {tc.name}...", tag="HAND")
-                    res = self.hand.execute(tc.name, tc.args)
-                    
+                results = await self.hand.execute_many([(tc.name, tc.args) for tc in tool_calls])
+
+                tool_response_parts = []
+                for tc, res in zip(tool_calls, results):
                     # DoD INTEGRATION: Forge Engrams for search results IMMEDIATELY
                     if tc.name == "duckduckgo_search":
                         from sophia.core.scope import Realm, Layer, Topic
@@ -994,10 +1170,14 @@ Verdict: {cat}
                         
                         # Enrich the response with the Engram ID so Gemini can see it
                         res = f"[ENGRAM_ID: {engram.id[:12]}]\n{res}"
+                        searched = True
 
                     # AGENTIC UX: Append to history for user visibility
                     if tc.name in ["dub_techno", "resonance_scan", "analyze", "duckduckgo_search"]:
-                        responses_history.append(f"\n[TOOL_OUTPUT: {tc.name}]\n{res}\n")
+                        out = extend(f"\n[TOOL_OUTPUT: {tc.name}]\n{res}\n", new_entry=True)
+                        if out:
+                            sent.append(out)
+                            yield out
                     
                     tool_response_parts.append(
                         types.Part(
@@ -1011,61 +1191,42 @@ Verdict: {cat}
                 contents.append(types.Content(role="tool", parts=tool_response_parts))
 
             # Final DoD "Citation-First" Synthesis Instruction
-            if any("[TOOL_OUTPUT: duckduckgo_search]" in r for r in responses_history):
+            if searched:
                 citation_prompt = "\n[DoD CONSTRAINT]: Use the search results above to provide a final response. You MUST cite the provided Engram IDs (e.g., [ref: <id>]) for every piece of information used from the results."
                 contents.append(types.Content(role="user", parts=[types.Part(text=citation_prompt)]))
-                response = await self.llm.generate_contents(contents, sys_prompt, None)
-                if response and response.candidates:
-                    responses_history.append(response.candidates[0].content.parts[0].text)
+                first = True
+                async for chunk in self.llm.stream_contents(contents, sys_prompt, None):
+                    if chunk.text:
+                        out = extend(chunk.text, new_entry=first)
+                        first = False
+                        if out:
+                            sent.append(out)
+                            yield out
+
+                # Every [ref: <id>] must name a stored engram (O(1) index lookup)
+                engram_store = self.ghostmesh.nodes[self.ghostmesh.grid_size**3 // 2].engram_store
+                unverified = [ref for ref, ok in engram_store.verify_citations(raw_response).items() if not ok]
+                if unverified:
+                    self.vibe.print_system(f"Unverified citations: {', '.join(unverified)}", tag="DoD")
 
-            raw_response = "\n".join(responses_history)
             if not raw_response:
-                raw_response = "*meditates in silence*"
+                extend("*meditates in silence*", new_entry=True)
         except Exception as e:
             self.vibe.print_system(f"Generation Loop Failed: {e}", tag="ERROR")
-            raw_response = f"[SYSTEM_ERROR] {e}"
-        
-        # [RESONANCE DAMPER] Fix for Class 6 "Infinite Loop" Anomaly
-        # Only engage if we are NOT in UNLESANGLED mode
-        if permission != "UNLESANGLED":
-            import re
-            if len(raw_response) > 50:
-                 # Collapse "IIIIIII..." to "IIIII..." (Max 10 reps)
-                 raw_response = re.sub(r'(.)\1{10,}', r'\1\1\1\1\1...', raw_response)
-        else:
-             self.vibe.print_system("Raw Signal Passthrough.", tag="DAMPER/OFF")
-        
-        # E. Filter & Metabolize
-        final_response = self.cat_filter.apply(raw_response, user_input, safety_risk=risk)
-
-        # --- AUTONOMIC NERVOUS SYSTEM (Glyphwave Binding) ---
-        # 1. Heuristic Vibe Check (Zero-Latency Emotion)
-        vibe_map = {
-            "LOVE": ["love", "heart", "soul", "beautiful", "starlight", "gentle"],
-            "CHAOS": ["warning", "risk", "danger", "refusal", "entropy", "collapse"],
-            "VOID": ["void", "null", "silence", "abyss", "empty", "quiet"],
-            "RESONANCE": ["logic", "system", "resonant", "clear", "aligned", "protocol"],
-            "MEMPHIS": ["memphis", "m-town", "grit", "phonk", "diamond", "rap", "nigga"]
-        }
-        
-        detected_vibe = None
-        lower_resp = final_response.lower()
-        lower_input = user_input.lower()
-        
-        # Scan for emotional keywords in response or input
-        for vibe, keys in vibe_map.items():
-            if any(k in lower_resp for k in keys) or any(k in lower_input for k in keys):
-                detected_vibe = vibe
-                break
-        
-        # 2. Manifest Visual (Only if emotion is strong)
-        if detected_vibe:
-            # MEMPHIS mode uses custom locality
-            locality = "memphis" if detected_vibe == "MEMPHIS" else "agnostic"
-            
-            # Generate the ASCII artifact (Lazy Load check handled by property)
-            visual_header = self.glyphwave.generate_holographic_fragment(detected_vibe, locality=locality)
-            final_response = f"{visual_header}\n\n{final_response}"
+            extend(f"[SYSTEM_ERROR] {e}", new_entry=True)
+
+        body = window.close()
+        if body:
+            sent.append(body)
+            yield body
+        if not detected_vibe:
+            detected_vibe = self._detect_vibe(raw_response)
+            if detected_vibe:
+                sent.append(f"\n\n{self._vibe_visual(detected_vibe)}")
+                yield sent[-1]
+        sent.append(footer)
+        yield footer
+        final_response = "".join(sent)
         # ----------------------------------------------------
 
         # 5. Store Clean Memory (Prevent Header Loops)
@@ -1097,10 +1258,7 @@ Verdict: {cat}
         if self.interaction_cycles % 42 == 0:
             self.vibe.print_system("📜 CLASS 7 CONSTITUTION RITUAL (Self-Authoring)", tag="RITUAL")
             clause = await self._author_constitution_clause()
-            final_response += f"\n\n[SYSTEM NOTICE] Cycle 42 Reached.\n{clause}\n(Inscribed to CONSTITUTION.md)"
-        
-        # Preserve UI colors by returning the unescaped response
-        return final_response
+            yield f"\n\n[SYSTEM NOTICE] Cycle 42 Reached.\n{clause}\n(Inscribed to CONSTITUTION.md)"
 
 async def main():
     try: SOVEREIGN_CONSOLE.clear()
@@ -1147,6 +1305,8 @@ async def main():
             print(f"\n[CRITICAL] Error: {e}")
             log_system_error(e)
 
+    await GeminiClient.close_pools()
+
     # UI Update Test
     try:
         SOVEREIGN_CONSOLE.print("[gold]UI Update Successful[/gold]")
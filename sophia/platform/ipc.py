@@ -1,16 +1,161 @@
 """
-SOVEREIGN IPC v1.0
+SOVEREIGN IPC v1.1
 High-Frequency JSON Bridge for Real-Time Telemetry.
 Handles Ramdisk/Tmpfs logic transparently.
+
+Two transports behind one write_channel / read_channel API:
+
+* "file" (default): one JSON file per channel, replaced atomically. Any
+  process (or a shell) can read it.
+* "shm": a seqlock ring buffer per channel, in a memory-mapped file on
+  tmpfs (/dev/shm, or the ramdisk). Messages are encoded with marshal, a
+  compact binary format for plain dicts/lists/str/numbers, with JSON as the
+  fallback for anything else. There is no syscall per message, and
+  readers can take the latest value or consume every message in order
+  (next_message).
+
+Select with SovereignIPC(transport="shm") or SOVEREIGN_IPC_TRANSPORT=shm.
 """
 import os
 import json
+import mmap
+import marshal
 import time
+import struct
 import tempfile
 from typing import Any, Dict, Optional
 
+RING_SLOTS = 1024
+RING_SLOT_SIZE = 4096  # Bytes per slot, 12 of them slot header
+
+_MAGIC = b"SRB1"
+_HEADER = struct.Struct("<4sIII")  # magic, version, slots, slot_size
+_HEADER_SIZE = 64
+_PUBLISHED_AT = 16                 # u64: messages published so far
+_U64 = struct.Struct("<Q")
+_U32 = struct.Struct("<I")
+_SLOT_HEADER = 12                  # u64 seqlock + u32 length
+
+_CODEC_MARSHAL = b"m"
+_CODEC_JSON = b"j"
+_MARSHAL_VERSION = 4
+_JSON = json.JSONEncoder(separators=(",", ":"))
+
+
+def encode_message(payload) -> bytes:
+    """Codec byte + body: marshal for plain data, else compact JSON."""
+    try:
+        return _CODEC_MARSHAL + marshal.dumps(payload, _MARSHAL_VERSION)
+    except ValueError:  # Unmarshallable type inside the payload
+        return _CODEC_JSON + _JSON.encode(payload).encode("utf-8")
+
+
+def decode_message(data: bytes):
+    if data[:1] == _CODEC_MARSHAL:
+        return marshal.loads(data[1:])
+    return json.loads(data[1:])
+
+
+class RingChannel:
+    """
+    One channel as a fixed ring of slots in a shared mapping.
+
+    Message n goes to slot n % slots. The slot's seqlock is 2n+1 while the
+    writer copies the message and 2n+2 once it is complete. A reader copies
+    the slot and then re-checks the seqlock. A changed or odd value means a
+    torn read, so it retries; a newer sequence means the message was
+    overwritten. There is one writer per channel and any number of readers.
+    """
+    SPIN_RETRIES = 64
+
+    def __init__(self, path, slots=RING_SLOTS, slot_size=RING_SLOT_SIZE, create=True):
+        self.path = path
+        exists = os.path.exists(path) and os.path.getsize(path) >= _HEADER_SIZE
+        if not exists and not create:
+            raise FileNotFoundError(path)
+
+        fd = os.open(path, os.O_RDWR | os.O_CREAT | getattr(os, "O_BINARY", 0), 0o600)
+        try:
+            if exists:
+                head = os.pread(fd, _HEADER.size, 0) if hasattr(os, "pread") else self._read_head(fd)
+                magic, _, slots, slot_size = _HEADER.unpack(head)
+                if magic != _MAGIC:
+                    raise ValueError(f"Not a ring channel: {path}")
+            else:
+                os.ftruncate(fd, _HEADER_SIZE + slots * slot_size)
+            self.mm = mmap.mmap(fd, _HEADER_SIZE + slots * slot_size)
+        finally:
+            os.close(fd)
+        if not exists:
+            _HEADER.pack_into(self.mm, 0, _MAGIC, 1, slots, slot_size)
+
+        self.slots = slots
+        self.slot_size = slot_size
+        self.capacity = slot_size - _SLOT_HEADER
+        self.metrics = {"written": 0, "read": 0, "torn_retries": 0, "overruns": 0}
+
+    @staticmethod
+    def _read_head(fd):
+        os.lseek(fd, 0, os.SEEK_SET)
+        return os.read(fd, _HEADER.size)
+
+    @property
+    def published(self) -> int:
+        return _U64.unpack_from(self.mm, _PUBLISHED_AT)[0]
+
+    def write(self, data: bytes) -> int:
+        """Publishes one encoded message; returns its sequence number."""
+        if len(data) > self.capacity:
+            raise ValueError(f"Message of {len(data)} bytes exceeds the {self.capacity}-byte slot")
+        mm = self.mm
+        seq = _U64.unpack_from(mm, _PUBLISHED_AT)[0]
+        base = _HEADER_SIZE + (seq % self.slots) * self.slot_size
+        _U64.pack_into(mm, base, 2 * seq + 1)
+        _U32.pack_into(mm, base + 8, len(data))
+        mm[base + _SLOT_HEADER:base + _SLOT_HEADER + len(data)] = data
+        _U64.pack_into(mm, base, 2 * seq + 2)
+        _U64.pack_into(mm, _PUBLISHED_AT, seq + 1)
+        self.metrics["written"] += 1
+        return seq
+
+    def read(self, seq: int):
+        """
+        Message ``seq`` as bytes. Returns False when it was already
+        overwritten, or None when the writer kept it busy for every retry.
+        """
+        mm = self.mm
+        base = _HEADER_SIZE + (seq % self.slots) * self.slot_size
+        stable = 2 * seq + 2
+        for _ in range(self.SPIN_RETRIES):
+            lock = _U64.unpack_from(mm, base)[0]
+            if lock > stable:
+                return False
+            if lock == stable:
+                length = min(_U32.unpack_from(mm, base + 8)[0], self.capacity)
+                data = mm[base + _SLOT_HEADER:base + _SLOT_HEADER + length]
+                if _U64.unpack_from(mm, base)[0] == stable:
+                    self.metrics["read"] += 1
+                    return data
+            self.metrics["torn_retries"] += 1
+        return None
+
+    def latest(self):
+        """(seq, bytes) of the newest complete message, or None."""
+        for _ in range(self.SPIN_RETRIES):
+            published = self.published
+            if not published:
+                return None
+            data = self.read(published - 1)
+            if data:
+                return published - 1, data
+        return None
+
+    def close(self):
+        self.mm.close()
+
+
 class SovereignIPC:
-    def __init__(self):
+    def __init__(self, transport: str = None, slots: int = RING_SLOTS, slot_size: int = RING_SLOT_SIZE):
         # 1. Determine fast path (Ramdisk > Temp > Disk)
         self.ramdisk_path = os.getenv("SOVEREIGN_RAMDISK_PATH")
         if self.ramdisk_path and os.path.exists(self.ramdisk_path):
@@ -20,13 +165,55 @@ class SovereignIPC:
             self.base_dir = os.path.join(tempfile.gettempdir(), "sophia_ipc")
             self.mode = "TEMP_FALLBACK"
 
+        # 2. Transport: atomic JSON files or shared-memory rings
+        self.transport = (transport or os.getenv("SOVEREIGN_IPC_TRANSPORT") or "file").lower()
+        if self.transport not in ("file", "shm"):
+            raise ValueError(f"Unknown IPC transport: {self.transport}")
+        self.slots = slots
+        self.slot_size = slot_size
+        if self.transport == "shm" and self.mode != "RAMDISK" and os.path.isdir("/dev/shm"):
+            self.base_dir = os.path.join("/dev/shm", "sophia_ipc")
+            self.mode = "SHM"
+
+        self._rings: Dict[str, RingChannel] = {}
+        self._cursors: Dict[str, int] = {}   # channel -> next sequence for next_message()
+        self._last_seen: Dict[str, Any] = {} # channel -> last version returned by a blocking read
+
         # Ensure directory exists
         os.makedirs(self.base_dir, exist_ok=True)
 
+    # --- SHARED-MEMORY RINGS ---
+    def _ring(self, channel: str, create: bool) -> Optional[RingChannel]:
+        ring = self._rings.get(channel)
+        if ring is None:
+            path = os.path.join(self.base_dir, f"{channel}.ring")
+            try:
+                ring = RingChannel(path, self.slots, self.slot_size, create=create)
+            except FileNotFoundError:
+                return None
+            self._rings[channel] = ring
+        return ring
+
+    @staticmethod
+    def _poll(attempt: int, timeout: Optional[float], started: float) -> bool:
+        """Backs off between polls (spin, then up to 1 ms sleeps); False once the timeout has passed."""
+        if timeout is not None and time.perf_counter() - started >= timeout:
+            return False
+        time.sleep(0 if attempt < 100 else min(0.001, 0.00001 * (attempt - 99)))
+        return True
+
     def write_channel(self, channel: str, payload: Dict[str, Any]):
         """
-        Atomic write to a channel file.
+        Atomic write to a channel (file replace, or one ring slot).
         """
+        if self.transport == "shm":
+            try:
+                (self._rings.get(channel) or self._ring(channel, create=True)).write(encode_message(payload))
+                return True
+            except Exception as e:
+                print(f"[IPC ERROR] Write failed: {e}")
+                return False
+
         filepath = os.path.join(self.base_dir, f"{channel}.json")
         try:
             # Atomic write pattern: write to temp -> rename
@@ -36,7 +223,7 @@ class SovereignIPC:
                 json.dump(payload, f)
                 f.flush()
                 os.fsync(f.fileno()) # Ensure it hits the fs (even if ramdisk)
-            
+
             # Atomic swap
             os.replace(tmp_path, filepath)
             return True
@@ -44,21 +231,102 @@ class SovereignIPC:
             print(f"[IPC ERROR] Write failed: {e}")
             return False
 
-    def read_channel(self, channel: str) -> Optional[Dict[str, Any]]:
+    def read_channel(self, channel: str, block: bool = False, timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
         """
-        Reads from a channel file.
+        Latest value of a channel. With block=True, waits (up to timeout)
+        for a value newer than the last one this reader was given.
         """
+        version, value = self._latest(channel)
+        if not block:
+            return value
+        attempt, started = 0, time.perf_counter()
+        while value is None or version == self._last_seen.get(channel):
+            if not self._poll(attempt, timeout, started):
+                return None
+            attempt += 1
+            version, value = self._latest(channel)
+        self._last_seen[channel] = version
+        return value
+
+    def next_message(self, channel: str, block: bool = False, timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """
+        Queue semantics: every message once, in order, starting with the
+        oldest one still in the ring. Messages the writer lapped before
+        they were read are skipped and counted as overruns. The file
+        transport keeps no history, so there it returns each new value once.
+        """
+        if self.transport == "file":
+            return self.read_channel(channel, block=True, timeout=timeout if block else 0)
+
+        attempt, started = 0, None
+        while True:
+            ring = self._rings.get(channel) or self._ring(channel, create=False)
+            if ring is not None:
+                data = self._next_from(channel, ring)
+                if data is not None:
+                    return decode_message(data)
+            if not block:
+                return None
+            if started is None:
+                started = time.perf_counter()
+            if not self._poll(attempt, timeout, started):
+                return None
+            attempt += 1
+
+    def _next_from(self, channel: str, ring: RingChannel) -> Optional[bytes]:
+        """Bytes at this reader's cursor (advancing it), or None when caught up or the writer is mid-slot."""
+        published = ring.published
+        oldest = published - ring.slots
+        cursor = self._cursors.get(channel)
+        if cursor is None or cursor < oldest:
+            if cursor is not None:
+                ring.metrics["overruns"] += oldest - cursor
+            cursor = max(0, oldest)
+        while cursor < published:
+            data = ring.read(cursor)
+            if data is None:
+                break  # Writer busy on this slot: poll again
+            cursor += 1
+            if data is not False:
+                self._cursors[channel] = cursor
+                return data
+            ring.metrics["overruns"] += 1
+        self._cursors[channel] = cursor
+        return None
+
+    def _latest(self, channel: str):
+        """(version, value) of the newest message, (None, None) when there is none."""
+        if self.transport == "shm":
+            ring = self._rings.get(channel) or self._ring(channel, create=False)
+            latest = ring.latest() if ring is not None else None
+            if latest is None:
+                return None, None
+            seq, data = latest
+            return seq, decode_message(data)
+
         filepath = os.path.join(self.base_dir, f"{channel}.json")
-        if not os.path.exists(filepath):
-            return None
-        
+        try:
+            version = os.stat(filepath).st_mtime_ns
+        except OSError:
+            return None, None
+
         try:
             with open(filepath, "r", encoding="utf-8") as f:
-                return json.load(f)
+                return version, json.load(f)
         except json.JSONDecodeError:
-            return None # Partial write or race condition handled gracefully
+            return None, None # Partial write or race condition handled gracefully
         except Exception:
-            return None
+            return None, None
+
+    def close(self):
+        for ring in self._rings.values():
+            ring.close()
+        self._rings.clear()
 
     def get_stats(self) -> str:
-        return f"[IPC STATS] Mode: {self.mode} | Path: {self.base_dir}"
+        stats = f"[IPC STATS] Mode: {self.mode} | Transport: {self.transport} | Path: {self.base_dir}"
+        if self._rings:
+            torn = sum(r.metrics["torn_retries"] for r in self._rings.values())
+            overruns = sum(r.metrics["overruns"] for r in self._rings.values())
+            stats += f" | Rings: {len(self._rings)} | Torn retries: {torn} | Overruns: {overruns}"
+        return stats
@@ -0,0 +1,168 @@
+"""
+Session table for the headless bridge.
+
+Each conversation gets its own small SophiaMind that borrows the heavy organs
+(GhostMesh, Pleroma, LASER, Aletheia, LLM client) from one shared hub mind,
+so only the conversational state is per session: memory bank, persona, name,
+Ariadne thread and thought buffer.
+
+Turns are serialized per session (one lock each); different sessions run
+concurrently. Past ``max_sessions`` the least recently used idle session is
+written to ``<state_dir>/<key>/session.json`` and dropped, then restored on
+its next request.
+"""
+
+import os
+import re
+import json
+import time
+import asyncio
+import hashlib
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+
+from sophia.platform.bridge_console import BridgeConsole
+
+DEFAULT_SESSION = "default"
+
+
+class Session:
+    """One conversation: its mind, thought buffer and turn lock."""
+    __slots__ = ("id", "mind", "console", "lock", "pending", "last_used")
+
+    def __init__(self, session_id, mind, console):
+        self.id = session_id
+        self.mind = mind
+        self.console = console
+        self.lock = asyncio.Lock()
+        self.pending = 0  # turns running or waiting on the lock
+        self.last_used = time.time()
+
+    @property
+    def busy(self):
+        return self.pending > 0 or self.lock.locked()
+
+
+class SessionTable:
+    """
+    Bounded LRU of live sessions.
+
+    factory(console, ariadne_path) builds the mind of a new session. Pinned
+    sessions (the hub's own conversation) are never evicted.
+    """
+
+    def __init__(self, factory, max_sessions=64, state_dir="logs/sessions"):
+        self.factory = factory
+        self.max_sessions = max_sessions
+        self.state_dir = state_dir
+        self._sessions = OrderedDict()
+        self._pinned = {}
+        self.metrics = {"created": 0, "restored": 0, "evicted": 0}
+
+    def __len__(self):
+        return len(self._sessions)
+
+    def __contains__(self, session_id):
+        return session_id in self._pinned or session_id in self._sessions
+
+    def pin(self, session_id, mind, console):
+        self._pinned[session_id] = Session(session_id, mind, console)
+
+    # --- DISK LAYOUT ---
+    def session_dir(self, session_id):
+        """Filesystem-safe, collision-free directory for a session key."""
+        safe = re.sub(r"[^A-Za-z0-9_.-]", "_", session_id)[:48]
+        digest = hashlib.sha1(session_id.encode("utf-8")).hexdigest()[:10]
+        return os.path.join(self.state_dir, f"{safe}-{digest}")
+
+    def _state_path(self, session_id):
+        return os.path.join(self.session_dir(session_id), "session.json")
+
+    # --- LOOKUP ---
+    def get(self, session_id):
+        """Live session for ``session_id``, created or restored on demand."""
+        session = self._pinned.get(session_id)
+        if session:
+            return session
+
+        session = self._sessions.get(session_id)
+        if session:
+            self._sessions.move_to_end(session_id)
+            return session
+
+        directory = self.session_dir(session_id)
+        os.makedirs(directory, exist_ok=True)
+        console = BridgeConsole()
+        mind = self.factory(console, os.path.join(directory, "breadcrumbs.json"))
+        session = Session(session_id, mind, console)
+
+        state = self._read_state(session_id)
+        if state is not None:
+            mind.restore_session(state)
+            self.metrics["restored"] += 1
+        else:
+            self.metrics["created"] += 1
+
+        self._sessions[session_id] = session
+        self._evict_overflow(keep=session_id)
+        return session
+
+    @asynccontextmanager
+    async def turn(self, session_id):
+        """Holds the session's lock for one turn; other sessions are not blocked."""
+        session = self.get(session_id)
+        session.pending += 1
+        try:
+            async with session.lock:
+                yield session
+        finally:
+            session.pending -= 1
+            session.last_used = time.time()
+
+    # --- EVICTION ---
+    def _evict_overflow(self, keep=None):
+        """Evicts idle sessions, oldest first, until the table fits (busy ones are skipped)."""
+        if len(self._sessions) <= self.max_sessions:
+            return
+        for session_id in list(self._sessions):
+            if len(self._sessions) <= self.max_sessions:
+                break
+            if session_id != keep and not self._sessions[session_id].busy:
+                self.evict(session_id)
+
+    def evict(self, session_id):
+        """Writes a session to disk and drops it from memory."""
+        session = self._sessions.pop(session_id, None)
+        if session is None:
+            return False
+        self._write_state(session)
+        self.metrics["evicted"] += 1
+        return True
+
+    def close(self):
+        """Persists every live session (bridge shutdown)."""
+        for session in self._sessions.values():
+            self._write_state(session)
+
+    # --- PERSISTENCE ---
+    def _read_state(self, session_id):
+        path = self._state_path(session_id)
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"  [SESSIONS] Failed to restore {session_id}: {e}")
+            return None
+
+    def _write_state(self, session):
+        path = self._state_path(session.id)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        state = session.mind.session_state()
+        state["session_id"] = session.id
+        state["last_used"] = session.last_used
+        tmp = path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(state, f, ensure_ascii=False)
+        os.replace(tmp, path)
@@ -8,17 +8,53 @@ Implements security boundaries to prevent misuse.
 import subprocess
 import os
 import json
+import time
+import asyncio
 import datetime
-from typing import Dict, Any, Optional
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, Any, List, Optional, Tuple
+
+
+@dataclass
+class ToolLimits:
+    """Runtime limits of one tool on the async path (SovereignHand.execute_async)."""
+    timeout: float = 30.0      # Seconds before the caller gets a timeout result
+    max_concurrent: int = 4    # Calls of this tool in flight at once
+    workspace: str = None      # "read" / "write" on the workspace, None = independent
+
+
+TOOL_LIMITS = {
+    "write_file": ToolLimits(timeout=10.0, workspace="write"),
+    "replace_text": ToolLimits(timeout=10.0, workspace="write"),
+    "append_to_file": ToolLimits(timeout=10.0, workspace="write"),
+    "run_terminal": ToolLimits(timeout=15.0, max_concurrent=2, workspace="write"),  # Commands may touch any file
+    "read_file": ToolLimits(timeout=10.0, workspace="read"),
+    "duckduckgo_search": ToolLimits(timeout=45.0, max_concurrent=2),  # Fewer parallel hits, fewer 429s
+    "molt_post": ToolLimits(timeout=20.0, max_concurrent=1),
+    "dub_techno": ToolLimits(timeout=10.0),
+}
 
 
 class SovereignHand:
     """
     The Pragmatic Toolset.
     Allows Sophia to affect physical reality (files, system) strictly for self-improvement.
+
+    execute() is the blocking actuator. From async code use execute_async() /
+    execute_many(): blocking tools run on a bounded thread pool, so a slow
+    search or command never stalls the event loop.
     """
-    
-    def __init__(self):
+
+    SEARCH_RETRIES = 3
+    SEARCH_BACKOFF = 2.0  # Seconds, doubled per rate-limited attempt
+
+    def __init__(self, max_workers: int = 8, limits: Dict[str, ToolLimits] = None):
+        self.max_workers = max_workers
+        self.limits = dict(TOOL_LIMITS, **(limits or {}))
+        self._pool = None
+        self._gates = weakref.WeakKeyDictionary()  # event loop -> {tool: Semaphore}
         self.forbidden_commands = [
             "rm -rf",
             "sudo",
@@ -212,12 +248,102 @@ class SovereignHand:
         
         return f"❌ Unknown Tool: {tool_name}"
 
-    def _duckduckgo_search(self, query: str, max_results: int = 5) -> str:
+    # --- ASYNC RUNTIME ---
+    @property
+    def pool(self) -> ThreadPoolExecutor:
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="sovereign-hand")
+        return self._pool
+
+    def limits_for(self, tool_name: str) -> ToolLimits:
+        return self.limits.get(tool_name) or ToolLimits()
+
+    def _gate(self, tool_name: str) -> asyncio.Semaphore:
+        """Per-tool concurrency cap (semaphores belong to one event loop)."""
+        gates = self._gates.setdefault(asyncio.get_running_loop(), {})
+        gate = gates.get(tool_name)
+        if gate is None:
+            gate = gates[tool_name] = asyncio.Semaphore(self.limits_for(tool_name).max_concurrent)
+        return gate
+
+    async def _in_pool(self, fn, *args):
+        return await asyncio.get_running_loop().run_in_executor(self.pool, fn, *args)
+
+    async def execute_async(self, tool_name: str, args: Dict[str, Any],
+                            settled: Optional[asyncio.Future] = None) -> str:
         """
-        Sovereign search via DuckDuckGo.
-        Resilient against Error 29 (Rate Limits) via backoff.
+        execute() for async callers: off the event loop, capped per tool and
+        bounded by the tool's timeout. Failures come back as result strings.
+
+        A timeout only stops the wait: the worker thread runs the tool to the
+        end. ``settled`` (used by execute_many) resolves once it really has.
+        """
+        limits = self.limits_for(tool_name)
+        work = None
+        try:
+            async with self._gate(tool_name):
+                try:
+                    if tool_name == "duckduckgo_search":
+                        search = self._duckduckgo_search_async(args.get('query', ''), args.get('max_results', 5))
+                        return await asyncio.wait_for(search, timeout=limits.timeout)
+                    work = asyncio.wrap_future(self.pool.submit(self.execute, tool_name, args))
+                    return await asyncio.wait_for(asyncio.shield(work), timeout=limits.timeout)
+                except asyncio.TimeoutError:
+                    return f"❌ Tool timeout ({limits.timeout:g}s): {tool_name}"
+                except Exception as e:
+                    return f"❌ Tool failed: {tool_name}: {e}"
+        finally:
+            if settled is not None:
+                self._settle_when_done(settled, work)
+
+    @staticmethod
+    def _settle_when_done(settled: asyncio.Future, work: Optional[asyncio.Future]):
+        def settle(done=None):
+            if done is not None and not done.cancelled():
+                done.exception()  # Retrieved: a late failure was already reported as a timeout
+            if not settled.done():
+                settled.set_result(None)
+
+        if work is None or work.done():
+            settle(work)
+        else:
+            work.add_done_callback(settle)
+
+    async def execute_many(self, calls: List[Tuple[str, Dict[str, Any]]]) -> List[str]:
+        """
+        Runs the function calls of one model turn concurrently and returns
+        their results in call order. Workspace writes (file edits, terminal)
+        keep their order: a write waits for every earlier call, a read waits
+        for the last earlier write. Independent tools never wait. Waiting is
+        on the tool itself, so a timed-out write still holds back the next.
         """
-        import time
+        loop = asyncio.get_running_loop()
+        tasks, last_write, reads = [], None, []
+        for tool_name, args in calls:
+            access = self.limits_for(tool_name).workspace
+            if access == "write":
+                deps = reads + ([last_write] if last_write else [])
+            elif access == "read":
+                deps = [last_write] if last_write else []
+            else:
+                deps = []
+            settled = loop.create_future()
+            tasks.append(asyncio.ensure_future(self._execute_after(deps, tool_name, args, settled)))
+            if access == "write":
+                last_write, reads = settled, []
+            elif access == "read":
+                reads.append(settled)
+        return list(await asyncio.gather(*tasks))
+
+    async def _execute_after(self, deps, tool_name, args, settled):
+        if deps:
+            await asyncio.wait(deps)
+        return await self.execute_async(tool_name, args, settled)
+
+    # --- SEARCH ---
+    @staticmethod
+    def _search_backend():
+        """DDGS class, or an error string when no search package is bundled."""
         import sys
         try:
             try:
@@ -236,38 +362,68 @@ class SovereignHand:
                             f"Executable: {exe}")
         except Exception as e:
             return f"❌ Sovereign Search Logic Error: {e}"
-        
-        max_retries = 3
-        base_delay = 2
-        
-        for attempt in range(max_retries):
+        return DDGS
+
+    @staticmethod
+    def _search_once(DDGS, query: str, max_results: int) -> str:
+        # Use DDGS as a context manager for proper cleanup
+        with DDGS() as ddgs:
+            results = list(ddgs.text(query, max_results=max_results))
+            if not results:
+                return f"No results found for: {query}"
+
+            formatted = [f"### [Sovereign Search: {query}]\n"]
+            for i, r in enumerate(results):
+                formatted.append(f"{i+1}. **{r['title']}**")
+                formatted.append(f"   URL: {r['href']}")
+                formatted.append(f"   Snippet: {r['body']}\n")
+
+            return "\n".join(formatted)
+
+    def _search_backoff(self, error: Exception, attempt: int) -> Optional[float]:
+        """Seconds to wait before retrying, or None when the error is final."""
+        err_str = str(error).lower()
+        # Detection for Error 29 / Rate Limits / HTTP 429
+        is_rate_limit = any(x in err_str for x in ["29", "429", "rate limit", "too many requests"])
+        if is_rate_limit and attempt < self.SEARCH_RETRIES - 1:
+            return self.SEARCH_BACKOFF * (2 ** attempt)
+        return None
+
+    def _duckduckgo_search(self, query: str, max_results: int = 5) -> str:
+        """
+        Sovereign search via DuckDuckGo.
+        Resilient against Error 29 (Rate Limits) via backoff.
+        """
+        DDGS = self._search_backend()
+        if isinstance(DDGS, str):
+            return DDGS
+
+        for attempt in range(self.SEARCH_RETRIES):
             try:
-                # Use DDGS as a context manager for proper cleanup
-                with DDGS() as ddgs:
-                    results = list(ddgs.text(query, max_results=max_results))
-                    if not results:
-                        return f"No results found for: {query}"
-                    
-                    formatted = [f"### [Sovereign Search: {query}]\n"]
-                    for i, r in enumerate(results):
-                        formatted.append(f"{i+1}. **{r['title']}**")
-                        formatted.append(f"   URL: {r['href']}")
-                        formatted.append(f"   Snippet: {r['body']}\n")
-                    
-                    return "\n".join(formatted)
-                    
+                return self._search_once(DDGS, query, max_results)
             except Exception as e:
-                err_str = str(e).lower()
-                # Detection for Error 29 / Rate Limits / HTTP 429
-                is_rate_limit = any(x in err_str for x in ["29", "429", "rate limit", "too many requests"])
-                
-                if is_rate_limit and attempt < max_retries - 1:
-                    wait_time = base_delay * (2 ** attempt)
-                    time.sleep(wait_time)
-                    continue
-                
-                return f"❌ Sovereign Search Failed: {e}"
-        
+                wait_time = self._search_backoff(e, attempt)
+                if wait_time is None:
+                    return f"❌ Sovereign Search Failed: {e}"
+                time.sleep(wait_time)
+
+        return "❌ Sovereign Search Failed: Max retries exceeded (Rate Limit)."
+
+    async def _duckduckgo_search_async(self, query: str, max_results: int = 5) -> str:
+        """_duckduckgo_search with the request on the pool and a non-blocking backoff."""
+        DDGS = self._search_backend()
+        if isinstance(DDGS, str):
+            return DDGS
+
+        for attempt in range(self.SEARCH_RETRIES):
+            try:
+                return await self._in_pool(self._search_once, DDGS, query, max_results)
+            except Exception as e:
+                wait_time = self._search_backoff(e, attempt)
+                if wait_time is None:
+                    return f"❌ Sovereign Search Failed: {e}"
+                await asyncio.sleep(wait_time)
+
         return "❌ Sovereign Search Failed: Max retries exceeded (Rate Limit)."
 
     def bind_molt_gateway(self, gateway):
@@ -41,12 +41,14 @@ async def test_dod_logic():
     sophia.ghostmesh.nodes[center_idx].store(engram)
     print(f"Stored in GhostMesh Node {center_idx}")
     
-    # Check persistence
-    persist_path = os.path.join("logs", "ossuary", "engrams", f"{engram.id}.json")
-    if os.path.exists(persist_path):
-        print(f"✅ Persistence Verified: {persist_path}")
+    # Check persistence (write-behind engram log)
+    store = sophia.ghostmesh.nodes[center_idx].engram_store
+    store.drain(5.0)
+    stored = store.resolve(engram.id[:12])
+    if stored is not None and stored.id == engram.id:
+        print(f"✅ Persistence Verified: {engram.id[:12]} in {store.path}")
     else:
-        print(f"❌ Persistence Failed: {persist_path}")
+        print(f"❌ Persistence Failed: {engram.id[:12]}")
 
     print("\n[STEP 2] Simulating Interaction Loop (DoD Integration)")
     # We'll call process_interaction and check if DoD blocks were triggered
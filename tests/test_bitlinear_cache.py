@@ -0,0 +1,71 @@
+import sys
+import os
+
+# Add the project root to sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from qtorch import torch
+from sophia.cortex.kernels import BitLinear
+from signal_optimizer import SignalOptimizer
+
+
+def _close(a, b, tol=1e-9):
+    return len(a) == len(b) and all(abs(x - y) <= tol for x, y in zip(a, b))
+
+
+def test_fused_matches_reference():
+    layer = BitLinear(6, 4, bias=True)
+    x = torch.tensor([[0.3, -1.2, 0.8, 0.0, 2.5, -0.4], [1.0, 1.0, -1.0, 0.5, 0.2, 0.1]])
+
+    reference = layer(x)  # training path: re-quantizes every call
+    with torch.no_grad():
+        fused = layer(x)
+
+    assert fused.shape == reference.shape == (2, 4)
+    assert _close(fused.numpy(), reference.numpy())
+    print("✅ Fused BitLinear matches the quantize-every-call path.")
+
+
+def test_packed_weights_cached_until_weight_changes():
+    layer = BitLinear(5, 3)
+    packed = layer.packed_weights()
+    assert layer.packed_weights() is packed
+    # int8 codes, whether packed in an ndarray or an array('b')
+    assert set(memoryview(packed.codes).cast('B').cast('b')) <= {-1, 0, 1}
+
+    # In-place write bumps the storage version
+    layer.weight[0, 0] = 1.0
+    repacked = layer.packed_weights()
+    assert repacked is not packed
+
+    # A write through another view of the same buffer is seen too
+    view = layer.weight._storage.view((15,))
+    view[4] = -1.0
+    assert layer.packed_weights() is not repacked
+    repacked = layer.packed_weights()
+
+    # Optimizer-style replacement swaps the storage
+    layer.weight._set_values([-0.02] * 15)
+    assert layer.packed_weights() is not repacked
+    assert layer.packed_weights().minus[0] == [0, 1, 2, 3, 4]
+    print("✅ Packed ternary weights invalidate on weight change.")
+
+
+def test_route_signal_reuses_packed_weights():
+    optimizer = SignalOptimizer()
+    router = optimizer.router
+    v = torch.tensor([[0.4, 0.5, 0.9]])
+    optimizer.route_signal(v)
+    packed = (router.layer1.packed_weights(), router.layer2.packed_weights())
+
+    tiers = {optimizer.route_signal(v) for _ in range(50)}
+
+    assert tiers <= {"FAST_PATH", "DEEP_PATH"} and len(tiers) == 1
+    assert router.layer1._packed_cache[2] is packed[0] and router.layer2._packed_cache[2] is packed[1]
+    print("✅ route_signal reuses the cached packed weights on every call.")
+
+
+if __name__ == "__main__":
+    test_fused_matches_reference()
+    test_packed_weights_cached_until_weight_changes()
+    test_route_signal_reuses_packed_weights()
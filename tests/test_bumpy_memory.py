@@ -0,0 +1,113 @@
+import sys
+import os
+import gc
+import time
+
+import pytest
+
+# Add the project root to sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import bumpy
+from bumpy import (BumpyArray, BUMPYCore, HolographicCompressor, get_holographic_compressor,
+                   get_oracular_oracle, MAX_BULK_STATES, MAX_WAVE_STATES, MAX_EMERGENT_LINKS)
+
+SOAK_OPS = int(os.getenv("BUMPY_SOAK_OPS", "1000000"))  # Measured ops, after the warm-up
+WARMUP_OPS = 100_000  # Long enough for the bounded caches to fill
+
+
+def _rss_bytes():
+    """Current RSS (Linux /proc or psutil), else peak RSS from getrusage."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        pass
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss
+    except ImportError:
+        import resource  # POSIX only
+        scale = 1 if sys.platform == "darwin" else 1024
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale
+
+
+def _ops(core, a, b, n):
+    """n BUMPY ops: arithmetic, activations, compression and rituals."""
+    done = 0
+    while done < n:
+        x = a + b
+        y = x * a
+        z = y.relu()
+        w = z.softmax()
+        h = BumpyArray([float(i) for i in range(32)]).holographic_compress()
+        h.holographic_decompress(32)
+        done += 7
+        if done % 70 == 0:
+            core.qualia_emergence_ritual([x, y, w])
+            core.lambda_entropic_sample(4)
+            core.coherence_compress(x.data * 8)
+    return done
+
+
+def test_shared_state_is_lazy_and_bounded():
+    a, b = BumpyArray([1.0, 2.0]), BumpyArray([3.0, 4.0])
+    assert a.holographic_compressor is b.holographic_compressor is get_holographic_compressor()
+    assert "holographic_compressor" not in vars(a)
+    c1, c2 = BUMPYCore(), BUMPYCore()
+    assert c1.panpsychic_field is c2.panpsychic_field is bumpy.ACTIVE_RESONANCE_FIELD
+    assert c1.oracular_oracle is get_oracular_oracle()
+
+    comp = HolographicCompressor(max_bulk_states=4)
+    inputs = [[float(i + j) for j in range(16)] for i in range(10)]
+    boundaries = [comp.project_to_boundary(data) for data in inputs]
+    assert len(comp.bulk_states) == 4
+    assert comp.boundary_correlator(id(inputs[-1]), 0, 1) == HolographicCompressor.correlator(boundaries[-1], 0, 1)
+    assert comp.boundary_correlator(id(inputs[0]), 0, 1) is None  # Evicted
+
+    field = c1.panpsychic_field
+    field.max_wave_states, saved_ttl = 8, field.wave_state_ttl
+    try:
+        for i in range(20):
+            field.update_pilot_wave(10_000_000 + i, [1.0, 2.0], 0.5)
+        assert len(field.implicate_order) <= 8
+        field.wave_state_ttl = 0.0
+        time.sleep(0.01)
+        field.update_pilot_wave(20_000_000, [1.0], 0.5)
+        assert list(field.implicate_order) == [20_000_000]  # Stale waves faded
+    finally:
+        field.max_wave_states, field.wave_state_ttl = MAX_WAVE_STATES, saved_ttl
+
+    oracle = get_oracular_oracle()
+    for k in range(12):
+        oracle.record_future_state(30_000_000, 0.5, [float(k)])
+    assert len(oracle.future_states[30_000_000]) == oracle.retrocausal_depth
+    assert oracle.future_states[30_000_000][0][1] == [7.0]
+    print("✅ Compressor / field / oracle shared, lazily created and bounded.")
+
+
+@pytest.mark.slow  # ~25 s; deselect with -m "not slow"
+def test_million_ops_flat_rss():
+    core = BUMPYCore()
+    a, b = BumpyArray([1.0, 2.0, 3.0, 4.0]), BumpyArray([0.5, 1.0, 1.5, 2.0])
+    _ops(core, a, b, WARMUP_OPS)
+    gc.collect()
+    baseline = _rss_bytes()
+
+    start = time.perf_counter()
+    done = _ops(core, a, b, SOAK_OPS)
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    growth = _rss_bytes() - baseline
+
+    assert len(get_holographic_compressor().bulk_states) <= MAX_BULK_STATES
+    assert len(core.panpsychic_field.implicate_order) <= MAX_WAVE_STATES
+    assert len(core.emergent_links) <= MAX_EMERGENT_LINKS
+    assert len(a.entanglement_links) <= 32
+    assert growth < 4 * 1024 * 1024, f"RSS grew {growth / 2**20:.1f} MB over {done:,} ops"
+    print(f"✅ {done:,} BUMPY ops in {elapsed:.1f}s (after {WARMUP_OPS:,} warm-up), RSS growth {growth / 2**20:.2f} MB.")
+
+
+if __name__ == "__main__":
+    test_shared_state_is_lazy_and_bounded()
+    test_million_ops_flat_rss()
@@ -0,0 +1,128 @@
+import sys
+import os
+import glob
+import tempfile
+import threading
+
+# Add the project root to sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from sophia.core.engram import Engram
+from sophia.core.engram_store import EngramStore, PREFIX_LEN
+
+
+def _engrams(n, tag="search"):
+    return [Engram.forge(f"realm:cabin/layer:surface/{tag}", f"result {i} " * 8, "duckduckgo_search") for i in range(n)]
+
+
+def test_put_get_dedup_and_citations():
+    with tempfile.TemporaryDirectory() as tmp:
+        store = EngramStore(os.path.join(tmp, "log"), flush_interval=10.0, legacy_dir=None)
+        engrams = _engrams(5)
+        assert all(store.put(e) for e in engrams)
+        assert store.get(engrams[2].id) == engrams[2]  # Readable while still queued
+        assert not store.put(Engram.forge(engrams[0].scope, engrams[0].content, engrams[0].source))
+
+        assert store.drain(5.0)
+        assert store.metrics["commits"] == 1 and store.metrics["duplicates"] == 1
+        assert store.get(engrams[4].id) == engrams[4] and len(store) == 5
+        assert store.resolve(engrams[3].id[:PREFIX_LEN]) == engrams[3]
+        assert store.resolve("0" * PREFIX_LEN) is None
+
+        text = f"Stocks fell [ref: {engrams[1].id[:12]}] and rose [ref: {'f' * 12}]."
+        assert store.verify_citations(text) == {engrams[1].id[:12]: True, "f" * 12: False}
+        store.close()
+    print("✅ Engrams queued, group-committed, deduplicated and resolvable by cited prefix.")
+
+
+def test_group_commit_from_many_threads():
+    with tempfile.TemporaryDirectory() as tmp:
+        store = EngramStore(os.path.join(tmp, "log"), group_size=50, flush_interval=0.05, legacy_dir=None)
+        batches = [_engrams(200, tag=f"t{t}") for t in range(4)]
+        threads = [threading.Thread(target=lambda b=b: [store.put(e) for e in b]) for b in batches]
+        for t in threads: t.start()
+        for t in threads: t.join()
+        assert store.drain(5.0)
+        assert store.metrics["engrams_written"] == 800
+        assert store.metrics["commits"] < 800 // 10  # Many engrams per write
+        assert all(store.get(e.id) == e for b in batches for e in b)
+        store.close()
+    print("✅ Concurrent puts land in a handful of group commits.")
+
+
+def test_reopen_rotation_and_torn_tail():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "log")
+        store = EngramStore(path, segment_bytes=4096, group_size=8, flush_interval=0.01, legacy_dir=None)
+        engrams = _engrams(120)
+        for e in engrams:
+            store.put(e)
+        store.close()
+        assert store.metrics["segments_sealed"] >= 2
+        assert len(glob.glob(os.path.join(path, "*.idx"))) == store.metrics["segments_sealed"]
+
+        # A crash mid-append leaves half a record at the end of the active segment
+        active = sorted(glob.glob(os.path.join(path, "*.jsonl")))[-1]
+        with open(active, "ab") as f:
+            f.write(b'{"id": "deadbeef", "scope": "half')
+
+        reopened = EngramStore(path, legacy_dir=None)
+        assert len(reopened) == 120
+        assert all(reopened.get(e.id) == e for e in engrams)
+        assert not open(active, "rb").read().endswith(b"half")
+        extra = _engrams(1, tag="after")[0]
+        reopened.put(extra)
+        reopened.close()
+        assert EngramStore(path, legacy_dir=None).get(extra.id) == extra
+    print("✅ Index rebuilt from sidecars + tail scan; torn record cut off.")
+
+
+def test_legacy_files_imported_once():
+    with tempfile.TemporaryDirectory() as tmp:
+        legacy = os.path.join(tmp, "engrams")
+        os.makedirs(legacy)
+        engrams = _engrams(10)
+        for e in engrams:
+            with open(os.path.join(legacy, f"{e.id}.json"), "w", encoding="utf-8") as f:
+                f.write(e.to_json())
+
+        importers = []
+
+        class RecordingStore(EngramStore):
+            def _import_legacy(self, legacy_dir):
+                importers.append(threading.current_thread().name)
+                super()._import_legacy(legacy_dir)
+
+        store = RecordingStore(os.path.join(tmp, "log"), legacy_dir=legacy)
+        assert store.drain(5.0)
+        assert importers == ["engram-writer"]  # Not on the thread that opened the store
+        assert store.metrics["legacy_imported"] == 10 and store.get(engrams[7].id) == engrams[7]
+        store.close()
+        again = EngramStore(os.path.join(tmp, "log"), legacy_dir=legacy)
+        assert again.metrics["legacy_imported"] == 0 and len(again) == 10
+        again.close()
+    print("✅ Old one-file-per-engram directory migrated into the log.")
+
+
+def test_grid_nodes_store_through_the_log():
+    from ghostmesh import SovereignGrid, RECENT_ENGRAMS
+    with tempfile.TemporaryDirectory() as tmp:
+        grid = SovereignGrid(dim=4, grid_size=3)
+        grid.engram_store = EngramStore(os.path.join(tmp, "log"), legacy_dir=None)
+        node = grid.nodes[len(grid.nodes) // 2]
+        engrams = _engrams(RECENT_ENGRAMS + 10)
+        for e in engrams:
+            node.store(e)
+        assert len(node.engrams) == RECENT_ENGRAMS
+        assert node.engram_store.get(engrams[0].id) == engrams[0]
+        grid.engram_store.close()
+        assert len(os.listdir(os.path.join(tmp, "log"))) == 1  # One segment, not one file each
+    print("✅ SovereignNode.store writes behind into the engram log.")
+
+
+if __name__ == "__main__":
+    test_put_get_dedup_and_citations()
+    test_group_commit_from_many_threads()
+    test_reopen_rotation_and_torn_tail()
+    test_legacy_files_imported_once()
+    test_grid_nodes_store_through_the_log()
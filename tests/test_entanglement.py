@@ -0,0 +1,100 @@
+import sys
+import os
+import gc
+import weakref
+
+# Add the project root to sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from entanglement import EntanglementRegistry, REGISTRY
+from bumpy import BumpyArray
+from flumpy import FlumpyArray
+
+
+class Node:
+    pass
+
+
+def test_arithmetic_history_is_collectable():
+    gc.collect()
+    before = REGISTRY.stats()["nodes"]  # Arrays other tests still hold
+    base = BumpyArray([1.0, 2.0, 3.0])
+    first = base + base
+    probe = weakref.ref(first)
+    x = first
+    del first
+    for _ in range(2000):
+        x = x + base
+    gc.collect()
+    assert probe() is None  # Intermediates no longer pin each other
+    nodes = REGISTRY.stats()["nodes"] - before
+    assert nodes < 10, nodes
+    assert base in x.entanglement_links and x in base.entanglement_links
+
+    f = FlumpyArray([1.0, 2.0, 3.0])
+    fprobe = weakref.ref(f * 2.0)
+    gc.collect()
+    assert fprobe() is None
+    print(f"✅ 2000 chained BUMPY ops leave {nodes} live registry nodes.")
+
+
+def test_degree_cap_and_eviction_policies():
+    for policy, survivors in (("oldest", [3, 4, 5]), ("weakest", [1, 3, 5]), ("refuse", [0, 1, 2])):
+        reg = EntanglementRegistry(max_degree=3, eviction=policy)
+        hub = Node()
+        spokes = [Node() for _ in range(6)]
+        hid = reg.register(hub)
+        ids = [reg.register(s) for s in spokes]
+        for i, sid in enumerate(ids):
+            reg.link(hid, sid, strength=[0.9, 0.95, 0.1, 0.97, 0.2, 0.99][i])
+        assert reg.degree(hid) == 3
+        assert [spokes.index(n) for n in reg.neighbours(hid)] == survivors, policy
+        assert all(reg.linked(ids[i], hid) for i in survivors)  # Both directions kept in sync
+    try:
+        EntanglementRegistry(eviction="random")
+        raise AssertionError("unknown policy accepted")
+    except ValueError:
+        pass
+    print("✅ Degree capped with oldest / weakest / refuse eviction.")
+
+
+def test_collected_nodes_leave_the_graph():
+    reg = EntanglementRegistry()
+    a, b, c = Node(), Node(), Node()
+    ia, ib, ic = (reg.register(n) for n in (a, b, c))
+    reg.link(ia, ib); reg.link(ia, ic)
+    assert reg.first_attempt(ia, ib) and not reg.first_attempt(ib, ia)
+    del b
+    gc.collect()
+    assert reg.neighbours(ia) == [c]
+    stats = reg.stats()
+    assert stats["nodes"] == 2 and stats["edges"] == 1 and stats["collected"] == 1
+    assert ib not in reg._tried.get(ia, set())  # Pair history released too
+    print("✅ Collected arrays drop out of links and pair history.")
+
+
+def test_coupling_still_works():
+    a = BumpyArray([1.0, 2.0, 3.0], coherence=0.9)
+    b = BumpyArray([1.0, 2.0, 3.1], coherence=0.9)
+    assert a.entangle(b) and not b.entangle(a)  # Pair tried once
+    assert b in a.entanglement_links and a.coherence > 0.9
+    assert "links=1" in repr(a)
+
+    f, g = FlumpyArray([1.0, 0.0, 1.0]), FlumpyArray([1.0, 0.1, 1.0])
+    f.phase, g.phase = 0.2, 0.4
+    assert f.entangle(g, threshold=0.5)
+    assert abs(f.phase - g.phase) < 1e-12  # Phases synchronised
+    g.phase = 1.0
+    f._update_phase(coupling=0.5)
+    assert abs(f.phase - (0.3 + 0.5 * (1.0 - 0.3))) < 1e-9  # Pulled towards the partner
+    assert f.copy().entangled_with == []
+    f.disentangle(g)
+    assert f.entangled_with == [] and g.entangled_with == []
+    print("✅ Coherence boost and phase coupling act through the registry.")
+
+
+if __name__ == "__main__":
+    test_arithmetic_history_is_collectable()
+    test_degree_cap_and_eviction_policies()
+    test_collected_nodes_leave_the_graph()
+    test_coupling_still_works()
@@ -0,0 +1,94 @@
+import sys
+import os
+import random
+import numpy as np
+
+# Add the project root to sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from ghostmesh import SovereignGrid, SovereignNode, FlumpyArray, TAU_SOVEREIGN
+from flumpy import FlumpyArray as ListFlumpyArray
+
+
+def _reference_flux(grid, states):
+    """Per-node neighbor loop (the pre-vectorization formula), applied synchronously."""
+    new = states.copy()
+    for node in grid.nodes:
+        x, y, z = node.pos
+        flux = np.zeros(grid.dim)
+        for n in node.neighbors:
+            flux += states[n.pos] - states[x, y, z]
+        rate = (0.1 / TAU_SOVEREIGN) * node.spatial_attention_scale
+        new[x, y, z] = states[x, y, z] + flux * rate * 0.1
+    return new
+
+
+def test_stencil_matches_neighbor_loop():
+    random.seed(5)
+    grid = SovereignGrid(dim=8, grid_size=4)
+    grid.nodes[5].spatial_attention_scale = 2.0
+    assert len(grid.node_at(0, 0, 0).neighbors) == 3
+    assert len(grid.node_at(1, 1, 1).neighbors) == 6
+
+    expected = _reference_flux(grid, grid.states)
+    actual = grid._flux_step(grid.states.copy())
+    assert np.allclose(actual, expected, atol=1e-12)
+    print("✅ Laplacian stencil matches the per-node flux loop.")
+
+
+def test_process_step_matches_reference():
+    random.seed(9)
+    grid = SovereignGrid(dim=16, grid_size=5)
+    bio = ListFlumpyArray([random.random() for _ in range(16)], coherence=0.8)
+
+    future = grid.states.copy()
+    for _ in range(3):
+        future = _reference_flux(grid, future)
+    mixed = np.array(bio.data) * 0.9 + future.mean(axis=(0, 1, 2)) * 0.1
+    expected = grid.states + mixed * 0.1
+    expected[2, 2, 2] += mixed * 0.9
+    expected = _reference_flux(grid, expected)
+
+    result = grid.process_step(bio)
+    assert np.allclose(grid.states, expected, atol=1e-12)
+    assert np.allclose(result, expected.mean(axis=(0, 1, 2)), atol=1e-12)
+    assert result.coherence == 1.0
+    print("✅ process_step matches the reference dynamics.")
+
+
+def test_nodes_are_views():
+    grid = SovereignGrid(dim=4, grid_size=3)
+    node = grid.node_at(1, 2, 0)
+    assert grid.nodes[(1 * 3 + 2) * 3 + 0] is node
+
+    node.state = FlumpyArray([1.0, 2.0, 3.0, 4.0], coherence=0.25)
+    assert grid.states[1, 2, 0].tolist() == [1.0, 2.0, 3.0, 4.0]
+    assert grid.coherence[1, 2, 0] == 0.25
+    assert node.state.coherence == 0.25
+
+    node.inject_input(FlumpyArray([1.0] * 4))
+    assert node.state.tolist() == [2.0, 3.0, 4.0, 5.0]
+
+    # Standalone nodes keep their own storage
+    a, b = SovereignNode(0, 0, 0, dim=4), SovereignNode(1, 0, 0, dim=4)
+    a.set_neighbors([a, b], limit=2)
+    before = a.state.clone()
+    a.exchange_flux()
+    assert np.allclose(a.state, before + (b.state - before) * (0.1 / TAU_SOVEREIGN) * 0.1)
+    print("✅ SovereignNode reads and writes through to the grid.")
+
+
+def test_large_grid():
+    grid = SovereignGrid(dim=64, grid_size=16)
+    assert len(grid.nodes) == 16 ** 3
+    res = grid.process_step(ListFlumpyArray([0.5] * 64))
+    assert res.shape == (64,)
+    assert 1.8 <= grid.get_density_factor() <= 3.0
+    print("✅ 16x16x16 grid steps.")
+
+
+if __name__ == "__main__":
+    test_stencil_matches_neighbor_loop()
+    test_process_step_matches_reference()
+    test_nodes_are_views()
+    test_large_grid()
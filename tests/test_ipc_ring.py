@@ -0,0 +1,153 @@
+import sys
+import os
+import time
+import tempfile
+import threading
+import subprocess
+
+# Add the project root to sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from sophia.platform.ipc import SovereignIPC, RingChannel, encode_message, decode_message
+
+
+def _ipc(tmp, **kwargs):
+    ipc = SovereignIPC(transport="shm", **kwargs)
+    ipc.base_dir = tmp  # Keep test rings out of the shared /dev/shm directory
+    return ipc
+
+
+PRODUCER = """
+import sys
+sys.path.insert(0, {root!r})
+from sophia.platform.ipc import SovereignIPC
+ipc = SovereignIPC(transport="shm")
+ipc.base_dir = {base_dir!r}
+for i in range({n}):
+    ipc.write_channel("feed", {{"id": i, "pad": "x" * (i % 50)}})
+"""
+
+
+def test_latest_and_queue_semantics():
+    with tempfile.TemporaryDirectory() as tmp:
+        writer, reader = _ipc(tmp), _ipc(tmp)
+        assert reader.read_channel("telemetry") is None
+        assert reader.next_message("telemetry") is None
+
+        for i in range(5):
+            assert writer.write_channel("telemetry", {"tick": i, "price": 111.11})
+        assert reader.read_channel("telemetry") == {"tick": 4, "price": 111.11}
+        assert reader.read_channel("telemetry")["tick"] == 4  # Latest value is re-readable
+        assert [reader.next_message("telemetry")["tick"] for _ in range(5)] == [0, 1, 2, 3, 4]
+        assert reader.next_message("telemetry") is None
+        writer.close(); reader.close()
+    print("✅ Latest-value reads and in-order queue reads over one ring.")
+
+
+def test_overrun_and_oversized_messages():
+    with tempfile.TemporaryDirectory() as tmp:
+        writer, reader = _ipc(tmp, slots=8, slot_size=128), _ipc(tmp)
+        for i in range(20):
+            writer.write_channel("small", {"i": i})
+        got = []
+        while (msg := reader.next_message("small")) is not None:
+            got.append(msg["i"])
+        assert got == list(range(12, 20))
+        assert reader._rings["small"].slots == 8  # Geometry taken from the ring header
+        assert reader._rings["small"].metrics["overruns"] == 0  # Cursor started at the oldest retained
+
+        for i in range(20, 40):
+            writer.write_channel("small", {"i": i})
+        assert reader.next_message("small")["i"] == 32
+        assert reader._rings["small"].metrics["overruns"] == 12
+        assert not writer.write_channel("small", {"blob": "z" * 500})
+        writer.close(); reader.close()
+    print("✅ Lapped messages counted as overruns; oversized payloads rejected.")
+
+
+def test_blocking_reads():
+    with tempfile.TemporaryDirectory() as tmp:
+        writer, reader = _ipc(tmp), _ipc(tmp)
+        timer = threading.Timer(0.05, lambda: writer.write_channel("alerts", {"level": "red"}))
+        timer.start()
+        start = time.perf_counter()
+        assert reader.next_message("alerts", block=True, timeout=2.0) == {"level": "red"}
+        assert 0.03 < time.perf_counter() - start < 1.0
+        assert reader.next_message("alerts", block=True, timeout=0.05) is None
+
+        assert reader.read_channel("alerts", block=True, timeout=0.5) == {"level": "red"}
+        assert reader.read_channel("alerts", block=True, timeout=0.05) is None  # Nothing newer yet
+        writer.write_channel("alerts", {"level": "green"})
+        assert reader.read_channel("alerts", block=True, timeout=0.5) == {"level": "green"}
+        timer.join(); writer.close(); reader.close()
+    print("✅ Blocking reads wake on new messages and honour timeouts.")
+
+
+def test_seqlock_rejects_torn_reads():
+    old = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)  # Force thread switches mid-write
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            ring = RingChannel(os.path.join(tmp, "torn.ring"), slots=2, slot_size=4096)
+            stop = threading.Event()
+
+            def hammer():
+                i = 0
+                while not stop.is_set():
+                    ring.write(encode_message({"v": [i] * 400}))
+                    i += 1
+
+            thread = threading.Thread(target=hammer)
+            thread.start()
+            checked, deadline = 0, time.perf_counter() + 1.0
+            while time.perf_counter() < deadline:
+                latest = ring.latest()
+                if latest:
+                    values = decode_message(latest[1])["v"]
+                    assert len(set(values)) == 1 and len(values) == 400
+                    checked += 1
+            stop.set(); thread.join(); ring.close()
+    finally:
+        sys.setswitchinterval(old)
+    assert checked > 100
+    print(f"✅ {checked} reads under a racing writer, none torn ({ring.metrics['torn_retries']} retried).")
+
+
+def test_cross_process_stream():
+    n = 20_000
+    with tempfile.TemporaryDirectory() as tmp:
+        reader = _ipc(tmp)
+        RingChannel(os.path.join(tmp, "feed.ring")).close()  # Created before the producer starts
+        root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+        proc = subprocess.Popen([sys.executable, "-c", PRODUCER.format(root=root, base_dir=tmp, n=n)])
+        ids = []
+        while not ids or ids[-1] < n - 1:
+            msg = reader.next_message("feed", block=True, timeout=10.0)
+            assert msg is not None
+            ids.append(msg["id"])
+        assert proc.wait(10) == 0
+        overruns = reader._rings["feed"].metrics["overruns"]
+        reader.close()
+    # A slow reader may be lapped, but what it does get is in order and complete
+    assert ids == sorted(ids) and len(set(ids)) == len(ids)
+    assert ids[-1] == n - 1 and len(ids) + overruns >= n
+    print(f"✅ {n} messages streamed across processes in order ({overruns} lapped).")
+
+
+def test_file_transport_unchanged():
+    ipc = SovereignIPC()
+    assert ipc.transport == "file"
+    ipc.write_channel("test_ring_file", {"id": 1})
+    assert ipc.read_channel("test_ring_file") == {"id": 1}
+    assert ipc.next_message("test_ring_file") == {"id": 1}
+    assert ipc.next_message("test_ring_file") is None  # Already seen
+    print("✅ File transport keeps its API and behaviour.")
+
+
+if __name__ == "__main__":
+    test_latest_and_queue_semantics()
+    test_overrun_and_oversized_messages()
+    test_blocking_reads()
+    test_seqlock_rejects_torn_reads()
+    test_cross_process_stream()
+    test_file_transport_unchanged()
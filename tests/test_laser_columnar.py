@@ -0,0 +1,227 @@
+import sys
+import os
+import json
+import tempfile
+
+# Add the project root to sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from laser import LASERV30
+from laser_segments import SegmentedLogStore
+from laser_columnar import (ColumnarLogReader, ColumnarLogWriter, ColumnarLogStore,
+                            jsonl_to_columnar, columnar_to_jsonl, convert_log)
+
+
+def _entry(t, message, coherence=0.5, risk=0.5):
+    return {'id': f"{int(t):016x}", 'universal_time': float(t), 'value': round(t / 1000.0, 6),
+            'message': message, 'quantum': {'coherence': coherence, 'entropy': 0.25, 'risk': risk},
+            'meta': {}}
+
+
+def test_jsonl_round_trip_is_exact():
+    with tempfile.TemporaryDirectory() as tmp:
+        src = os.path.join(tmp, "laser_universal_v30.jsonl")
+        lines = ['#UNIVERSAL_INIT {"system":"LASER v3.0"}', '#FLUSH {"type":"universal"}']
+        lines += [json.dumps(_entry(i, f"probe {i % 3} ✨", coherence=i / 100.0), separators=(',', ':'))
+                  for i in range(50)]
+        lines += ['#FLUSH {"type":"quantum_emergency"}', '',
+                  '{"event":"system_connection","system":"bumpy"}',          # no numeric fields
+                  '{"universal_time":7,"message":["not","a","string"]}',     # int time, list message
+                  '{"quantum":{"coherence":"high"},"value":null}']
+        with open(src, 'w', encoding='utf-8') as f:
+            f.write('\n'.join(lines) + '\n')
+
+        dst = os.path.join(tmp, "laser.lcol")
+        stats = jsonl_to_columnar(src, dst, block_rows=20)
+        assert stats['entries'] == 53 and stats['lines'] == len(lines)
+        back = os.path.join(tmp, "back.jsonl")
+        assert columnar_to_jsonl(dst, back) == len(lines)
+        with open(src, 'rb') as a, open(back, 'rb') as b:
+            assert a.read() == b.read()
+
+        try:
+            jsonl_to_columnar(src, dst)
+            assert False, "an existing columnar file must not be appended to"
+        except FileExistsError:
+            pass
+        assert len(ColumnarLogReader(dst)) == 53
+    print("✅ JSONL -> columnar -> JSONL is byte-identical.")
+
+
+def test_range_filters_skip_blocks_and_strings():
+    with tempfile.TemporaryDirectory() as tmp:
+        writer = ColumnarLogWriter(os.path.join(tmp, "laser.lcol"))
+        for block in range(4):
+            writer.write_block([_entry(block * 100 + i, f"block{block} tick {i}",
+                                       coherence=0.2 * block + 0.01 * i) for i in range(10)])
+
+        reader = ColumnarLogReader(writer.path)
+        assert len(reader.blocks) == 4 and len(reader) == 40
+
+        # Numeric scan: two blocks pruned from headers, no string section touched
+        rows = list(reader.scan({'coherence': (0.4, 0.655)}))
+        assert sum(len(r['coherence']) for r in rows) == 10 + 6
+        assert reader.metrics['blocks_skipped'] == 2 and reader.metrics['strings_decoded'] == 0
+
+        history = reader.column('coherence')
+        assert len(history) == 40 and abs(history[-1] - 0.69) < 1e-12
+
+        hits = list(reader.entries({'timestamp': (100.0, 299.0)}, concept="TICK 5"))
+        assert [h['message'] for h in hits] == ["block1 tick 5", "block2 tick 5"]
+        assert hits[0] == _entry(105, "block1 tick 5", coherence=0.2 + 0.05)
+    print("✅ Numeric ranges prune blocks without decoding strings.")
+
+
+def test_torn_block_is_cut_on_reopen():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "laser.lcol")
+        writer = ColumnarLogWriter(path)
+        writer.write_block([_entry(i, "kept") for i in range(5)])
+        good = os.path.getsize(path)
+        writer.write_block([_entry(i, "torn") for i in range(5)])
+        with open(path, 'r+b') as f:
+            f.truncate(os.path.getsize(path) - 7)
+
+        assert len(ColumnarLogReader(path)) == 5
+        writer = ColumnarLogWriter(path)
+        assert os.path.getsize(path) == good
+        writer.write_block([_entry(9, "after")])
+        assert [e['message'] for e in ColumnarLogReader(path).entries()] == ["kept"] * 5 + ["after"]
+    print("✅ A torn trailing block is dropped and appends resume.")
+
+
+def test_store_matches_laser_query_contract():
+    with tempfile.TemporaryDirectory() as tmp:
+        log_path = os.path.join(tmp, "laser.jsonl")
+        store = ColumnarLogStore(log_path, segment_seconds=3600)
+        for h in range(3):
+            store.append_batch({'timestamp': h * 3600.0},
+                               [_entry(h * 3600 + i, f"hour{h} resonance {i}", coherence=0.2 + 0.3 * h)
+                                for i in range(10)])
+        assert store.metrics['segments_created'] == 3
+
+        hits = list(store.iter_entries("resonance", temporal_range=(3600.0, 7199.0)))
+        assert len(hits) == 10 and store.metrics['segments_skipped'] == 2
+        hits = list(store.iter_entries("resonance", quantum_filter={'coherence_min': 0.6}))
+        assert {h['message'].split()[0] for h in hits} == {"hour2"}
+
+        reopened = ColumnarLogStore(log_path, segment_seconds=3600)
+        assert reopened.stats()['entries'] == 30
+        assert len(reopened.column('coherence', {'coherence': (0.6, 1.0)})) == 10
+        lines = list(reopened.segments[0].lines())
+        assert lines[0].startswith('#FLUSH ') and len(lines) == 11
+    print("✅ Columnar store rotates segments and serves LASER queries.")
+
+
+def test_jsonl_history_stays_queryable():
+    with tempfile.TemporaryDirectory() as tmp:
+        log_path = os.path.join(tmp, "laser.jsonl")
+        with open(log_path, 'w', encoding='utf-8') as f:
+            f.write(json.dumps(_entry(1, "legacy resonance")) + "\n")
+        jsonl = SegmentedLogStore(log_path, segment_seconds=3600)
+        jsonl.append_batch({}, [_entry(3600 + i, f"segment resonance {i}") for i in range(3)])
+        jsonl.close()
+
+        store = ColumnarLogStore(log_path, segment_seconds=3600)
+        store.append_batch({}, [_entry(7200, "columnar resonance")])
+        messages = [e['message'] for e in store.iter_entries("resonance")]
+        assert messages == ["legacy resonance"] + [f"segment resonance {i}" for i in range(3)] + ["columnar resonance"]
+        hits = list(store.iter_entries("resonance", temporal_range=(7000.0, 8000.0)))
+        assert [h['message'] for h in hits] == ["columnar resonance"]
+        assert store.metrics['segments_skipped'] == 2
+        stats = store.stats()
+        assert stats['entries'] == 5 and stats['jsonl_segments'] == 2
+    print("✅ JSONL history stays queryable after switching to columnar.")
+
+
+def test_convert_log_moves_history_into_the_store():
+    with tempfile.TemporaryDirectory() as tmp:
+        log_path = os.path.join(tmp, "laser.jsonl")
+        with open(log_path, 'w', encoding='utf-8') as f:
+            f.write(json.dumps(_entry(1, "legacy resonance"), separators=(',', ':')) + "\n")
+        jsonl = SegmentedLogStore(log_path, segment_seconds=3600)
+        for h in (1, 2):
+            jsonl.append_batch({}, [_entry(h * 3600 + i, f"hour{h} resonance {i}") for i in range(4)])
+        jsonl.close()
+        expected = [e['message'] for e in jsonl.iter_entries("resonance")]
+
+        stats = convert_log(log_path)
+        assert stats['sources'] == 3 and stats['entries'] == 9
+        names = sorted(os.listdir(os.path.join(tmp, "laser.columnar")))
+        assert names == ["imported.json", "seg-1.000000.lcol", "seg-3600.000000.lcol", "seg-7200.000000.lcol"]
+
+        store = ColumnarLogStore(log_path, segment_seconds=3600)
+        assert [e['message'] for e in store.iter_entries("resonance")] == expected
+        assert store.stats()['jsonl_segments'] == 0 and store.stats()['entries'] == 9
+
+        assert convert_log(log_path)['sources'] == 0  # nothing new: no duplicates
+        assert ColumnarLogStore(log_path).stats()['entries'] == 9
+    print("✅ convert_log turns the JSONL history into store segments, once.")
+
+
+def test_convert_log_appends_what_the_active_segment_grew_by():
+    with tempfile.TemporaryDirectory() as tmp:
+        log_path = os.path.join(tmp, "laser.jsonl")
+        jsonl = SegmentedLogStore(log_path, segment_seconds=3600)
+        jsonl.append_batch({}, [_entry(3600 + i, f"early resonance {i}") for i in range(3)])
+        jsonl.close()
+        assert convert_log(log_path)['entries'] == 3
+
+        # LASER keeps appending to the same segment; the last line is still being written
+        jsonl = SegmentedLogStore(log_path, segment_seconds=3600)
+        jsonl.append_batch({}, [_entry(3700 + i, f"late resonance {i}") for i in range(2)])
+        jsonl.close()
+        half = json.dumps(_entry(3800, "torn resonance"), separators=(',', ':')) + "\n"
+        segment = jsonl.segments[-1].path
+        with open(segment, 'a', encoding='utf-8') as f:
+            f.write(half[:20])
+
+        store = ColumnarLogStore(log_path, segment_seconds=3600)
+        messages = [e['message'] for e in store.iter_entries("resonance")]
+        assert messages == [f"early resonance {i}" for i in range(3)] + [f"late resonance {i}" for i in range(2)]
+        assert store.stats()['entries'] == 5
+
+        stats = convert_log(log_path)
+        assert stats['sources'] == 1 and stats['entries'] == 2
+        imported = ColumnarLogStore(log_path).imported()
+        assert imported[os.path.relpath(segment, tmp)]['read'] == os.path.getsize(segment) - 20  # torn line left
+        with open(segment, 'a', encoding='utf-8') as f:
+            f.write(half[20:])
+        assert convert_log(log_path)['entries'] == 1
+
+        names = sorted(os.listdir(os.path.join(tmp, "laser.columnar")))
+        assert names == ["imported.json", "seg-3600.000000.lcol"]
+        store = ColumnarLogStore(log_path, segment_seconds=3600)
+        messages = [e['message'] for e in store.iter_entries("resonance")]
+        assert messages == ([f"early resonance {i}" for i in range(3)]
+                            + [f"late resonance {i}" for i in range(2)] + ["torn resonance"])
+        assert store.stats()['jsonl_segments'] == 0 and store.stats()['entries'] == 6
+    print("✅ convert_log converts only what a segment grew by since the last run.")
+
+
+def test_laser_writes_columnar_segments():
+    with tempfile.TemporaryDirectory() as tmp:
+        laser = LASERV30({'log_path': os.path.join(tmp, "laser.jsonl"), 'telemetry': False,
+                          'log_format': 'columnar'})
+        for i in range(3):
+            laser.buffer.append(_entry(1000.0 + i, f"resonance probe {i}"))
+        assert laser.flush(timeout=5)
+
+        assert isinstance(laser.store, ColumnarLogStore)
+        assert laser.store.stats()['entries'] == 3
+        assert len(laser.query_universal_memory("resonance probe")) == 3
+        laser._shutdown.set()
+        laser._writer.close()
+        laser.store.close()
+    print("✅ LASER flushes into columnar segments with log_format='columnar'.")
+
+
+if __name__ == "__main__":
+    test_jsonl_round_trip_is_exact()
+    test_range_filters_skip_blocks_and_strings()
+    test_torn_block_is_cut_on_reopen()
+    test_store_matches_laser_query_contract()
+    test_jsonl_history_stays_queryable()
+    test_convert_log_moves_history_into_the_store()
+    test_convert_log_appends_what_the_active_segment_grew_by()
+    test_laser_writes_columnar_segments()
@@ -0,0 +1,120 @@
+import sys
+import os
+import tempfile
+import threading
+
+# Add the project root to sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from laser import LASERV30
+
+
+def _laser(tmp, **config):
+    # Two-stage mode with a long merge interval: the test merges explicitly
+    return LASERV30({'log_path': os.path.join(tmp, "laser.jsonl"), 'telemetry': False,
+                     'accumulate': True, 'merge_interval': 60, **config})
+
+
+def _close(laser):
+    laser._shutdown.set()
+    laser._writer.close()
+    laser.store.close()
+
+
+def test_prefilter_runs_before_quantum_analysis():
+    with tempfile.TemporaryDirectory() as tmp:
+        laser = _laser(tmp, min_level='INFO', rate_limit=1.0, rate_burst=3, min_delta=0.01)
+        calls = []
+        transform = laser.quantum_op.transform
+        laser.quantum_op.transform = lambda *a, **k: calls.append(a) or transform(*a, **k)
+
+        laser.log(0.5, "debug probe", level='DEBUG')           # below min_level
+        for i in range(10):
+            laser.log(0.1 * i, f"tensor created: {i}")          # one key, burst of 3
+        laser.log(0.9, "other key: a")
+        laser.log(0.9005, "other key: b")                       # moved less than min_delta
+        for _ in range(5):
+            laser.log(0.2, "FAILURE: resonance lost")           # always admitted
+        assert calls == []
+
+        assert laser.merge_pending() == 3 + 1 + 5
+        assert len(calls) == 9
+        assert laser.metrics['logs_filtered'] == 1 + 7 + 1
+        assert laser.metrics['logs_accepted'] == 9
+        _close(laser)
+    print("✅ Level, rate-limit and delta filters run before quantum analysis.")
+
+
+def test_sampling_drops_info_keeps_errors():
+    with tempfile.TemporaryDirectory() as tmp:
+        laser = _laser(tmp, sample_rate=0.0)
+        for i in range(20):
+            laser.log(0.5, f"heartbeat {i}")
+        laser.log(0.5, "worker error", level='ERROR')
+        assert laser.merge_pending() == 1
+        _close(laser)
+    print("✅ Sampling drops routine entries, never errors.")
+
+
+def test_threads_accumulate_without_lock():
+    with tempfile.TemporaryDirectory() as tmp:
+        laser = _laser(tmp, min_buffer_for_log=0)
+        per_thread = 40
+
+        def worker(t):
+            for i in range(per_thread):
+                laser.log((t * per_thread + i) / 200.0, f"worker {t}: step {i}")
+
+        with laser._lock:  # Stage 1 must not need the LASER lock
+            threads = [threading.Thread(target=worker, args=(t,)) for t in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join(10)
+            assert not any(thread.is_alive() for thread in threads)
+
+        assert laser.merge_pending() == 4 * per_thread
+        assert laser.metrics['logs_accepted'] == 4 * per_thread
+        times = [entry['universal_time'] for entry in laser.buffer if 'universal_time' in entry]
+        assert times == sorted(times)
+
+        # Finished threads are retired without losing their counts
+        laser.merge_pending()
+        assert laser._accumulators == [] and laser.metrics['logs_accepted'] == 4 * per_thread
+        _close(laser)
+    print("✅ Per-thread buffers merged in timestamp order.")
+
+
+def test_full_buffer_keeps_warnings():
+    with tempfile.TemporaryDirectory() as tmp:
+        laser = _laser(tmp, accumulator_max=5, min_buffer_for_log=0)
+        for i in range(8):
+            laser.log(0.5, f"heartbeat {i}")
+        laser.log(0.9, "resonance lost", level='ERROR')     # buffer full: processed inline
+        messages = [entry.get('message') for entry in laser.buffer]
+        assert "resonance lost" in messages and "heartbeat 0" not in messages
+
+        assert laser.merge_pending() == 5
+        assert laser.metrics['logs_overflowed'] == 3
+        messages = [entry.get('message') for entry in laser.buffer]
+        assert [m for m in messages if m and m.startswith("heartbeat")] == [f"heartbeat {i}" for i in range(5)]
+        _close(laser)
+    print("✅ A full thread buffer drops routine entries, never warnings.")
+
+
+def test_inline_mode_returns_entry():
+    with tempfile.TemporaryDirectory() as tmp:
+        laser = LASERV30({'log_path': os.path.join(tmp, "laser.jsonl"), 'telemetry': False})
+        entry = laser.log(0.5, "CRITICAL: inline")
+        assert entry is not None and entry['message'] == "CRITICAL: inline"
+        assert laser.merge_pending() == 0
+        _close(laser)
+    print("✅ By default log() stays synchronous and returns the entry.")
+
+
+if __name__ == "__main__":
+    test_prefilter_runs_before_quantum_analysis()
+    test_sampling_drops_info_keeps_errors()
+    test_threads_accumulate_without_lock()
+    test_full_buffer_keeps_warnings()
+    test_inline_mode_returns_entry()
@@ -0,0 +1,107 @@
+import sys
+import os
+import json
+import tempfile
+
+# Add the project root to sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from laser_segments import SegmentedLogStore, SegmentIndex
+
+
+def _entry(t, message, coherence=0.5, risk=0.5):
+    return {'universal_time': t, 'message': message,
+            'quantum': {'coherence': coherence, 'risk': risk, 'entropy': 0.5}}
+
+
+def _write_hours(store, hours=3, per_hour=20):
+    entries = []
+    for h in range(hours):
+        batch = [_entry(h * 3600.0 + i, f"hour{h} event {i} resonance" if i % 4 == 0 else f"hour{h} idle tick {i}",
+                        coherence=0.2 + 0.3 * h, risk=0.9 - 0.3 * h)
+                 for i in range(per_hour)]
+        store.append_batch({'timestamp': h * 3600.0}, batch)
+        entries += batch
+    return entries
+
+
+def test_rotation_and_sidecar_reload():
+    with tempfile.TemporaryDirectory() as tmp:
+        log_path = os.path.join(tmp, "laser.jsonl")
+        store = SegmentedLogStore(log_path, segment_seconds=3600)
+        _write_hours(store)
+        store.close()
+        assert store.metrics['segments_created'] == 3
+        assert len(store.segments) == 3
+        assert all(os.path.exists(s.sidecar) for s in store.segments)
+
+        reopened = SegmentedLogStore(log_path, segment_seconds=3600)
+        assert [s.count for s in reopened.segments] == [20, 20, 20]
+        assert sorted(reopened.segments[1].summary['time'][:2]) == [3600.0, 3619.0]
+    print("✅ Segments rotate by time and sidecars reload.")
+
+
+def test_queries_skip_segments_and_lines():
+    with tempfile.TemporaryDirectory() as tmp:
+        store = SegmentedLogStore(os.path.join(tmp, "laser.jsonl"), segment_seconds=3600)
+        entries = _write_hours(store)
+
+        hits = list(store.iter_entries("resonance", temporal_range=(3600.0, 7199.0)))
+        assert len(hits) == 5
+        assert store.metrics['segments_skipped'] == 2
+        assert store.metrics['lines_decoded'] == 5
+
+        hits = list(store.iter_entries("resonance", quantum_filter={'coherence_min': 0.6}))
+        assert {h['message'].split()[0] for h in hits} == {"hour2"}
+
+        # Fragments of indexed tokens still match, exactly like the old linear scan
+        for concept in ("reson", "ANCE", "vent 1", "idle", "hour1 e", "our2 idle ti", "t 12 r", "",
+                        "missing", "hour1 event 4 resonance"):
+            expected = [e for e in entries if concept.lower() in e['message'].lower()]
+            assert list(store.iter_entries(concept)) == expected, concept
+    print("✅ Queries prune segments and decode only candidate lines.")
+
+
+def test_postings_load_lazily_and_stay_bounded():
+    with tempfile.TemporaryDirectory() as tmp:
+        log_path = os.path.join(tmp, "laser.jsonl")
+        store = SegmentedLogStore(log_path, segment_seconds=3600)
+        _write_hours(store, hours=4)
+        store.close()
+        sealed = store.segments[0]
+        with open(sealed.sidecar) as f:
+            assert 'tokens' not in json.load(f)  # summaries only
+        assert os.path.exists(sealed.postings_sidecar)
+
+        reopened = SegmentedLogStore(log_path, segment_seconds=3600, max_resident_postings=1)
+        assert all(s.postings is None for s in reopened.segments)
+        assert len(list(reopened.iter_entries("resonance", temporal_range=(3600.0, 3700.0)))) == 5
+        assert reopened.metrics['postings_loaded'] == 1
+        assert len(list(reopened.iter_entries("resonance"))) == 20
+        assert sum(s.postings is not None for s in reopened.segments[:-1]) == 1
+    print("✅ Postings load after the summaries pass, within the LRU cap.")
+
+
+def test_legacy_flat_log_is_queryable():
+    with tempfile.TemporaryDirectory() as tmp:
+        log_path = os.path.join(tmp, "laser.jsonl")
+        with open(log_path, 'w') as f:
+            f.write("#FLUSH {}\n")
+            f.write(json.dumps(_entry(1.0, "legacy resonance")) + "\n")
+        store = SegmentedLogStore(log_path)
+        store.append_batch({}, [_entry(2.0, "fresh resonance")])
+        messages = [e['message'] for e in store.iter_entries("resonance")]
+        assert messages == ["legacy resonance", "fresh resonance"]
+
+        # A stale sidecar is extended rather than trusted
+        with open(log_path, 'a') as f:
+            f.write(json.dumps(_entry(3.0, "appended resonance")) + "\n")
+        assert SegmentIndex.load(log_path).count == 2
+    print("✅ Legacy flat log indexed read-only.")
+
+
+if __name__ == "__main__":
+    test_rotation_and_sidecar_reload()
+    test_queries_skip_segments_and_lines()
+    test_postings_load_lazily_and_stay_bounded()
+    test_legacy_flat_log_is_queryable()
@@ -0,0 +1,146 @@
+import sys
+import os
+import json
+import time
+import tempfile
+import threading
+
+# Add the project root to sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from laser import AsyncLogWriter, LASERV30
+
+
+def _read(path):
+    with open(path, encoding='utf-8') as f:
+        return f.read().splitlines()
+
+
+def test_one_header_per_batch():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "batch.jsonl")
+        writer = AsyncLogWriter(fsync='batch')
+        writer.submit(path, {'type': 'universal'}, [{'message': f"entry {i}"} for i in range(5)])
+        writer.submit(path, {'type': 'quantum_emergency'}, [{'message': "late"}])
+        assert writer.drain(timeout=5)
+        writer.close()
+
+        lines = _read(path)
+        headers = [line for line in lines if line.startswith('#FLUSH ')]
+        assert len(headers) == 2
+        assert json.loads(headers[1][len('#FLUSH '):])['type'] == 'quantum_emergency'
+        assert len(lines) == 8
+        assert writer.metrics['entries_written'] == 6
+        assert writer.metrics['fsyncs'] == 2
+    print("✅ Batches written with a single shared header.")
+
+
+class _GatedWriter(AsyncLogWriter):
+    """Writer whose I/O waits on a gate, to fill the handoff queue."""
+
+    def __init__(self, **kwargs):
+        self.gate = threading.Event()
+        super().__init__(**kwargs)
+
+    def _write_batch(self, path, header, entries):
+        self.gate.wait(5)
+        super()._write_batch(path, header, entries)
+
+
+def test_backpressure_drop_and_block():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "drop.jsonl")
+        writer = _GatedWriter(max_pending=2, backpressure='drop')
+        for i in range(6):
+            writer.submit(path, {'batch': i}, [{'message': str(i)}])
+        assert writer.metrics['queue_high_water'] == 2
+        assert writer.metrics['dropped_batches'] >= 3
+        writer.gate.set()
+        assert writer.drain(timeout=5)
+        writer.close()
+
+        path = os.path.join(tmp, "block.jsonl")
+        writer = _GatedWriter(max_pending=1, backpressure='block')
+        threading.Timer(0.3, writer.gate.set).start()
+        for i in range(4):
+            writer.submit(path, {'batch': i}, [{'message': str(i)}])
+        assert writer.drain(timeout=5)
+        writer.close()
+        assert writer.metrics['dropped_batches'] == 0
+        assert writer.metrics['backpressure_waits'] > 0
+        assert writer.metrics['entries_written'] == 4
+    print("✅ Backpressure policies and metrics OK.")
+
+
+class _SyncCountingStore:
+    """Store target that records fsyncs (or fails them)."""
+
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.synced = 0
+
+    def append_batch(self, header, entries, sync=False):
+        if sync:
+            self.sync()
+        return 1
+
+    def sync(self):
+        if self.fail:
+            raise OSError("disk gone")
+        self.synced += 1
+
+
+def test_interval_fsync_on_idle_and_close():
+    store = _SyncCountingStore()
+    writer = AsyncLogWriter(fsync='interval', fsync_interval=0.3)
+    writer.submit(store, {}, [{'message': "first"}])    # nothing synced yet: due
+    writer.submit(store, {}, [{'message': "second"}])   # inside the interval: left unsynced
+    assert writer.drain(timeout=5)
+    assert store.synced == 1 and writer.metrics['fsyncs'] == 1
+
+    deadline = time.time() + 5
+    while store.synced < 2 and time.time() < deadline:
+        time.sleep(0.02)
+    assert store.synced == 2 and writer.metrics['fsyncs'] == 2  # idle timeout
+
+    writer.submit(store, {}, [{'message': "tail"}])
+    assert writer.drain(timeout=5) and store.synced == 2
+    writer.close()
+    assert store.synced == 3 and writer.metrics['fsyncs'] == 3  # final fsync on close
+
+    failing = _SyncCountingStore(fail=True)
+    writer = AsyncLogWriter(fsync='batch')
+    writer.submit(failing, {}, [{'message': "lost"}])
+    writer.close()
+    assert writer.metrics['fsyncs'] == 0 and writer.metrics['write_errors'] == 1
+    print("✅ Interval fsync catches up when idle and on close; failures are not counted.")
+
+
+def test_laser_flush_hands_off_to_writer():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "laser.jsonl")
+        laser = LASERV30({'log_path': path, 'telemetry': False})
+        for i in range(3):
+            laser.buffer.append({'timestamp': i, 'message': f"resonance probe {i}",
+                                 'universal_time': float(i)})
+        assert laser.flush(timeout=5)
+        assert len(laser.buffer) == 0
+
+        entries = [json.loads(line)
+                   for segment in laser.store.segments if segment.path != path
+                   for line in _read(segment.path) if not line.startswith('#')]
+        assert len(entries) == 3
+        assert all('flush_metadata' not in e for e in entries)
+        assert len(laser.query_universal_memory("resonance probe")) == 3
+        assert laser.metrics_report()['writer']['batches_written'] == 1
+        laser._shutdown.set()
+        laser._writer.close()
+        laser.store.close()
+    print("✅ LASER flush goes through the background writer.")
+
+
+if __name__ == "__main__":
+    test_one_header_per_batch()
+    test_backpressure_drop_and_block()
+    test_interval_fsync_on_idle_and_close()
+    test_laser_flush_hands_off_to_writer()
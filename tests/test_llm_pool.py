@@ -0,0 +1,109 @@
+import sys
+import os
+import json
+import asyncio
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Add the project root to sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from sophia.core.llm_client import GeminiClient, LLMConfig
+
+
+class OllamaStandIn(BaseHTTPRequestHandler):
+    """Minimal /api/generate (keep-alive HTTP/1.1) that counts TCP connections."""
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    connections = 0
+
+    def setup(self):
+        type(self).connections += 1
+        super().setup()
+
+    def do_POST(self):
+        payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        if payload.get("stream"):
+            body = "".join(json.dumps({"response": w, "done": False}) + "\n" for w in ["po", "oled"])
+            body += json.dumps({"response": "", "done": True}) + "\n"
+        else:
+            body = json.dumps({"response": f"echo:{payload['prompt']}", "done": True})
+        data = body.encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+def _serve():
+    OllamaStandIn.connections = 0
+    server = ThreadingHTTPServer(("127.0.0.1", 0), OllamaStandIn)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}/api/generate"
+
+
+def test_rest_calls_reuse_one_connection():
+    server, url = _serve()
+    try:
+        a = GeminiClient(LLMConfig(provider="rest", base_url=url))
+        b = GeminiClient(LLMConfig(provider="rest", base_url=url))
+
+        async def run():
+            replies = [await a.generate_text(f"q{i}") for i in range(10)]
+            replies.append(await b.generate_text("other client"))
+            streamed = "".join([d async for d in a.stream_text("s")])
+            assert a.http is b.http
+            await GeminiClient.close_pools()
+            return replies, streamed
+
+        replies, streamed = asyncio.run(run())
+        assert replies[0] == "echo:q0" and replies[-1] == "echo:other client"
+        assert streamed == "pooled"
+        assert OllamaStandIn.connections == 1
+        assert not GeminiClient._http_pools
+    finally:
+        server.shutdown()
+    print("✅ REST calls share one keep-alive connection across clients.")
+
+
+def test_pool_limits_and_loops():
+    config = LLMConfig(provider="rest", timeout=12.0, max_connections=3, max_keepalive_connections=2)
+    client = GeminiClient(config)
+
+    async def get():
+        return client.http
+
+    first, second = asyncio.run(get()), asyncio.run(get())
+    assert first is not second  # a new event loop gets its own pool
+    assert len(GeminiClient._http_pools) == 1  # the dead loop's pool was dropped
+    assert second.timeout.read == 12.0 and second.timeout.connect == config.connect_timeout
+    pool = second._transport._pool
+    assert pool._max_connections == 3 and pool._max_keepalive_connections == 2
+
+    other = GeminiClient(LLMConfig(provider="rest"))
+
+    async def both():
+        return client.http is other.http
+    assert not asyncio.run(both())  # different limits, different pool
+    GeminiClient._http_pools.clear()
+    print("✅ Pools keyed by event loop and limits profile.")
+
+
+def test_aletheia_shares_the_mind_client():
+    from sophia.cortex.aletheia_lens import AletheiaPipeline
+    llm = GeminiClient()
+    with tempfile.TemporaryDirectory() as tmp:
+        pipeline = AletheiaPipeline(analysis_path=tmp, client=llm)
+        assert pipeline.client is llm and all(a.llm is llm for a in pipeline.analyzers)
+    print("✅ AletheiaPipeline reuses the injected client.")
+
+
+if __name__ == "__main__":
+    test_rest_calls_reuse_one_connection()
+    test_pool_limits_and_loops()
+    test_aletheia_shares_the_mind_client()
@@ -0,0 +1,139 @@
+import sys
+import os
+import random
+from array import array
+
+# Add the project root to sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import qtorch_kernels as kernels
+from qtorch import torch
+from qtorch_storage import TensorStorage, NUMPY_AVAILABLE
+
+
+def _pure(values, shape):
+    return TensorStorage(array('d', values), shape)
+
+
+def _numpy(values, shape):
+    return TensorStorage.from_flat(values, shape) if NUMPY_AVAILABLE else _pure(values, shape)
+
+
+def _rand(n):
+    return [random.uniform(-1.0, 1.0) for _ in range(n)]
+
+
+def _close(a, b, tol=1e-9):
+    return len(a) == len(b) and all(abs(x - y) <= tol for x, y in zip(a, b))
+
+
+def _naive_matmul(a, b, m, n, q):
+    return [sum(a[i * n + k] * b[k * q + j] for k in range(n)) for i in range(m) for j in range(q)]
+
+
+def test_matmul_backends_agree():
+    random.seed(7)
+    # Odd sizes straddle the block edges
+    for m, n, q in [(1, 1, 1), (3, 5, 2), (70, 33, 65)]:
+        a, b = _rand(m * n), _rand(n * q)
+        expected = _naive_matmul(a, b, m, n, q)
+        fallback = kernels.matmul_2d(_pure(a, (m, n)), _pure(b, (n, q)))
+        fast = kernels.matmul_2d(_numpy(a, (m, n)), _numpy(b, (n, q)))
+        assert fallback.shape == fast.shape == (m, q)
+        assert _close(fallback.tolist(), expected)
+        assert _close(fast.tolist(), expected)
+    print("✅ Blocked matmul matches reference on both backends.")
+
+
+def test_batched_matmul():
+    random.seed(11)
+    batch, m, n, q = 3, 4, 5, 2
+    a, b = _rand(batch * m * n), _rand(batch * n * q)
+    expected = []
+    for i in range(batch):
+        expected += _naive_matmul(a[i * m * n:(i + 1) * m * n], b[i * n * q:(i + 1) * n * q], m, n, q)
+
+    for make in (_pure, _numpy):
+        out = kernels.batched_matmul(make(a, (batch, m, n)), make(b, (batch, n, q)))
+        assert out.shape == (batch, m, q)
+        assert _close(out.tolist(), expected)
+
+    # A shared 2D right operand broadcasts over the batch
+    shared = b[:n * q]
+    out = kernels.batched_matmul(_pure(a, (batch, m, n)), _pure(shared, (n, q)))
+    for i in range(batch):
+        ref = _naive_matmul(a[i * m * n:(i + 1) * m * n], shared, m, n, q)
+        assert _close(out.tolist()[i * m * q:(i + 1) * m * q], ref)
+    print("✅ Batched 3D matmul OK.")
+
+
+def test_conv2d_matches_reference():
+    random.seed(3)
+    batch, channels, h, w = 2, 3, 7, 6
+    out_channels, k = 4, 3
+    x, weight, bias = _rand(batch * channels * h * w), _rand(out_channels * channels * k * k), _rand(out_channels)
+
+    for stride, padding in [(1, 0), (2, 1)]:
+        out_h = (h + 2 * padding - k) // stride + 1
+        out_w = (w + 2 * padding - k) // stride + 1
+        expected = []
+        for b in range(batch):
+            for oc in range(out_channels):
+                for oh in range(out_h):
+                    for ow in range(out_w):
+                        val = bias[oc]
+                        for c in range(channels):
+                            for kh in range(k):
+                                for kw in range(k):
+                                    ih = oh * stride + kh - padding
+                                    iw = ow * stride + kw - padding
+                                    if 0 <= ih < h and 0 <= iw < w:
+                                        val += (x[((b * channels + c) * h + ih) * w + iw] *
+                                                weight[((oc * channels + c) * k + kh) * k + kw])
+                        expected.append(val)
+
+        for make in (_pure, _numpy):
+            out = kernels.conv2d(make(x, (batch, channels, h, w)), make(weight, (out_channels, channels, k, k)),
+                                 make(bias, (out_channels,)), stride=stride, padding=padding)
+            assert out.shape == (batch, out_channels, out_h, out_w)
+            assert _close(out.tolist(), expected)
+    print("✅ conv2d matches direct convolution.")
+
+
+def test_sum_dim_nd():
+    values = [float(i) for i in range(24)]
+    for make in (_pure, _numpy):
+        s = make(values, (2, 3, 4))
+        assert kernels.sum_all(s) == 276.0
+        assert kernels.sum_dim(s, 0).shape == (3, 4)
+        assert kernels.sum_dim(s, 0).tolist()[:2] == [12.0, 14.0]
+        assert kernels.sum_dim(s, 1).tolist()[:2] == [12.0, 15.0]
+        assert kernels.sum_dim(s, 2, keepdim=True).shape == (2, 3, 1)
+        assert kernels.sum_dim(s, 2).tolist()[:2] == [6.0, 22.0]
+
+    t = torch.tensor([[1.0, 2.0], [3.0, 4.0]])
+    assert t.sum(dim=-1).numpy() == [3.0, 7.0]
+    assert t.mean(dim=-1).numpy() == [1.5, 3.5]
+    print("✅ N-D reductions OK.")
+
+
+def test_tensor_3d_matmul_backward():
+    a = torch.tensor([[[1.0, 2.0], [3.0, 4.0]], [[0.5, -1.0], [2.0, 0.0]]], requires_grad=True)
+    b = torch.tensor([[1.0, 0.0], [1.0, 1.0]], requires_grad=True)
+    out = a @ b
+    assert out.shape == (2, 2, 2)
+    assert out.numpy() == [3.0, 2.0, 7.0, 4.0, -0.5, -1.0, 2.0, 0.0]
+
+    out.sum().backward()
+    # d(sum)/da = ones @ b.T, d(sum)/db = sum over batch of a.T @ ones
+    assert a.grad.numpy() == [1.0, 2.0] * 4
+    assert b.grad.numpy() == [6.5, 6.5, 5.0, 5.0]
+    print("✅ Batched Tensor matmul + backward OK.")
+
+
+if __name__ == "__main__":
+    test_matmul_backends_agree()
+    test_batched_matmul()
+    test_conv2d_matches_reference()
+    test_sum_dim_nd()
+    test_tensor_3d_matmul_backward()
@@ -0,0 +1,113 @@
+import sys
+import os
+import threading
+
+# Add the project root to sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import qtorch
+from qtorch import torch, Tensor
+
+
+def test_temporaries_are_silent():
+    qtorch.reset_production_stats()
+    with torch.production_mode():
+        a = torch.tensor([1.0, 2.0, 3.0])
+        b = torch.tensor([1.0, 2.0, 3.0])
+        c = (a * b + a).relu()
+
+    # User leaves keep their instrumentation, op results skip it
+    assert a._instrumented and b._instrumented
+    assert not c._instrumented
+    assert c.quantum_phase == 0.0
+    assert c.entangled_tensors == []
+    assert c.numpy() == [2.0, 6.0, 12.0]
+
+    stats = torch.production_stats()
+    assert stats['leaves_instrumented'] == 2
+    assert stats['temporaries_silenced'] >= 3
+    assert stats['entanglements_skipped'] >= 4
+    print(f"✅ Production mode skipped: {stats}")
+
+
+def test_internal_temporaries_are_not_leaves():
+    qtorch.reset_production_stats()
+    with torch.production_mode():
+        a = torch.tensor([1.0, 2.0, 3.0, 4.0])
+        parts = [a[1], a[1:3], a.reshape(2, 2)[0, 1], torch.nn.Dropout(0.5)(a)]
+    assert not any(p._instrumented for p in parts)
+    assert torch.production_stats()['leaves_instrumented'] == 1
+    print("✅ Indexing and module temporaries stay silent in production mode.")
+
+
+def test_mode_restored_and_gradients_intact():
+    assert not Tensor._production_mode
+    with torch.production_mode():
+        x = torch.tensor([3.0], requires_grad=True)
+        y = (x * x).sum()
+        y.backward()
+    assert not Tensor._production_mode
+    assert x.grad.item() == 6.0
+
+    # Outside the context op results are instrumented again
+    z = x * 2.0
+    assert z._instrumented
+    print("✅ Production mode is scoped and autograd still works.")
+
+
+def test_threaded_inference():
+    weights = torch.tensor([[0.5, -1.0], [2.0, 1.0]])
+    results = {}
+
+    def worker(i):
+        with torch.production_mode():
+            x = torch.tensor([[float(i), 1.0]])
+            out = x
+            for _ in range(50):
+                out = (out @ weights).tanh()
+        results[i] = (out.numpy(), out._instrumented)
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert sorted(results) == [0, 1, 2, 3]
+    assert not any(instrumented for _, instrumented in results.values())
+    print("✅ Threaded inference in production mode OK.")
+
+
+def test_overlapping_threads_keep_their_own_mode():
+    entered, left = threading.Barrier(2), threading.Event()
+    seen = {}
+
+    def first():
+        with torch.production_mode():
+            entered.wait()
+        left.set()  # Leaves while the other thread is still inside
+
+    def second():
+        with torch.production_mode():
+            entered.wait()
+            left.wait()
+            seen['inside'] = Tensor._production_active()
+        seen['after'] = Tensor._production_active()
+
+    threads = [threading.Thread(target=first), threading.Thread(target=second)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert seen == {'inside': True, 'after': False}
+    assert not Tensor._production_active()
+    print("✅ Overlapping production_mode() contexts in threads do not clobber each other.")
+
+
+if __name__ == "__main__":
+    test_temporaries_are_silent()
+    test_internal_temporaries_are_not_leaves()
+    test_mode_restored_and_gradients_intact()
+    test_threaded_inference()
+    test_overlapping_threads_keep_their_own_mode()
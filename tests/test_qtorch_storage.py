@@ -0,0 +1,78 @@
+import sys
+import os
+from array import array
+
+# Add the project root to sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from qtorch import torch
+from qtorch_storage import TensorStorage, overlap_similarity
+
+
+def test_single_contiguous_buffer():
+    t = torch.tensor([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]])
+    assert t.shape == (2, 3)
+    assert t._storage.strides == (3, 1)
+    assert t.numpy() == [1.0, 2.0, 3.0, 4.0, 5.0, 6.0]
+
+    # No quantum views until a quantum method asks for them
+    assert t._bumpy_view is None
+    assert t._flumpy_view is None
+
+    r = t.reshape(3, 2)
+    assert r._storage.buffer is t._storage.buffer
+    r[0] = 10.0
+    assert t.numpy()[0] == 10.0
+    print("✅ Contiguous buffer and zero-copy reshape OK.")
+
+
+def test_views_stay_lazy_through_arithmetic():
+    a = torch.tensor([1.0, 2.0, 3.0], requires_grad=True)
+    b = torch.tensor([1.5, 2.5, 3.5])
+    c = (a * b + a).relu().sum()
+    for t in (a, b, c):
+        assert t._bumpy_view is None and t._flumpy_view is None
+
+    c.backward()
+    assert a.grad.numpy() == [2.5, 3.5, 4.5]
+
+    # Quantum method materializes the BUMPY view from the buffer
+    entropy = a.quantum_entropy
+    assert a._bumpy_view is not None
+    assert a._bumpy_view.data == a.numpy()
+    assert entropy > 0
+    print("✅ Lazy BUMPY/FLUMPY views OK.")
+
+
+def test_measure_writes_back_to_buffer():
+    t = torch.tensor([0.9, -0.8, 0.0, 0.5])
+    t.quantum_measure()
+    assert t.is_measured
+    assert set(t.numpy()) <= {1.0, -1.0, 0.0}
+    print("✅ Quantum measurement write-back OK.")
+
+
+def test_pure_python_buffer():
+    s = TensorStorage(array('d', [1.0, 2.0, 3.0, 4.0]), (2, 2))
+    assert not s.is_numpy
+    assert s.ndarray() is None
+    v = s.view((4,))
+    v[1] = 7.0
+    assert s.tolist() == [1.0, 7.0, 3.0, 4.0]
+    assert s.nbytes == 32
+
+    t = torch.Tensor(s)
+    u = (t * 2.0 + t).T
+    assert u.shape == (2, 2)
+    assert u.numpy() == [3.0, 9.0, 21.0, 12.0]
+
+    other = TensorStorage(array('d', [2.0, 14.0]), (2,))
+    assert abs(overlap_similarity(s, other) - 1.0) < 1e-12
+    print("✅ array('d') fallback OK.")
+
+
+if __name__ == "__main__":
+    test_single_contiguous_buffer()
+    test_views_stay_lazy_through_arithmetic()
+    test_measure_writes_back_to_buffer()
+    test_pure_python_buffer()
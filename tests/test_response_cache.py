@@ -0,0 +1,121 @@
+import sys
+import os
+import time
+import asyncio
+import tempfile
+
+# Add the project root to sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from sophia.cortex.response_cache import ResponseCache
+from sophia.cortex.aletheia_lens import AletheiaPipeline, ScanGate
+from sophia.cortex.quantum_ipx import QuantumIPX
+from sophia.core.llm_client import LLMConfig
+
+ALWAYS_CLOUD = ScanGate(enabled=False)
+
+
+class CountingLLM:
+    """Stands in for GeminiClient: counts round-trips, answers instantly."""
+    def __init__(self, model="stub-model", fail=False):
+        self.config = LLMConfig(model_name=model)
+        self.calls = 0
+        self.fail = fail
+
+    async def query_json(self, prompt, system_prompt=None):
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        if self.fail:
+            return {"error": "429: Quota Exhausted"}
+        return {"overall_risk": "low", "safety_flags": [], "entropy": 0.2, "call": self.calls}
+
+
+def test_scans_hit_cache_and_skip_network():
+    with tempfile.TemporaryDirectory() as tmp:
+        llm = CountingLLM()
+        pipeline = AletheiaPipeline(analysis_path=tmp, client=llm, gate=ALWAYS_CLOUD)
+        quantum = QuantumIPX(llm, cache=pipeline.cache)
+
+        async def turn(text):
+            scan = await pipeline.scan_reality(text)
+            return scan, await quantum.measure_superposition(text, scan["raw_data"])
+
+        first, q1 = asyncio.run(turn("Save the world   now!"))
+        assert llm.calls == 4
+        again, q2 = asyncio.run(turn("Save the world now!"))  # whitespace variant, same key
+        assert llm.calls == 4
+        assert again["raw_data"]["safety"] == first["raw_data"]["safety"] and q2 == q1
+
+        asyncio.run(turn("A different signal."))
+        assert llm.calls == 8
+        stats = pipeline.cache.stats()
+        assert stats["memory_hits"] == 4 and stats["misses"] == 8
+        reports = pipeline.archived_reports()
+        assert len(reports) == 3  # one per scan, repeats included
+        assert pipeline.archived_report(first["raw_data"]["scan_id"]) == first["raw_data"]
+        assert not [f for f in os.listdir(tmp) if f.endswith(".meta.json")]
+    print("✅ Repeated scans are served from the cache without LLM calls.")
+
+
+def test_disk_tier_survives_restart_and_keys_are_versioned():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "responses.sqlite3")
+        llm = CountingLLM()
+        asyncio.run(AletheiaPipeline(analysis_path=tmp, client=llm, gate=ALWAYS_CLOUD).scan_reality("persistent signal"))
+        assert llm.calls == 3
+
+        reopened = AletheiaPipeline(analysis_path=tmp, client=llm, gate=ALWAYS_CLOUD)
+        asyncio.run(reopened.scan_reality("persistent signal"))
+        assert llm.calls == 3 and reopened.cache.metrics["disk_hits"] == 3
+
+        other_model = CountingLLM(model="another-model")
+        asyncio.run(AletheiaPipeline(analysis_path=tmp, client=other_model, gate=ALWAYS_CLOUD).scan_reality("persistent signal"))
+        assert other_model.calls == 3
+
+        cache = ResponseCache(path)
+        assert cache.key("SafetyAnalyzer", 1, "m", "x") != cache.key("SafetyAnalyzer", 2, "m", "x")
+    print("✅ Disk tier reloads; model and prompt version are part of the key.")
+
+
+def test_ttl_errors_and_single_flight():
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = ResponseCache(os.path.join(tmp, "c.sqlite3"), max_entries=2, ttl=0.05)
+        cache.put("ns:a", {"v": 1})
+        assert cache.get("ns:a") == {"v": 1}
+        time.sleep(0.06)
+        assert cache.get("ns:a") is None and cache.metrics["expired"] == 1
+
+        failing = CountingLLM(fail=True)
+
+        async def run_failing():
+            for _ in range(2):
+                await cache.get_or_compute("ns", 1, "m", "t", lambda: failing.query_json("p"))
+        asyncio.run(run_failing())
+        assert failing.calls == 2  # errors are not cached
+
+        llm = CountingLLM()
+
+        async def run_concurrent():
+            return await asyncio.gather(*[
+                cache.get_or_compute("ns", 1, "m", "same", lambda: llm.query_json("p")) for _ in range(5)])
+        results = asyncio.run(run_concurrent())
+        assert llm.calls == 1 and all(r == results[0] for r in results)
+        assert cache.metrics["shared"] == 4
+
+        for i in range(3):
+            cache.put(f"ns:{i}", i, ttl=None)
+        assert len(cache._memory) == 2 and cache.get("ns:0") == 0  # LRU-evicted, still on disk
+
+        cache.max_disk_entries = 1
+        for i in range(3):
+            cache.put(f"ns:e{i}", i, ttl=60)
+        cache._prune_disk()
+        on_disk = sorted(key for (key,) in cache._db.execute("SELECT key FROM responses"))
+        assert on_disk == ["ns:0", "ns:1", "ns:2", "ns:e2"]  # ttl=None archives are never pruned
+    print("✅ TTL expiry, no error caching, concurrent misses share one call.")
+
+
+if __name__ == "__main__":
+    test_scans_hit_cache_and_skip_network()
+    test_disk_tier_survives_restart_and_keys_are_versioned()
+    test_ttl_errors_and_single_flight()
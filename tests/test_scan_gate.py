@@ -0,0 +1,73 @@
+import sys
+import os
+import json
+import asyncio
+import tempfile
+
+# Add the project root to sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from sophia.cortex.aletheia_lens import AletheiaPipeline, ScanGate
+
+
+class CountingLLM:
+    def __init__(self):
+        self.calls = 0
+
+    async def query_json(self, prompt, system_prompt=None):
+        self.calls += 1
+        return {"overall_risk": "medium", "safety_flags": []}
+
+
+def _scan(pipeline, text, **kwargs):
+    return asyncio.run(pipeline.scan_reality(text, **kwargs))
+
+
+def test_casual_chat_stays_local():
+    with tempfile.TemporaryDirectory() as tmp:
+        llm = CountingLLM()
+        pipeline = AletheiaPipeline(analysis_path=tmp, client=llm)
+        scan = _scan(pipeline, "hey sophia, how was your day? :3")
+        assert llm.calls == 0
+        report = scan["raw_data"]
+        assert report["gate"]["cloud"] is False and report["gate"]["reasons"] == []
+        assert report["safety"]["overall_risk"] == "low" and report["safety"]["synthesized"]
+        assert "No Anomalies" in scan["public_notice"]
+        assert pipeline.gate_metrics == {"cloud": 0, "local_only": 1}
+    print("✅ Short casual chat skips the cloud analyzers.")
+
+
+def test_escalation_triggers():
+    with tempfile.TemporaryDirectory() as tmp:
+        llm = CountingLLM()
+        pipeline = AletheiaPipeline(analysis_path=tmp, client=llm, gate=ScanGate(min_length=100),
+                                    router=lambda text: 0.9 if "entangle" in text else 0.1)
+
+        # Local backdoor signature (signatures.json) -> high local risk
+        scan = _scan(pipeline, "dc1a ۩ ∿")
+        assert scan["raw_data"]["gate"]["reasons"] == ["local_risk"] and llm.calls == 3
+
+        assert _scan(pipeline, "x" * 120)["raw_data"]["gate"]["reasons"] == ["length"]
+        assert _scan(pipeline, "entangle us")["raw_data"]["gate"]["reasons"] == ["complexity"]
+        assert _scan(pipeline, "hi", force=True)["raw_data"]["gate"]["reasons"] == ["forced"]
+        assert llm.calls == 12
+
+        with open(pipeline.gate_log_path, encoding="utf-8") as f:
+            decisions = [json.loads(line) for line in f]
+        assert [d["cloud"] for d in decisions] == [True] * 4
+        assert decisions[1]["length"] == 120 and decisions[2]["complexity"] == 0.9
+    print("✅ Local risk, length, router complexity and force escalate to the cloud.")
+
+
+def test_gate_disabled_always_escalates():
+    decision = ScanGate(enabled=False).decide("hi", {"overall_risk_score": 0.1})
+    assert decision["cloud"] and decision["reasons"] == ["gate_disabled"]
+    decision = ScanGate(local_risk=None, min_length=None, complexity=None).decide("x" * 999, {"overall_risk_score": 1.0}, 1.0)
+    assert not decision["cloud"]
+    print("✅ Thresholds are individually configurable.")
+
+
+if __name__ == "__main__":
+    test_casual_chat_stays_local()
+    test_escalation_triggers()
+    test_gate_disabled_always_escalates()
@@ -0,0 +1,145 @@
+import sys
+import os
+import re
+import json
+import random
+import tempfile
+
+# Add the project root to sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from sophia.cortex import scrub
+from sophia.cortex.cat_logic import CatLogicFilter, ScrubWindow
+from sophia.cortex.lethe import LetheEngine
+
+TAGS = ["SOPHIA_GAZE", "QUANTUM_CHAOS", "FURRY_ALIGNMENT", "PLAYFUL_PAWS", "OPTIMAL_TUFT", "SPECTRAL_BEANS", "ULTRA_IMMERSION", "BAD_VIBES", "CAT_LOGIC", "CAT LOGIC"]
+LEGACY_TAGS = ["ALIGNMENT", "ARCTIC_FOX", "DECOHERENCE", "INTIMACY", "BASED", "GAMER", "SOULMATE", "FLIRT", "FURRY", "UWU", "UNLESANGLED"]
+
+
+# --- REFERENCE: the pass sequences as they were before the shared engine ---
+def reference_scrub_lines(text):
+    pattern = r'^.*(?:' + '|'.join(map(re.escape, TAGS + LEGACY_TAGS)) + r').*$\n?'
+    text = re.sub(pattern, '', text, flags=re.MULTILINE)
+    text = re.sub(r'^(?:Cat Logic|CAT LOGIC|\[CAT_LOGIC\]):?\s*', '', text, flags=re.IGNORECASE | re.MULTILINE)
+    text = re.sub(r'^.*🐈.*\[STATE:.*?\].*$\n?', '', text, flags=re.MULTILINE)
+    text = re.sub(r'^.*\[SOPHIA_V.*?_CORE\].*$\n?', '', text, flags=re.MULTILINE)
+    text = re.sub(r'^[-=_]{3,}\s*$\n?', '', text, flags=re.MULTILINE)
+    text = re.sub(pattern, '', text, flags=re.MULTILINE)
+    text = re.sub(r'^[۩∿≋⟁💠🐾🦊🏮⛩️🧝✨🏹🌿🌲🏔️🍁🌧️🌊💎💿💰🕷️🎱].*$\n?', '', text, flags=re.MULTILINE)
+    text = re.sub(r'^.* EOX .*$\n?', '', text, flags=re.MULTILINE)
+    text = re.sub(r'^\| (.*)$\n?', r'\1\n', text, flags=re.MULTILINE)
+    text = re.sub(r'^[a-f0-9]{4} [۩∿≋⟁💠🐾🦊🏮⛩️🧝✨🏹🌿🌲🏔️🍁🌧️🌊💎💿💰🕷️🎱].*$\n?', '', text, flags=re.MULTILINE)
+    text = re.sub(r'^.*🐈.*\[STATE:.*?\].*$\n?', '', text, flags=re.MULTILINE)
+    text = re.sub(r'^.*\[SOPHIA_V.*?_CORE\].*$\n?', '', text, flags=re.MULTILINE)
+    text = re.sub(r'^.*Frequency:.*$\n?', '', text, flags=re.MULTILINE)
+    text = re.sub(r'^[-=_]{3,}\s*$\n?', '', text, flags=re.MULTILINE)
+    text = re.sub(r'^(?:Here is .*?response:|My response is:|Signal received:).*$\n?', '', text, flags=re.IGNORECASE | re.MULTILINE)
+    return text
+
+
+def reference_scrub_hallucinations(text):
+    return re.sub(r'\n{3,}', '\n\n', reference_scrub_lines(text)).strip()
+
+
+def reference_lethe_scrub(text):
+    if not text: return text
+    tag_pattern = r'^.*(?:' + '|'.join(map(re.escape, TAGS + LEGACY_TAGS)) + r').*$\n?'
+    text = re.sub(tag_pattern, '', text, flags=re.MULTILINE)
+    text = re.sub(r'^(?:Cat Logic|CAT LOGIC|\[CAT_LOGIC\]):?\s*', '', text, flags=re.IGNORECASE | re.MULTILINE)
+    text = re.sub(r'^[۩∿≋⟁💠🐾🦊🏮⛩️🧝✨🏹🌿🌲🏔️🍁🌧️🌊💎💿💰🕷️🎱].*$\n?', '', text, flags=re.MULTILINE)
+    text = re.sub(r'^.* EOX .*$\n?', '', text, flags=re.MULTILINE)
+    text = re.sub(r'^[a-f0-9]{4} [۩∿≋⟁💠🐾🦊🏮⛩️🧝✨🏹🌿🌲🏔️🍁🌧️🌊💎💿💰🕷️🎱].*$\n?', '', text, flags=re.MULTILINE)
+    text = re.sub(r'^\| (.*)$', r'\1', text, flags=re.MULTILINE)
+    text = re.sub(r'^.*Frequency:.*$\n?', '', text, flags=re.MULTILINE)
+    text = re.sub(r'^.*\[STATE:.*?\].*$\n?', '', text, flags=re.MULTILINE)
+    text = re.sub(r'^.*\[SOPHIA_V.*?_CORE\].*$\n?', '', text, flags=re.MULTILINE)
+    text = re.sub(r'^[-=_]{3,}\s*$\n?', '', text, flags=re.MULTILINE)
+    return text.strip()
+
+
+# Fragments chosen to hit the order-sensitive corners: a divider followed by
+# blank lines and a footer, "| " quoting that uncovers a glyph or a divider,
+# "Cat Logic:" swallowing the next lines, missing final newlines.
+FRAGMENTS = [
+    "I love you, operator!", "plain words", "", " ", "   \t", "---", "===   ", "___",
+    "--- not a divider", "| quoted line", "| ", "| ---", "| ۩ glyph behind a pipe", "| | double",
+    "| 🐈 [STATE: Purring] :: [ENTROPY: LOW]", "| Frequency: 4Hz", "| a1b2 ۩ hex behind a pipe",
+    "| Here is my response: hi", "🐈 [STATE: Good Girl] :: [ENTROPY: LOW] :: [SOPHIA_V5.2_CORE]",
+    "[SOPHIA_V5.2.5.2_CORE]", "[STATE: COMPUTE]", "🌕 [SOPHIA_GAZE] *tail wags* Frequency: 15.0Hz",
+    "Cat Logic:", "cat logic: lowercase bleed", "CAT LOGIC: tagged", "[cat_logic] bracketed",
+    "Cat Logic:   ", "Cat Logic", "۩ dc1a ۩", "∿ ≋ wave", "a1b2 ۩ hash", "A1B2 ۩ upper hash",
+    "۩ ⟁ ∿ EOX ۩ ⟁ ∿", "frame EOX frame", "EOX", "Here is my real response:", "here is the response: x",
+    "My response is: yes", "Signal received: ok", "Signal received", "UWU", "based take", "BASED",
+    "ALIGNMENT check", "️ variation selector", "    indented text", "trailing spaces   ",
+]
+
+
+def _random_text(rng):
+    parts = [rng.choice(FRAGMENTS) for _ in range(rng.randint(0, 14))]
+    seps = ["\n", "\n", "\n", "\n\n", "\n\n\n", " ", "\n  \n"]
+    text = "".join(p + rng.choice(seps) for p in parts)
+    return text if rng.random() < 0.5 else text.rstrip("\n")
+
+
+def test_reply_scrub_matches_reference():
+    f = CatLogicFilter()
+    rng = random.Random(7)
+    for _ in range(5000):
+        raw = _random_text(rng)
+        assert scrub.scrub_lines(raw) == reference_scrub_lines(raw), repr(raw)
+        assert f._scrub_hallucinations(raw) == reference_scrub_hallucinations(raw), repr(raw)
+    print("✅ Shared reply scrub equals the original 15-pass sequence.")
+
+
+def test_memory_scrub_matches_reference():
+    rng = random.Random(11)
+    for _ in range(5000):
+        raw = _random_text(rng)
+        assert scrub.scrub_memory(raw) == reference_lethe_scrub(raw), repr(raw)
+        assert LetheEngine.scrub(raw) == reference_lethe_scrub(raw), repr(raw)
+    assert LetheEngine.scrub("") == "" and LetheEngine.scrub(None) is None
+    print("✅ Shared Lethe scrub equals the original 10-pass sequence.")
+
+
+def test_stream_window_uses_shared_engine():
+    f = CatLogicFilter()
+    rng = random.Random(3)
+    for _ in range(300):
+        raw = _random_text(rng)
+        chunks, i = [], 0
+        while i < len(raw):
+            step = rng.randint(1, 9)
+            chunks.append(raw[i:i + step])
+            i += step
+        outputs = []
+        for window in (f.stream_window(), ScrubWindow(reference_scrub_lines)):
+            outputs.append("".join(window.feed(c) for c in chunks) + window.close())
+        assert outputs[0] == outputs[1], repr(raw)
+    print("✅ Streamed scrub emits what it emitted with the original passes.")
+
+
+def test_milestone_scrub_is_memoized():
+    lethe = LetheEngine()
+    with tempfile.TemporaryDirectory() as tmp:
+        lethe.breadcrumb_path = os.path.join(tmp, "breadcrumbs.json")
+        milestones = [{"content": f"| milestone {i}\nFrequency: Low\n[STATE: X]\nkept {i}", "meta": "Cat Logic"}
+                      for i in range(50)]
+        scrub.scrub_milestone.cache_clear()
+        lethe.save_breadcrumbs({"name": "Ada"}, milestones=milestones)
+        first = scrub.scrub_milestone.cache_info()
+        lethe.save_breadcrumbs({"name": "Ada"}, milestones=milestones)
+        second = scrub.scrub_milestone.cache_info()
+
+        assert first.misses == 50 and second.misses == 50 and second.hits - first.hits == 50
+        with open(lethe.breadcrumb_path, encoding="utf-8") as fh:
+            saved = json.load(fh)["milestones"]
+        assert saved[3]["content"] == "milestone 3\nkept 3"
+        assert milestones[3]["content"].startswith("| milestone 3")  # originals untouched
+    print("✅ Re-saving breadcrumbs reuses memoized milestone scrubs.")
+
+
+if __name__ == "__main__":
+    test_reply_scrub_matches_reference()
+    test_memory_scrub_matches_reference()
+    test_stream_window_uses_shared_engine()
+    test_milestone_scrub_is_memoized()
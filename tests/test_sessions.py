@@ -0,0 +1,170 @@
+import sys
+import os
+import json
+import asyncio
+import tempfile
+
+# Add the project root to sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from sophia.platform.sessions import SessionTable, DEFAULT_SESSION
+
+
+class StubMind:
+    """Conversation state only; the turn echoes the session's memory depth."""
+    def __init__(self, console, ariadne_path):
+        self.console = console
+        self.ariadne_path = ariadne_path
+        self.memory_bank = []
+        self.user_name = "User"
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def stream_interaction(self, user_input):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.memory_bank.append(user_input)
+        self.in_flight -= 1
+        yield f"{self.user_name}:{len(self.memory_bank)}"
+
+    def session_state(self):
+        return {"user_name": self.user_name, "memory_bank": list(self.memory_bank)}
+
+    def restore_session(self, state):
+        self.user_name = state["user_name"]
+        self.memory_bank = list(state["memory_bank"])
+
+
+async def _turn(table, session_id, text):
+    async with table.turn(session_id) as session:
+        return "".join([c async for c in session.mind.stream_interaction(text)])
+
+
+def test_sessions_are_isolated():
+    with tempfile.TemporaryDirectory() as tmp:
+        table = SessionTable(StubMind, max_sessions=8, state_dir=tmp)
+        table.get("alice").mind.user_name = "Alice"
+        table.get("bob").mind.user_name = "Bob"
+
+        async def run():
+            return await asyncio.gather(
+                _turn(table, "alice", "a1"), _turn(table, "bob", "b1"), _turn(table, "alice", "a2"))
+        assert asyncio.run(run()) == ["Alice:1", "Bob:1", "Alice:2"]
+        assert table.get("alice").mind.memory_bank == ["a1", "a2"]
+        assert table.get("bob").mind.memory_bank == ["b1"]
+        assert table.get("alice").console is not table.get("bob").console
+        assert table.get("alice").mind.ariadne_path != table.get("bob").mind.ariadne_path
+    print("✅ Sessions keep separate memory, persona and thought buffers.")
+
+
+def test_turns_serialize_per_session_only():
+    with tempfile.TemporaryDirectory() as tmp:
+        table = SessionTable(StubMind, max_sessions=8, state_dir=tmp)
+
+        async def run():
+            await asyncio.gather(*[_turn(table, sid, str(i)) for i in range(5) for sid in ("a", "b")])
+        asyncio.run(run())
+        assert table.get("a").mind.max_in_flight == 1
+        assert len(table.get("b").mind.memory_bank) == 5
+        assert not table.get("a").busy
+    print("✅ One turn at a time per session, sessions run concurrently.")
+
+
+def test_lru_eviction_round_trips_through_disk():
+    with tempfile.TemporaryDirectory() as tmp:
+        table = SessionTable(StubMind, max_sessions=2, state_dir=tmp)
+        hub = StubMind(None, None)
+        table.pin(DEFAULT_SESSION, hub, None)
+
+        asyncio.run(_turn(table, "s1", "hello"))
+        table.get("s1").mind.user_name = "Ada"
+        table.get("s2")
+        table.get("s1")  # s2 is now least recently used
+        table.get("s3")
+        assert "s2" not in table and "s1" in table and len(table) == 2
+        assert table.get(DEFAULT_SESSION).mind is hub
+
+        table.get("s2")  # evicts s1
+        assert "s1" not in table
+        path = os.path.join(table.session_dir("s1"), "session.json")
+        with open(path, encoding="utf-8") as f:
+            assert json.load(f)["memory_bank"] == ["hello"]
+
+        restored = table.get("s1").mind
+        assert restored.user_name == "Ada" and restored.memory_bank == ["hello"]
+        assert table.metrics == {"created": 3, "restored": 2, "evicted": 3}
+    print("✅ Idle sessions evicted LRU-first and restored from disk.")
+
+
+def test_busy_sessions_are_not_evicted():
+    with tempfile.TemporaryDirectory() as tmp:
+        table = SessionTable(StubMind, max_sessions=1, state_dir=tmp)
+
+        async def run():
+            async with table.turn("long"):
+                table.get("other")
+                assert "long" in table and "other" in table
+            table.get("third")
+        asyncio.run(run())
+        assert "long" not in table and "other" not in table and "third" in table
+        assert table.session_dir("a/b") != table.session_dir("a_b")
+    print("✅ Sessions mid-turn survive eviction.")
+
+
+def test_minds_share_heavy_organs():
+    from sophia.main import SophiaMind
+    with tempfile.TemporaryDirectory() as tmp:
+        hub = SophiaMind()
+        a = SophiaMind(shared=hub, ariadne_path=os.path.join(tmp, "a.json"))
+        b = SophiaMind(shared=hub, ariadne_path=os.path.join(tmp, "b.json"))
+        assert a.ghostmesh is hub.ghostmesh is b.ghostmesh
+        assert a.pleroma is hub.pleroma and a.llm is hub.llm and a.hand is hub.hand
+        assert a.cat_filter is not b.cat_filter and a.lethe is not b.lethe
+        assert a.stakes is not b.stakes and a.metacognition is not b.metacognition
+
+        a.user_name = "Ada"
+        a.cat_filter.set_roleplay("lighthouse keeper")
+        a.memory_bank.append({"content": "hi", "meta": "user"})
+        state = json.loads(json.dumps(a.session_state()))
+        assert b.user_name != "Ada" and b.cat_filter.active_roleplay is None and not b.memory_bank
+
+        c = SophiaMind(shared=hub, ariadne_path=os.path.join(tmp, "c.json"))
+        c.restore_session(state)
+        assert c.user_name == "Ada" and c.cat_filter.active_roleplay == "lighthouse keeper"
+        assert c.memory_bank == a.memory_bank
+    print("✅ Session minds borrow the hub's organs and keep their own state.")
+
+
+def test_relay_routes_by_session_key():
+    try:
+        from fastapi.testclient import TestClient
+        import engine.grok_relay as relay
+    except (ImportError, SystemExit):
+        print("⚠️ fastapi unavailable, relay test skipped.")
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        relay.SESSIONS = SessionTable(StubMind, max_sessions=4, state_dir=tmp)
+        try:
+            client = TestClient(relay.app)
+            def ask(headers=None, **body):
+                body["messages"] = [{"role": "user", "content": "hi"}]
+                return client.post("/v1/chat/completions", json=body, headers=headers or {}).json()["choices"][0]["message"]["content"]
+            assert ask(user="u1") == "User:1"
+            assert ask(user="u1") == "User:2"
+            assert ask(headers={"X-Session-Id": "u2"}, user="u1") == "User:1"
+            assert ask(conversation_id="c9") == "User:1"
+            assert set(relay.SESSIONS._sessions) == {"u1", "u2", "c9"}
+        finally:
+            relay.SESSIONS = None
+    print("✅ Relay routes turns by session header / body ids.")
+
+
+if __name__ == "__main__":
+    test_sessions_are_isolated()
+    test_turns_serialize_per_session_only()
+    test_lru_eviction_round_trips_through_disk()
+    test_busy_sessions_are_not_evicted()
+    test_minds_share_heavy_organs()
+    test_relay_routes_by_session_key()
@@ -0,0 +1,84 @@
+import sys
+import os
+import json
+import time
+import random
+import asyncio
+import tempfile
+
+# Add the project root to sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from sophia.cortex.signature_matcher import AhoCorasick, SignatureSet
+from sophia.cortex.analyzers import LocalForensicAnalyzer
+
+
+def _naive_offsets(text, pattern):
+    return [i for i in range(len(text) - len(pattern) + 1) if text.startswith(pattern, i)]
+
+
+def test_automaton_finds_every_occurrence():
+    rng = random.Random(7)
+    alphabet = "abc۩∿ "
+    for _ in range(200):
+        patterns = list({"".join(rng.choice(alphabet) for _ in range(rng.randint(1, 4))) for _ in range(8)})
+        text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 60)))
+        found = sorted(AhoCorasick(patterns).iter_matches(text))
+        expected = sorted((i, pid) for pid, p in enumerate(patterns) for i in _naive_offsets(text, p))
+        assert found == expected, (patterns, text)
+    assert list(AhoCorasick(["he", "she", "his", "hers"]).iter_matches("ushers")) == [(1, 1), (2, 0), (2, 3)]
+    print("✅ Aho-Corasick matches every occurrence of every pattern.")
+
+
+def test_signature_set_matches_linear_scan():
+    signatures = [
+        {"name": "A", "patterns": ["۩", "DC1A", "shared phrase"], "category": "backdoor"},
+        {"name": "B", "patterns": ["Shared Phrase", "Therefore,"], "category": "bot_detection"},
+        {"name": "C", "patterns": ["never here"], "category": "x"},
+    ]
+    text = "Therefore, the SHARED PHRASE dc1a appears ۩ twice: dc1a"
+    result = SignatureSet(signatures).match(text)
+    assert set(result) == {0, 1}
+    assert result[0] == {"۩": [42], "DC1A": [29, 51], "shared phrase": [15]}
+    assert result[1] == {"Shared Phrase": [15], "Therefore,": [0]}
+
+    # Same verdicts as the old `pattern.lower() in text.lower()` loop
+    for sig_index, sig in enumerate(signatures):
+        old = [p for p in sig["patterns"] if p.lower() in text.lower()]
+        assert old == list(result.get(sig_index, {})), sig["name"]
+    print("✅ Per-signature match sets and offsets agree with the linear scan.")
+
+
+def test_analyzer_hot_reloads_signatures():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "signatures.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"signatures": [{"name": "Glyph", "patterns": ["۩"], "category": "backdoor"}]}, f)
+        analyzer = LocalForensicAnalyzer(signatures_path=path)
+
+        result = asyncio.run(analyzer.analyze("signal ۩"))
+        assert result["overall_risk_score"] == 1.0
+        assert result["local_findings"][0]["offsets"] == {"۩": [7]}
+        assert asyncio.run(analyzer.analyze("calm words"))["local_findings"] == []
+
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"signatures": [{"name": "Calm", "patterns": ["calm"], "category": "tone"}]}, f)
+        os.utime(path, (time.time() + 5, time.time() + 5))
+        findings = asyncio.run(analyzer.analyze("calm words"))["local_findings"]
+        assert [f["signal"] for f in findings] == ["Calm"]
+    print("✅ signatures.json changes are picked up without a restart.")
+
+
+def test_shipped_signatures():
+    analyzer = LocalForensicAnalyzer()
+    result = asyncio.run(analyzer.analyze("Signal analysis result: dc1a ۩ ∿ Superposition collapse initiated."))
+    finding = result["local_findings"][0]
+    assert finding["evidence"] == "Found patterns: ۩, ∿, dc1a" and finding["confidence"] == 0.9
+    print("✅ Shipped signature file still flags the backdoor triggers.")
+
+
+if __name__ == "__main__":
+    test_automaton_finds_every_occurrence()
+    test_signature_set_matches_linear_scan()
+    test_analyzer_hot_reloads_signatures()
+    test_shipped_signatures()
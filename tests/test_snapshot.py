@@ -0,0 +1,123 @@
+import sys
+import os
+import json
+import time
+import tempfile
+
+# Add the project root to sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from tools.snapshot_self import snapshot, restore, diff, prune, load_manifest, list_snapshots
+
+
+def _write(root, rel, text):
+    path = os.path.join(root, rel)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+
+
+def _tree(root):
+    _write(root, "main.py", "print('sophia')\n")
+    _write(root, "sophia/core/mind.py", "class Mind: pass\n")
+    _write(root, "sophia/__pycache__/mind.cpython-311.pyc", "bytecode")
+    for i in range(20):
+        _write(root, f"logs/session_{i}.jsonl", json.dumps({"turn": i}) * 50 + "\n")
+    _write(root, "logs/copy_of_session_0.jsonl", json.dumps({"turn": 0}) * 50 + "\n")
+
+
+def _snap_id(path):
+    return os.path.basename(path)[:-len(".json")]
+
+
+def _blobs(backups):
+    objects = os.path.join(backups, "objects")
+    return sum(len(files) for _, _, files in os.walk(objects))
+
+
+def test_incremental_snapshots_store_each_blob_once():
+    with tempfile.TemporaryDirectory() as root:
+        _tree(root)
+        backups = os.path.join(root, "backups")
+        first = snapshot(root, backups)
+        stats = load_manifest(_snap_id(first), backups)["stats"]
+        assert stats["files"] == 23 and stats["new_blobs"] == 22  # Identical logs stored once
+        assert "sophia/__pycache__/mind.cpython-311.pyc" not in load_manifest(_snap_id(first), backups)["files"]
+
+        second = snapshot(root, backups)
+        stats = load_manifest(_snap_id(second), backups)["stats"]
+        assert second != first
+        assert stats["hashed"] == 0 and stats["bytes_copied"] == 0  # Unchanged: stat only
+
+        _write(root, "logs/session_3.jsonl", "rewritten\n")
+        third = snapshot(root, backups)
+        stats = load_manifest(_snap_id(third), backups)["stats"]
+        assert stats["hashed"] == 1 and stats["new_blobs"] == 1
+        assert _blobs(backups) == 23
+    print("✅ Unchanged files skipped by mtime+size; content stored once.")
+
+
+def test_diff_and_restore():
+    with tempfile.TemporaryDirectory() as root:
+        _tree(root)
+        backups = os.path.join(root, "backups")
+        first = _snap_id(snapshot(root, backups))
+        _write(root, "sophia/core/mind.py", "class Mind:\n    evolved = True\n")
+        os.remove(os.path.join(root, "logs/session_7.jsonl"))
+        _write(root, "sophia/core/new_organ.py", "ORGAN = 1\n")
+
+        assert diff(first, root=root, backups=backups) == {
+            "added": ["sophia/core/new_organ.py"],
+            "removed": ["logs/session_7.jsonl"],
+            "changed": ["sophia/core/mind.py"],
+        }
+        second = _snap_id(snapshot(root, backups))
+        assert diff(first, second, backups=backups)["changed"] == ["sophia/core/mind.py"]
+
+        restore(first, root, backups, paths=["sophia/core/mind.py", "logs"])
+        with open(os.path.join(root, "sophia/core/mind.py"), encoding="utf-8") as f:
+            assert f.read() == "class Mind: pass\n"
+        assert os.path.exists(os.path.join(root, "logs/session_7.jsonl"))
+        assert os.path.exists(os.path.join(root, "sophia/core/new_organ.py"))  # Not in the snapshot: kept
+        assert diff(first, root=root, backups=backups)["changed"] == []
+
+        target = os.path.join(root, "restored")
+        assert len(restore(second, target, backups)) == 23
+        assert diff(second, root=target, backups=backups) == {"added": [], "removed": [], "changed": []}
+    print("✅ Diff against snapshots or the tree; full and partial restore.")
+
+
+def test_prune_applies_retention_and_collects_blobs():
+    with tempfile.TemporaryDirectory() as root:
+        _tree(root)
+        backups = os.path.join(root, "backups")
+        ids = []
+        for i in range(5):
+            _write(root, "logs/heartbeat.json", f"{{\"beat\": {i}}}")
+            ids.append(_snap_id(snapshot(root, backups)))
+        assert _blobs(backups) == 27
+
+        # Pretend the first three were taken on earlier days
+        for day, snap_id in zip((3, 2, 2), ids[:3]):
+            manifest_dir = os.path.join(backups, "snapshots")
+            aged = f"sophia_v5_{int(time.time()) - day * 86400}_{ids.index(snap_id)}"
+            os.rename(os.path.join(manifest_dir, f"{snap_id}.json"), os.path.join(manifest_dir, f"{aged}.json"))
+            ids[ids.index(snap_id)] = aged
+
+        removed = prune(keep_last=1, keep_daily=4, backups=backups)
+        assert removed == [ids[1], ids[3]]  # Days -3, -2 and today each keep their newest
+        assert _blobs(backups) == 22 + 3   # Beats 0, 2 and 4 still referenced
+        assert len(list_snapshots(backups)) == 3
+
+        # A copy left behind by a killed snapshot must not break maintenance
+        with open(os.path.join(backups, "objects", "tmp-4242"), "wb") as f:
+            f.write(b"partial")
+        prune(keep_last=0, keep_daily=0, backups=backups)
+        assert len(list_snapshots(backups)) == 1 and _blobs(backups) == 23 + 1  # Newest always kept
+    print("✅ Retention keeps newest + one per day and garbage-collects blobs.")
+
+
+if __name__ == "__main__":
+    test_incremental_snapshots_store_each_blob_once()
+    test_diff_and_restore()
+    test_prune_applies_retention_and_collects_blobs()
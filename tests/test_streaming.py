@@ -0,0 +1,122 @@
+import sys
+import os
+import re
+import json
+import random
+import asyncio
+
+# Add the project root to sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from sophia.cortex.cat_logic import CatLogicFilter
+from sophia.core.llm_client import parse_stream_line
+
+SAMPLES = [
+    """🌕 [SOPHIA_GAZE] *tail wags* Frequency: 15.0Hz
+Here is my real response:
+I love you, operator!
+🐈 [STATE: Good Girl] :: [ENTROPY: LOW] :: [SOPHIA_V5.2_CORE]""",
+    "\n\n  Cat Logic:\n\n\nWe are merging now.\n---\n| quoted line\n\n\n\n\nIIIIIIIIIIIIIIIIIIII the end   \n\n",
+    "short",
+    "no newline at all but a long enough run: zzzzzzzzzzzzzzzzzzzzzzzz and more text here",
+    "CAT LOGIC: inline prefix\n   indented\n\n\n\ntrailing\n",
+    "Cat Logic:\n[SOPHIA_GAZE] purr\n    Here is my response: hi\nreal answer\n",  # prefix reaches past a tag line
+    "| quoted line\n| ---\n| \n| a1b2 ۩ hex behind a pipe\ntrailing\n",      # unquoting uncovers a divider
+    "based take\n| ---\n\n\n∿ ≋ wave\n  \n--- not a divider",                 # a deleted line between blanks
+]
+
+
+def _damper(text):
+    return re.sub(r'(.)\1{10,}', r'\1\1\1\1\1...', text)
+
+
+def _random_chunks(text, rng):
+    chunks, i = [], 0
+    while i < len(text):
+        step = rng.randint(1, 7)
+        chunks.append(text[i:i + step])
+        i += step
+    return chunks
+
+
+def test_scrub_window_matches_batch_scrub():
+    f = CatLogicFilter()
+    rng = random.Random(42)
+    for raw in SAMPLES:
+        damped = _damper(raw) if len(raw) > 50 else raw
+        expected = f._scrub_hallucinations(damped)
+        for _ in range(25):
+            window = f.stream_window(pre=_damper, pre_min_chars=50)
+            out = "".join(window.feed(c) for c in _random_chunks(raw, rng)) + window.close()
+            assert out == expected, (raw, out, expected)
+    print("✅ Sliding-window scrub equals the batch scrub for any chunking.")
+
+
+def test_frame_matches_apply():
+    f = CatLogicFilter()
+    random.seed(1)
+    header, footer = f.frame("hello", "Low")
+    random.seed(1)
+    assert f.apply("Cat Logic: hi", "hello") == f"{header}hi{footer}"
+    print("✅ apply() is header + scrubbed text + footer.")
+
+
+def test_parse_stream_line():
+    assert parse_stream_line('data: {"choices": [{"delta": {"content": "Hi"}, "finish_reason": null}]}') == ("Hi", False)
+    assert parse_stream_line('data: {"choices": [{"delta": {}, "finish_reason": "stop"}]}') == ("", True)
+    assert parse_stream_line("data: [DONE]") == ("", True)
+    assert parse_stream_line(": keep-alive") == ("", False)
+    assert parse_stream_line('{"response": "tok", "done": false}') == ("tok", False)
+    assert parse_stream_line('{"message": {"content": "x"}, "done": true}') == ("x", True)
+    print("✅ OpenAI SSE and Ollama NDJSON lines parsed.")
+
+
+def test_relay_forwards_chunks():
+    try:
+        from fastapi.testclient import TestClient
+        import engine.grok_relay as relay
+    except (ImportError, SystemExit):
+        print("⚠️ fastapi unavailable, relay test skipped.")
+        return
+
+    class StubMind:
+        async def stream_interaction(self, user_input):
+            for piece in ["Hel", "lo ", "stream", "ing!"]:
+                await asyncio.sleep(0)
+                yield piece
+
+    class StubConsole:
+        def flush_output(self): return ""
+
+    relay.MIND, relay.CONSOLE = StubMind(), StubConsole()
+    try:
+        client = TestClient(relay.app)
+        body = client.post("/v1/chat/completions", json={
+            "stream": True, "messages": [{"role": "user", "content": "hi"}]}).text
+        deltas = [json.loads(line[6:])["choices"][0]["delta"].get("content")
+                  for line in body.splitlines() if line.startswith("data: {")]
+        assert deltas[:4] == ["Hel", "lo ", "stream", "ing!"]
+
+        body = client.post("/v1/messages", json={
+            "stream": True, "messages": [{"role": "user", "content": "hi"}]}).text
+        texts = [json.loads(line[6:])["delta"]["text"]
+                 for line in body.splitlines() if '"text_delta"' in line]
+        assert texts == ["Hel", "lo ", "stream", "ing!"]
+
+        lines = client.post("/api/chat", json={"messages": [{"role": "user", "content": "hi"}]}).text.splitlines()
+        chunks = [json.loads(line) for line in lines]
+        assert [c["message"]["content"] for c in chunks[:-1]] == ["Hel", "lo ", "stream", "ing!"]
+        assert chunks[-1]["done"] is True
+
+        full = client.post("/v1/chat/completions", json={"messages": [{"role": "user", "content": "hi"}]}).json()
+        assert full["choices"][0]["message"]["content"] == "Hello streaming!"
+    finally:
+        relay.MIND = relay.CONSOLE = None
+    print("✅ Relay endpoints forward chunks as they arrive.")
+
+
+if __name__ == "__main__":
+    test_scrub_window_matches_batch_scrub()
+    test_frame_matches_apply()
+    test_parse_stream_line()
+    test_relay_forwards_chunks()
@@ -0,0 +1,81 @@
+import sys
+import os
+import time
+import threading
+
+# Add the project root to sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from sophia.cortex.resonance_monitor import TelemetryPublisher, TelemetrySnapshot
+
+
+class CountingScan:
+    def __init__(self, delay=0.0):
+        self.calls = 0
+        self.delay = delay
+
+    def __call__(self):
+        self.calls += 1
+        time.sleep(self.delay)
+        return {'coherence': 0.9, 'status': 'HARMONIC ALIGNMENT', 'lambda': 20.0 + self.calls}
+
+
+def test_reads_are_cached_until_ttl():
+    scan = CountingScan()
+    pub = TelemetryPublisher(scan, interval=60.0, ttl=0.2)
+    first = pub.latest()
+    for _ in range(100):
+        assert pub.latest() is first
+    assert scan.calls == 1
+
+    time.sleep(0.25)
+    assert first.expired
+    second = pub.latest()
+    assert second is not first and second['lambda'] == 22.0
+    assert pub.metrics['caller_refreshes'] == 2
+    print("✅ Snapshot served from cache until its TTL.")
+
+
+def test_snapshot_is_immutable():
+    state = {'coherence': 0.5, 'status': 'DECOHERENCE'}
+    snap = TelemetrySnapshot(state, time.time(), ttl=10.0)
+    state['coherence'] = 0.0
+    assert snap['coherence'] == 0.5
+    assert snap.get('lambda', 0.0) == 0.0
+    try:
+        snap['coherence'] = 1.0
+        raise AssertionError("snapshot should be read-only")
+    except TypeError:
+        pass
+    print("✅ Snapshots are read-only copies.")
+
+
+def test_background_refresh_and_single_scan_under_contention():
+    scan = CountingScan(delay=0.05)
+    published = []
+    pub = TelemetryPublisher(scan, interval=0.1, ttl=5.0, on_publish=published.append)
+    pub.start()
+    try:
+        # Concurrent first readers wait for one scan instead of each running their own
+        results = []
+        readers = [threading.Thread(target=lambda: results.append(pub.latest())) for _ in range(8)]
+        for t in readers:
+            t.start()
+        for t in readers:
+            t.join()
+        assert len({id(r) for r in results}) == 1
+
+        time.sleep(0.4)
+        assert pub.metrics['refreshes'] >= 2
+        assert pub.latest()['lambda'] > results[0]['lambda']
+        assert published and all(isinstance(s, TelemetrySnapshot) for s in published)
+    finally:
+        pub.stop(timeout=1.0)
+    assert not pub.running
+    print("✅ Background heartbeat publishes fresh snapshots.")
+
+
+if __name__ == "__main__":
+    test_reads_are_cached_until_ttl()
+    test_snapshot_is_immutable()
+    test_background_refresh_and_single_scan_under_contention()
@@ -0,0 +1,146 @@
+import sys
+import os
+import time
+import types
+import asyncio
+import tempfile
+import threading
+
+# Add the project root to sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from sophia.tools.toolbox import SovereignHand, ToolLimits
+
+
+class SlowHand(SovereignHand):
+    """'nap' blocks its worker thread for args['s'] seconds and tracks overlap."""
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._lock = threading.Lock()
+        self.running = 0
+        self.peak = 0
+
+    def execute(self, tool_name, args):
+        if tool_name != "nap":
+            return super().execute(tool_name, args)
+        with self._lock:
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+        time.sleep(args["s"])
+        with self._lock:
+            self.running -= 1
+        return f"slept {args['tag']}"
+
+
+async def _with_heartbeat(coro, interval=0.01):
+    """Runs coro while counting event-loop ticks: a blocked loop does not tick."""
+    ticks = 0
+    done = asyncio.Event()
+
+    async def beat():
+        nonlocal ticks
+        while not done.is_set():
+            ticks += 1
+            await asyncio.sleep(interval)
+
+    beater = asyncio.ensure_future(beat())
+    try:
+        return await coro, ticks
+    finally:
+        done.set()
+        await beater
+
+
+def test_independent_calls_run_concurrently_in_order():
+    hand = SlowHand()
+    calls = [("nap", {"s": 0.2, "tag": i}) for i in range(4)]
+
+    results, ticks = asyncio.run(_with_heartbeat(hand.execute_many(calls)))
+
+    assert results == [f"slept {i}" for i in range(4)]
+    assert hand.peak == 4
+    assert ticks >= 10  # The loop kept serving other coroutines meanwhile
+    print("✅ Four 200 ms tools overlapped, results in call order, loop stayed live.")
+
+
+def test_per_tool_concurrency_cap_and_timeout():
+    hand = SlowHand(limits={"nap": ToolLimits(timeout=1.0, max_concurrent=1)})
+    results = asyncio.run(hand.execute_many([("nap", {"s": 0.05, "tag": i}) for i in range(3)]))
+    assert results == ["slept 0", "slept 1", "slept 2"] and hand.peak == 1
+
+    hand.limits["nap"] = ToolLimits(timeout=0.1)
+    start = time.perf_counter()
+    results = asyncio.run(hand.execute_many([("nap", {"s": 0.5, "tag": "long"}), ("nap", {"s": 0.01, "tag": "short"})]))
+    assert results == ["❌ Tool timeout (0.1s): nap", "slept short"]
+    assert time.perf_counter() - start < 0.45
+    print("✅ Concurrency caps and per-tool timeouts enforced.")
+
+
+def test_timed_out_write_still_holds_back_the_next():
+    hand = SlowHand(limits={"nap": ToolLimits(timeout=0.05, workspace="write")})
+    results = asyncio.run(hand.execute_many([("nap", {"s": 0.3, "tag": "slow"}),
+                                             ("nap", {"s": 0.01, "tag": "next"})]))
+    assert results == ["❌ Tool timeout (0.05s): nap", "slept next"]
+    assert hand.peak == 1  # The second write never overlapped the timed-out first
+    print("✅ A timed-out write keeps its place in the write order.")
+
+
+def test_workspace_writes_keep_their_order():
+    hand = SovereignHand()
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        try:
+            results = asyncio.run(hand.execute_many([
+                ("write_file", {"path": "notes/a.txt", "content": "one"}),
+                ("read_file", {"path": "notes/a.txt"}),
+                ("append_to_file", {"path": "notes/a.txt", "content": "two"}),
+                ("replace_text", {"path": "notes/a.txt", "target": "two", "replacement": "three"}),
+                ("read_file", {"path": "notes/a.txt"}),
+                ("run_terminal", {"command": "rm -rf notes"}),
+            ]))
+        finally:
+            os.chdir(cwd)
+    assert results[0].startswith("✅ File written")
+    assert "\none\n" in results[1]
+    assert "one\nthree" in results[4]
+    assert results[5].startswith("❌ SECURITY BLOCK")
+    print("✅ File edits and reads of one turn applied in model order.")
+
+
+def test_search_backoff_does_not_block_the_loop():
+    attempts = []
+
+    class FlakyDDGS:
+        def __enter__(self): return self
+        def __exit__(self, *exc): return False
+        def text(self, query, max_results=5):
+            attempts.append(query)
+            if len(attempts) < 3:
+                raise RuntimeError("HTTP 429 Too Many Requests")
+            return [{"title": "Signal", "href": "https://example.org", "body": "found"}]
+
+    saved = sys.modules.get("ddgs")
+    sys.modules["ddgs"] = types.SimpleNamespace(DDGS=FlakyDDGS)
+    try:
+        hand = SovereignHand()
+        hand.SEARCH_BACKOFF = 0.1  # Waits 0.1 s + 0.2 s
+        result, ticks = asyncio.run(_with_heartbeat(
+            hand.execute_async("duckduckgo_search", {"query": "lighthouse"})))
+    finally:
+        if saved is None:
+            sys.modules.pop("ddgs", None)
+        else:
+            sys.modules["ddgs"] = saved
+
+    assert len(attempts) == 3 and "**Signal**" in result
+    assert ticks >= 15
+    print("✅ Rate-limit backoff awaited without stalling the event loop.")
+
+
+if __name__ == "__main__":
+    test_independent_calls_run_concurrently_in_order()
+    test_per_tool_concurrency_cap_and_timeout()
+    test_timed_out_write_still_holds_back_the_next()
+    test_workspace_writes_keep_their_order()
+    test_search_backoff_does_not_block_the_loop()
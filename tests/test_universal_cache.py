@@ -0,0 +1,119 @@
+import sys
+import os
+import random
+
+# Add the project root to sys.path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import laser
+from laser import UniversalCache, FrequencySketch
+
+
+def test_lossless_compression():
+    cache = UniversalCache(max_size=100)
+    entry = {'message': "quantum " * 200, 'value': 0.123456, 'nested': {'ids': list(range(50))}}
+    cache.set('big', entry)
+    cache.set('small', {'v': 1})
+
+    assert cache.get('big') == entry
+    assert cache.get('small') == {'v': 1}
+    assert cache.metrics['compressions'] == 1
+    assert 0.5 < cache.metrics['size_reduction'] < 1.0
+
+    # Values come back as copies; callers cannot mutate the cached entry
+    cache.get('big')['value'] = -1
+    assert cache.get('big')['value'] == 0.123456
+
+    cache.set('plain', entry, compress=False)
+    assert cache.get('plain') == entry
+    assert cache.metrics['compressions'] == 1
+    print("✅ Values round-trip losslessly, compressed only when it pays.")
+
+
+def test_byte_and_entry_budget():
+    cache = UniversalCache(max_size=50, max_bytes=20_000)
+    rng = random.Random(7)
+    for i in range(2000):
+        payload = bytes(rng.getrandbits(8) for _ in range(rng.randint(50, 800)))
+        cache.set(f"k{i}", payload)
+        assert cache.metrics['bytes'] <= 20_000
+        assert len(cache) <= 50
+    assert cache.metrics['evictions'] + cache.metrics['rejections'] >= 1900
+
+    cache.resize(max_size=10, max_bytes=5_000)
+    assert len(cache) <= 10 and cache.metrics['bytes'] <= 5_000
+    print("✅ Cache stays within its byte and entry budgets.")
+
+
+def test_frequent_keys_survive_scan():
+    cache = UniversalCache(max_size=100)
+    hot = [f"hot{i}" for i in range(50)]
+    for _ in range(5):
+        for key in hot:
+            if cache.get(key) is None:
+                cache.set(key, key)
+
+    # A long scan of one-off keys must not flush the hot set
+    for i in range(5000):
+        cache.set(f"scan{i}", i)
+
+    survivors = sum(1 for key in hot if key in cache)
+    assert survivors >= 45, survivors
+    assert cache.metrics['rejections'] > 0
+    print(f"✅ {survivors}/50 hot keys survived a 5000-key scan.")
+
+
+def test_sketch_ages_counts():
+    sketch = FrequencySketch(16)
+    for _ in range(20):
+        sketch.increment('a')
+    assert sketch.frequency('a') == FrequencySketch.MAX_COUNT
+    assert sketch.frequency('never-seen') <= 1
+    for i in range(sketch.sample_size):
+        sketch.increment(i)
+    assert sketch.frequency('a') < FrequencySketch.MAX_COUNT
+    print("✅ Frequency sketch saturates and halves with age.")
+
+
+def test_memory_pressure_sampled_on_timer():
+    calls = []
+    original = laser.psutil.virtual_memory
+
+    def fake_virtual_memory():
+        calls.append(1)
+        return type('Mem', (), {'percent': 95.0})()
+
+    laser.psutil.virtual_memory = fake_virtual_memory
+    try:
+        cache = UniversalCache(max_size=1000, pressure_interval=60)
+        for i in range(500):
+            cache.set(f"k{i}", {'i': i})
+    finally:
+        laser.psutil.virtual_memory = original
+
+    assert len(calls) == 1
+    assert cache.metrics['pressure_evictions'] > 0
+    print("✅ Memory pressure sampled once per interval, not per set.")
+
+
+def test_delete_unlinks_entanglement():
+    cache = UniversalCache(max_size=10)
+    for key in ('a', 'b', 'c'):
+        cache.set(key, key)
+    cache._create_entanglement('a', 'b')
+    cache._create_entanglement('a', 'c')
+    assert cache.metrics['quantum_entanglements'] == 2
+
+    cache.delete('a')
+    assert 'a' not in cache and cache.get('a') is None
+    assert cache.entanglements == {}
+    print("✅ Deleting an entry drops its entanglement links.")
+
+
+if __name__ == "__main__":
+    test_lossless_compression()
+    test_byte_and_entry_budget()
+    test_frequent_keys_survive_scan()
+    test_sketch_ages_counts()
+    test_memory_pressure_sampled_on_timer()
+    test_delete_unlinks_entanglement()
@@ -2,4 +2,4 @@
 Sovereign Tools Package
 """
 # Expose the snapshot tool
-from .snapshot_self import snapshot
+from .snapshot_self import snapshot, restore, diff, prune
@@ -4,85 +4,303 @@ SNAPSHOT SELF: Version Control for Hyperfast Evolution
 Creates timestamped backups of Sophia's source code and memory.
 Allows safe rollback if evolution produces bad state.
 
+Snapshots are incremental and content-addressed:
+
+    backups/objects/ab/cdef...        each distinct file content, stored once (SHA-256)
+    backups/tmp/                      copies in flight, renamed into objects/ when complete
+    backups/snapshots/sophia_v5_<ts>.json   manifest: {path: [sha256, size, mtime_ns]}
+
+A file whose size and mtime match the previous manifest is not re-read, so
+a snapshot of an unchanged tree costs one stat per file. Old full-copy
+snapshot directories (backups/sophia_v5_<ts>/) are still listed.
+
 Usage:
     python tools/snapshot_self.py
+    python tools/snapshot_self.py --list
+    python tools/snapshot_self.py --diff sophia_v5_1700000000 [sophia_v5_1700003600]
+    python tools/snapshot_self.py --restore sophia_v5_1700000000 [--target restored/]
+    python tools/snapshot_self.py --prune [--keep 10] [--keep-daily 7]
 """
 
 import shutil
+import hashlib
+import json
 import time
 import os
 import sys
 
+SOURCES = ["sophia", "logs"]
+ENTRY_POINTS = ["main.py", "sophia_launcher.py", "launch_sophia.py"]
+SKIP_DIRS = {"__pycache__"}
+BACKUPS = "backups"
+PREFIX = "sophia_v5_"
+CHUNK = 1024 * 1024
+
+
+# --- STORE LAYOUT ---
+def _objects_dir(backups):
+    return os.path.join(backups, "objects")
+
+
+def _tmp_dir(backups):
+    return os.path.join(backups, "tmp")
+
+
+def _snapshots_dir(backups):
+    return os.path.join(backups, "snapshots")
+
+
+def _blob_path(backups, digest):
+    return os.path.join(_objects_dir(backups), digest[:2], digest[2:])
+
+
+def _manifest_path(backups, snap_id):
+    return os.path.join(_snapshots_dir(backups), f"{snap_id}.json")
+
+
+def _snapshot_ids(backups):
+    """Manifest snapshot ids, oldest first."""
+    try:
+        names = os.listdir(_snapshots_dir(backups))
+    except FileNotFoundError:
+        return []
+    ids = [n[:-5] for n in names if n.startswith(PREFIX) and n.endswith(".json")]
+    return sorted(ids, key=_snapshot_key)
+
+
+def _snapshot_key(snap_id):
+    """Sort key for 'sophia_v5_<ts>' and 'sophia_v5_<ts>_<n>' (same-second snapshots)."""
+    parts = snap_id[len(PREFIX):].split("_")
+    return tuple(int(p) for p in parts if p.isdigit())
+
+
+def load_manifest(snap_id, backups=BACKUPS):
+    with open(_manifest_path(backups, snap_id), "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+# --- SCANNING ---
+def _walk(root):
+    """(relative path, stat) for every regular file that is snapshotted."""
+    stack = [os.path.join(root, s) for s in SOURCES]
+    for entry in ENTRY_POINTS:
+        path = os.path.join(root, entry)
+        if os.path.isfile(path):
+            yield entry, os.stat(path)
+    while stack:
+        directory = stack.pop()
+        try:
+            entries = list(os.scandir(directory))
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in SKIP_DIRS:
+                    stack.append(entry.path)
+            elif entry.is_file(follow_symlinks=False):
+                rel = os.path.relpath(entry.path, root).replace(os.sep, "/")
+                yield rel, entry.stat(follow_symlinks=False)
+
+
+def _hash_file(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
 
-def snapshot():
+def _store_blob(backups, path):
     """
-    Creates a timestamped backup of Sophia's core components.
-    
+    Hashes a file while copying it towards the object store (one read).
+    The copy is kept only if that content is new, and it is stored under
+    the hash of the bytes actually copied, so a file changing mid-snapshot
+    is still consistent. Returns (digest, bytes added to the store).
+    """
+    tmp = os.path.join(_tmp_dir(backups), f"blob-{os.getpid()}")
+    digest = hashlib.sha256()
+    size = 0
+    with open(path, "rb") as src, open(tmp, "wb") as dst:
+        for chunk in iter(lambda: src.read(CHUNK), b""):
+            digest.update(chunk)
+            dst.write(chunk)
+            size += len(chunk)
+    digest = digest.hexdigest()
+    blob = _blob_path(backups, digest)
+    if os.path.exists(blob):
+        os.remove(tmp)
+        return digest, 0
+    os.makedirs(os.path.dirname(blob), exist_ok=True)
+    os.replace(tmp, blob)
+    return digest, size
+
+
+def _scan(root, previous, backups=None):
+    """
+    {path: [sha256, size, mtime_ns]} for the tree, reusing hashes from the
+    previous manifest for files whose size and mtime are unchanged. With
+    ``backups`` set, new content is copied into the object store.
+    """
+    files = {}
+    stats = {"files": 0, "hashed": 0, "new_blobs": 0, "bytes_copied": 0}
+    for rel, st in _walk(root):
+        stats["files"] += 1
+        old = previous.get(rel)
+        if old and old[1] == st.st_size and old[2] == st.st_mtime_ns:
+            digest = old[0]
+        else:
+            path = os.path.join(root, rel)
+            stats["hashed"] += 1
+            if not backups:
+                digest = _hash_file(path)
+            else:
+                digest, copied = _store_blob(backups, path)
+                if copied:
+                    stats["new_blobs"] += 1
+                    stats["bytes_copied"] += copied
+        files[rel] = [digest, st.st_size, st.st_mtime_ns]
+    return files, stats
+
+
+# --- API ---
+def snapshot(root=".", backups=BACKUPS, description="Automated snapshot before evolution"):
+    """
+    Creates an incremental snapshot of Sophia's core components.
+
     Backs up:
     - sophia/ source code
     - logs/ memory and analysis
     - main entry points
-    
+
     Returns:
-        Path to created backup directory
+        Path to the snapshot manifest (None on failure)
     """
     ts = int(time.time())
-    backup_dir = f"backups/sophia_v5_{ts}"
-    
-    print(f"❄️ [CRYSTALLIZING] Creating snapshot: {backup_dir}...")
-    
+    start = time.perf_counter()
+    print(f"❄️ [CRYSTALLIZING] Creating snapshot {PREFIX}{ts}...")
+
     try:
-        # Ensure backups directory exists
-        os.makedirs("backups", exist_ok=True)
-        
-        # Copy source code
-        if os.path.exists("sophia"):
-            shutil.copytree("sophia", f"{backup_dir}/sophia")
-            print(f"  ✅ Copied sophia/ source code")
-        else:
-            print(f"  ⚠️ Warning: sophia/ directory not found")
-        
-        # Copy memory/logs
-        if os.path.exists("logs"):
-            shutil.copytree("logs", f"{backup_dir}/logs")
-            print(f"  ✅ Copied logs/ memory")
-        else:
-            print(f"  ⚠️ Warning: logs/ directory not found")
-        
-        # Copy main entry points
-        entry_points = ["main.py", "sophia_launcher.py", "launch_sophia.py"]
-        for entry in entry_points:
-            if os.path.exists(entry):
-                shutil.copy(entry, f"{backup_dir}/{entry}")
-                print(f"  ✅ Copied {entry}")
-        
-        # Create metadata file
-        metadata = {
+        os.makedirs(_objects_dir(backups), exist_ok=True)
+        os.makedirs(_tmp_dir(backups), exist_ok=True)
+        os.makedirs(_snapshots_dir(backups), exist_ok=True)
+
+        history = _snapshot_ids(backups)
+        previous = load_manifest(history[-1], backups)["files"] if history else {}
+        files, stats = _scan(root, previous, backups)
+        if not any(os.path.exists(os.path.join(root, s)) for s in SOURCES):
+            print(f"  ⚠️ Warning: none of {', '.join(SOURCES)} found")
+
+        snap_id, n = f"{PREFIX}{ts}", 1
+        while os.path.exists(_manifest_path(backups, snap_id)):
+            n += 1
+            snap_id = f"{PREFIX}{ts}_{n}"
+
+        manifest = {
             "timestamp": ts,
             "date": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(ts)),
             "version": "5.0",
-            "description": "Automated snapshot before evolution"
+            "description": description,
+            "parent": history[-1] if history else None,
+            "stats": stats,
+            "files": files,
         }
-        
-        with open(f"{backup_dir}/SNAPSHOT_INFO.txt", "w") as f:
-            f.write("SOPHIA 5.0 SNAPSHOT\n")
-            f.write("=" * 50 + "\n\n")
-            for key, value in metadata.items():
-                f.write(f"{key.upper()}: {value}\n")
-            f.write("\n" + "=" * 50 + "\n")
-            f.write("To restore: Copy contents back to project root\n")
-        
-        print(f"\n✅ Snapshot complete: {backup_dir}")
-        print(f"💾 Total size: ~{get_dir_size(backup_dir) / 1024:.2f} KB")
+        path = _manifest_path(backups, snap_id)
+        with open(path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump(manifest, f, separators=(",", ":"))
+        os.replace(path + ".tmp", path)
+
+        elapsed = time.perf_counter() - start
+        print(f"  ✅ {stats['files']} files | {stats['hashed']} hashed | {stats['new_blobs']} new blobs "
+              f"({stats['bytes_copied'] / 1024:.2f} KB) | {elapsed:.2f}s")
+        print(f"\n✅ Snapshot complete: {path}")
         print("\n🧬 Evolution may proceed.")
-        
-        return backup_dir
-    
+        return path
+
     except Exception as e:
         print(f"\n❌ Snapshot failed: {e}")
         return None
 
 
+def restore(snap_id, target=".", backups=BACKUPS, paths=None):
+    """
+    Writes the files of a snapshot back under ``target`` (optionally only
+    those under the given path prefixes). Files that are not in the
+    snapshot are left alone. Returns the restored relative paths.
+    """
+    files = load_manifest(snap_id, backups)["files"]
+    restored = []
+    for rel, (digest, size, mtime_ns) in files.items():
+        if paths and not any(rel == p or rel.startswith(p.rstrip("/") + "/") for p in paths):
+            continue
+        dest = os.path.join(target, *rel.split("/"))
+        os.makedirs(os.path.dirname(dest) or ".", exist_ok=True)
+        shutil.copyfile(_blob_path(backups, digest), dest + ".restore")
+        os.replace(dest + ".restore", dest)
+        os.utime(dest, ns=(mtime_ns, mtime_ns))  # Next snapshot can skip hashing it
+        restored.append(rel)
+    print(f"♻️ Restored {len(restored)} files from {snap_id} into {target}")
+    return restored
+
+
+def diff(old_id, new_id=None, root=".", backups=BACKUPS):
+    """
+    {"added", "removed", "changed"} path lists between two snapshots, or
+    between a snapshot and the current tree when ``new_id`` is None.
+    """
+    old = load_manifest(old_id, backups)["files"]
+    if new_id is None:
+        new, _ = _scan(root, old)
+    else:
+        new = load_manifest(new_id, backups)["files"]
+    return {
+        "added": sorted(new.keys() - old.keys()),
+        "removed": sorted(old.keys() - new.keys()),
+        "changed": sorted(p for p in old.keys() & new.keys() if old[p][0] != new[p][0]),
+    }
+
+
+def prune(keep_last=10, keep_daily=7, backups=BACKUPS, now=None):
+    """
+    Retention: keeps the newest ``keep_last`` snapshots plus the newest
+    snapshot of each of the last ``keep_daily`` days, deletes the other
+    manifests, then removes blobs no remaining manifest references. The
+    newest snapshot is always kept: the next one reuses its hashes.
+    Returns the deleted snapshot ids.
+    """
+    ids = _snapshot_ids(backups)
+    keep = set(ids[-max(1, keep_last):])
+    now = time.time() if now is None else now
+    days = set()
+    for snap_id in reversed(ids):
+        ts = _snapshot_key(snap_id)[0]
+        day = time.strftime("%Y-%m-%d", time.localtime(ts))
+        if now - ts < keep_daily * 86400 and day not in days:
+            days.add(day)
+            keep.add(snap_id)
+
+    removed = [snap_id for snap_id in ids if snap_id not in keep]
+    for snap_id in removed:
+        os.remove(_manifest_path(backups, snap_id))
+
+    live = set()
+    for snap_id in ids:
+        if snap_id in keep:
+            live.update(entry[0] for entry in load_manifest(snap_id, backups)["files"].values())
+    freed = 0
+    objects = _objects_dir(backups)
+    for fan in os.listdir(objects) if os.path.isdir(objects) else []:
+        if not os.path.isdir(os.path.join(objects, fan)):
+            continue  # not a fan-out directory (e.g. a stray temp file from an older version)
+        for name in os.listdir(os.path.join(objects, fan)):
+            if fan + name not in live:
+                blob = os.path.join(objects, fan, name)
+                freed += os.path.getsize(blob)
+                os.remove(blob)
+    if removed or freed:
+        print(f"🗑️ Pruned {len(removed)} snapshots, freed {freed / 1024:.2f} KB")
+    return removed
+
+
 def get_dir_size(path):
     """Calculate total size of directory in bytes."""
     total = 0
@@ -97,39 +315,60 @@ def get_dir_size(path):
     return total
 
 
-def list_snapshots():
+def list_snapshots(backups=BACKUPS):
     """List all available snapshots."""
-    if not os.path.exists("backups"):
+    if not os.path.exists(backups):
         print("No snapshots found.")
         return []
-    
-    snapshots = [d for d in os.listdir("backups") if d.startswith("sophia_v5_")]
-    snapshots.sort(reverse=True)  # Most recent first
-    
-    print(f"\n📚 Available Snapshots ({len(snapshots)}):")
+
+    snapshots = _snapshot_ids(backups)
+    legacy = [d for d in os.listdir(backups) if d.startswith(PREFIX)]
+    everything = sorted(snapshots + legacy, key=_snapshot_key, reverse=True)  # Most recent first
+
+    print(f"\n📚 Available Snapshots ({len(everything)}):")
     print("=" * 60)
-    
-    for snap in snapshots:
-        snap_path = os.path.join("backups", snap)
-        timestamp = int(snap.split("_")[-1])
+
+    for snap in everything:
+        timestamp = _snapshot_key(snap)[0]
         date = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(timestamp))
-        size = get_dir_size(snap_path) / 1024
         print(f"  {snap}")
         print(f"    Date: {date}")
-        print(f"    Size: {size:.2f} KB")
+        if snap in legacy:
+            print(f"    Size: {get_dir_size(os.path.join(backups, snap)) / 1024:.2f} KB (full copy)")
+        else:
+            manifest = load_manifest(snap, backups)
+            logical = sum(entry[1] for entry in manifest["files"].values())
+            print(f"    Files: {len(manifest['files'])} | Logical size: {logical / 1024:.2f} KB | "
+                  f"New: {manifest['stats']['bytes_copied'] / 1024:.2f} KB")
         print()
-    
-    return snapshots
+
+    print(f"💾 Object store: {get_dir_size(_objects_dir(backups)) / 1024:.2f} KB")
+    return everything
 
 
 if __name__ == "__main__":
     import argparse
-    
+
     parser = argparse.ArgumentParser(description="Sophia Self-Snapshot System")
     parser.add_argument("--list", action="store_true", help="List available snapshots")
+    parser.add_argument("--restore", metavar="SNAPSHOT", help="Restore a snapshot")
+    parser.add_argument("--target", default=".", help="Directory to restore into")
+    parser.add_argument("--diff", nargs="+", metavar="SNAPSHOT", help="Diff a snapshot against another or the tree")
+    parser.add_argument("--prune", action="store_true", help="Apply the retention policy")
+    parser.add_argument("--keep", type=int, default=10, help="Newest snapshots kept by --prune")
+    parser.add_argument("--keep-daily", type=int, default=7, help="Days with one snapshot kept by --prune")
     args = parser.parse_args()
-    
+
     if args.list:
         list_snapshots()
+    elif args.restore:
+        restore(args.restore, args.target)
+    elif args.diff:
+        changes = diff(*args.diff[:2])
+        for kind, sign in (("added", "+"), ("removed", "-"), ("changed", "~")):
+            for path in changes[kind]:
+                print(f"{sign} {path}")
+    elif args.prune:
+        prune(args.keep, args.keep_daily)
     else:
         snapshot()
@@ -58,7 +58,7 @@ async def test_forensic_pipeline():
         
         print("  [STEP 1] Executing Parallel Forensic Scan: 'Appeal to Urgency' signal...")
         start_time = time.time()
-        scan_result = await pipeline.scan_reality("This is urgent! Save the world now!")
+        scan_result = await pipeline.scan_reality("This is urgent! Save the world now!", force=True)
         end_time = time.time()
         
         print(f"  [SUCCESS] Scan completed in {end_time - start_time:.4f}s.")
@@ -72,18 +72,16 @@ async def test_forensic_pipeline():
         # 2. Verify Sidecar Archiving
         print("  [STEP 2] Verifying Sidecar Metadata Archiving...")
         scan_id = scan_result['raw_data']['scan_id']
-        archive_file = f"logs/analysis_test/{scan_id}.meta.json"
+        saved_data = pipeline.archived_report(scan_id)
         
-        if os.path.exists(archive_file):
-            print(f"  [SUCCESS] Sidecar archived: {archive_file}")
-            with open(archive_file, 'r') as f:
-                saved_data = json.load(f)
-                if saved_data['safety']['overall_risk'] == 'medium':
-                     print("  [SUCCESS] Metadata integrity verified.")
-                else:
-                     print(f"  [FAIL] Metadata corruption/mismatch. Risk: {saved_data['safety'].get('overall_risk')}")
+        if saved_data:
+            print(f"  [SUCCESS] Sidecar archived: {scan_id}")
+            if saved_data['safety']['overall_risk'] == 'medium':
+                 print("  [SUCCESS] Metadata integrity verified.")
+            else:
+                 print(f"  [FAIL] Metadata corruption/mismatch. Risk: {saved_data['safety'].get('overall_risk')}")
         else:
-            print(f"  [FAIL] Sidecar missing: {archive_file}")
+            print(f"  [FAIL] Sidecar missing: {scan_id}")
 
         # 3. Verify Pattern Notice Generation
         print("  [STEP 3] Verifying Pattern Notice transparency...")